@@ -0,0 +1,81 @@
+"""
+Benchmark: wall time to download a finished crawl with the async client.
+
+A local stand-in server serves a completed crawl of ``--pages`` pages of
+``--page-size`` documents, adding ``--latency`` seconds to every response to
+mimic a distant API. ``get_crawl_status`` is timed with
+``max_concurrent_pages=1`` (one page at a time, as before) and with higher
+concurrency.
+
+Usage:
+    python benchmarks/bench_async_pagination.py [--pages 50] [--page-size 20] [--latency 0.05]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.common import StandInServer  # noqa: E402
+from firecrawl.v2.methods.aio.crawl import get_crawl_status  # noqa: E402
+from firecrawl.v2.types import PaginationConfig  # noqa: E402
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient  # noqa: E402
+
+
+class FinishedCrawl:
+    """Route handler for a completed crawl served page by page."""
+
+    def __init__(self, docs: int, page_size: int, latency: float):
+        self.docs = docs
+        self.page_size = page_size
+        self.latency = latency
+
+    def __call__(self, method, path, body):
+        time.sleep(self.latency)
+        query = parse_qs(urlparse(path).query)
+        skip = int(query.get("skip", ["0"])[0])
+        limit = min(self.page_size, int(query.get("limit", [str(self.page_size)])[0]))
+        end = min(self.docs, skip + limit)
+        return 200, {
+            "success": True,
+            "status": "completed",
+            "completed": self.docs,
+            "total": self.docs,
+            "creditsUsed": self.docs,
+            "next": f"{path.split('?')[0]}?skip={end}" if end < self.docs else None,
+            "data": [{"markdown": "x" * 2000, "metadata": {"sourceURL": f"https://example.com/{i}"}} for i in range(skip, end)],
+        }
+
+
+async def _run(url: str, docs: int, concurrency: int) -> float:
+    client = AsyncHttpClient("fc-bench", url)
+    try:
+        start = time.perf_counter()
+        job = await get_crawl_status(client, "job", PaginationConfig(max_concurrent_pages=concurrency))
+        elapsed = time.perf_counter() - start
+    finally:
+        await client.close()
+    assert len(job.data) == docs, len(job.data)
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds added to every response")
+    args = parser.parse_args()
+
+    docs = args.pages * args.page_size
+    with StandInServer({"/v2/crawl/": FinishedCrawl(docs, args.page_size, args.latency)}) as server:
+        for concurrency in (1, 4, 8, 16):
+            elapsed = asyncio.run(_run(server.url, docs, concurrency))
+            print(f"max_concurrent_pages={concurrency:<3} {elapsed:>7.2f} s for {args.pages} pages")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark: crawl waiter poll modes ("full" vs "status" vs "delta").
+
+A local stand-in server simulates a crawl that finishes ``--docs`` pages over
+``--duration`` seconds, paginating results ``--page-size`` documents at a
+time. For each poll mode the benchmark reports bytes downloaded, requests
+made and client-side CPU time spent parsing (server work is excluded by
+measuring the waiting thread only).
+
+Usage:
+    python benchmarks/bench_crawl_polling.py [--docs 2000] [--duration 3] [--poll-interval 0.1]
+"""
+
+import argparse
+import os
+import sys
+import time
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.common import StandInServer  # noqa: E402
+from firecrawl.v2.methods.crawl import wait_for_crawl_completion  # noqa: E402
+from firecrawl.v2.utils.http_client import HttpClient  # noqa: E402
+
+
+class GrowingCrawl:
+    """Route handler for a crawl whose result set grows linearly over time."""
+
+    def __init__(self, docs: int, duration: float, page_size: int, doc_bytes: int):
+        self.docs = docs
+        self.duration = duration
+        self.page_size = page_size
+        self.body = "x" * doc_bytes
+        self.started = time.monotonic()
+
+    def restart(self) -> None:
+        self.started = time.monotonic()
+
+    def __call__(self, method, path, body):
+        elapsed = time.monotonic() - self.started
+        available = min(self.docs, int(self.docs * elapsed / self.duration))
+        done = available >= self.docs
+        query = parse_qs(urlparse(path).query)
+        skip = int(query.get("skip", ["0"])[0])
+        limit = min(self.page_size, int(query.get("limit", [str(self.page_size)])[0]))
+        end = min(available, skip + limit)
+        data = [
+            {"markdown": self.body, "metadata": {"sourceURL": f"https://example.com/{i}", "statusCode": 200}}
+            for i in range(skip, end)
+        ]
+        next_url = None
+        if end < available and "limit" not in query:
+            next_url = f"http://127.0.0.1/v2/crawl/job?skip={end}"
+        return 200, {
+            "success": True,
+            "status": "completed" if done else "scraping",
+            "completed": available,
+            "total": self.docs,
+            "creditsUsed": available,
+            "next": next_url,
+            "data": data,
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--poll-interval", type=float, default=0.1)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--doc-bytes", type=int, default=2000)
+    args = parser.parse_args()
+
+    crawl = GrowingCrawl(args.docs, args.duration, args.page_size, args.doc_bytes)
+    print(
+        f"{args.docs} documents over {args.duration:.1f}s, poll every {args.poll_interval}s, "
+        f"{args.page_size} docs/page, ~{args.doc_bytes} B/doc"
+    )
+    print(f"{'mode':<8} {'downloaded':>12} {'requests':>9} {'client CPU':>11} {'wall':>7} {'docs':>6}")
+
+    with StandInServer({"/v2/crawl/": crawl}) as server:
+        for mode in ("full", "status", "delta"):
+            with HttpClient("fc-bench", server.url) as client:
+                server.reset_counters()
+                crawl.restart()
+                cpu = time.thread_time()
+                wall = time.perf_counter()
+                job = wait_for_crawl_completion(client, "job", poll_interval=args.poll_interval, poll_mode=mode)
+                cpu = time.thread_time() - cpu
+                wall = time.perf_counter() - wall
+            print(
+                f"{mode:<8} {server.bytes_sent / 1e6:>9.1f} MB {server.requests:>9} "
+                f"{cpu:>9.2f} s {wall:>6.2f}s {len(job.data):>6}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark: documents/sec for parsing crawl status pages.
+
+Feeds canned crawl status pages straight into ``get_crawl_status`` (no
+network) and compares the eager path used before (``normalize_document_input``
+plus a validated ``Document`` with a full ``DocumentMetadata`` per page) with
+the trusted ``Document.from_api`` path, whose metadata is only validated when
+read. The "lazy + metadata" row reads ``metadata`` of every document, which is
+the worst case for the lazy path.
+
+Usage:
+    python benchmarks/bench_document_parsing.py [--docs 100] [--pages 200]
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from firecrawl.v2.methods import crawl as crawl_module  # noqa: E402
+from firecrawl.v2.types import Document  # noqa: E402
+from firecrawl.v2.utils.normalize import normalize_document_input  # noqa: E402
+
+
+def _page(docs: int) -> Dict[str, Any]:
+    return {
+        "success": True,
+        "status": "completed",
+        "completed": docs,
+        "total": docs,
+        "creditsUsed": docs,
+        "next": None,
+        "data": [
+            {
+                "markdown": "# Title\n\n" + "lorem ipsum " * 150,
+                "rawHtml": "<p>lorem ipsum</p>" * 100,
+                "links": [f"https://example.com/{i}/{j}" for j in range(20)],
+                "metadata": {
+                    "title": f"Page {i}",
+                    "description": "A page",
+                    "language": "en",
+                    "keywords": ["a", "b"],
+                    "ogTitle": f"Page {i}",
+                    "ogImage": "https://example.com/og.png",
+                    "sourceURL": f"https://example.com/{i}",
+                    "url": f"https://example.com/{i}",
+                    "statusCode": 200,
+                    "scrapeId": f"scrape-{i}",
+                    "contentType": "text/html",
+                    "proxyUsed": "basic",
+                    "cacheState": "miss",
+                    "creditsUsed": 1,
+                },
+            }
+            for i in range(docs)
+        ],
+    }
+
+
+class _Response:
+    ok = True
+    status_code = 200
+
+    def __init__(self, body: Dict[str, Any]):
+        self._body = body
+
+    def json(self) -> Dict[str, Any]:
+        return self._body
+
+
+class _Client:
+    def __init__(self, body: Dict[str, Any]):
+        self._response = _Response(body)
+
+    def get(self, endpoint: str, **kwargs) -> _Response:
+        return self._response
+
+
+def _eager(doc: Dict[str, Any]) -> Document:
+    return Document(**normalize_document_input(doc))
+
+
+def _run(label: str, client: _Client, pages: int, touch_metadata: bool) -> None:
+    parsed = 0
+    start = time.perf_counter()
+    for _ in range(pages):
+        job = crawl_module.get_crawl_status(client, "job")
+        if touch_metadata:
+            for doc in job.data:
+                doc.metadata
+        parsed += len(job.data)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<20} {parsed / elapsed:>12,.0f} docs/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=100, help="documents per page")
+    parser.add_argument("--pages", type=int, default=200)
+    args = parser.parse_args()
+
+    client = _Client(_page(args.docs))
+    print(f"{args.pages} pages x {args.docs} documents")
+
+    from_api = Document.__dict__["from_api"]
+    Document.from_api = staticmethod(_eager)  # type: ignore[method-assign]
+    try:
+        _run("eager (before)", client, args.pages, touch_metadata=False)
+    finally:
+        Document.from_api = from_api  # type: ignore[method-assign]
+    _run("lazy", client, args.pages, touch_metadata=False)
+    _run("lazy + metadata", client, args.pages, touch_metadata=True)
+
+
+if __name__ == "__main__":
+    main()
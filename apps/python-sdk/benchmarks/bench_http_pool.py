@@ -0,0 +1,82 @@
+"""
+Benchmark: pooled ``HttpClient`` session vs. one-shot ``requests`` calls.
+
+Runs against a local stand-in server, so the numbers isolate client-side
+connection handling (TCP setup, socket churn) from real API latency.
+
+Usage:
+    python benchmarks/bench_http_pool.py [--requests 2000] [--threads 64]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.common import StandInServer, report  # noqa: E402
+from firecrawl.v2.utils.http_client import HttpClient  # noqa: E402
+
+STATUS = {"success": True, "status": "scraping", "completed": 3, "total": 10, "data": []}
+SCRAPE = {"success": True, "data": {"markdown": "# hello", "metadata": {"sourceURL": "https://example.com"}}}
+
+
+def _measure(call: Callable[[], None], count: int, threads: int) -> List[float]:
+    latencies: List[float] = []
+
+    def one(_):
+        start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+
+    if threads <= 1:
+        for i in range(count):
+            one(i)
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(one, range(count)))
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=64)
+    args = parser.parse_args()
+
+    routes = {
+        "/v2/crawl/": lambda m, p, b: (200, STATUS),
+        "/v2/scrape": lambda m, p, b: (200, SCRAPE),
+    }
+    with StandInServer(routes) as server:
+        headers = {"Authorization": "Bearer fc-bench", "Content-Type": "application/json"}
+        status_url = f"{server.url}/v2/crawl/job-1"
+        scrape_url = f"{server.url}/v2/scrape"
+
+        pooled = HttpClient("fc-bench", server.url, pool_maxsize=args.threads)
+
+        scenarios = [
+            ("poll  (unpooled, sequential)", lambda: requests.get(status_url, headers=headers), 1),
+            ("poll  (pooled, sequential)", lambda: pooled.get("/v2/crawl/job-1"), 1),
+            (f"scrape (unpooled, {args.threads} threads)",
+             lambda: requests.post(scrape_url, headers=headers, json={"url": "https://example.com"}), args.threads),
+            (f"scrape (pooled, {args.threads} threads)",
+             lambda: pooled.post("/v2/scrape", {"url": "https://example.com"}), args.threads),
+        ]
+
+        for label, call, threads in scenarios:
+            call()  # warm up
+            start = time.perf_counter()
+            latencies = _measure(call, args.requests, threads)
+            report(label, latencies, time.perf_counter() - start)
+
+        pooled.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Benchmark: JSON decode throughput for crawl status pages.
+
+Decodes crawl status pages with every installed codec (stdlib ``json``,
+orjson, msgspec) and with ``requests.Response.json()``, the path the SDK used
+before the codec layer. Pass recorded pages (raw response bodies saved from
+``GET /v2/crawl/{id}``) with ``--recorded``; without it, synthetic pages shaped
+like real ones (markdown, raw HTML, links, metadata) are generated.
+
+Usage:
+    python benchmarks/bench_json_decode.py [--recorded 'pages/*.json'] [--docs 100] [--seconds 2]
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from typing import Callable, List
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from firecrawl.v2.utils import json_codec  # noqa: E402
+
+
+def _synthetic_page(docs: int) -> bytes:
+    page = {
+        "success": True,
+        "status": "completed",
+        "completed": docs,
+        "total": docs,
+        "creditsUsed": docs,
+        "next": "https://api.firecrawl.dev/v2/crawl/job?skip=100",
+        "data": [
+            {
+                "markdown": "# Heading\n\n" + "Some paragraph text with **markup** and [links](https://x). " * 120,
+                "rawHtml": "<div class=\"content\"><p>Some paragraph text &amp; markup</p></div>\n" * 150,
+                "links": [f"https://example.com/{i}/{j}" for j in range(40)],
+                "metadata": {
+                    "title": f"Page {i} – example",
+                    "description": "An example page",
+                    "language": "en",
+                    "sourceURL": f"https://example.com/{i}",
+                    "url": f"https://example.com/{i}",
+                    "statusCode": 200,
+                    "contentType": "text/html; charset=utf-8",
+                    "scrapeId": f"0b8c{i:08d}",
+                    "cacheState": "miss",
+                    "creditsUsed": 1,
+                },
+            }
+            for i in range(docs)
+        ],
+    }
+    return json.dumps(page).encode()
+
+
+def _requests_json(body: bytes) -> Callable[[], object]:
+    def decode() -> object:
+        response = requests.Response()
+        response._content = body
+        response.encoding = None
+        return response.json()
+
+    return decode
+
+
+def _measure(decode: Callable[[], object], size: int, seconds: float) -> float:
+    decode()  # warm up
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        decode()
+        count += 1
+    return count * size / (time.perf_counter() - start) / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--recorded", help="glob of recorded crawl status response bodies")
+    parser.add_argument("--docs", type=int, default=100, help="documents per synthetic page")
+    parser.add_argument("--seconds", type=float, default=2.0, help="time spent per codec")
+    args = parser.parse_args()
+
+    if args.recorded:
+        pages: List[bytes] = []
+        for path in sorted(glob.glob(args.recorded)):
+            with open(path, "rb") as f:
+                pages.append(f.read())
+        if not pages:
+            parser.error(f"no files match {args.recorded!r}")
+    else:
+        pages = [_synthetic_page(args.docs)]
+    size = sum(len(p) for p in pages)
+    print(f"{len(pages)} page(s), {size / 1e6:.1f} MB per pass")
+
+    candidates = [("requests .json()", None)]
+    for name in json_codec.CODEC_NAMES:
+        try:
+            candidates.append((name, json_codec.load_codec(name)))
+        except ImportError:
+            print(f"{name:<18} not installed")
+
+    for label, codec in candidates:
+        if codec is None:
+            decoders = [_requests_json(p) for p in pages]
+        else:
+            decoders = [(lambda p=p, loads=codec.loads: loads(p)) for p in pages]
+
+        def decode_all() -> None:
+            for decode in decoders:
+                decode()
+
+        print(f"{label:<18} {_measure(decode_all, size, args.seconds):>8.0f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
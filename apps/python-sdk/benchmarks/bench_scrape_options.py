@@ -0,0 +1,85 @@
+"""
+Benchmark: cost of building scrape request bodies.
+
+Compares, per request, the path used before compiled options (run
+``prepare_scrape_options`` and encode the merged dict every time) with the
+automatic cache (fresh but identical ScrapeOptions each call, as
+``Firecrawl.scrape(**kwargs)`` builds them) and with options compiled once up
+front. The options include a JSON format with a pydantic schema class, whose
+JSON schema used to be regenerated on every call.
+
+Usage:
+    python benchmarks/bench_scrape_options.py [--seconds 2]
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable
+
+from pydantic import BaseModel
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from firecrawl.v2.types import ScrapeOptions  # noqa: E402
+from firecrawl.v2.utils import json_codec  # noqa: E402
+from firecrawl.v2.utils.validation import compile_scrape_options, prepare_scrape_options  # noqa: E402
+
+
+class Article(BaseModel):
+    title: str
+    author: str
+    published: str
+    tags: list
+    body: str
+
+
+def _options() -> ScrapeOptions:
+    return ScrapeOptions(
+        formats=["markdown", "links", {"type": "json", "prompt": "Extract the article", "schema": Article}],
+        headers={"User-Agent": "bench"},
+        include_tags=["article", "main"],
+        exclude_tags=["nav", "footer"],
+        wait_for=1000,
+        timeout=30000,
+    )
+
+
+def _measure(build: Callable[[int], bytes], seconds: float) -> float:
+    build(0)  # warm up
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        build(count)
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=2.0, help="time spent per variant")
+    args = parser.parse_args()
+
+    shared = _options()
+    compiled = compile_scrape_options(shared)
+
+    def uncached(i: int) -> bytes:
+        return json_codec.dumps({"url": f"https://example.com/{i}", **prepare_scrape_options(shared)})
+
+    def cached(i: int) -> bytes:
+        return compile_scrape_options(_options()).encode_request(f"https://example.com/{i}")
+
+    def precompiled(i: int) -> bytes:
+        return compiled.encode_request(f"https://example.com/{i}")
+
+    for label, build in (
+        ("prepare + encode", uncached),
+        ("cached, new options", cached),
+        ("precompiled", precompiled),
+    ):
+        print(f"{label:<22} {_measure(build, args.seconds):>10.0f} requests/s")
+
+
+if __name__ == "__main__":
+    main()
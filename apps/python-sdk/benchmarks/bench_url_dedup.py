@@ -0,0 +1,87 @@
+"""
+Benchmark: URL canonicalization and deduplication throughput.
+
+Builds a list of URLs where each page appears several times with tracking
+parameters, fragments, trailing slashes and host case changes, then reports
+URLs per second for ``UrlCanonicalizer`` against an equivalent
+``urllib.parse.urlsplit`` based canonicalizer, and the time, number removed
+and memory of ``dedupe_urls`` with an exact set and with a Bloom filter.
+
+Usage:
+    python benchmarks/bench_url_dedup.py [--urls 200000] [--pages 50000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from urllib.parse import urlsplit, urlunsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from firecrawl.v2.utils.url_dedup import UrlCanonicalizer, dedupe_urls  # noqa: E402
+
+
+def _urls(count: int, pages: int) -> list:
+    rng = random.Random(0)
+    urls = []
+    for _ in range(count):
+        page = rng.randrange(pages)
+        host = rng.choice(["example.com", "Example.com", "EXAMPLE.COM"])
+        url = f"https://{host}/articles/{page}"
+        if rng.random() < 0.3:
+            url += "/"
+        query = [f"id={page % 97}"]
+        if rng.random() < 0.5:
+            query.append(f"utm_source=feed{rng.randrange(10)}")
+        rng.shuffle(query)
+        url += "?" + "&".join(query)
+        if rng.random() < 0.2:
+            url += "#comments"
+        urls.append(url)
+    return urls
+
+
+def _urlsplit_canonical(url: str) -> str:
+    scheme, netloc, path, query, _ = urlsplit(url.strip())
+    params = sorted(p for p in query.split("&") if p and not p.lower().startswith("utm_"))
+    return urlunsplit((scheme.lower(), netloc.lower(), path.rstrip("/") or "/", "&".join(params), ""))
+
+
+def _rate(fn, urls) -> float:
+    start = time.perf_counter()
+    for url in urls:
+        fn(url)
+    return len(urls) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--urls", type=int, default=200_000)
+    parser.add_argument("--pages", type=int, default=50_000, help="distinct pages among the URLs")
+    args = parser.parse_args()
+
+    urls = _urls(args.urls, args.pages)
+    print(f"{len(urls)} URLs, {args.pages} distinct pages")
+    print(f"{'urlsplit canonicalizer':<24} {_rate(_urlsplit_canonical, urls):>12,.0f} URLs/s")
+    print(f"{'UrlCanonicalizer':<24} {_rate(UrlCanonicalizer(), urls):>12,.0f} URLs/s")
+
+    for method in ("exact", "bloom"):
+        start = time.perf_counter()
+        result = dedupe_urls(urls, method=method)
+        elapsed = time.perf_counter() - start
+        # Measured in a second run; tracing slows allocation-heavy code down
+        tracemalloc.start()
+        dedupe_urls(urls, method=method)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"dedupe {method:<17} {elapsed:>8.2f} s   removed {result.removed:>8}   "
+            f"peak {peak / 1024 / 1024:>6.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
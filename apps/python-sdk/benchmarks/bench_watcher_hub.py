@@ -0,0 +1,129 @@
+"""
+Benchmark: threads and memory per watched job, thread-per-watcher vs WatcherHub.
+
+A local WebSocket stand-in (its own process) accepts one connection per job,
+sends a status snapshot every ``--interval`` seconds and finishes the job
+after ``--duration`` seconds. With every watcher connected, the benchmark
+reports the process's thread count and resident memory growth per job for 1,
+100 and 1000 jobs (``--jobs``).
+
+Usage:
+    python benchmarks/bench_watcher_hub.py [--jobs 1 100 1000] [--duration 3]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import threading
+import time
+
+import websockets
+from websockets.asyncio.server import serve
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from firecrawl.v2.watcher import Watcher  # noqa: E402
+from firecrawl.v2.watcher_hub import WatcherHub  # noqa: E402
+
+
+class _HttpClient:
+    def __init__(self, api_url: str):
+        self.api_url = api_url
+        self.api_key = "fc-bench"
+
+
+class _Client:
+    def __init__(self, api_url: str):
+        self.http_client = _HttpClient(api_url)
+
+
+def _raise_fd_limit() -> None:
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def _serve(port_queue, duration: float, interval: float) -> None:
+    _raise_fd_limit()
+
+    async def job(websocket) -> None:
+        started = time.monotonic()
+        while time.monotonic() - started < duration:
+            await websocket.send(json.dumps({"data": {"status": "scraping", "completed": 1, "total": 2, "data": []}}))
+            await asyncio.sleep(interval)
+        await websocket.send(json.dumps({"type": "done", "data": {"status": "completed", "data": []}}))
+        await websocket.wait_closed()
+
+    async def main() -> None:
+        async with serve(job, "127.0.0.1", 0, backlog=4096) as server:
+            port_queue.put(server.sockets[0].getsockname()[1])
+            await asyncio.Future()
+
+    asyncio.run(main())
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Peak RSS in KiB on Linux; good enough where /proc is unavailable
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _run(url: str, jobs: int, duration: float, interval: float, use_hub: bool) -> None:
+    hub = WatcherHub() if use_hub else None
+    client = _Client(url)
+    threads_before = threading.active_count()
+    rss_before = _rss_bytes()
+
+    done = threading.Semaphore(0)
+    watchers = []
+    for i in range(jobs):
+        watcher = Watcher(client, f"job-{i}", poll_interval=int(interval * 10) or 1, hub=hub)
+        watcher.add_event_listener("done", lambda detail: done.release())
+        watcher.start()
+        watchers.append(watcher)
+
+    time.sleep(duration / 2)
+    threads = threading.active_count() - threads_before
+    rss = _rss_bytes() - rss_before
+    finished = sum(done.acquire(timeout=duration * 4) for _ in range(jobs))
+    for watcher in watchers:
+        watcher.stop()
+    if hub is not None:
+        hub.close()
+
+    label = "hub" if use_hub else "thread per watcher"
+    print(
+        f"{label:<20} {jobs:>5} jobs   {threads:>5} threads   "
+        f"{rss / jobs / 1024:>8.1f} KiB/job   {finished}/{jobs} finished"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--duration", type=float, default=3.0, help="seconds each job runs")
+    parser.add_argument("--interval", type=float, default=0.2, help="seconds between snapshots")
+    args = parser.parse_args()
+
+    _raise_fd_limit()
+    port_queue: "multiprocessing.Queue[int]" = multiprocessing.Queue()
+    server = multiprocessing.Process(target=_serve, args=(port_queue, args.duration, args.interval), daemon=True)
+    server.start()
+    url = f"http://127.0.0.1:{port_queue.get(timeout=10)}"
+    print(f"websockets {websockets.__version__}")
+    try:
+        for jobs in args.jobs:
+            for use_hub in (False, True):
+                _run(url, jobs, args.duration, args.interval, use_hub)
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Shared helpers for the SDK benchmarks: a local stand-in for the Firecrawl API
+and small timing utilities. Nothing here talks to the real API.
+"""
+
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# A route handler receives (method, path, body) and returns (status, payload).
+# ``payload`` may be a dict (JSON encoded) or raw bytes.
+Route = Callable[[str, str, bytes], Tuple[int, Any]]
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def get_request(self):
+        conn, addr = super().get_request()
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return conn, addr
+
+
+class StandInServer:
+    """Threaded HTTP/1.1 server with keep-alive, serving canned API responses."""
+
+    def __init__(self, routes: Dict[str, Route], default: Optional[Route] = None):
+        self.routes = routes
+        self.default = default or (lambda method, path, body: (200, {"success": True}))
+        self.bytes_sent = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _resolve(self, path: str) -> Route:
+        bare = path.split("?", 1)[0]
+        best = None
+        for prefix, route in self.routes.items():
+            if bare.startswith(prefix) and (best is None or len(prefix) > len(best[0])):
+                best = (prefix, route)
+        return best[1] if best else self.default
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):  # silence per-request logging
+                pass
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                status, payload = server._resolve(self.path)(self.command, self.path, body)
+                raw = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+                head = (
+                    f"HTTP/1.1 {status} OK\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(raw)}\r\n\r\n"
+                ).encode()
+                # One write per response avoids Nagle/delayed-ACK stalls on keep-alive sockets
+                self.wfile.write(head + raw)
+                with server._lock:
+                    server.bytes_sent += len(raw)
+                    server.requests += 1
+
+            do_GET = do_POST = do_DELETE = _handle
+
+        return Handler
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.bytes_sent = 0
+            self.requests = 0
+
+    def __enter__(self) -> "StandInServer":
+        self._server = _Server(("127.0.0.1", 0), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples`` (``pct`` in 0-100)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def report(label: str, latencies: List[float], elapsed: float) -> None:
+    """Print requests/sec and p50/p99 latency (milliseconds) for one run."""
+    rps = len(latencies) / elapsed if elapsed > 0 else 0.0
+    print(
+        f"{label:<34} {rps:>10.0f} req/s   "
+        f"p50 {percentile(latencies, 50) * 1000:>7.2f} ms   "
+        f"p99 {percentile(latencies, 99) * 1000:>7.2f} ms"
+    )
+
+
+def timed(fn: Callable[[], Any]) -> float:
+    """Run ``fn`` and return its wall-clock duration in seconds."""
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
@@ -8,6 +8,7 @@ import os
 
 from .client import Firecrawl, AsyncFirecrawl, FirecrawlApp, AsyncFirecrawlApp
 from .v2.watcher import Watcher
+from .v2.watcher_hub import WatcherHub
 from .v2.watcher_async import AsyncWatcher
 from .v1 import (
     V1FirecrawlApp,
@@ -78,6 +79,7 @@ __all__ = [
     'FirecrawlApp',
     'AsyncFirecrawlApp',
     'Watcher',
+    'WatcherHub',
     'AsyncWatcher',
     'V1FirecrawlApp',
     'AsyncV1FirecrawlApp',
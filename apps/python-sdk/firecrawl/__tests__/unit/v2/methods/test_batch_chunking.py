@@ -0,0 +1,203 @@
+"""
+Unit tests for chunked submission of large batch scrape URL lists.
+"""
+
+import threading
+import uuid
+
+import pytest
+import requests
+from unittest.mock import Mock
+
+from firecrawl.v2.methods.batch import start_batch_scrape
+from firecrawl.v2.methods.aio.batch import start_batch_scrape as start_batch_scrape_async
+from firecrawl.v2.utils.batch_chunking import chunk_idempotency_key, split_batch_urls
+from firecrawl.v2.utils.error_handler import BatchChunkError, FirecrawlError, InternalServerError
+
+KEY = "5f0c6a56-6a1e-4b7c-9a55-2f1f0b3e8d11"
+
+
+def _urls(n):
+    return [f"https://example.com/{i}" for i in range(n)]
+
+
+class FakeBatchServer:
+    """Records start requests; URLs ending in ``/bad`` are reported invalid."""
+
+    def __init__(self, fail_on=(), errors=None):
+        self.requests = []
+        self.fail_on = set(fail_on)
+        # First URL of a chunk -> exception its request raises
+        self.errors = dict(errors or {})
+        self._lock = threading.Lock()
+
+    def _respond(self, body, key):
+        with self._lock:
+            self.requests.append((body, key))
+        if body["urls"][0] in self.fail_on:
+            raise InternalServerError("chunk lost", 500)
+        if body["urls"][0] in self.errors:
+            raise self.errors[body["urls"][0]]
+        response = Mock()
+        response.ok = True
+        response.status_code = 200
+        response.json.return_value = {
+            "success": True,
+            "id": body.get("appendToId", "job-1"),
+            "url": "https://api.example.com/v2/batch/scrape/job-1",
+            "invalidURLs": [u for u in body["urls"] if u.endswith("/bad")],
+        }
+        return response
+
+    def _prepare_headers(self, idempotency_key=None):
+        return {"x-idempotency-key": idempotency_key} if idempotency_key else {}
+
+    def post(self, endpoint, data, headers=None, **kwargs):
+        return self._respond(dict(data), (headers or {}).get("x-idempotency-key"))
+
+
+class FakeAsyncBatchServer(FakeBatchServer):
+    async def post(self, endpoint, data, headers=None, **kwargs):
+        return self._respond(dict(data), (headers or {}).get("x-idempotency-key"))
+
+
+def test_split_batch_urls_bounds_count_and_bytes():
+    assert [len(c) for c in split_batch_urls(_urls(2500))] == [1000, 1000, 500]
+    long_urls = ["https://example.com/" + "x" * 100] * 10
+    chunks = split_batch_urls(long_urls, max_bytes=250)
+    assert [len(c) for c in chunks] == [2] * 5
+    assert split_batch_urls([]) == []
+
+
+def test_small_list_is_one_request():
+    server = FakeBatchServer()
+    start_batch_scrape(server, _urls(10), idempotency_key=KEY)
+    assert len(server.requests) == 1
+    body, key = server.requests[0]
+    assert key == KEY and "appendToId" not in body
+
+
+def test_large_list_is_chunked_and_appended():
+    server = FakeBatchServer()
+    urls = _urls(2500) + ["https://example.com/bad"]
+    response = start_batch_scrape(server, urls, idempotency_key=KEY, chunk_size=1000)
+
+    first, key = server.requests[0]
+    assert key == KEY and "appendToId" not in first and len(first["urls"]) == 1000
+    appended = server.requests[1:]
+    assert sorted(k for _, k in appended) == [chunk_idempotency_key(KEY, 1), chunk_idempotency_key(KEY, 2)]
+    assert all(body["appendToId"] == "job-1" for body, _ in appended)
+    assert sorted(u for body, _ in server.requests for u in body["urls"]) == sorted(urls)
+
+    assert response.id == "job-1"
+    assert response.invalid_urls == ["https://example.com/bad"]
+
+
+def test_chunks_get_idempotency_keys_without_caller_key():
+    server = FakeBatchServer()
+    start_batch_scrape(server, _urls(30), chunk_size=10)
+    keys = [k for _, k in server.requests]
+    assert all(keys) and len(set(keys)) == 3
+
+
+@pytest.mark.parametrize("key", [KEY, None])
+def test_every_sent_key_is_a_uuid(key):
+    server = FakeBatchServer()
+    start_batch_scrape(server, _urls(30), chunk_size=10, idempotency_key=key)
+    for _, sent in server.requests:
+        uuid.UUID(sent)
+    assert chunk_idempotency_key(KEY, 1) == chunk_idempotency_key(KEY, 1) != chunk_idempotency_key(KEY, 2)
+
+
+def test_non_uuid_key_is_rejected_before_anything_is_sent():
+    server = FakeBatchServer()
+    with pytest.raises(ValueError):
+        start_batch_scrape(server, _urls(30), chunk_size=10, idempotency_key="job-42")
+    assert server.requests == []
+
+
+def test_append_to_existing_job_sends_every_chunk_in_parallel():
+    server = FakeBatchServer()
+    response = start_batch_scrape(server, _urls(30), chunk_size=10, append_to_id="existing")
+    assert len(server.requests) == 3
+    assert all(body["appendToId"] == "existing" for body, _ in server.requests)
+    assert response.id == "existing" and response.invalid_urls is None
+
+
+def test_failed_chunk_reports_job_and_urls_to_resubmit():
+    urls = _urls(40)
+    server = FakeBatchServer(fail_on={urls[10], urls[30]})
+    with pytest.raises(BatchChunkError) as info:
+        start_batch_scrape(server, urls, chunk_size=10, idempotency_key=KEY)
+
+    error = info.value
+    assert error.job_id == "job-1" and error.failed_chunks == [1, 3]
+    assert error.failed_urls == urls[10:20] + urls[30:40]
+    assert error.status_code == 500 and isinstance(error.errors[1], InternalServerError)
+    # Every chunk was still attempted
+    assert len(server.requests) == 4
+
+    server.fail_on.clear()
+    response = start_batch_scrape(server, error.failed_urls, chunk_size=10, append_to_id=error.job_id)
+    assert response.id == "job-1"
+
+
+def test_chunks_that_may_have_been_queued_are_not_in_failed_urls():
+    urls = _urls(40)
+    server = FakeBatchServer(
+        fail_on={urls[30]},
+        errors={
+            urls[10]: requests.ReadTimeout("response lost"),
+            urls[20]: FirecrawlError("Idempotency key already used", 409),
+        },
+    )
+    with pytest.raises(BatchChunkError) as info:
+        start_batch_scrape(server, urls, chunk_size=10, idempotency_key=KEY)
+
+    error = info.value
+    assert error.failed_chunks == [3] and error.failed_urls == urls[30:]
+    assert error.unconfirmed_chunks == [1, 2] and error.unconfirmed_urls == urls[10:30]
+    assert sorted(error.errors) == [1, 2, 3]
+
+
+def test_failed_first_chunk_raises_its_own_error():
+    urls = _urls(20)
+    server = FakeBatchServer(fail_on={urls[0]})
+    with pytest.raises(InternalServerError):
+        start_batch_scrape(server, urls, chunk_size=10)
+    assert len(server.requests) == 1
+
+
+def test_invalid_url_fails_before_anything_is_sent():
+    server = FakeBatchServer()
+    with pytest.raises(ValueError):
+        start_batch_scrape(server, _urls(25) + ["ftp://example.com"], chunk_size=10)
+    assert server.requests == []
+
+
+@pytest.mark.asyncio
+async def test_async_large_list_is_chunked():
+    server = FakeAsyncBatchServer()
+    urls = _urls(25) + ["https://example.com/bad"]
+    response = await start_batch_scrape_async(server, urls, chunk_size=10, idempotency_key=KEY)
+
+    assert [k for _, k in server.requests][0] == KEY
+    assert sorted(k for _, k in server.requests[1:]) == sorted(
+        [chunk_idempotency_key(KEY, 1), chunk_idempotency_key(KEY, 2)]
+    )
+    assert sorted(u for body, _ in server.requests for u in body["urls"]) == sorted(urls)
+    assert response.id == "job-1"
+    assert response.invalid_urls == ["https://example.com/bad"]
+
+    with pytest.raises(ValueError):
+        await start_batch_scrape_async(server, urls, chunk_size=10, idempotency_key="key")
+
+
+@pytest.mark.asyncio
+async def test_async_failed_chunk_reports_job_and_urls_to_resubmit():
+    urls = _urls(30)
+    server = FakeAsyncBatchServer(fail_on={urls[20]})
+    with pytest.raises(BatchChunkError) as info:
+        await start_batch_scrape_async(server, urls, chunk_size=10)
+    assert info.value.job_id == "job-1" and info.value.failed_chunks == [2]
+    assert info.value.failed_urls == urls[20:]
@@ -0,0 +1,170 @@
+"""
+Unit tests for re-submitting failed batch scrape URLs (retry_failed).
+"""
+
+import types
+
+import pytest
+from unittest.mock import Mock
+
+from firecrawl.v2.methods import batch as batch_methods
+from firecrawl.v2.methods.batch import batch_scrape
+from firecrawl.v2.methods.aio.batch import batch_scrape as batch_scrape_async
+from firecrawl.v2.types import CrawlError
+from firecrawl.v2.utils.batch_retry import is_retryable_error
+from firecrawl.v2.utils.document_store import DocumentStore
+
+
+def _error(url, code=None, message="failed"):
+    return {"id": url, "url": url, "code": code, "error": message}
+
+
+def _response(body):
+    response = Mock()
+    response.ok = True
+    response.status_code = 200
+    response.json.return_value = body
+    return response
+
+
+class FakeBatchServer:
+    """
+    Each submitted job scrapes its URLs once; ``outcomes`` maps a URL to the
+    errors it produces on successive jobs (then it succeeds).
+    """
+
+    def __init__(self, outcomes, robots_blocked=()):
+        self.outcomes = {url: list(errors) for url, errors in outcomes.items()}
+        self.robots_blocked = list(robots_blocked)
+        self.jobs = {}
+        self.submitted = []
+
+    def _prepare_headers(self, idempotency_key=None):
+        return {}
+
+    def _submit(self, data):
+        job_id = f"job-{len(self.jobs)}"
+        self.submitted.append(list(data["urls"]))
+        docs, errors = [], []
+        for url in data["urls"]:
+            pending = self.outcomes.get(url)
+            if pending:
+                errors.append(pending.pop(0))
+            else:
+                docs.append({"markdown": url, "metadata": {"sourceURL": url}})
+        robots = self.robots_blocked if not self.jobs else []
+        self.jobs[job_id] = (docs, errors, robots)
+        return _response({"success": True, "id": job_id, "url": f"https://api/{job_id}"})
+
+    def _get(self, endpoint):
+        job_id = endpoint.split("/")[4].split("?")[0]
+        docs, errors, robots = self.jobs[job_id]
+        if endpoint.endswith("/errors"):
+            return _response({"errors": errors, "robotsBlocked": robots})
+        return _response({
+            "success": True, "status": "completed", "completed": len(docs),
+            "total": len(docs) + len(errors), "creditsUsed": len(docs), "data": docs,
+        })
+
+    def post(self, endpoint, data, headers=None, **kwargs):
+        return self._submit(data)
+
+    def get(self, endpoint, **kwargs):
+        return self._get(endpoint)
+
+
+class FakeAsyncBatchServer(FakeBatchServer):
+    async def post(self, endpoint, data, headers=None, **kwargs):
+        return self._submit(data)
+
+    async def get(self, endpoint, **kwargs):
+        return self._get(endpoint)
+
+
+OUTCOMES = {
+    "https://a.com/slow": [_error("https://a.com/slow", "SCRAPE_TIMEOUT")],
+    "https://a.com/flaky": [
+        _error("https://a.com/flaky", message="Server returned 503"),
+        _error("https://a.com/flaky", "SCRAPE_ALL_ENGINES_FAILED"),
+        _error("https://a.com/flaky", "SCRAPE_TIMEOUT"),
+    ],
+    "https://a.com/dns": [_error("https://a.com/dns", "SCRAPE_DNS_RESOLUTION_ERROR")],
+}
+URLS = ["https://a.com/ok", "https://a.com/slow", "https://a.com/flaky", "https://a.com/dns"]
+
+
+def test_error_classification():
+    assert is_retryable_error(CrawlError(**_error("u", "SCRAPE_TIMEOUT")))
+    assert is_retryable_error(CrawlError(**_error("u", message="Request timed out")))
+    assert is_retryable_error(CrawlError(**_error("u", message="upstream returned 502")))
+    assert not is_retryable_error(CrawlError(**_error("u", "SCRAPE_SSL_ERROR")))
+    assert not is_retryable_error(CrawlError(**_error("u", message="Unsupported file type")))
+
+
+def test_failed_urls_are_retried_and_merged():
+    server = FakeBatchServer(OUTCOMES, robots_blocked=["https://a.com/private"])
+    job = batch_scrape(server, URLS, retry_failed=2, retry_backoff=0)
+
+    assert server.submitted[1:] == [["https://a.com/slow", "https://a.com/flaky"], ["https://a.com/flaky"]]
+    assert sorted(d.markdown for d in job.data) == ["https://a.com/ok", "https://a.com/slow"]
+    assert job.credits_used == 2
+
+    report = job.retry_report
+    assert report.rounds == 2 and report.retry_job_ids == ["job-1", "job-2"]
+    assert report.recovered == ["https://a.com/slow"]
+    assert [(e.url, e.code) for e in report.failed] == [
+        ("https://a.com/dns", "SCRAPE_DNS_RESOLUTION_ERROR"),
+        ("https://a.com/flaky", "SCRAPE_TIMEOUT"),
+    ]
+    assert report.robots_blocked == ["https://a.com/private"]
+
+
+def test_no_retry_round_without_retryable_errors():
+    server = FakeBatchServer({"https://a.com/dns": OUTCOMES["https://a.com/dns"]})
+    job = batch_scrape(server, ["https://a.com/ok", "https://a.com/dns"], retry_failed=3, retry_backoff=0)
+    assert len(server.submitted) == 1
+    assert job.retry_report.rounds == 0 and len(job.retry_report.failed) == 1
+
+    assert batch_scrape(FakeBatchServer({}), ["https://a.com/ok"]).retry_report is None
+
+
+def test_retried_documents_go_to_document_store():
+    server = FakeBatchServer({"https://a.com/slow": OUTCOMES["https://a.com/slow"]})
+    with DocumentStore() as store:
+        job = batch_scrape(server, ["https://a.com/ok", "https://a.com/slow"], retry_failed=1,
+                           retry_backoff=0, document_store=store)
+        assert [d.markdown for d in job.data] == ["https://a.com/ok", "https://a.com/slow"]
+
+
+@pytest.mark.asyncio
+async def test_async_failed_urls_are_retried():
+    server = FakeAsyncBatchServer(OUTCOMES)
+    job = await batch_scrape_async(server, URLS, retry_failed=3, retry_backoff=0)
+
+    assert len(server.submitted) == 4
+    assert sorted(d.markdown for d in job.data) == ["https://a.com/flaky", "https://a.com/ok", "https://a.com/slow"]
+    assert job.retry_report.recovered == ["https://a.com/slow", "https://a.com/flaky"]
+    assert [e.url for e in job.retry_report.failed] == ["https://a.com/dns"]
+
+
+def test_retry_rounds_share_the_timeout(monkeypatch):
+    clock = types.SimpleNamespace(now=0.0)
+    monkeypatch.setattr(batch_methods, "time", types.SimpleNamespace(
+        monotonic=lambda: clock.now, sleep=lambda seconds: None,
+    ))
+    waiter = batch_methods.wait_for_batch_completion
+    timeouts = []
+
+    def slow_wait(client, job_id, poll_interval, timeout, **kwargs):
+        timeouts.append(timeout)
+        clock.now += 4
+        return waiter(client, job_id, poll_interval, None, **kwargs)
+
+    monkeypatch.setattr(batch_methods, "wait_for_batch_completion", slow_wait)
+    server = FakeBatchServer(OUTCOMES)
+    job = batch_scrape(server, URLS, timeout=10, retry_failed=3, retry_backoff=0)
+
+    # Each round only gets what is left of the overall timeout; none starts after it ran out
+    assert timeouts == [10, 6, 2]
+    assert job.retry_report.rounds == 2
+    assert [e.url for e in job.retry_report.failed] == ["https://a.com/dns", "https://a.com/flaky"]
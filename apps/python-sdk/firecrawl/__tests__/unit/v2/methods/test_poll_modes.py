@@ -0,0 +1,144 @@
+"""
+Unit tests for the poll modes used by the crawl/batch waiters.
+"""
+
+import pytest
+from unittest.mock import Mock
+from urllib.parse import urlparse, parse_qs
+
+from firecrawl.v2.methods.crawl import wait_for_crawl_completion
+from firecrawl.v2.methods.batch import wait_for_batch_completion
+
+
+class FakeJobServer:
+    """
+    Serves a job that gains one finished job per poll, paginated two at a time.
+
+    With ``api_next`` the ``next`` link behaves like the API's: it stays set
+    until every job was iterated over, even when nothing new has finished.
+    Jobs in ``no_document`` finish without leaving a document.
+    """
+
+    def __init__(self, base, finish_after, api_next=False, no_document=()):
+        self.base = base
+        self.finish_after = finish_after
+        self.api_next = api_next
+        self.no_document = set(no_document)
+        self.polls = 0
+        self.requests = []
+        self.documents_sent = 0
+
+    def get(self, url):
+        # Requests built by the SDK are relative; follow-up pages use absolute next links,
+        # and a waiter only repeats a request on its next poll
+        if not urlparse(url).netloc or self.requests[-1:] == [url]:
+            self.polls += 1
+        self.requests.append(url)
+        parsed = urlparse(url)
+        query = parse_qs(parsed.query)
+        skip = int(query.get("skip", ["0"])[0])
+        limit = int(query.get("limit", ["2"])[0])
+        available = min(self.polls, self.finish_after)
+        status = "completed" if self.polls >= self.finish_after else "scraping"
+        jobs = range(skip, min(available, skip + limit))
+        docs = [
+            {"markdown": f"doc {i}", "metadata": {"sourceURL": f"https://example.com/{i}"}}
+            for i in jobs
+            if i not in self.no_document
+        ]
+        self.documents_sent += len(docs)
+        position = skip + len(jobs)
+        if self.api_next:
+            more = position < self.finish_after and "limit" not in query
+        else:
+            more = position < available and "limit" not in query
+        response = Mock()
+        response.ok = True
+        response.json.return_value = {
+            "success": True,
+            "status": status,
+            "completed": available,
+            "total": self.finish_after,
+            "next": f"https://api.firecrawl.dev{self.base}?skip={position}" if more else None,
+            "data": docs,
+        }
+        return response
+
+
+def _client(server):
+    client = Mock()
+    client.get.side_effect = server.get
+    return client
+
+
+@pytest.mark.parametrize("poll_mode", ["status", "delta", "full"])
+def test_all_modes_return_every_document(poll_mode):
+    server = FakeJobServer("/v2/crawl/job", finish_after=5, api_next=poll_mode == "delta")
+    job = wait_for_crawl_completion(_client(server), "job", poll_interval=0, poll_mode=poll_mode)
+    assert job.status == "completed"
+    assert [d.markdown for d in job.data] == [f"doc {i}" for i in range(5)]
+    assert job.next is None
+
+
+def test_status_mode_transfers_fewer_documents_than_full():
+    full = FakeJobServer("/v2/crawl/job", finish_after=8)
+    wait_for_crawl_completion(_client(full), "job", poll_interval=0, poll_mode="full")
+    status = FakeJobServer("/v2/crawl/job", finish_after=8)
+    wait_for_crawl_completion(_client(status), "job", poll_interval=0, poll_mode="status")
+    delta = FakeJobServer("/v2/crawl/job", finish_after=8, api_next=True)
+    wait_for_crawl_completion(_client(delta), "job", poll_interval=0, poll_mode="delta")
+
+    assert status.documents_sent < full.documents_sent
+    # Delta mode downloads each document exactly once
+    assert delta.documents_sent == 8
+
+
+def test_full_mode_is_the_default():
+    server = FakeJobServer("/v2/batch/scrape/job", finish_after=3)
+    wait_for_batch_completion(_client(server), "job", poll_interval=0)
+    # Every poll re-fetches the results from the first page
+    polls = [url for url in server.requests if not urlparse(url).netloc]
+    assert polls == ["/v2/batch/scrape/job"] * 3
+
+
+def test_status_mode_polls_with_limit():
+    server = FakeJobServer("/v2/batch/scrape/job", finish_after=3)
+    wait_for_batch_completion(_client(server), "job", poll_interval=0, poll_mode="status")
+    assert server.requests[0] == "/v2/batch/scrape/job?limit=1"
+    # Full results are downloaded once, after the job reports completion
+    assert server.requests.count("/v2/batch/scrape/job") == 1
+    assert all(url.endswith("?limit=1") for url in server.requests[: server.requests.index("/v2/batch/scrape/job")])
+
+
+def test_delta_mode_follows_next_cursor():
+    server = FakeJobServer("/v2/batch/scrape/job", finish_after=3, api_next=True)
+    job = wait_for_batch_completion(_client(server), "job", poll_interval=0, poll_mode="delta")
+    assert [d.markdown for d in job.data] == ["doc 0", "doc 1", "doc 2"]
+    # A next link that does not advance ends the poll; the next poll resumes from it
+    assert server.requests == [
+        "/v2/batch/scrape/job?skip=0",
+        "https://api.firecrawl.dev/v2/batch/scrape/job?skip=1",
+        "https://api.firecrawl.dev/v2/batch/scrape/job?skip=1",
+        "https://api.firecrawl.dev/v2/batch/scrape/job?skip=2",
+        "https://api.firecrawl.dev/v2/batch/scrape/job?skip=2",
+    ]
+
+
+def test_delta_mode_offsets_count_jobs_without_documents():
+    server = FakeJobServer("/v2/crawl/job", finish_after=5, api_next=True, no_document={1})
+    job = wait_for_crawl_completion(_client(server), "job", poll_interval=0, poll_mode="delta")
+    assert [d.markdown for d in job.data] == ["doc 0", "doc 2", "doc 3", "doc 4"]
+    assert server.documents_sent == 4
+
+
+def test_delta_mode_resumes_at_total_without_next():
+    server = FakeJobServer("/v2/crawl/job", finish_after=3)
+    job = wait_for_crawl_completion(_client(server), "job", poll_interval=0, poll_mode="delta")
+    # Without a next link every job was iterated over, so polling resumes at ``total``
+    assert server.requests[1] == "/v2/crawl/job?skip=3"
+    assert [d.markdown for d in job.data] == ["doc 0"]
+
+
+def test_unknown_poll_mode_rejected():
+    with pytest.raises(ValueError):
+        wait_for_crawl_completion(Mock(), "job", poll_mode="sometimes")
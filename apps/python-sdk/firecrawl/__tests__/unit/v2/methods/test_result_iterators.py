@@ -0,0 +1,97 @@
+"""
+Unit tests for the streaming crawl/batch result iterators.
+"""
+
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from firecrawl.v2.types import CrawlJob, BatchScrapeJob, Document
+from firecrawl.v2.methods.crawl import iter_crawl_pages, iter_crawl_documents
+from firecrawl.v2.methods.batch import iter_batch_pages, iter_batch_documents
+from firecrawl.v2.methods.aio.crawl import iter_crawl_documents as iter_crawl_documents_async
+from firecrawl.v2.methods.aio.batch import iter_batch_pages as iter_batch_pages_async
+
+
+def _page(urls, next_url=None, status="completed"):
+    response = Mock()
+    response.ok = True
+    response.status_code = 200
+    response.json.return_value = {
+        "success": True,
+        "status": status,
+        "completed": 3,
+        "total": 3,
+        "creditsUsed": 3,
+        "next": next_url,
+        "data": [{"markdown": f"# {u}", "metadata": {"sourceURL": u}} for u in urls],
+    }
+    return response
+
+
+class TestSyncIterators:
+    def setup_method(self):
+        self.client = Mock()
+        self.client.get.side_effect = [
+            _page(["https://a"], "https://api.firecrawl.dev/v2/crawl/job?skip=1"),
+            _page(["https://b", "https://c"]),
+        ]
+
+    def test_crawl_pages_yield_one_page_at_a_time(self):
+        pages = iter_crawl_pages(self.client, "job")
+        first = next(pages)
+        assert isinstance(first, CrawlJob)
+        assert [d.metadata.source_url for d in first.data] == ["https://a"]
+        assert first.next == "https://api.firecrawl.dev/v2/crawl/job?skip=1"
+        assert self.client.get.call_count == 1
+
+        second = next(pages)
+        assert len(second.data) == 2
+        assert second.next is None
+        with pytest.raises(StopIteration):
+            next(pages)
+        assert [c.args[0] for c in self.client.get.call_args_list] == [
+            "/v2/crawl/job",
+            "https://api.firecrawl.dev/v2/crawl/job?skip=1",
+        ]
+
+    def test_crawl_documents_are_flattened(self):
+        docs = list(iter_crawl_documents(self.client, "job"))
+        assert all(isinstance(d, Document) for d in docs)
+        assert [d.markdown for d in docs] == ["# https://a", "# https://b", "# https://c"]
+
+    def test_resume_from_cursor(self):
+        self.client.get.side_effect = [_page(["https://b"])]
+        docs = list(iter_batch_documents(self.client, "job", cursor="https://api.firecrawl.dev/v2/batch/scrape/job?skip=1"))
+        assert len(docs) == 1
+        self.client.get.assert_called_once_with("https://api.firecrawl.dev/v2/batch/scrape/job?skip=1")
+
+    def test_batch_pages_start_at_status_endpoint(self):
+        pages = list(iter_batch_pages(self.client, "job"))
+        assert all(isinstance(p, BatchScrapeJob) for p in pages)
+        assert self.client.get.call_args_list[0].args[0] == "/v2/batch/scrape/job"
+
+    def test_page_error_is_raised(self):
+        failed = Mock()
+        failed.ok = True
+        failed.json.return_value = {"success": False, "error": "expired"}
+        self.client.get.side_effect = [failed]
+        with pytest.raises(Exception, match="expired"):
+            list(iter_crawl_documents(self.client, "job"))
+
+
+class TestAsyncIterators:
+    @pytest.mark.asyncio
+    async def test_crawl_documents_async(self):
+        client = AsyncMock()
+        client.get.side_effect = [_page(["https://a"], "next-1"), _page(["https://b"])]
+        docs = [d async for d in iter_crawl_documents_async(client, "job")]
+        assert [d.markdown for d in docs] == ["# https://a", "# https://b"]
+        assert [c.args[0] for c in client.get.call_args_list] == ["/v2/crawl/job", "next-1"]
+
+    @pytest.mark.asyncio
+    async def test_batch_pages_async_resume(self):
+        client = AsyncMock()
+        client.get.side_effect = [_page(["https://c"])]
+        pages = [p async for p in iter_batch_pages_async(client, "job", cursor="cursor-2")]
+        assert len(pages) == 1 and pages[0].next is None
+        client.get.assert_called_once_with("cursor-2")
@@ -0,0 +1,148 @@
+"""
+Unit tests for concurrent scrape_many on the sync and async paths.
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from firecrawl.v2.methods.scrape import scrape_many
+from firecrawl.v2.methods.aio.scrape import scrape_many as scrape_many_async
+from firecrawl.v2.types import ScrapeOptions
+from firecrawl.v2.utils.error_handler import FirecrawlError
+
+
+def _url_of(payload):
+    return payload["url"] if isinstance(payload, dict) else json.loads(payload)["url"]
+
+
+class FakeScrapeServer:
+    """Answers scrapes after ``delays[url]`` seconds; URLs containing "bad" fail with a 500."""
+
+    def __init__(self, delays=None):
+        self.delays = delays or {}
+        self.payloads = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled = 0
+        self._lock = threading.Lock()
+
+    def _enter(self, payload):
+        with self._lock:
+            self.payloads.append(payload)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _exit(self, url):
+        with self._lock:
+            self.in_flight -= 1
+        if "bad" in url:
+            raise FirecrawlError("Internal error", status_code=500)
+        response = Mock()
+        response.ok = True
+        response.status_code = 200
+        response.json.return_value = {"success": True, "data": {"markdown": url, "metadata": {"sourceURL": url}}}
+        return response
+
+    def post(self, endpoint, payload, **kwargs):
+        url = _url_of(payload)
+        self._enter(payload)
+        time.sleep(self.delays.get(url, 0.01))
+        return self._exit(url)
+
+
+class FakeAsyncScrapeServer(FakeScrapeServer):
+    async def post(self, endpoint, payload, **kwargs):
+        url = _url_of(payload)
+        self._enter(payload)
+        try:
+            await asyncio.sleep(self.delays.get(url, 0.01))
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return self._exit(url)
+
+
+URLS = [f"https://example.com/{i}" for i in range(20)]
+
+
+def test_results_come_back_in_completion_order_with_bounded_concurrency():
+    server = FakeScrapeServer({"https://example.com/0": 0.2})
+    results = list(scrape_many(server, URLS, ScrapeOptions(formats=["markdown"]), concurrency=4))
+
+    assert sorted(r.index for r in results) == list(range(20))
+    assert results[-1].url == "https://example.com/0"
+    assert all(r.ok and r.document.markdown == r.url for r in results)
+    assert server.max_in_flight <= 4
+    # Options were compiled once into the encoded request body
+    assert all(isinstance(p, bytes) for p in server.payloads)
+
+
+def test_errors_are_captured_per_url():
+    server = FakeScrapeServer()
+    results = {r.url: r for r in scrape_many(server, ["https://example.com/a", "https://example.com/bad", ""])}
+
+    assert results["https://example.com/a"].ok
+    bad = results["https://example.com/bad"]
+    assert not bad.ok and bad.status_code == 500 and isinstance(bad.exception, FirecrawlError)
+    assert "empty" in results[""].error
+
+
+def test_closing_the_iterator_stops_submitting():
+    server = FakeScrapeServer()
+    results = scrape_many(server, iter(URLS), concurrency=2)
+    next(results)
+    results.close()
+    time.sleep(0.05)
+    assert len(server.payloads) <= 4
+
+
+def test_stop_on_error():
+    server = FakeScrapeServer()
+    urls = ["https://example.com/bad"] + URLS
+    results = list(scrape_many(server, urls, concurrency=1, stop_on_error=True))
+    assert [r.ok for r in results] == [False]
+    assert len(server.payloads) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_scrape_many():
+    server = FakeAsyncScrapeServer({"https://example.com/0": 0.1})
+    urls = URLS + ["https://example.com/bad"]
+    results = [r async for r in scrape_many_async(server, urls, concurrency=5)]
+
+    assert len(results) == 21 and server.max_in_flight <= 5
+    assert results[-1].url == "https://example.com/0"
+    assert [r.url for r in results if not r.ok] == ["https://example.com/bad"]
+
+
+@pytest.mark.asyncio
+async def test_async_early_exit_cancels_in_flight():
+    server = FakeAsyncScrapeServer({url: 10 for url in URLS[1:]})
+    results = scrape_many_async(server, URLS, concurrency=3)
+    first = await results.__anext__()
+    await results.aclose()
+    assert first.url == URLS[0]
+    assert len(server.payloads) == 3
+    assert server.cancelled == 2
+
+
+def test_unified_clients_default_concurrency_to_pool_size(monkeypatch):
+    from firecrawl import AsyncFirecrawl, Firecrawl
+    from firecrawl.v2 import client as client_module, client_async as client_async_module
+
+    seen = {}
+    monkeypatch.setattr(client_module.scrape_module, "scrape_many", lambda *a, **kw: seen.update(sync=kw["concurrency"]))
+    monkeypatch.setattr(client_async_module.async_scrape, "scrape_many", lambda *a, **kw: seen.update(aio=kw["concurrency"]))
+
+    sync_client = Firecrawl(api_key="fc-key")
+    async_client = AsyncFirecrawl(api_key="fc-key")
+    sync_client.scrape_many(URLS)
+    async_client.scrape_many(URLS)
+
+    assert seen["sync"] == sync_client._v2_client.http_client.pool_maxsize
+    assert seen["aio"] == async_client._v2_client.async_http_client.limits.max_keepalive_connections == 20
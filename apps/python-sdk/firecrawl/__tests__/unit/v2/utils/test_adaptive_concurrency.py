@@ -0,0 +1,98 @@
+import asyncio
+
+import httpx
+import pytest
+
+from firecrawl.v2.utils.adaptive_concurrency import AdaptiveConcurrency
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+from firecrawl.v2.utils.retry import RetryPolicy
+
+
+def _fill(controller, n):
+    return [controller.acquire("POST", "/v2/scrape") for _ in range(n)]
+
+
+def test_invalid_bounds_rejected():
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(initial_limit=4, min_limit=8)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(decrease_factor=1.5)
+
+
+def test_additive_increase_under_load():
+    controller = AdaptiveConcurrency(initial_limit=4, max_limit=10)
+    for _ in range(20):
+        tokens = _fill(controller, controller.limit)
+        for token in tokens:
+            controller.release(token, status_code=200)
+    assert controller.limit > 4
+    assert controller.limit <= 10
+    assert [c.reason for c in controller.history()][0] == "initial"
+    assert all(c.reason == "increase" for c in controller.history()[1:])
+
+
+def test_no_increase_when_idle():
+    controller = AdaptiveConcurrency(initial_limit=8)
+    for _ in range(50):
+        (token,) = _fill(controller, 1)
+        controller.release(token, status_code=200)
+    assert controller.limit == 8
+
+
+def test_multiplicative_decrease_once_per_window():
+    controller = AdaptiveConcurrency(initial_limit=16)
+    tokens = _fill(controller, 8)
+    for token in tokens:
+        controller.release(token, status_code=429)
+    # All eight attempts started before the cut, so only one halving applies
+    assert controller.limit == 8
+
+    (token,) = _fill(controller, 1)
+    controller.release(token, error=TimeoutError("slow"))
+    assert controller.limit == 4
+    assert [c.reason for c in controller.history()[-2:]] == ["status 429", "TimeoutError"]
+
+
+def test_decrease_respects_min_limit():
+    controller = AdaptiveConcurrency(initial_limit=2, min_limit=2)
+    (token,) = _fill(controller, 1)
+    controller.release(token, status_code=503)
+    assert controller.limit == 2
+
+
+def test_client_errors_do_not_change_limit():
+    controller = AdaptiveConcurrency(initial_limit=4)
+    (token,) = _fill(controller, 1)
+    controller.release(token, status_code=404)
+    assert controller.limit == 4
+    assert controller.in_flight == 0
+
+
+def test_history_is_a_ring_buffer():
+    controller = AdaptiveConcurrency(initial_limit=64, history_size=3)
+    for _ in range(5):
+        (token,) = _fill(controller, 1)
+        controller.release(token, status_code=503)
+    assert len(controller.history()) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_transport_backs_off_on_429():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0)
+        return httpx.Response(429, json={"success": False})
+
+    controller = AdaptiveConcurrency(initial_limit=16)
+    client = AsyncHttpClient(
+        "fc-key",
+        "https://api.firecrawl.dev",
+        concurrency_controller=controller,
+        retry_policy=RetryPolicy(max_retries=0, budget=None),
+    )
+    client._client = httpx.AsyncClient(base_url="https://api.firecrawl.dev", transport=httpx.MockTransport(handler))
+
+    for _ in range(3):
+        await asyncio.gather(*(client.post("/v2/scrape", {"url": "https://example.com"}) for _ in range(4)))
+    assert controller.limit == 2
+    assert controller.in_flight == 0
+    await client.close()
@@ -0,0 +1,98 @@
+import json
+
+import pytest
+from pydantic import BaseModel
+from unittest.mock import Mock
+
+from firecrawl.v2.methods.scrape import _encode_scrape_request, scrape
+from firecrawl.v2.types import ScrapeOptions
+from firecrawl.v2.utils import json_codec
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.validation import CompiledScrapeOptions, compile_scrape_options, prepare_scrape_options
+
+
+class Product(BaseModel):
+    name: str
+    price: float
+
+
+def _options(**overrides):
+    values = dict(
+        formats=["markdown", {"type": "json", "prompt": "Extract", "schema": Product}],
+        headers={"User-Agent": "Test"},
+        only_main_content=False,
+        timeout=15000,
+    )
+    values.update(overrides)
+    return ScrapeOptions(**values)
+
+
+def test_equal_options_share_compiled_payload():
+    compiled = compile_scrape_options(_options())
+    assert compile_scrape_options(_options()) is compiled
+    assert compile_scrape_options(compiled) is compiled
+    assert compile_scrape_options(_options(timeout=20000)) is not compiled
+    one = compile_scrape_options(_options(formats=[{"type": "json", "schema": {"const": 1}}]))
+    true = compile_scrape_options(_options(formats=[{"type": "json", "schema": {"const": True}}]))
+    assert one is not true
+    assert json.loads(true.encoded)["formats"][0]["schema"]["const"] is True
+
+
+def test_payload_matches_prepare_scrape_options():
+    compiled = compile_scrape_options(_options())
+    assert compiled.payload == prepare_scrape_options(_options())
+    assert compiled.payload["formats"][1]["schema"]["properties"]["price"]["type"] == "number"
+    assert prepare_scrape_options(compiled) == compiled.payload
+
+
+def test_payload_copies_are_independent():
+    compiled = compile_scrape_options(_options())
+    compiled.payload["formats"].append("html")
+    assert compiled.payload["formats"][-1] != "html"
+
+
+def test_encoded_request_splices_url():
+    compiled = compile_scrape_options(_options())
+    body = json.loads(compiled.encode_request("https://example.com"))
+    assert body == {"url": "https://example.com", **compiled.payload}
+
+
+def test_extend_object():
+    assert json.loads(json_codec.extend_object(b"{}", {"a": 1})) == {"a": 1}
+    assert json.loads(json_codec.extend_object(b'{"a": 1} ', {"b": "é"})) == {"a": 1, "b": "é"}
+    assert json_codec.extend_object(b'{"a":1}', {}) == b'{"a":1}'
+
+
+def test_invalid_options_are_not_cached():
+    with pytest.raises(ValueError):
+        compile_scrape_options(ScrapeOptions(timeout=-1))
+    with pytest.raises(ValueError):
+        compile_scrape_options(ScrapeOptions(timeout=-1))
+
+
+def test_uncacheable_options_still_compile():
+    options = _options()
+    options.formats[1]["schema"] = {"type": "object", "marker": object()}
+    first = compile_scrape_options(options)
+    assert isinstance(first, CompiledScrapeOptions)
+    assert compile_scrape_options(options) is not first
+
+
+def test_scrape_sends_encoded_body():
+    client = HttpClient("fc-key", "https://api.firecrawl.dev")
+    response = Mock(status_code=200, ok=True, headers={})
+    response.json.return_value = {"success": True, "data": {"markdown": "# hi"}}
+    client.session.request = Mock(return_value=response)
+
+    document = scrape(client, " https://example.com ", _options())
+
+    sent = json.loads(client.session.request.call_args.kwargs["data"])
+    assert sent["url"] == "https://example.com"
+    assert sent["origin"].startswith("python-sdk@")
+    assert sent["timeout"] == 15000
+    assert document.markdown == "# hi"
+
+
+def test_empty_url_rejected():
+    with pytest.raises(ValueError):
+        _encode_scrape_request("  ", _options())
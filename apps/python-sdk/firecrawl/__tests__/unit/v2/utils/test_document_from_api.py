@@ -0,0 +1,77 @@
+import copy
+import pickle
+
+from firecrawl.v2.types import CrawlJob, Document, DocumentMetadata
+from firecrawl.v2.utils.normalize import normalize_document_input
+
+RAW = {
+    "markdown": "# hello",
+    "rawHtml": "<p>hello</p>",
+    "changeTracking": {"changeStatus": "same"},
+    "links": ["https://example.com/a"],
+    "unknownKey": "ignored",
+    "metadata": {
+        "title": "Hello",
+        "sourceURL": "https://example.com",
+        "statusCode": "200",
+        "ogTitle": ["a", "b"],
+        "cacheState": "miss",
+    },
+}
+
+
+def _lazy():
+    return Document.from_api(RAW)
+
+
+def test_matches_eager_construction():
+    eager = Document(**normalize_document_input(RAW))
+    assert _lazy() == eager
+    assert _lazy().model_dump() == eager.model_dump()
+    assert repr(_lazy()) == repr(eager)
+    assert dict(_lazy()) == dict(eager)
+
+
+def test_metadata_is_validated_on_first_access():
+    doc = _lazy()
+    assert "metadata" not in doc.__dict__
+    assert doc.raw_html == "<p>hello</p>"
+    assert doc.change_tracking == {"changeStatus": "same"}
+    metadata = doc.metadata
+    assert isinstance(metadata, DocumentMetadata)
+    assert metadata.source_url == "https://example.com"
+    assert metadata.status_code == 200
+    assert metadata.og_title == "a, b"
+    assert doc.metadata is metadata
+
+
+def test_invalid_metadata_falls_back_to_dict():
+    doc = Document.from_api({"markdown": "x", "metadata": {"proxyUsed": "unknown", "sourceURL": "u"}})
+    assert doc.metadata == {"proxy_used": "unknown", "source_url": "u"}
+    assert doc.metadata_dict["source_url"] == "u"
+
+
+def test_missing_metadata():
+    doc = Document.from_api({"markdown": "x"})
+    assert doc.metadata is None
+    assert doc.model_fields_set == {"markdown"}
+
+
+def test_nested_serialization_materializes_metadata():
+    job = CrawlJob(status="completed", completed=1, total=1, data=[_lazy()])
+    dumped = job.model_dump()
+    assert dumped["data"][0]["metadata"]["source_url"] == "https://example.com"
+    assert '"source_url":"https://example.com"' in job.model_dump_json()
+
+
+def test_copy_and_pickle_keep_metadata():
+    assert pickle.loads(pickle.dumps(_lazy())).metadata.title == "Hello"
+    assert copy.deepcopy(_lazy()).metadata.title == "Hello"
+    assert _lazy().model_copy().metadata.title == "Hello"
+
+
+def test_assignment_replaces_pending_metadata():
+    doc = _lazy()
+    doc.metadata = None
+    assert doc.metadata is None
+    assert doc.model_dump()["metadata"] is None
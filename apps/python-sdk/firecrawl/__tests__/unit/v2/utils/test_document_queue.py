@@ -0,0 +1,102 @@
+import asyncio
+import os
+import queue
+import threading
+
+import pytest
+
+from firecrawl.v2.types import Document
+from firecrawl.v2.utils.document_queue import DocumentQueue
+
+
+def _doc(i):
+    return Document.from_api({"markdown": str(i), "metadata": {"sourceURL": f"https://example.com/{i}"}})
+
+
+def _drain(q):
+    return [d.markdown for d in q]
+
+
+def test_fifo_and_close():
+    q = DocumentQueue(maxsize=4)
+    for i in range(3):
+        assert q.put(_doc(i))
+    q.close()
+    assert _drain(q) == ["0", "1", "2"]
+    with pytest.raises(queue.Empty):
+        q.get(timeout=0)
+
+
+def test_block_policy_waits_for_consumer():
+    q = DocumentQueue(maxsize=2)
+    assert q.put(_doc(0)) and q.put(_doc(1))
+    assert not q.put(_doc(2), timeout=0.01)
+
+    consumer = threading.Timer(0.05, q.get)
+    consumer.start()
+    assert q.put(_doc(2), timeout=2)
+    consumer.join()
+    q.close()
+    assert _drain(q) == ["1", "2"]
+
+
+def test_drop_oldest_policy():
+    q = DocumentQueue(maxsize=2, overflow="drop_oldest")
+    for i in range(5):
+        assert q.put(_doc(i), timeout=0)
+    q.close()
+    assert q.dropped == 3
+    assert _drain(q) == ["3", "4"]
+
+
+def test_spill_policy_keeps_order_and_removes_file():
+    q = DocumentQueue(maxsize=2, overflow="spill")
+    for i in range(7):
+        assert q.put(_doc(i), timeout=0)
+    assert len(q) == 7
+    path = q._spill.path
+
+    assert q.get().markdown == "0"
+    # Documents put while older ones are on disk queue up behind them
+    q.put(_doc(7), timeout=0)
+    q.close()
+    assert _drain(q) == [str(i) for i in range(1, 8)]
+    assert not os.path.exists(path)
+
+
+def test_put_after_close_is_discarded():
+    q = DocumentQueue(maxsize=1)
+    q.close()
+    assert q.put(_doc(0), timeout=0)
+    assert len(q) == 0
+
+
+@pytest.mark.asyncio
+async def test_put_async_waits_without_blocking_loop():
+    q = DocumentQueue(maxsize=1)
+    await q.put_async(_doc(0))
+    put = asyncio.ensure_future(q.put_async(_doc(1)))
+    await asyncio.sleep(0.01)
+    assert not put.done()
+
+    taken = await asyncio.to_thread(q.get)
+    await asyncio.wait_for(put, timeout=2)
+    assert taken.markdown == "0"
+    assert q.get(timeout=0).markdown == "1"
+
+
+@pytest.mark.asyncio
+async def test_close_releases_waiting_put():
+    q = DocumentQueue(maxsize=1)
+    await q.put_async(_doc(0))
+    put = asyncio.ensure_future(q.put_async(_doc(1)))
+    await asyncio.sleep(0.01)
+    q.close()
+    await asyncio.wait_for(put, timeout=2)
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        DocumentQueue(maxsize=0)
+    with pytest.raises(ValueError):
+        DocumentQueue(overflow="grow")
@@ -0,0 +1,118 @@
+from unittest.mock import Mock, AsyncMock
+
+import pytest
+
+from firecrawl.v2.types import Document, PaginationConfig
+from firecrawl.v2.methods.crawl import get_crawl_status, wait_for_crawl_completion
+from firecrawl.v2.methods.aio.batch import get_batch_scrape_status as get_batch_scrape_status_async
+from firecrawl.v2.utils.document_store import DocumentStore, StoredDocuments
+
+
+def _page(start, count, next_url=None, status="completed"):
+    response = Mock()
+    response.ok = True
+    response.status_code = 200
+    response.json.return_value = {
+        "success": True,
+        "status": status,
+        "completed": start + count,
+        "total": start + count,
+        "next": next_url,
+        "data": [
+            {"markdown": f"doc {i}", "rawHtml": "<p>" * 10, "metadata": {"sourceURL": f"https://example.com/{i}"}}
+            for i in range(start, start + count)
+        ],
+    }
+    return response
+
+
+@pytest.fixture
+def store(tmp_path):
+    with DocumentStore(str(tmp_path / "results.sqlite3"), cache_size=2) as s:
+        yield s
+
+
+def test_random_access_reads_single_records(store):
+    store.extend(Document(markdown=f"doc {i}", metadata={"source_url": f"https://example.com/{i}"}) for i in range(5))
+    docs = store.documents()
+    assert isinstance(docs, StoredDocuments)
+    assert len(docs) == 5
+    assert docs[3].markdown == "doc 3"
+    assert docs[-1].markdown == "doc 4"
+    assert [d.markdown for d in docs[1:3]] == ["doc 1", "doc 2"]
+    assert docs.get("https://example.com/2").markdown == "doc 2"
+    assert docs.get("https://example.com/missing") is None
+    with pytest.raises(IndexError):
+        docs[5]
+
+
+def test_cache_is_bounded(store):
+    store.extend({"markdown": str(i)} for i in range(10))
+    docs = store.documents()
+    for i in range(10):
+        docs[i]
+    assert list(docs._cache) == [8, 9]
+    assert [d.markdown for d in docs] == [str(i) for i in range(10)]
+
+
+def test_clear_invalidates_old_views(store):
+    store.append({"markdown": "old"})
+    old = store.documents()
+    store.clear()
+    store.append({"markdown": "new"})
+    assert store.documents()[0].markdown == "new"
+    with pytest.raises(RuntimeError):
+        old[0]
+
+
+def test_temporary_store_removes_file():
+    store = DocumentStore()
+    store.append({"markdown": "x"})
+    path = store.path
+    store.close()
+    import os
+    assert not os.path.exists(path)
+
+
+def test_crawl_status_spills_every_page(store):
+    client = Mock()
+    client.get.side_effect = [
+        _page(0, 2, "https://api.firecrawl.dev/v2/crawl/job?skip=2"),
+        _page(2, 2, "https://api.firecrawl.dev/v2/crawl/job?skip=4"),
+        _page(4, 1),
+    ]
+    job = get_crawl_status(client, "job", document_store=store)
+    assert isinstance(job.data, StoredDocuments)
+    assert len(job.data) == 5
+    assert job.data.get("https://example.com/3").raw_html == "<p>" * 10
+    assert len(store) == 5
+
+
+def test_pagination_limits_apply_to_store(store):
+    client = Mock()
+    client.get.side_effect = [
+        _page(0, 2, "https://api.firecrawl.dev/v2/crawl/job?skip=2"),
+        _page(2, 2, "https://api.firecrawl.dev/v2/crawl/job?skip=4"),
+    ]
+    job = get_crawl_status(client, "job", PaginationConfig(max_results=3), document_store=store)
+    assert [d.markdown for d in job.data] == ["doc 0", "doc 1", "doc 2"]
+
+
+def test_delta_waiter_appends_to_store(store):
+    client = Mock()
+    client.get.side_effect = [
+        _page(0, 2, status="scraping"),
+        _page(2, 1),
+    ]
+    job = wait_for_crawl_completion(client, "job", poll_interval=0, poll_mode="delta", document_store=store)
+    assert [d.markdown for d in job.data] == ["doc 0", "doc 1", "doc 2"]
+    assert client.get.call_args_list[1].args[0] == "/v2/crawl/job?skip=2"
+
+
+@pytest.mark.asyncio
+async def test_async_batch_status_spills(store):
+    client = AsyncMock()
+    client.get.side_effect = [_page(0, 2, "next-1"), _page(2, 2)]
+    job = await get_batch_scrape_status_async(client, "job", document_store=store)
+    assert len(job.data) == 4
+    assert job.data[2].metadata.source_url == "https://example.com/2"
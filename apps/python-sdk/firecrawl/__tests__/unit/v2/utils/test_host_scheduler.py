@@ -0,0 +1,106 @@
+"""
+Unit tests for per-host fair dispatch (HostScheduler, fair_order) and its use
+by scrape_many and batch chunking.
+"""
+
+import threading
+import time
+from collections import Counter
+
+import pytest
+from unittest.mock import Mock
+
+from firecrawl.v2.methods.batch import start_batch_scrape
+from firecrawl.v2.methods.scrape import scrape_many
+from firecrawl.v2.types import HostFairness
+from firecrawl.v2.utils.host_scheduler import HostScheduler, fair_order, host_of
+
+BIG = [f"https://big.com/{i}" for i in range(6)]
+SMALL = ["https://a.com/1", "https://b.com/1", "https://a.com/2"]
+
+
+def test_host_of():
+    assert host_of("https://User:pw@Example.COM:443/path?q#f") == "example.com"
+    assert host_of("http://example.com:8080") == "example.com:8080"
+    assert host_of("example.com/path") == ""
+
+
+def test_round_robin_interleaves_hosts():
+    assert fair_order(BIG + SMALL) == [
+        "https://big.com/0", "https://a.com/1", "https://b.com/1",
+        "https://big.com/1", "https://a.com/2",
+        "https://big.com/2", "https://big.com/3", "https://big.com/4", "https://big.com/5",
+    ]
+
+
+def test_weights_set_dispatch_shares():
+    urls = [f"https://big.com/{i}" for i in range(20)] + [f"https://small.com/{i}" for i in range(20)]
+    fairness = HostFairness(weights={"big.com": 3})
+    first = Counter(host_of(url) for url in fair_order(urls, fairness)[:16])
+    assert first == {"big.com": 12, "small.com": 4}
+
+    fairness = HostFairness(default_weight=0.5, weights={"big.com": 0.25})
+    first = Counter(host_of(url) for url in fair_order(urls, fairness)[:12])
+    assert first == {"big.com": 4, "small.com": 8}
+
+
+def test_per_host_cap_and_release():
+    scheduler = HostScheduler(HostFairness(max_in_flight_per_host=2))
+    scheduler.extend(BIG[:4] + ["https://a.com/1"])
+    taken = [scheduler.next() for _ in range(3)]
+    assert [url for _, url in taken] == ["https://big.com/0", "https://a.com/1", "https://big.com/1"]
+    assert taken[1][0] == 4
+    # big.com is at its cap and a.com has nothing queued
+    assert scheduler.next() is None and len(scheduler) == 2
+    scheduler.done("https://big.com/0")
+    assert scheduler.next() == (2, "https://big.com/2")
+
+
+def test_invalid_weights():
+    with pytest.raises(ValueError):
+        HostScheduler(HostFairness(weights={"a.com": 0}))
+
+
+class FakeScrapeServer:
+    def __init__(self):
+        self.in_flight = Counter()
+        self.max_in_flight = Counter()
+        self._lock = threading.Lock()
+
+    def post(self, endpoint, payload, **kwargs):
+        host = host_of(payload["url"])
+        with self._lock:
+            self.in_flight[host] += 1
+            self.max_in_flight[host] = max(self.max_in_flight[host], self.in_flight[host])
+        time.sleep(0.01)
+        with self._lock:
+            self.in_flight[host] -= 1
+        response = Mock()
+        response.ok = True
+        response.status_code = 200
+        response.json.return_value = {"success": True, "data": {"markdown": payload["url"]}}
+        return response
+
+
+def test_scrape_many_respects_per_host_cap():
+    server = FakeScrapeServer()
+    urls = [f"https://big.com/{i}" for i in range(12)] + [f"https://small.com/{i}" for i in range(4)]
+    fairness = HostFairness(max_in_flight_per_host=2)
+    results = list(scrape_many(server, urls, concurrency=8, fairness=fairness))
+
+    assert sorted(r.index for r in results) == list(range(16))
+    assert all(r.ok for r in results)
+    assert server.max_in_flight == {"big.com": 2, "small.com": 2}
+
+
+def test_batch_chunks_mix_hosts():
+    client = Mock()
+    client._prepare_headers.return_value = {}
+    client.post.return_value.ok = True
+    client.post.return_value.json.return_value = {"success": True, "id": "job-1", "url": "u"}
+
+    start_batch_scrape(client, BIG + SMALL, chunk_size=3, fairness=HostFairness())
+
+    chunks = [call.args[1]["urls"] for call in client.post.call_args_list]
+    assert chunks[0] == ["https://big.com/0", "https://a.com/1", "https://b.com/1"]
+    assert sorted(url for chunk in chunks for url in chunk) == sorted(BIG + SMALL)
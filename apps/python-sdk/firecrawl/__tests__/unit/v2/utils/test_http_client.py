@@ -0,0 +1,71 @@
+import threading
+from unittest.mock import Mock
+
+import requests
+
+from firecrawl.v2.utils.http_client import HttpClient
+
+
+def _ok_response():
+    response = Mock(spec=requests.Response)
+    response.status_code = 200
+    response.headers = {}
+    return response
+
+
+class TestHttpClientSession:
+    def test_session_is_created_lazily_and_reused(self, monkeypatch):
+        calls = []
+
+        def fake_request(self, method, url, **kwargs):
+            calls.append((id(self), method, url))
+            return _ok_response()
+
+        monkeypatch.setattr(requests.Session, "request", fake_request)
+        client = HttpClient("fc-key", "https://api.firecrawl.dev")
+        assert client._session is None
+
+        client.get("/v2/crawl/abc")
+        client.post("/v2/scrape", {"url": "https://example.com"})
+        client.delete("/v2/crawl/abc")
+
+        assert len({session_id for session_id, _, _ in calls}) == 1
+        assert [method for _, method, _ in calls] == ["GET", "POST", "DELETE"]
+        assert calls[0][2] == "https://api.firecrawl.dev/v2/crawl/abc"
+
+    def test_pool_settings_are_applied_to_adapters(self):
+        client = HttpClient("fc-key", "https://api.firecrawl.dev", pool_connections=4, pool_maxsize=32, pool_block=True)
+        for scheme in ("https://", "http://"):
+            adapter = client.session.get_adapter(f"{scheme}api.firecrawl.dev")
+            assert adapter._pool_connections == 4
+            assert adapter._pool_maxsize == 32
+            assert adapter._pool_block is True
+
+    def test_session_shared_across_threads(self):
+        client = HttpClient("fc-key", "https://api.firecrawl.dev")
+        seen = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            seen.append(client.session)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(s) for s in seen}) == 1
+
+    def test_close_releases_session(self):
+        client = HttpClient("fc-key", "https://api.firecrawl.dev")
+        first = client.session
+        client.close()
+        assert client._session is None
+        assert client.session is not first
+
+    def test_context_manager_closes(self):
+        with HttpClient("fc-key", "https://api.firecrawl.dev") as client:
+            _ = client.session
+        assert client._session is None
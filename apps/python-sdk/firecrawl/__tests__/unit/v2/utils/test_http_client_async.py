@@ -0,0 +1,105 @@
+import asyncio
+import importlib.util
+
+import httpx
+import pytest
+
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+
+
+def test_keepalive_enabled_by_default():
+    client = AsyncHttpClient("fc-key", "https://api.firecrawl.dev")
+    pool = client._client._transport._pool
+    assert pool._max_keepalive_connections == 20
+    assert pool._max_connections == 100
+    assert pool._keepalive_expiry == 5.0
+
+
+def test_pool_limits_are_configurable():
+    client = AsyncHttpClient(
+        "fc-key",
+        "https://api.firecrawl.dev",
+        max_connections=8,
+        max_keepalive_connections=4,
+        keepalive_expiry=30.0,
+    )
+    stats = client.pool_stats()
+    assert stats["max_connections"] == 8
+    assert stats["max_keepalive_connections"] == 4
+    assert stats["open"] == 0
+    assert stats["in_flight"] == 0
+    assert stats["http2"] is False
+
+
+@pytest.mark.skipif(importlib.util.find_spec("h2") is not None, reason="h2 is installed")
+def test_http2_without_h2_raises_helpful_error():
+    with pytest.raises(ImportError, match="firecrawl-py\\[http2\\]"):
+        AsyncHttpClient("fc-key", "https://api.firecrawl.dev", http2=True)
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_tracks_in_flight_requests():
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200, json={"success": True})
+
+    client = AsyncHttpClient("fc-key", "https://api.firecrawl.dev")
+    client._client = httpx.AsyncClient(base_url="https://api.firecrawl.dev", transport=httpx.MockTransport(handler))
+
+    tasks = [asyncio.create_task(client.get("/v2/crawl/abc")) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    assert client.pool_stats()["in_flight"] == 3
+
+    release.set()
+    responses = await asyncio.gather(*tasks)
+    assert all(r.status_code == 200 for r in responses)
+    assert client.pool_stats()["in_flight"] == 0
+    await client.close()
+
+
+@pytest.fixture
+def local_server():
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            body = b'{"success": true}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_counts_real_connections(local_server):
+    client = AsyncHttpClient("fc-key", local_server)
+    response = await client.get("/v2/team/credit-usage")
+    assert response.status_code == 200
+
+    stats = client.pool_stats()
+    assert stats["open"] == 1
+    assert stats["idle"] == 1 and stats["active"] == 0
+    await client.close()
+
+
+def test_pool_stats_with_custom_transport():
+    client = AsyncHttpClient("fc-key", "https://api.firecrawl.dev")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+    stats = client.pool_stats()
+    assert stats["open"] is None and stats["in_flight"] == 0
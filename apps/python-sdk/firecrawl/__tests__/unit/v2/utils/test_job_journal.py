@@ -0,0 +1,243 @@
+import json
+import logging
+import uuid
+
+import pytest
+from unittest.mock import Mock
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.methods import journal as journal_methods
+from firecrawl.v2.types import CrawlRequest, Document
+from firecrawl.v2.utils.job_journal import JobJournal, UnconfirmedSubmission
+
+BASE = "https://api.firecrawl.dev/v2/batch/scrape/job-1"
+KEY = "0b7d3c1e-2f4a-4e8b-9c6d-1a2b3c4d5e6f"
+
+
+def _response(body):
+    response = Mock()
+    response.ok = True
+    response.status_code = 200
+    response.json.return_value = body
+    return response
+
+
+class FakeJobServer:
+    """Serves a three-page batch job; ``fail_on`` makes one page request raise, like a dying worker."""
+
+    def __init__(self, status="completed", fail_on=None):
+        self.status = status
+        self.fail_on = fail_on
+        self.gets = []
+        self.posts = []
+        # Status code to reject start requests with, and a hook run as each one arrives
+        self.reject = None
+        self.on_post = None
+        # Accept start requests but send a body that does not decode
+        self.garble = False
+        self.pages = {
+            "/v2/batch/scrape/job-1": (["a", "b"], f"{BASE}?skip=2"),
+            f"{BASE}?skip=2": (["c"], f"{BASE}?skip=3"),
+            f"{BASE}?skip=3": (["d", "e"], None),
+        }
+
+    def _prepare_headers(self, idempotency_key=None):
+        return {"x-idempotency-key": idempotency_key} if idempotency_key else {}
+
+    def post(self, endpoint, data, headers=None, **kwargs):
+        self.posts.append((endpoint, (headers or {}).get("x-idempotency-key")))
+        if self.on_post:
+            self.on_post()
+        if self.reject:
+            response = _response({"success": False, "error": "rejected"})
+            response.ok = False
+            response.status_code = self.reject
+            return response
+        response = _response({"success": True, "id": "job-1", "url": BASE})
+        if self.garble:
+            response.json.side_effect = json.JSONDecodeError("truncated", '{"success": tr', 14)
+        return response
+
+    def get(self, url, **kwargs):
+        self.gets.append(url)
+        body = {"success": True, "status": self.status, "completed": 5, "total": 5}
+        if url.endswith("?limit=1"):
+            return _response(dict(body, data=[]))
+        if url == self.fail_on:
+            raise ConnectionError("worker killed")
+        names, next_url = self.pages[url]
+        data = [{"markdown": name, "metadata": {"sourceURL": f"https://example.com/{name}"}} for name in names]
+        return _response(dict(body, next=next_url, data=data))
+
+
+@pytest.fixture
+def journal(tmp_path):
+    with JobJournal(str(tmp_path / "jobs.sqlite3")) as journal:
+        yield journal
+
+
+def _markdown(job):
+    return [doc.markdown for doc in job.data]
+
+
+def test_pages_and_cursor_are_persisted(journal):
+    journal.record_job("batch", "job-1", urls=["https://example.com"], options={"formats": ["markdown"]})
+    journal.save_page("job-1", [Document(markdown="a"), Document(markdown="b")], "cursor-1", "scraping")
+
+    entry = journal.get("job-1")
+    assert (entry.documents, entry.next_cursor, entry.downloaded) == (2, "cursor-1", False)
+    assert [d.markdown for d in journal.documents("job-1")] == ["a", "b"]
+    assert [e.job_id for e in journal.jobs(pending=True)] == ["job-1"]
+
+    journal.mark_downloaded("job-1", "completed")
+    assert journal.jobs(pending=True) == []
+    assert journal.get("job-1").status == "completed"
+
+
+def test_journal_survives_reopening(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    with JobJournal(path) as journal:
+        journal.record_job("crawl", "crawl-1", urls=["https://example.com"], idempotency_key="item-7")
+        journal.save_page("crawl-1", [Document(markdown="x")], "cursor", "scraping")
+    with JobJournal(path) as journal:
+        entry = journal.find("crawl", "item-7")
+        assert entry.job_id == "crawl-1" and entry.next_cursor == "cursor"
+        assert [d.markdown for d in journal.documents("crawl-1")] == ["x"]
+
+
+def test_restarted_start_reattaches_instead_of_resubmitting(journal):
+    server = FakeJobServer()
+    urls = ["https://example.com/a", "https://example.com/b"]
+    first = journal_methods.start_batch_scrape(server, journal, urls, idempotency_key=KEY)
+    again = journal_methods.start_batch_scrape(server, journal, urls, idempotency_key=KEY)
+    assert first.id == again.id == "job-1"
+    assert server.posts == [("/v2/batch/scrape", KEY)]
+
+    with pytest.raises(ValueError):
+        journal_methods.start_batch_scrape(server, journal, urls, idempotency_key=KEY, max_concurrency=2)
+
+
+def test_generated_key_is_recorded(journal):
+    server = FakeJobServer()
+    journal_methods.start_crawl(server, journal, CrawlRequest(url="https://example.com"))
+    (_, key), = server.posts
+    uuid.UUID(key)
+    assert journal.get("job-1").idempotency_key == key
+
+
+def test_non_uuid_key_is_rejected(journal):
+    server = FakeJobServer()
+    with pytest.raises(ValueError):
+        journal_methods.start_batch_scrape(server, journal, ["https://example.com"], idempotency_key="item-1")
+    assert server.posts == [] and journal.jobs() == []
+
+
+def test_submission_is_journaled_before_the_request(journal):
+    server = FakeJobServer()
+    seen = []
+    server.on_post = lambda: seen.extend(journal.unconfirmed())
+    journal_methods.start_batch_scrape(server, journal, ["https://example.com/a"], idempotency_key=KEY)
+
+    (entry,) = seen
+    assert (entry.job_id, entry.status, entry.idempotency_key) == (None, "submitting", KEY)
+    assert entry.urls == ["https://example.com/a"]
+    assert journal.unconfirmed() == [] and journal.find("batch", KEY).job_id == "job-1"
+
+
+def test_crash_before_job_id_is_recorded(journal, caplog):
+    # The worker died after sending the start request but before recording the response
+    urls = ["https://example.com/a"]
+    journal.record_submission("batch", KEY, urls=urls, options={})
+    server = FakeJobServer()
+
+    with caplog.at_level(logging.WARNING, logger="firecrawl"):
+        assert journal_methods.resume(server, journal) == {}
+    assert KEY in caplog.text and server.posts == [] and server.gets == []
+
+    # The request had reached the server, which rejects the repeated key
+    server.reject = 409
+    with pytest.raises(UnconfirmedSubmission) as info:
+        journal_methods.start_batch_scrape(server, journal, urls, idempotency_key=KEY)
+    assert info.value.entry.idempotency_key == KEY
+    assert len(journal.unconfirmed()) == 1
+
+    # It never arrived: sending it again under the same key starts the job once
+    server.reject = None
+    response = journal_methods.start_batch_scrape(server, journal, urls, idempotency_key=KEY)
+    assert response.id == "job-1" and journal.unconfirmed() == []
+    assert server.posts == [("/v2/batch/scrape", KEY)] * 2
+
+
+def test_rejected_start_is_not_journaled(journal):
+    server = FakeJobServer()
+    server.reject = 400
+    with pytest.raises(Exception):
+        journal_methods.start_crawl(server, journal, CrawlRequest(url="https://example.com"), idempotency_key=KEY)
+    assert journal.jobs() == []
+
+    server.reject = 408
+    with pytest.raises(Exception):
+        journal_methods.start_crawl(server, journal, CrawlRequest(url="https://example.com"), idempotency_key=KEY)
+    assert [entry.idempotency_key for entry in journal.unconfirmed()] == [KEY]
+
+
+def test_resume_downloads_only_missing_pages(journal):
+    server = FakeJobServer(fail_on=f"{BASE}?skip=3")
+    journal_methods.start_batch_scrape(server, journal, ["https://example.com"], idempotency_key=KEY)
+    with pytest.raises(ConnectionError):
+        journal_methods.download_job(server, journal, "job-1")
+    entry = journal.get("job-1")
+    assert entry.documents == 3 and entry.next_cursor == f"{BASE}?skip=3"
+
+    server.fail_on = None
+    server.gets.clear()
+    jobs = journal_methods.resume(server, journal)
+    assert _markdown(jobs["job-1"]) == ["a", "b", "c", "d", "e"]
+    assert server.gets == ["/v2/batch/scrape/job-1?limit=1", f"{BASE}?skip=3"]
+    assert journal.jobs(pending=True) == []
+    assert journal_methods.resume(server, journal) == {}
+
+
+def test_resume_after_last_page_skips_persisted_documents(journal):
+    journal.record_job("batch", "job-1", urls=["https://example.com"])
+    journal.save_page("job-1", [Document(markdown=n) for n in "abc"], None, "completed")
+    server = FakeJobServer()
+    server.pages["/v2/batch/scrape/job-1?skip=3"] = (["d", "e"], None)
+
+    job = journal_methods.download_job(server, journal, "job-1")
+    assert _markdown(job) == ["a", "b", "c", "d", "e"]
+    assert server.gets[-1] == "/v2/batch/scrape/job-1?skip=3"
+
+
+def test_client_batch_scrape_uses_journal(journal):
+    client = FirecrawlClient(api_key="fc-key", journal=journal)
+    server = FakeJobServer()
+    client.http_client = server
+
+    job = client.batch_scrape(["https://example.com/a"], idempotency_key=KEY)
+    assert _markdown(job) == ["a", "b", "c", "d", "e"]
+    assert journal.get("job-1").downloaded
+    assert client.resume() == {}
+
+    with pytest.raises(ValueError):
+        FirecrawlClient(api_key="fc-key").resume()
+
+
+def test_invalid_request_is_not_journaled(journal):
+    server = FakeJobServer()
+    with pytest.raises(ValueError):
+        journal_methods.start_batch_scrape(server, journal, ["ftp://example.com"], idempotency_key=KEY)
+    with pytest.raises(ValueError):
+        journal_methods.start_crawl(server, journal, CrawlRequest(url="https://example.com", limit=-1))
+    assert server.posts == [] and journal.jobs() == []
+
+
+def test_undecodable_response_keeps_the_submission(journal):
+    server = FakeJobServer()
+    server.garble = True
+    with pytest.raises(ValueError):
+        journal_methods.start_batch_scrape(server, journal, ["https://example.com/a"], idempotency_key=KEY)
+    with pytest.raises(ValueError):
+        journal_methods.start_crawl(server, journal, CrawlRequest(url="https://example.com"))
+    # The server accepted both starts, so neither row may be dropped
+    assert [entry.kind for entry in journal.unconfirmed()] == ["batch", "crawl"]
@@ -0,0 +1,101 @@
+import json
+
+import httpx
+import pytest
+import requests
+from unittest.mock import Mock
+
+from firecrawl.v2.utils import json_codec
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+
+PAYLOAD = {"success": True, "data": [{"markdown": "héllo", "metadata": {"statusCode": 200}}], "next": None}
+
+
+@pytest.fixture(params=["json", "orjson", "msgspec"])
+def codec(request):
+    try:
+        json_codec.load_codec(request.param)
+    except ImportError:
+        pytest.skip(f"{request.param} is not installed")
+    previous = json_codec.get_codec()
+    yield json_codec.set_codec(request.param)
+    json_codec.set_codec(previous)
+
+
+def _requests_response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    return response
+
+
+def test_round_trip(codec):
+    encoded = json_codec.dumps(PAYLOAD)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == PAYLOAD
+    assert json_codec.loads(encoded) == PAYLOAD
+    assert json_codec.loads(encoded.decode()) == PAYLOAD
+
+
+def test_default_hook(codec):
+    class Opaque:
+        pass
+
+    assert json.loads(json_codec.dumps({"x": Opaque()}, default=lambda o: "opaque")) == {"x": "opaque"}
+
+
+def test_unknown_codec_rejected():
+    with pytest.raises(ValueError):
+        json_codec.set_codec("yaml")
+
+
+def test_bound_responses_decode_with_codec(codec):
+    body = json.dumps(PAYLOAD).encode()
+    for response in (_requests_response(body), httpx.Response(200, content=body)):
+        json_codec.bind_response(response)
+        assert response.json() == PAYLOAD
+
+
+def test_invalid_body_raises_library_error(codec):
+    response = json_codec.bind_response(_requests_response(b"<html>"))
+    with pytest.raises(requests.exceptions.JSONDecodeError):
+        response.json()
+
+
+def test_test_doubles_are_left_alone():
+    response = Mock()
+    response.json.return_value = {"ok": True}
+    assert json_codec.bind_response(response).json() == {"ok": True}
+
+
+def test_http_client_sends_encoded_body():
+    client = HttpClient("fc-key", "https://api.firecrawl.dev")
+    client.session.request = Mock(return_value=_requests_response(b'{"success": true}'))
+    response = client.post("/v2/scrape", {"url": "https://example.com"})
+    kwargs = client.session.request.call_args.kwargs
+    assert "json" not in kwargs
+    assert json.loads(kwargs["data"])["url"] == "https://example.com"
+    assert response.json() == {"success": True}
+
+
+@pytest.mark.asyncio
+async def test_async_client_sends_encoded_body():
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["body"] = json.loads(request.content)
+        seen["content_type"] = request.headers["content-type"]
+        return httpx.Response(200, json={"success": True})
+
+    client = AsyncHttpClient("fc-key", "https://api.firecrawl.dev")
+    client._client = httpx.AsyncClient(
+        base_url="https://api.firecrawl.dev",
+        headers={"Content-Type": "application/json"},
+        transport=httpx.MockTransport(handler),
+    )
+    response = await client.post("/v2/scrape", {"url": "https://example.com"})
+    assert seen["body"]["url"] == "https://example.com"
+    assert seen["content_type"] == "application/json"
+    assert response.json() == {"success": True}
+    await client.close()
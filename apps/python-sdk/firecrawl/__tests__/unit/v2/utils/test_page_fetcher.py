@@ -0,0 +1,107 @@
+import asyncio
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+from unittest.mock import Mock
+
+from firecrawl.v2.types import Document, PaginationConfig
+from firecrawl.v2.utils.page_fetcher import fetch_remaining_pages
+
+BASE = "https://api.firecrawl.dev/v2/crawl/job"
+
+
+class FakeJobClient:
+    """Serves ``total`` documents in pages of at most ``page_cap`` documents."""
+
+    def __init__(self, total, page_cap=10, honour_limit=True, fail_at=None, delay=0.01):
+        self.total = total
+        self.page_cap = page_cap
+        self.honour_limit = honour_limit
+        self.fail_at = fail_at
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def get(self, url):
+        query = dict(parse_qsl(urlsplit(url).query))
+        skip = int(query.get("skip", 0))
+        self.requests.append(skip)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        response = Mock()
+        if skip == self.fail_at:
+            response.status_code = 500
+            return response
+        end = min(self.total, skip + self.page_cap)
+        if self.honour_limit and "limit" in query:
+            end = min(end, skip + int(query["limit"]))
+        response.status_code = 200
+        response.json.return_value = {
+            "success": True,
+            "data": [{"markdown": str(i)} for i in range(skip, end)],
+            "next": f"{BASE}?skip={end}" if end < self.total else None,
+        }
+        return response
+
+
+async def _fetch(client, config=None, available=None, first=10):
+    documents = [Document.from_api({"markdown": str(i)}) for i in range(first)]
+    await fetch_remaining_pages(client, f"{BASE}?skip={first}", documents, config, available=available)
+    return [int(d.markdown) for d in documents]
+
+
+@pytest.mark.asyncio
+async def test_pages_are_fetched_concurrently_in_order():
+    client = FakeJobClient(95)
+    assert await _fetch(client, PaginationConfig(max_concurrent_pages=4), available=95) == list(range(95))
+    assert client.peak == 4
+    assert len(client.requests) == 9
+
+
+@pytest.mark.asyncio
+async def test_short_pages_are_completed():
+    # Ranges are planned for 10 documents but the server caps pages at 4
+    client = FakeJobClient(50, page_cap=4)
+    assert await _fetch(client, available=50) == list(range(50))
+
+
+@pytest.mark.asyncio
+async def test_server_ignoring_limit_does_not_duplicate():
+    client = FakeJobClient(60, page_cap=25, honour_limit=False)
+    assert await _fetch(client, available=60) == list(range(60))
+
+
+@pytest.mark.asyncio
+async def test_documents_beyond_counters_are_followed():
+    client = FakeJobClient(70)
+    assert await _fetch(client, available=40) == list(range(70))
+
+
+@pytest.mark.asyncio
+async def test_max_results():
+    client = FakeJobClient(100)
+    assert await _fetch(client, PaginationConfig(max_results=35), available=100) == list(range(35))
+    assert max(client.requests) < 40
+
+
+@pytest.mark.asyncio
+async def test_max_pages():
+    client = FakeJobClient(100)
+    assert await _fetch(client, PaginationConfig(max_pages=2), available=100) == list(range(30))
+    assert len(client.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_page_keeps_contiguous_prefix():
+    client = FakeJobClient(100, fail_at=40)
+    assert await _fetch(client, available=100) == list(range(40))
+
+
+@pytest.mark.asyncio
+async def test_sequential_without_counters():
+    client = FakeJobClient(45)
+    assert await _fetch(client, PaginationConfig(max_concurrent_pages=8)) == list(range(45))
+    assert client.peak == 1
@@ -0,0 +1,85 @@
+import copy
+import json
+
+import pytest
+import requests
+from unittest.mock import Mock
+
+from firecrawl.v2.types import Document
+from firecrawl.v2.utils import payload_decoder
+from firecrawl.v2.utils.payload_decoder import decode_job_page
+
+PAGE = {
+    "success": True,
+    "status": "scraping",
+    "completed": 2,
+    "total": 5,
+    "creditsUsed": 2,
+    "expiresAt": "2025-01-01T00:00:00Z",
+    "next": "https://api.firecrawl.dev/v2/crawl/job?skip=2",
+    "data": [
+        {
+            "markdown": "# a",
+            "rawHtml": "<p>a</p>",
+            "changeTracking": {"changeStatus": "new"},
+            "unknownKey": "ignored",
+            "metadata": {"sourceURL": "https://example.com/a", "statusCode": 200},
+        },
+        "not-a-document",
+        {"markdown": "# b"},
+    ],
+}
+
+
+def _requests_response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    return response
+
+
+def _mock_response(body):
+    response = Mock()
+    response.json.return_value = body
+    return response
+
+
+def test_documents_match_from_api():
+    body = decode_job_page(_mock_response(PAGE))
+    assert body["next"] == PAGE["next"]
+    assert body["creditsUsed"] == 2
+    assert body["data"] == [Document.from_api(PAGE["data"][0]), Document.from_api(PAGE["data"][2])]
+    assert body["data"][0].metadata.source_url == "https://example.com/a"
+
+
+def test_response_body_is_not_mutated():
+    original = copy.deepcopy(PAGE)
+    response = _mock_response(PAGE)
+    decode_job_page(response)
+    decode_job_page(response)
+    assert PAGE == original
+
+
+def test_missing_data():
+    body = decode_job_page(_mock_response({"success": False, "error": "nope"}))
+    assert body["data"] == []
+    assert body["error"] == "nope"
+
+
+def test_raw_responses_decode_like_test_doubles():
+    body = decode_job_page(_requests_response(json.dumps(PAGE).encode()))
+    expected = decode_job_page(_mock_response(PAGE))
+    assert body["data"] == expected["data"]
+    assert repr(body["data"]) == repr(expected["data"])
+    assert {k: v for k, v in body.items() if k != "data"} == {k: v for k, v in expected.items() if k != "data"}
+
+
+def test_typed_decoder_is_used_when_available():
+    pytest.importorskip("msgspec")
+    assert payload_decoder._page_decoder is not None
+    body = decode_job_page(_requests_response(json.dumps(PAGE).encode()))
+    assert [doc.model_dump() for doc in body["data"]] == [
+        Document.from_api(PAGE["data"][0]).model_dump(),
+        Document.from_api(PAGE["data"][2]).model_dump(),
+    ]
+    assert body["data"][1].model_fields_set == {"markdown"}
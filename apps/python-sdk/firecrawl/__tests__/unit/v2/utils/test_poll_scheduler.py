@@ -0,0 +1,115 @@
+from unittest.mock import Mock
+
+import pytest
+
+from firecrawl.v2.methods.crawl import wait_for_crawl_completion
+from firecrawl.v2.utils import poll_scheduler
+from firecrawl.v2.utils.poll_scheduler import PollLimitExceeded, PollScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(poll_scheduler.time, "monotonic", fake.monotonic)
+    return fake
+
+
+def test_interval_grows_without_progress_information():
+    scheduler = PollScheduler(2, growth=2, max_interval=10)
+    intervals = []
+    for _ in range(5):
+        scheduler.observe()
+        intervals.append(scheduler.next_interval())
+    assert intervals == [2, 4, 8, 10, 10]
+
+
+def test_interval_tightens_near_predicted_completion(clock):
+    scheduler = PollScheduler(2, min_interval=0.5, max_interval=60)
+    scheduler.observe(completed=0, total=100)
+    first = scheduler.next_interval()
+    clock.now += first
+    # 10 pages/second -> 80 remaining pages take ~8 seconds
+    scheduler.observe(completed=20, total=100)
+    assert scheduler.eta == pytest.approx(8.0)
+    for _ in range(4):
+        scheduler.next_interval()
+    clock.now += 7.8
+    scheduler.observe(completed=98, total=100)
+    assert scheduler.next_interval() == pytest.approx(0.5)
+
+
+def test_long_running_job_backs_off(clock):
+    scheduler = PollScheduler(2, max_interval=30)
+    scheduler.observe(completed=0, total=100000)
+    intervals = []
+    completed = 0
+    for _ in range(12):
+        interval = scheduler.next_interval()
+        intervals.append(interval)
+        clock.now += interval
+        completed += int(interval * 5)
+        scheduler.observe(completed=completed, total=100000)
+    assert intervals[-1] == 30
+    assert intervals == sorted(intervals)
+
+
+def test_max_polls():
+    scheduler = PollScheduler(1, max_polls=2)
+    scheduler.observe()
+    assert not scheduler.exhausted
+    scheduler.observe()
+    assert scheduler.exhausted
+
+
+def test_waiter_raises_when_poll_limit_reached(monkeypatch):
+    monkeypatch.setattr(poll_scheduler.time, "sleep", lambda _: None)
+    response = Mock()
+    response.ok = True
+    response.json.return_value = {"success": True, "status": "scraping", "completed": 1, "total": 10, "data": []}
+    client = Mock()
+    client.get.return_value = response
+
+    with pytest.raises(PollLimitExceeded):
+        wait_for_crawl_completion(client, "job", poll_interval=1, max_polls=3)
+    assert client.get.call_count == 3
+
+
+def test_interval_never_passes_the_deadline(clock):
+    scheduler = PollScheduler(2, growth=2, max_interval=30, timeout=10)
+    intervals = []
+    for _ in range(4):
+        scheduler.observe()
+        interval = scheduler.next_interval()
+        intervals.append(interval)
+        clock.now += interval
+    assert intervals == [2, 4, 4, 0]
+
+
+def test_waiter_honours_timeout_after_interval_grows(clock, monkeypatch):
+    def sleep(seconds):
+        clock.now += seconds
+
+    def get(*args, **kwargs):
+        # Each status request takes a little time
+        clock.now += 0.05
+        return response
+
+    monkeypatch.setattr(poll_scheduler.time, "sleep", sleep)
+    response = Mock()
+    response.ok = True
+    response.json.return_value = {"success": True, "status": "scraping", "data": []}
+    client = Mock()
+    client.get.side_effect = get
+
+    with pytest.raises(TimeoutError):
+        wait_for_crawl_completion(client, "job", poll_interval=2, timeout=30)
+    # Unclamped, the 15s interval reached by then would overshoot to ~42s
+    assert 30 < clock.now < 31
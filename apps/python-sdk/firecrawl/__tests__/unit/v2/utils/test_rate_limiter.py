@@ -0,0 +1,177 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import httpx
+import pytest
+import requests
+
+from firecrawl.v2.types import ConcurrencyCheck
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+from firecrawl.v2.utils.rate_limiter import FairSemaphore, RateLimiter, TokenBucket, classify_endpoint
+from firecrawl.v2.utils.retry import RetryPolicy
+
+
+def test_classify_endpoint():
+    assert classify_endpoint("POST", "/v2/scrape") == "scrape"
+    assert classify_endpoint("POST", "/v2/search") == "search"
+    assert classify_endpoint("POST", "/v2/crawl") == "crawl_start"
+    assert classify_endpoint("POST", "/v2/batch/scrape") == "crawl_start"
+    assert classify_endpoint("GET", "https://api.firecrawl.dev/v2/crawl/abc?skip=10") == "status"
+    assert classify_endpoint("DELETE", "/v2/crawl/abc") == "other"
+    assert classify_endpoint("POST", "/v2/map") == "other"
+
+
+def test_unknown_endpoint_class_rejected():
+    with pytest.raises(ValueError):
+        RateLimiter(rates={"scrapes": 1.0})
+
+
+def test_token_bucket_reservations_are_spaced():
+    bucket = TokenBucket(rate=10.0, burst=2)
+    delays = [bucket.reserve() for _ in range(4)]
+    assert delays[0] == 0.0 and delays[1] == 0.0
+    assert delays[2] == pytest.approx(0.1, abs=0.02)
+    assert delays[3] == pytest.approx(0.2, abs=0.02)
+
+
+def test_fair_semaphore_is_fifo_for_threads():
+    sem = FairSemaphore(1)
+    sem.acquire()
+    order = []
+    threads = []
+    for i in range(5):
+        def worker(i=i):
+            sem.acquire()
+            order.append(i)
+            sem.release()
+
+        t = threading.Thread(target=worker)
+        t.start()
+        threads.append(t)
+        while sem.waiting < i + 1:
+            time.sleep(0.001)
+
+    sem.release()
+    for t in threads:
+        t.join()
+    assert order == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_fair_semaphore_cancelled_waiter_does_not_leak_slot():
+    sem = FairSemaphore(1)
+    await sem.acquire_async()
+    waiter = asyncio.ensure_future(sem.acquire_async())
+    await asyncio.sleep(0)
+    assert sem.waiting == 1
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert sem.waiting == 0
+    sem.release()
+    assert sem.in_use == 0
+
+
+def test_limits_refresh_from_concurrency_check():
+    limiter = RateLimiter(max_concurrency=50, refresh_interval=60)
+    calls = []
+
+    def refresher():
+        calls.append(1)
+        return ConcurrencyCheck(concurrency=1, max_concurrency=4)
+
+    limiter.bind(sync_refresher=refresher)
+    with limiter.acquire("POST", "/v2/scrape"):
+        stats = limiter.stats()
+    assert stats["limit"] == 4
+    assert stats["in_flight"] == 1
+    assert stats["server_max_concurrency"] == 4
+
+    with limiter.acquire("POST", "/v2/scrape"):
+        pass
+    assert len(calls) == 1
+
+
+def test_refresh_failure_is_ignored():
+    limiter = RateLimiter(max_concurrency=3)
+
+    def refresher():
+        raise RuntimeError("boom")
+
+    limiter.bind(sync_refresher=refresher)
+    with limiter.acquire("POST", "/v2/scrape"):
+        pass
+    assert limiter.limit == 3
+
+
+def test_status_polls_do_not_take_concurrency_slots():
+    limiter = RateLimiter(max_concurrency=1, refresh_interval=None)
+    with limiter.acquire("POST", "/v2/scrape"):
+        with limiter.acquire("GET", "/v2/crawl/abc"):
+            assert limiter.stats()["in_flight"] == 1
+
+
+def test_http_client_caps_in_flight_requests(monkeypatch):
+    limiter = RateLimiter(max_concurrency=2, refresh_interval=None)
+    lock = threading.Lock()
+    current = [0]
+    peak = [0]
+
+    def fake_request(self, method, url, **kwargs):
+        with lock:
+            current[0] += 1
+            peak[0] = max(peak[0], current[0])
+        time.sleep(0.02)
+        with lock:
+            current[0] -= 1
+        response = Mock(spec=requests.Response)
+        response.status_code = 200
+        response.headers = {}
+        return response
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+    client = HttpClient("fc-key", "https://api.firecrawl.dev", rate_limiter=limiter)
+    threads = [
+        threading.Thread(target=client.post, args=("/v2/scrape", {"url": "https://example.com"}))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert peak[0] == 2
+    assert limiter.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_async_client_refreshes_and_caps_concurrency():
+    current = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal current, peak
+        if request.url.path == "/v2/concurrency-check":
+            return httpx.Response(200, json={"success": True, "data": {"concurrency": 0, "maxConcurrency": 3}})
+        current += 1
+        peak = max(peak, current)
+        await asyncio.sleep(0.01)
+        current -= 1
+        return httpx.Response(200, json={"success": True})
+
+    from firecrawl.v2.methods.aio import usage as async_usage
+
+    limiter = RateLimiter()
+    client = AsyncHttpClient(
+        "fc-key", "https://api.firecrawl.dev", rate_limiter=limiter, retry_policy=RetryPolicy(budget=None)
+    )
+    client._client = httpx.AsyncClient(base_url="https://api.firecrawl.dev", transport=httpx.MockTransport(handler))
+    limiter.bind(async_refresher=lambda: async_usage.get_concurrency(client))
+
+    await asyncio.gather(*(client.post("/v2/scrape", {"url": "https://example.com"}) for _ in range(10)))
+    assert limiter.limit == 3
+    assert peak == 3
+    await client.close()
@@ -0,0 +1,201 @@
+import time
+from email.utils import formatdate
+from unittest.mock import Mock
+
+import httpx
+import pytest
+import requests
+
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+from firecrawl.v2.utils.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+def _response(status_code, headers=None):
+    response = Mock(spec=requests.Response)
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+def _policy(**kwargs):
+    kwargs.setdefault("backoff_factor", 0)
+    kwargs.setdefault("budget", None)
+    return RetryPolicy(**kwargs)
+
+
+class TestParseRetryAfter:
+    def test_delta_seconds(self):
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(" 1.5 ") == 1.5
+
+    def test_http_date(self):
+        now = time.time()
+        value = formatdate(now + 10, usegmt=True)
+        assert 8.0 <= parse_retry_after(value, now=now) <= 10.0
+
+    def test_missing_or_malformed(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("") is None
+        assert parse_retry_after("soon") is None
+
+
+class TestRetryState:
+    def test_non_retryable_status_stops(self):
+        state = _policy().begin()
+        assert state.next_delay(status_code=400) is None
+        assert state.next_delay(status_code=200) is None
+
+    def test_max_retries_is_enforced(self):
+        state = _policy(max_retries=2).begin()
+        assert state.next_delay(status_code=503) == 0.0
+        assert state.next_delay(status_code=503) == 0.0
+        assert state.next_delay(status_code=503) is None
+
+    def test_retry_after_is_honored_and_capped(self):
+        state = _policy(max_retry_after=5).begin()
+        assert state.next_delay(status_code=429, headers={"Retry-After": "2"}) == 2.0
+        assert state.next_delay(status_code=429, headers={"Retry-After": "120"}) is None
+
+    def test_deadline_stops_long_waits(self):
+        state = _policy(backoff_factor=1.0, jitter=False).begin(deadline=0.5)
+        assert state.next_delay(status_code=503) is None
+
+    def test_attempt_timeout_clamped_to_deadline(self):
+        state = _policy().begin(deadline=2.0)
+        assert state.attempt_timeout(None) <= 2.0
+        assert state.attempt_timeout(30.0) <= 2.0
+        assert _policy().begin().attempt_timeout(30.0) == 30.0
+
+    def test_jittered_backoff_stays_within_bounds(self):
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=4.0, budget=None)
+        previous = 0.0
+        for attempt in range(10):
+            delay = policy.backoff(attempt, previous)
+            assert 0.5 <= delay <= 4.0
+            previous = delay
+
+    def test_budget_exhaustion_stops_retries(self):
+        budget = RetryBudget(ratio=0.0, min_per_second=0.0, max_tokens=1.0)
+        policy = _policy(budget=budget, max_retries=5)
+        state = policy.begin()
+        assert state.next_delay(status_code=503) == 0.0
+        assert state.next_delay(status_code=503) is None
+        assert budget.exhausted_count == 1
+
+
+class TestSyncRetries:
+    def test_retries_retryable_statuses_then_returns(self, monkeypatch):
+        responses = [_response(429, {"Retry-After": "0"}), _response(503), _response(200)]
+        monkeypatch.setattr(requests.Session, "request", lambda self, method, url, **kw: responses.pop(0))
+        client = HttpClient("fc-key", "https://api.firecrawl.dev", retry_policy=_policy())
+
+        assert client.get("/v2/crawl/abc").status_code == 200
+        assert responses == []
+
+    def test_returns_last_response_when_retries_run_out(self, monkeypatch):
+        calls = []
+
+        def fake_request(self, method, url, **kwargs):
+            calls.append(method)
+            return _response(502)
+
+        monkeypatch.setattr(requests.Session, "request", fake_request)
+        client = HttpClient("fc-key", "https://api.firecrawl.dev", retry_policy=_policy(max_retries=2))
+
+        assert client.post("/v2/scrape", {"url": "https://example.com"}).status_code == 502
+        assert len(calls) == 3
+
+    def test_legacy_retries_argument_means_total_attempts(self, monkeypatch):
+        calls = []
+
+        def fake_request(self, method, url, **kwargs):
+            calls.append(method)
+            return _response(503)
+
+        monkeypatch.setattr(requests.Session, "request", fake_request)
+        client = HttpClient("fc-key", "https://api.firecrawl.dev", retry_policy=_policy(max_retries=5))
+
+        client.get("/v2/crawl/abc", retries=2)
+        assert len(calls) == 2
+
+    def test_post_read_timeout_is_not_retried(self, monkeypatch):
+        calls = []
+
+        def fake_request(self, method, url, **kwargs):
+            calls.append(method)
+            raise requests.ReadTimeout("slow")
+
+        monkeypatch.setattr(requests.Session, "request", fake_request)
+        client = HttpClient("fc-key", "https://api.firecrawl.dev", retry_policy=_policy())
+
+        with pytest.raises(requests.ReadTimeout):
+            client.post("/v2/scrape", {"url": "https://example.com"})
+        assert calls == ["POST"]
+
+    def test_keyed_post_read_timeout_is_not_retried(self, monkeypatch):
+        # A retry would reuse the key, which the server rejects with 409 even
+        # if the first attempt created the job
+        calls = []
+
+        def fake_request(self, method, url, **kwargs):
+            calls.append(method)
+            raise requests.ReadTimeout("slow")
+
+        monkeypatch.setattr(requests.Session, "request", fake_request)
+        client = HttpClient("fc-key", "https://api.firecrawl.dev", retry_policy=_policy())
+
+        headers = client._prepare_headers("5f0c6a56-6a1e-4b7c-9a55-2f1f0b3e8d11")
+        with pytest.raises(requests.ReadTimeout):
+            client.post("/v2/batch/scrape", {"urls": []}, headers=headers)
+        assert calls == ["POST"]
+
+    def test_default_timeout_is_used(self, monkeypatch):
+        seen = {}
+
+        def fake_request(self, method, url, **kwargs):
+            seen.update(kwargs)
+            return _response(200)
+
+        monkeypatch.setattr(requests.Session, "request", fake_request)
+        client = HttpClient("fc-key", "https://api.firecrawl.dev", timeout=12.5)
+        client.get("/v2/crawl/abc")
+        assert seen["timeout"] == 12.5
+
+
+@pytest.mark.asyncio
+async def test_async_client_retries_and_honors_policy():
+    statuses = [503, 429, 200]
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(statuses.pop(0), headers={"Retry-After": "0"}, json={"success": True})
+
+    client = AsyncHttpClient("fc-key", "https://api.firecrawl.dev", retry_policy=_policy())
+    client._client = httpx.AsyncClient(base_url="https://api.firecrawl.dev", transport=httpx.MockTransport(handler))
+
+    response = await client.get("/v2/crawl/abc")
+    assert response.status_code == 200
+    assert calls == ["GET", "GET", "GET"]
+    assert client.pool_stats()["in_flight"] == 0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_connect_errors_are_retried():
+    attempts = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(1)
+        if len(attempts) < 2:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"success": True})
+
+    client = AsyncHttpClient("fc-key", "https://api.firecrawl.dev", retry_policy=_policy())
+    client._client = httpx.AsyncClient(base_url="https://api.firecrawl.dev", transport=httpx.MockTransport(handler))
+
+    response = await client.post("/v2/scrape", {"url": "https://example.com"})
+    assert response.status_code == 200
+    assert len(attempts) == 2
+    await client.close()
@@ -0,0 +1,187 @@
+"""
+Unit tests for the local scrape response cache (ScrapeCache) and cached scrape().
+"""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from firecrawl.v2.methods.scrape import scrape
+from firecrawl.v2.methods.aio.scrape import scrape as scrape_async
+from firecrawl.v2.types import ScrapeOptions
+from firecrawl.v2.utils.scrape_cache import ScrapeCache, scrape_cache_key
+
+
+class FakeScrapeServer:
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+
+    def _respond(self, payload):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("down")
+        response = Mock()
+        response.ok = True
+        response.status_code = 200
+        response.json.return_value = {
+            "success": True,
+            "data": {"markdown": f"v{self.calls}", "metadata": {"sourceURL": "https://example.com"}},
+        }
+        return response
+
+    def post(self, endpoint, payload, **kwargs):
+        return self._respond(payload)
+
+
+class FakeAsyncScrapeServer(FakeScrapeServer):
+    async def post(self, endpoint, payload, **kwargs):
+        return self._respond(payload)
+
+
+def test_key_ignores_option_order_but_not_values():
+    a = {"url": "https://example.com", "formats": ["markdown"], "onlyMainContent": True}
+    b = {"onlyMainContent": True, "formats": ["markdown"], "url": "https://example.com"}
+    assert scrape_cache_key(a) == scrape_cache_key(b)
+    assert scrape_cache_key(a) != scrape_cache_key({**a, "formats": ["html"]})
+
+
+def test_key_is_scoped_to_api_url_and_key():
+    payload = {"url": "https://example.com"}
+    cloud = scrape_cache_key(payload, api_url="https://api.firecrawl.dev", api_key="fc-a")
+    assert cloud == scrape_cache_key(payload, api_url="https://api.firecrawl.dev/", api_key="fc-a")
+    assert cloud != scrape_cache_key(payload, api_url="http://localhost:3002", api_key="fc-a")
+    assert cloud != scrape_cache_key(payload, api_url="https://api.firecrawl.dev", api_key="fc-b")
+
+
+def test_clients_of_other_deployments_do_not_share_entries(tmp_path):
+    path = str(tmp_path / "scrapes.sqlite3")
+    cloud, local = FakeScrapeServer(), FakeScrapeServer()
+    cloud.api_url, cloud.api_key = "https://api.firecrawl.dev", "fc-a"
+    local.api_url, local.api_key = "http://localhost:3002", "fc-a"
+    with ScrapeCache(path) as first, ScrapeCache(path) as second:
+        scrape(cloud, "https://example.com", cache=first)
+        scrape(local, "https://example.com", cache=second)
+        assert scrape(cloud, "https://example.com", cache=second).markdown == "v1"
+    assert (cloud.calls, local.calls) == (1, 1)
+
+
+def test_repeat_scrapes_are_served_from_memory():
+    server = FakeScrapeServer()
+    cache = ScrapeCache()
+    options = ScrapeOptions(formats=["markdown"])
+
+    first = scrape(server, "https://example.com", options, cache=cache)
+    again = scrape(server, " https://example.com ", ScrapeOptions(formats=["markdown"]), cache=cache)
+    other = scrape(server, "https://example.com", ScrapeOptions(formats=["html"]), cache=cache)
+
+    assert first.markdown == again.markdown == "v1" and other.markdown == "v2"
+    assert server.calls == 2
+    stats = cache.stats()
+    assert (stats.memory_hits, stats.misses, stats.memory_entries) == (1, 2, 2)
+    assert stats.bytes_served > 0 and stats.bytes_stored > stats.bytes_served
+
+
+def test_ttl_defaults_to_max_age_and_zero_bypasses():
+    cache = ScrapeCache()
+    assert cache.ttl_for({"url": "u"}) == 14400
+    assert cache.ttl_for({"url": "u", "maxAge": 60000}) == 60
+    assert ScrapeCache(ttl=5).ttl_for({"url": "u", "maxAge": 60000}) == 5
+
+    server = FakeScrapeServer()
+    for _ in range(2):
+        scrape(server, "https://example.com", ScrapeOptions(max_age=0), cache=cache)
+    assert server.calls == 2 and cache.stats().misses == 0
+
+
+def test_disk_tier_survives_reopen(tmp_path):
+    path = str(tmp_path / "cache" / "scrapes.sqlite3")
+    server = FakeScrapeServer()
+    with ScrapeCache(path) as cache:
+        scrape(server, "https://example.com", cache=cache)
+    with ScrapeCache(path) as cache:
+        assert scrape(server, "https://example.com", cache=cache).markdown == "v1"
+        assert scrape(server, "https://example.com", cache=cache).markdown == "v1"
+        stats = cache.stats()
+    assert server.calls == 1
+    assert (stats.disk_hits, stats.memory_hits) == (1, 1)
+
+
+def test_dead_disk_rows_are_not_promoted(tmp_path):
+    path = str(tmp_path / "scrapes.sqlite3")
+    with ScrapeCache(path) as writer:
+        writer.put("dead", "u", b"x" * 10, ttl=0.01)
+    time.sleep(0.02)
+    with ScrapeCache(path, max_entries=1) as cache:
+        cache.put("live", "u", b"y" * 10, ttl=60)
+        assert cache.get("dead") is None
+        stats = cache.stats()
+        assert (stats.memory_entries, stats.evictions) == (1, 0)
+        assert cache.get("live") == (b"y" * 10, True) and cache.stats().memory_hits == 1
+
+
+def test_memory_tier_is_bounded():
+    cache = ScrapeCache(max_entries=2)
+    for i in range(3):
+        cache.put(str(i), "u", b"x" * 10, ttl=60)
+    stats = cache.stats()
+    assert (stats.memory_entries, stats.memory_bytes, stats.evictions) == (2, 20, 1)
+    assert cache.get("0") is None
+
+    cache = ScrapeCache(max_memory_bytes=25)
+    for i in range(3):
+        cache.put(str(i), "u", b"x" * 10, ttl=60)
+    assert cache.stats().memory_bytes == 20
+
+
+def _wait_for(predicate):
+    deadline = time.time() + 2
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_stale_while_revalidate():
+    server = FakeScrapeServer()
+    cache = ScrapeCache(ttl=0.05, stale_while_revalidate=60)
+    scrape(server, "https://example.com", cache=cache)
+    time.sleep(0.06)
+
+    # Expired: the stale copy is returned at once and one refresh runs
+    assert scrape(server, "https://example.com", cache=cache).markdown == "v1"
+    _wait_for(lambda: server.calls == 2)
+    _wait_for(lambda: cache.get(scrape_cache_key({"url": "https://example.com"}))[1])
+    assert scrape(server, "https://example.com", cache=cache).markdown == "v2"
+    stats = cache.stats()
+    assert stats.stale_hits == 1 and stats.revalidations == 1
+
+    # A failed refresh keeps serving the stale entry
+    server.fail = True
+    time.sleep(0.06)
+    assert scrape(server, "https://example.com", cache=cache).markdown == "v2"
+    _wait_for(lambda: server.calls == 3)
+    assert scrape(server, "https://example.com", cache=cache).markdown == "v2"
+
+
+def test_expired_entry_without_swr_is_a_miss():
+    server = FakeScrapeServer()
+    cache = ScrapeCache(ttl=0.01)
+    scrape(server, "https://example.com", cache=cache)
+    time.sleep(0.02)
+    assert scrape(server, "https://example.com", cache=cache).markdown == "v2"
+
+
+@pytest.mark.asyncio
+async def test_async_scrape_uses_cache():
+    server = FakeAsyncScrapeServer()
+    cache = ScrapeCache(ttl=0.05, stale_while_revalidate=60)
+    await scrape_async(server, "https://example.com", cache=cache)
+    assert (await scrape_async(server, "https://example.com", cache=cache)).markdown == "v1"
+    assert server.calls == 1
+
+    await asyncio.sleep(0.06)
+    assert (await scrape_async(server, "https://example.com", cache=cache)).markdown == "v1"
+    await asyncio.sleep(0.01)
+    assert server.calls == 2
+    assert (await scrape_async(server, "https://example.com", cache=cache)).markdown == "v2"
@@ -0,0 +1,97 @@
+import pytest
+from unittest.mock import Mock
+
+from firecrawl.v2.methods.batch import start_batch_scrape
+from firecrawl.v2.methods.extract import _prepare_extract_request
+from firecrawl.v2.types import UrlCanonicalization
+from firecrawl.v2.utils.url_dedup import BloomFilter, UrlCanonicalizer, canonicalize_url, dedupe_urls
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("HTTPS://Example.COM/a", "https://example.com/a"),
+        ("https://example.com", "https://example.com/"),
+        ("https://example.com:443/a/", "https://example.com/a"),
+        ("http://example.com:8080/a", "http://example.com:8080/a"),
+        ("https://example.com/a#section", "https://example.com/a"),
+        ("https://example.com/a?utm_source=x&b=2&UTM_Medium=y&a=1", "https://example.com/a?a=1&b=2"),
+        ("https://example.com/?gclid=abc", "https://example.com/"),
+        ("https://User@Example.com/a", "https://User@example.com/a"),
+        ("  https://example.com/a  ", "https://example.com/a"),
+        ("mailto:someone@example.com", "mailto:someone@example.com"),
+    ],
+)
+def test_canonicalize_default_rules(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+def test_custom_rules():
+    keep_everything = UrlCanonicalization(
+        drop_fragment=False, strip_trailing_slash=False, sort_query=False, strip_query_params=[]
+    )
+    url = "https://example.com/a/?b=2&utm_source=x#top"
+    assert canonicalize_url(url, keep_everything) == url
+
+    ignore_query = UrlCanonicalization(ignore_query_parameters=True)
+    assert canonicalize_url("https://example.com/a?page=2", ignore_query) == "https://example.com/a"
+
+    session = UrlCanonicalizer(UrlCanonicalization(strip_query_params=["session*"]))
+    assert session("https://example.com/?sessionid=1&q=x") == "https://example.com/?q=x"
+
+
+def test_dedupe_keeps_first_occurrence_in_order():
+    urls = [
+        "https://example.com/a?utm_source=news",
+        "https://example.com/b",
+        "https://EXAMPLE.com/a",
+        "https://example.com/b/#comments",
+        "https://example.com/c",
+    ]
+    result = dedupe_urls(urls)
+    assert result.urls == ["https://example.com/a?utm_source=news", "https://example.com/b", "https://example.com/c"]
+    assert result.removed == 2
+
+
+def test_bloom_dedupe_matches_exact_on_small_lists():
+    urls = [f"https://example.com/{i % 500}?utm_campaign={i}" for i in range(2000)]
+    exact = dedupe_urls(urls, method="exact")
+    bloom = dedupe_urls(urls, method="bloom", error_rate=1e-6)
+    assert bloom.urls == exact.urls
+    assert bloom.removed == exact.removed == 1500
+
+
+def test_bloom_filter_false_positive_rate():
+    bloom = BloomFilter(10_000, error_rate=0.01)
+    for i in range(10_000):
+        bloom.add(f"seen-{i}")
+    assert all(f"seen-{i}" in bloom for i in range(10_000))
+    false_positives = sum(f"new-{i}" in bloom for i in range(10_000))
+    assert false_positives < 300
+
+
+def test_unknown_method_rejected():
+    with pytest.raises(ValueError):
+        dedupe_urls(["https://example.com"], method="fuzzy")
+
+
+def test_batch_scrape_dedupe_reports_removed():
+    client = Mock()
+    client._prepare_headers.return_value = {}
+    client.post.return_value.ok = True
+    client.post.return_value.json.return_value = {"success": True, "id": "job", "url": "https://api/job"}
+
+    urls = ["https://example.com/a", "https://example.com/a/", "https://example.com/b#x", "https://example.com/b"]
+    response = start_batch_scrape(client, urls, dedupe=True)
+
+    sent = client.post.call_args[0][1]
+    assert sent["urls"] == ["https://example.com/a", "https://example.com/b#x"]
+    assert response.duplicate_urls_removed == 2
+
+    start_batch_scrape(client, urls)
+    assert client.post.call_args[0][1]["urls"] == urls
+
+
+def test_extract_dedupe():
+    body = _prepare_extract_request(["https://example.com/?utm_source=a", "https://example.com"], dedupe=True)
+    assert body["urls"] == ["https://example.com/?utm_source=a"]
@@ -0,0 +1,127 @@
+import asyncio
+import json
+import threading
+
+import pytest
+import websockets
+
+from firecrawl.v2.watcher import Watcher
+
+
+class DummyHttpClient:
+    api_url = "http://localhost"
+    api_key = "TEST"
+
+
+class DummyClient:
+    def __init__(self):
+        self.http_client = DummyHttpClient()
+
+
+class ScriptedWebSocket:
+    def __init__(self, messages):
+        self._messages = list(messages)
+        self.sent = 0
+
+    async def recv(self):
+        await asyncio.sleep(0)
+        if not self._messages:
+            await asyncio.sleep(3600)
+        self.sent += 1
+        return json.dumps(self._messages.pop(0))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def _messages(docs):
+    messages = [
+        {"type": "document", "data": {"markdown": str(i), "metadata": {"sourceURL": f"https://example.com/{i}"}}}
+        for i in range(docs)
+    ]
+    messages.append({"type": "done", "data": {"status": "completed", "data": []}})
+    return messages
+
+
+def test_documents_iterator_yields_each_document(monkeypatch):
+    monkeypatch.setattr(websockets, "connect", lambda uri, **kwargs: ScriptedWebSocket(_messages(20)))
+    watcher = Watcher(DummyClient(), job_id="jid", queue_size=4)
+    documents = watcher.documents()
+    watcher.start()
+
+    assert [doc.markdown for doc in documents] == [str(i) for i in range(20)]
+    assert watcher.wait(timeout=5)
+    assert len(watcher.data) == 20
+
+
+def test_block_policy_stops_reading_socket(monkeypatch):
+    ws = ScriptedWebSocket(_messages(20))
+    monkeypatch.setattr(websockets, "connect", lambda uri, **kwargs: ws)
+    watcher = Watcher(DummyClient(), job_id="jid", queue_size=3)
+    documents = watcher.documents()
+    watcher.start()
+
+    first = next(documents)
+    assert not watcher.wait(timeout=0.1)
+    # Three queued, one taken and one waiting for room
+    assert ws.sent == 5
+    assert [first.markdown] + [doc.markdown for doc in documents] == [str(i) for i in range(20)]
+    assert watcher.wait(timeout=5)
+
+
+def test_documents_without_retaining_data(monkeypatch):
+    messages = _messages(5)
+    messages.insert(3, {"data": {"status": "scraping", "completed": 3, "total": 5, "data": []}})
+    monkeypatch.setattr(websockets, "connect", lambda uri, **kwargs: ScriptedWebSocket(messages))
+    watcher = Watcher(DummyClient(), job_id="jid", retain_data=False, overflow="spill", queue_size=1)
+    jobs = []
+    watcher.add_listener(jobs.append)
+    documents = watcher.documents()
+    watcher.start()
+    assert watcher.wait(timeout=5)
+
+    assert [doc.markdown for doc in documents] == [str(i) for i in range(5)]
+    assert watcher.data == []
+    assert watcher._tracker.documents == []
+    assert [job.data for job in jobs] == [[], []]
+
+
+def test_stop_ends_documents_iterator(monkeypatch):
+    monkeypatch.setattr(websockets, "connect", lambda uri, **kwargs: ScriptedWebSocket(_messages(3)[:-1]))
+    watcher = Watcher(DummyClient(), job_id="jid", poll_interval=60)
+    documents = watcher.documents()
+    watcher.start()
+
+    seen = []
+    consumer = threading.Thread(target=lambda: seen.extend(doc.markdown for doc in documents))
+    consumer.start()
+    watcher.stop()
+    consumer.join(timeout=5)
+    assert not consumer.is_alive()
+
+
+def test_restart_after_stop_delivers_documents(monkeypatch):
+    catchup = {"type": "catchup", "data": {"status": "scraping", "data": [m["data"] for m in _messages(3)[:-1]]}}
+    sockets = iter([ScriptedWebSocket(_messages(2)[:-1]), ScriptedWebSocket([catchup] + _messages(0))])
+    monkeypatch.setattr(websockets, "connect", lambda uri, **kwargs: next(sockets))
+    # A short poll interval lets stop() end the first run promptly
+    watcher = Watcher(DummyClient(), job_id="jid", poll_interval=0.05)
+
+    documents = watcher.documents()
+    watcher.start()
+    first = [next(documents).markdown, next(documents).markdown]
+    watcher.stop()
+    assert list(documents) == []
+
+    documents = watcher.documents()
+    watcher.start()
+    assert first + [doc.markdown for doc in documents] == ["0", "1", "2"]
+    assert watcher.wait(timeout=5)
+
+
+def test_invalid_overflow_policy():
+    with pytest.raises(ValueError):
+        Watcher(DummyClient(), job_id="jid", overflow="grow")
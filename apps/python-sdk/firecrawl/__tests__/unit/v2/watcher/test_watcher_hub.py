@@ -0,0 +1,132 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+import websockets
+
+from firecrawl.v2.watcher import Watcher
+from firecrawl.v2.watcher_hub import WatcherHub
+
+
+class DummyHttpClient:
+    api_url = "http://localhost"
+    api_key = "TEST"
+
+
+class DummyClient:
+    def __init__(self):
+        self.http_client = DummyHttpClient()
+
+
+class ScriptedWebSocket:
+    """Sends each message after a short delay, then stays open until cancelled."""
+
+    def __init__(self, messages, delay=0.005):
+        self._messages = list(messages)
+        self._delay = delay
+
+    async def recv(self):
+        if not self._messages:
+            await asyncio.sleep(3600)
+        await asyncio.sleep(self._delay)
+        return json.dumps(self._messages.pop(0))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def _job_messages(docs):
+    messages = [{"type": "document", "data": {"url": f"https://example.com/{i}", "markdown": str(i)}} for i in range(docs)]
+    messages.append({"type": "done", "data": {"status": "completed", "data": []}})
+    return messages
+
+
+@pytest.fixture
+def hub():
+    with WatcherHub(callback_workers=4) as hub:
+        yield hub
+
+
+def test_many_watchers_share_one_loop(monkeypatch, hub):
+    monkeypatch.setattr(websockets, "connect", lambda uri, **kwargs: ScriptedWebSocket(_job_messages(5)))
+    threads_before = threading.active_count()
+
+    results = {}
+    watchers = []
+    for i in range(50):
+        watcher = Watcher(DummyClient(), job_id=f"job-{i}", hub=hub)
+        seen = results[f"job-{i}"] = []
+        watcher.add_event_listener("document", lambda d, seen=seen: seen.append(d["data"]["markdown"]))
+        watcher.add_event_listener("done", lambda d, seen=seen: seen.append("done"))
+        watcher.start()
+        watchers.append(watcher)
+
+    for watcher in watchers:
+        assert watcher.wait(timeout=5)
+
+    # One loop thread plus the callback workers, however many jobs are watched
+    assert threading.active_count() - threads_before <= 1 + 4
+    for seen in results.values():
+        assert seen == ["0", "1", "2", "3", "4", "done"]
+
+
+def test_slow_callback_does_not_block_other_watchers(monkeypatch, hub):
+    monkeypatch.setattr(websockets, "connect", lambda uri, **kwargs: ScriptedWebSocket(_job_messages(1)))
+    release = threading.Event()
+
+    slow = Watcher(DummyClient(), job_id="slow", hub=hub)
+    slow.add_event_listener("document", lambda d: release.wait(5))
+    slow.start()
+
+    fast = Watcher(DummyClient(), job_id="fast", hub=hub)
+    statuses = []
+    fast.add_listener(lambda job: statuses.append(job.status))
+    fast.start()
+
+    assert fast.wait(timeout=2)
+    assert statuses == ["completed"]
+    release.set()
+    assert slow.wait(timeout=2)
+
+
+def test_stop_cancels_watcher(monkeypatch, hub):
+    monkeypatch.setattr(websockets, "connect", lambda uri, **kwargs: ScriptedWebSocket([]))
+    watcher = Watcher(DummyClient(), job_id="idle", hub=hub, poll_interval=60)
+    watcher.start()
+    time.sleep(0.05)
+    watcher.stop()
+    assert watcher.wait(timeout=2)
+
+
+def test_closed_hub_rejects_new_watchers():
+    hub = WatcherHub()
+    hub.close()
+    with pytest.raises(RuntimeError):
+        Watcher(DummyClient(), job_id="late", hub=hub).start()
+
+
+def test_close_drops_pending_callbacks():
+    from firecrawl.v2.watcher_hub import _DRAIN_BATCH
+
+    hub = WatcherHub(callback_workers=1)
+    hub.submit(asyncio.sleep(0)).result(1)
+    release = threading.Event()
+    ran = []
+    hub.dispatch("job", release.wait, 5)
+    for i in range(_DRAIN_BATCH * 2):
+        hub.dispatch("job", ran.append, i)
+
+    hub.close()
+    release.set()
+    # The worker finishes its batch, then drops the rest instead of resubmitting
+    assert hub.wait_idle("job", timeout=2)
+    assert len(ran) == _DRAIN_BATCH - 1
+
+    hub.dispatch("job", ran.append, "late")
+    assert hub.wait_idle("job", timeout=0)
+    assert "late" not in ran
@@ -0,0 +1,206 @@
+import asyncio
+import json
+
+import pytest
+import websockets
+from unittest.mock import Mock
+
+from firecrawl.v2 import types
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.utils.ws_resume import DocumentTracker
+from firecrawl.v2.watcher import Watcher
+from firecrawl.v2.watcher_async import AsyncWatcher
+
+
+class DummyHttpClient:
+    api_url = "http://localhost"
+    api_key = "TEST"
+
+
+class DummyClient:
+    def __init__(self):
+        self.http_client = DummyHttpClient()
+
+
+class ScriptedWebSocket:
+    def __init__(self, messages):
+        self._messages = list(messages)
+
+    async def recv(self):
+        await asyncio.sleep(0)
+        if not self._messages:
+            await asyncio.sleep(3600)
+        return json.dumps(self._messages.pop(0))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+def _doc(i):
+    return {"markdown": str(i), "metadata": {"sourceURL": f"https://example.com/{i}"}}
+
+
+def _messages():
+    return [
+        {"type": "document", "data": _doc(0)},
+        {"data": {"status": "scraping", "completed": 1, "total": 3, "data": []}},
+        {"type": "document", "data": _doc(1)},
+        {"data": {"status": "scraping", "completed": 3, "total": 3, "data": [_doc(1), _doc(2)]}},
+        {"type": "done", "data": {"status": "completed", "completed": 3, "total": 3, "data": []}},
+    ]
+
+
+def _watch(monkeypatch, snapshot_mode):
+    monkeypatch.setattr(websockets, "connect", lambda uri, **kwargs: ScriptedWebSocket(_messages()))
+    watcher = Watcher(DummyClient(), job_id="jid", snapshot_mode=snapshot_mode)
+    jobs = []
+    watcher.add_listener(jobs.append)
+    watcher.start()
+    assert watcher.wait(timeout=5)
+    return watcher, jobs
+
+
+@pytest.fixture
+def conversions(monkeypatch):
+    calls = []
+    from_api = types.Document.from_api.__func__
+
+    def counting(cls, doc):
+        calls.append(doc["markdown"])
+        return from_api(cls, doc)
+
+    monkeypatch.setattr(types.Document, "from_api", classmethod(counting))
+    return calls
+
+
+def test_full_snapshots_share_documents(monkeypatch, conversions):
+    watcher, jobs = _watch(monkeypatch, "full")
+
+    assert [[d.markdown for d in job.data] for job in jobs] == [["0"], ["0", "1", "2"], ["0", "1", "2"]]
+    assert jobs[1].data[0] is jobs[2].data[0]
+    assert conversions == ["0", "1", "2"]
+    assert [d["markdown"] for d in watcher.data] == ["0", "1", "2"]
+
+
+def test_delta_snapshots_hold_new_documents(monkeypatch, conversions):
+    _, jobs = _watch(monkeypatch, "delta")
+
+    assert [[d.markdown for d in job.data] for job in jobs] == [["0"], ["1", "2"], []]
+    assert conversions == ["0", "1", "2"]
+
+
+def test_counters_snapshots_hold_no_documents(monkeypatch):
+    _, jobs = _watch(monkeypatch, "counters")
+
+    assert [job.data for job in jobs] == [[], [], []]
+    assert [(job.status, job.completed) for job in jobs] == [("scraping", 1), ("scraping", 3), ("completed", 3)]
+
+
+@pytest.mark.asyncio
+async def test_async_delta_snapshots(monkeypatch):
+    messages = [m for m in _messages() if m.get("type") != "document"]
+    monkeypatch.setattr(websockets, "connect", lambda uri, **kwargs: ScriptedWebSocket(messages))
+
+    class Client(DummyClient):
+        def get_crawl_status(self, job_id):
+            return types.CrawlJob(status="scraping", completed=0, total=3, data=[])
+
+    watcher = AsyncWatcher(Client(), "jid", snapshot_mode="delta")
+    snapshots = [[d.markdown for d in job.data] async for job in watcher]
+
+    # Initial HTTP snapshot, then two status messages and done
+    assert snapshots == [[], [], ["1", "2"], []]
+
+
+def test_unknown_snapshot_mode_rejected():
+    with pytest.raises(ValueError):
+        DocumentTracker("everything")
+
+
+class ProgressResponses:
+    """
+    Stands in for HttpClient.get: answers counter polls with the next status
+    and ``?skip=N`` pages with the server's documents past N, recording URLs.
+    """
+
+    def __init__(self, statuses, docs=()):
+        self.statuses = list(statuses)
+        self.docs = list(docs)
+        self.urls = []
+
+    def _body(self, url):
+        if "?skip=" in url:
+            skip = int(url.rsplit("=", 1)[1])
+            return {"success": True, "status": "scraping", "data": self.docs[skip:], "next": None}
+        status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        return {"success": True, "status": status, "completed": len(self.docs), "total": len(self.docs), "data": self.docs[:1]}
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        response = Mock()
+        response.ok = True
+        response.status_code = 200
+        response.json.return_value = self._body(url)
+        return response
+
+    async def get_async(self, url, **kwargs):
+        return self.get(url)
+
+
+def test_quiet_period_polls_fetch_only_counters(monkeypatch):
+    monkeypatch.setattr(websockets, "connect", lambda uri, **kwargs: ScriptedWebSocket([{"type": "document", "data": _doc(0)}]))
+    client = FirecrawlClient(api_key="fc-test", api_url="http://localhost")
+    responses = ProgressResponses(["scraping", "completed"], [_doc(0)])
+    monkeypatch.setattr(client.http_client, "get", responses.get)
+
+    watcher = Watcher(client, job_id="jid", poll_interval=0.05, snapshot_mode="delta")
+    jobs = []
+    watcher.add_listener(jobs.append)
+    watcher.start()
+    assert watcher.wait(timeout=5)
+
+    assert responses.urls == ["/v2/crawl/jid?limit=1"] * 2
+    assert [(job.status, [d.markdown for d in job.data]) for job in jobs] == [("scraping", ["0"]), ("completed", [])]
+
+
+def test_polled_documents_reach_listeners_and_queue(monkeypatch):
+    monkeypatch.setattr(websockets, "connect", lambda uri, **kwargs: ScriptedWebSocket([{"type": "document", "data": _doc(0)}]))
+    client = FirecrawlClient(api_key="fc-test", api_url="http://localhost")
+    responses = ProgressResponses(["scraping", "completed"], [_doc(0), _doc(1), _doc(2)])
+    monkeypatch.setattr(client.http_client, "get", responses.get)
+
+    watcher = Watcher(client, job_id="jid", poll_interval=0.05, snapshot_mode="delta")
+    jobs, events = [], []
+    watcher.add_listener(jobs.append)
+    watcher.add_event_listener("document", lambda d: events.append(d["data"]["markdown"]))
+    documents = watcher.documents()
+    watcher.start()
+
+    assert [doc.markdown for doc in documents] == ["0", "1", "2"]
+    assert watcher.wait(timeout=5)
+    # Only the documents past the one streamed are fetched, once
+    assert responses.urls == ["/v2/crawl/jid?limit=1", "/v2/crawl/jid?skip=1", "/v2/crawl/jid?limit=1"]
+    assert events == ["0", "1", "2"]
+    assert [[d.markdown for d in job.data] for job in jobs] == [["0", "1", "2"], []]
+
+
+@pytest.mark.asyncio
+async def test_async_quiet_period_polls_fetch_only_counters(monkeypatch):
+    monkeypatch.setattr(websockets, "connect", lambda uri, **kwargs: ScriptedWebSocket([{"type": "document", "data": _doc(0)}]))
+    client = AsyncFirecrawlClient(api_key="fc-test", api_url="http://localhost")
+    responses = ProgressResponses(["scraping", "scraping", "completed"], [_doc(0), _doc(1)])
+    monkeypatch.setattr(client.async_http_client, "get", responses.get_async)
+
+    watcher = AsyncWatcher(client, "jid", kind="batch", poll_interval=0.05, snapshot_mode="delta")
+    jobs = [job async for job in watcher]
+
+    # The on-connect poll fetches both documents; the streamed copy of doc 0 is skipped
+    assert responses.urls == ["/v2/batch/scrape/jid?limit=1", "/v2/batch/scrape/jid?skip=0"] + ["/v2/batch/scrape/jid?limit=1"] * 2
+    assert [(job.status, [d.markdown for d in job.data]) for job in jobs] == [
+        ("scraping", ["0", "1"]), ("scraping", []), ("scraping", []), ("completed", []),
+    ]
+    assert [d["markdown"] for d in watcher._data] == ["0", "1"]
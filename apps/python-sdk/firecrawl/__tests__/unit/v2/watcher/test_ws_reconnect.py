@@ -0,0 +1,146 @@
+import asyncio
+import json
+
+import pytest
+import websockets
+from websockets.exceptions import ConnectionClosedError
+
+from firecrawl.v2.types import CrawlJob
+from firecrawl.v2.utils.retry import RetryPolicy
+from firecrawl.v2.utils.ws_resume import DocumentTracker
+from firecrawl.v2.watcher import Watcher
+from firecrawl.v2.watcher_async import AsyncWatcher
+
+NO_WAIT = RetryPolicy(max_retries=3, backoff_factor=0, budget=None)
+
+
+def _doc(i):
+    return {"markdown": str(i), "metadata": {"sourceURL": f"https://example.com/{i}"}}
+
+
+class DroppingWebSocket:
+    """Plays its messages, then drops the connection (or blocks when ``drop`` is False)."""
+
+    def __init__(self, messages, drop=True):
+        self._messages = list(messages)
+        self._drop = drop
+
+    async def recv(self):
+        await asyncio.sleep(0)
+        if not self._messages:
+            if self._drop:
+                raise ConnectionClosedError(None, None)
+            await asyncio.sleep(3600)
+        return json.dumps(self._messages.pop(0))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class Server:
+    """Hands out one scripted connection per connect; ``None`` refuses the connection."""
+
+    def __init__(self, connections):
+        self._connections = list(connections)
+        self.connects = 0
+
+    def connect(self, uri, **kwargs):
+        self.connects += 1
+        ws = self._connections.pop(0)
+        if ws is None:
+            raise OSError("connection refused")
+        return ws
+
+
+def _resuming_server():
+    return Server([
+        DroppingWebSocket([
+            {"type": "document", "data": _doc(0)},
+            {"type": "document", "data": _doc(1)},
+        ]),
+        None,
+        DroppingWebSocket([
+            {"type": "catchup", "data": {"status": "scraping", "data": [_doc(0), _doc(1), _doc(2)]}},
+            {"type": "document", "data": _doc(2)},
+            {"type": "document", "data": _doc(3)},
+            {"type": "done", "data": {"status": "completed", "data": []}},
+        ], drop=False),
+    ])
+
+
+class PollingClient:
+    class http_client:
+        api_url = "http://localhost"
+        api_key = "TEST"
+
+    def __init__(self, status="completed"):
+        self.status = status
+        self.polls = 0
+
+    def get_crawl_status(self, job_id):
+        self.polls += 1
+        return CrawlJob(status=self.status, completed=1, total=1, data=[])
+
+
+def test_tracker_skips_known_documents():
+    tracker = DocumentTracker()
+    assert tracker.accept(_doc(0))
+    assert not tracker.accept(_doc(0))
+    assert tracker.accept({"markdown": "no key"})
+    new = tracker.catchup([_doc(0), {"markdown": "no key"}, _doc(1), {"markdown": "later"}])
+    assert [d["markdown"] for d, _ in new] == ["1", "later"]
+    assert [doc.markdown for _, doc in new] == ["1", "later"]
+
+
+def test_sync_watcher_reconnects_and_resumes(monkeypatch):
+    server = _resuming_server()
+    monkeypatch.setattr(websockets, "connect", server.connect)
+    client = PollingClient()
+    watcher = Watcher(client, job_id="jid", reconnect_policy=NO_WAIT)
+
+    documents = []
+    done = []
+    watcher.add_event_listener("document", lambda d: documents.append(d["data"]["markdown"]))
+    watcher.add_event_listener("done", lambda d: done.append(len(d["data"])))
+    watcher.start()
+    assert watcher.wait(timeout=5)
+
+    assert server.connects == 3
+    assert documents == ["0", "1", "2", "3"]
+    assert done == [4]
+    assert client.polls == 0
+
+
+def test_sync_watcher_falls_back_to_polling(monkeypatch):
+    server = Server([None] * 4)
+    monkeypatch.setattr(websockets, "connect", server.connect)
+    client = PollingClient()
+    watcher = Watcher(client, job_id="jid", reconnect_policy=NO_WAIT)
+
+    statuses = []
+    watcher.add_listener(lambda job: statuses.append(job.status))
+    watcher.start()
+    assert watcher.wait(timeout=5)
+
+    assert server.connects == 4
+    assert client.polls == 1
+    assert statuses == ["completed"]
+
+
+@pytest.mark.asyncio
+async def test_async_watcher_reconnects_and_resumes(monkeypatch):
+    server = _resuming_server()
+    monkeypatch.setattr(websockets, "connect", server.connect)
+    client = PollingClient(status="scraping")
+
+    snapshots = [job async for job in AsyncWatcher(client, "jid", reconnect_policy=NO_WAIT)]
+
+    assert server.connects == 3
+    # Only the initial snapshot comes from HTTP
+    assert client.polls == 1
+    final = snapshots[-1]
+    assert final.status == "completed"
+    assert [d.markdown for d in final.data] == ["0", "1", "2", "3"]
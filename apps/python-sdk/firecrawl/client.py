@@ -61,6 +61,8 @@ class V2Proxy:
             self.crawl = client_instance.crawl
             self.start_crawl = client_instance.start_crawl
             self.get_crawl_status = client_instance.get_crawl_status
+            self.iter_crawl_pages = client_instance.iter_crawl_pages
+            self.iter_crawl_documents = client_instance.iter_crawl_documents
             self.cancel_crawl = client_instance.cancel_crawl
             self.get_crawl_errors = client_instance.get_crawl_errors
             self.get_active_crawls = client_instance.get_active_crawls
@@ -73,6 +75,8 @@ class V2Proxy:
 
             self.start_batch_scrape = client_instance.start_batch_scrape
             self.get_batch_scrape_status = client_instance.get_batch_scrape_status
+            self.iter_batch_pages = client_instance.iter_batch_pages
+            self.iter_batch_documents = client_instance.iter_batch_documents
             self.cancel_batch_scrape = client_instance.cancel_batch_scrape
             self.batch_scrape = client_instance.batch_scrape
             self.get_batch_scrape_errors = client_instance.get_batch_scrape_errors
@@ -122,6 +126,8 @@ class AsyncV2Proxy:
             self.start_crawl = client_instance.start_crawl
             self.wait_crawl = client_instance.wait_crawl
             self.get_crawl_status = client_instance.get_crawl_status
+            self.iter_crawl_pages = client_instance.iter_crawl_pages
+            self.iter_crawl_documents = client_instance.iter_crawl_documents
             self.cancel_crawl = client_instance.cancel_crawl
             self.get_crawl_errors = client_instance.get_crawl_errors
             self.get_active_crawls = client_instance.get_active_crawls
@@ -134,6 +140,8 @@ class AsyncV2Proxy:
 
             self.start_batch_scrape = client_instance.start_batch_scrape
             self.get_batch_scrape_status = client_instance.get_batch_scrape_status
+            self.iter_batch_pages = client_instance.iter_batch_pages
+            self.iter_batch_documents = client_instance.iter_batch_documents
             self.cancel_batch_scrape = client_instance.cancel_batch_scrape
             self.wait_batch_scrape = client_instance.wait_batch_scrape
             self.batch_scrape = client_instance.batch_scrape
@@ -181,6 +189,7 @@ class Firecrawl:
         self.v2 = V2Proxy(self._v2_client)
         
         self.scrape = self._v2_client.scrape
+        self.scrape_many = self._v2_client.scrape_many
         self.search = self._v2_client.search
         self.map = self._v2_client.map
 
@@ -188,6 +197,8 @@ class Firecrawl:
         self.start_crawl = self._v2_client.start_crawl
         self.crawl_params_preview = self._v2_client.crawl_params_preview
         self.get_crawl_status = self._v2_client.get_crawl_status
+        self.iter_crawl_pages = self._v2_client.iter_crawl_pages
+        self.iter_crawl_documents = self._v2_client.iter_crawl_documents
         self.cancel_crawl = self._v2_client.cancel_crawl
         self.get_crawl_errors = self._v2_client.get_crawl_errors
         self.get_active_crawls = self._v2_client.get_active_crawls
@@ -195,6 +206,8 @@ class Firecrawl:
 
         self.start_batch_scrape = self._v2_client.start_batch_scrape
         self.get_batch_scrape_status = self._v2_client.get_batch_scrape_status
+        self.iter_batch_pages = self._v2_client.iter_batch_pages
+        self.iter_batch_documents = self._v2_client.iter_batch_documents
         self.cancel_batch_scrape = self._v2_client.cancel_batch_scrape
         self.batch_scrape = self._v2_client.batch_scrape
         self.get_batch_scrape_errors = self._v2_client.get_batch_scrape_errors
@@ -228,11 +241,14 @@ class AsyncFirecrawl:
         # Expose v2 async surface directly on the top-level client for ergonomic access
         # Keep method names aligned with the sync client
         self.scrape = self._v2_client.scrape
+        self.scrape_many = self._v2_client.scrape_many
         self.search = self._v2_client.search
         self.map = self._v2_client.map
 
         self.start_crawl = self._v2_client.start_crawl
         self.get_crawl_status = self._v2_client.get_crawl_status
+        self.iter_crawl_pages = self._v2_client.iter_crawl_pages
+        self.iter_crawl_documents = self._v2_client.iter_crawl_documents
         self.cancel_crawl = self._v2_client.cancel_crawl
         self.crawl = self._v2_client.crawl
         self.get_crawl_errors = self._v2_client.get_crawl_errors
@@ -241,6 +257,8 @@ class AsyncFirecrawl:
 
         self.start_batch_scrape = self._v2_client.start_batch_scrape
         self.get_batch_scrape_status = self._v2_client.get_batch_scrape_status
+        self.iter_batch_pages = self._v2_client.iter_batch_pages
+        self.iter_batch_documents = self._v2_client.iter_batch_documents
         self.cancel_batch_scrape = self._v2_client.cancel_batch_scrape
         self.batch_scrape = self._v2_client.batch_scrape
         self.get_batch_scrape_errors = self._v2_client.get_batch_scrape_errors
@@ -24,6 +24,8 @@ import websockets
 import aiohttp
 import asyncio
 
+from ..v2.utils.poll_scheduler import PollScheduler
+
 logger : logging.Logger = logging.getLogger("firecrawl")
 
 def get_version():
@@ -2434,6 +2436,8 @@ class V1FirecrawlApp:
         Raises:
             Exception: If the job fails or an error occurs during status checks.
         """
+        # Re-check intervals adapt to the crawl's progress but never drop below 2 seconds
+        scheduler = PollScheduler(max(poll_interval, 2), min_interval=2)
         while True:
             api_url = f'{self.api_url}/v1/crawl/{id}'
 
@@ -2460,8 +2464,8 @@ class V1FirecrawlApp:
                     else:
                         raise Exception('Crawl job completed but no data was returned')
                 elif status_data['status'] in ['active', 'paused', 'pending', 'queued', 'waiting', 'scraping']:
-                    poll_interval=max(poll_interval,2)
-                    time.sleep(poll_interval)  # Wait for the specified interval before checking again
+                    scheduler.observe(status_data.get('completed'), status_data.get('total'))
+                    scheduler.sleep()  # Wait for the scheduled interval before checking again
                 else:
                     raise Exception(f'Crawl job failed or was stopped. Status: {status_data["status"]}')
             else:
@@ -3876,6 +3880,8 @@ class AsyncV1FirecrawlApp(V1FirecrawlApp):
         Raises:
             Exception: If the job fails or an error occurs during status checks
         """
+        # Re-check intervals adapt to the crawl's progress but never drop below 2 seconds
+        scheduler = PollScheduler(max(poll_interval, 2), min_interval=2)
         while True:
             status_data = await self._async_get_request(
                 f'{self.api_url}/v1/crawl/{id}',
@@ -3900,7 +3906,8 @@ class AsyncV1FirecrawlApp(V1FirecrawlApp):
                 else:
                     raise Exception('Job completed but no data was returned')
             elif status_data.get('status') in ['active', 'paused', 'pending', 'queued', 'waiting', 'scraping']:
-                await asyncio.sleep(max(poll_interval, 2))
+                scheduler.observe(status_data.get('completed'), status_data.get('total'))
+                await scheduler.sleep_async()
             else:
                 raise Exception(f'Job failed or was stopped. Status: {status_data["status"]}')
 
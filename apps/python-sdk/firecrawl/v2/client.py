@@ -5,7 +5,7 @@ This module provides the main client class that orchestrates all v2 functionalit
 """
 
 import os
-from typing import Optional, List, Dict, Any, Callable, Union, Literal
+from typing import Optional, List, Dict, Any, Callable, Union, Literal, Iterator, Iterable
 from .types import (
     ClientConfig,
     ScrapeOptions,
@@ -38,8 +38,23 @@ from .types import (
     Location,
     PaginationConfig,
     AgentOptions,
+    PollMode,
+    SnapshotMode,
+    OverflowPolicy,
+    UrlCanonicalization,
+    HostFairness,
+    BatchScrapeJob,
+    ScrapeManyResult,
 )
 from .utils.http_client import HttpClient
+from .utils.retry import RetryPolicy
+from .utils.rate_limiter import RateLimiter
+from .utils.adaptive_concurrency import AdaptiveConcurrency
+from .utils.document_store import DocumentStore
+from .utils.job_journal import JobJournal
+from .utils.scrape_cache import ScrapeCache
+from .utils.validation import CompiledScrapeOptions
+from .utils.batch_chunking import MAX_BATCH_URLS
 from .utils.error_handler import FirecrawlError
 from .methods import scrape as scrape_module
 from .methods import crawl as crawl_module  
@@ -49,7 +64,9 @@ from .methods import map as map_module
 from .methods import batch as batch_methods
 from .methods import usage as usage_methods
 from .methods import extract as extract_module
+from .methods import journal as journal_methods
 from .watcher import Watcher
+from .watcher_hub import WatcherHub
 
 class FirecrawlClient:
     """
@@ -64,7 +81,15 @@ class FirecrawlClient:
         api_url: str = "https://api.firecrawl.dev",
         timeout: Optional[float] = None,
         max_retries: int = 3,
-        backoff_factor: float = 0.5
+        backoff_factor: float = 0.5,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_controller: Optional[AdaptiveConcurrency] = None,
+        journal: Optional[JobJournal] = None,
+        scrape_cache: Optional[ScrapeCache] = None,
     ):
         """
         Initialize the Firecrawl client.
@@ -74,7 +99,20 @@ class FirecrawlClient:
             api_url: Base URL for the Firecrawl API
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
-            backoff_factor: Exponential backoff factor for retries (e.g. 0.5 means wait 0.5s, then 1s, then 2s between retries)
+            backoff_factor: Base backoff delay in seconds; retries wait a jittered, growing delay starting from this value
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum number of pooled connections per host (size this to your worker thread count)
+            pool_block: Block when the per-host pool is exhausted instead of opening extra connections
+            retry_policy: Full retry configuration (retryable statuses, Retry-After handling,
+                deadlines, retry budget); overrides max_retries and backoff_factor when given
+            rate_limiter: Optional client-side limiter capping in-flight requests at the
+                team's max concurrency and pacing requests per endpoint class
+            concurrency_controller: Optional AIMD controller that adapts the number of
+                in-flight requests to observed latency and 429/5xx/timeout responses
+            journal: Optional JobJournal recording batch scrape and crawl jobs and
+                their downloaded results, so ``resume()`` can finish them after a crash
+            scrape_cache: Optional ScrapeCache answering repeated ``scrape()`` calls for
+                the same URL and options locally, in memory and on disk
         """
         if api_key is None:
             api_key = os.getenv("FIRECRAWL_API_KEY")
@@ -93,7 +131,31 @@ class FirecrawlClient:
             backoff_factor=backoff_factor
         )
         
-        self.http_client = HttpClient(api_key, api_url)
+        self.journal = journal
+        self.scrape_cache = scrape_cache
+        self.http_client = HttpClient(
+            api_key,
+            api_url,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            timeout=timeout,
+            retry_policy=retry_policy or RetryPolicy(max_retries=max_retries, backoff_factor=backoff_factor),
+            rate_limiter=rate_limiter,
+            concurrency_controller=concurrency_controller,
+        )
+        if rate_limiter is not None:
+            rate_limiter.bind(sync_refresher=lambda: usage_methods.get_concurrency(self.http_client))
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self.http_client.close()
+
+    def __enter__(self) -> "FirecrawlClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
     
     def scrape(
         self,
@@ -170,7 +232,45 @@ class FirecrawlClient:
                 integration=integration,
             ).items() if v is not None}
         ) if any(v is not None for v in [formats, headers, include_tags, exclude_tags, only_main_content, timeout, wait_for, mobile, parsers, actions, location, skip_tls_verification, remove_base64_images, fast_mode, use_mock, block_ads, proxy, max_age, store_in_cache, integration]) else None
-        return scrape_module.scrape(self.http_client, url, options)
+        return scrape_module.scrape(self.http_client, url, options, cache=self.scrape_cache)
+
+    def scrape_many(
+        self,
+        urls: Iterable[str],
+        options: Optional[Union[ScrapeOptions, CompiledScrapeOptions]] = None,
+        *,
+        concurrency: Optional[int] = None,
+        stop_on_error: bool = False,
+        fairness: Optional[HostFairness] = None,
+    ) -> Iterator[ScrapeManyResult]:
+        """
+        Scrape many URLs concurrently, yielding results in completion order.
+
+        Each URL is a single scrape request sent from a thread pool over the
+        client's pooled session; ``options`` are compiled once and shared.
+
+        Args:
+            urls: URLs to scrape
+            options: Scraping options for every URL (ScrapeOptions or compiled options)
+            concurrency: Maximum scrapes in flight (defaults to ``pool_maxsize``,
+                so every worker has a pooled connection; the async client uses
+                its pool's ``max_keepalive_connections`` the same way)
+            stop_on_error: Stop submitting URLs after the first failure
+            fairness: Queue URLs per host and dispatch round-robin across
+                hosts (weighted), with an optional per-host in-flight cap
+
+        Returns:
+            Iterator of ScrapeManyResult, each holding a Document or the error for
+            one URL; close it (or break out of the loop) to stop early
+        """
+        return scrape_module.scrape_many(
+            self.http_client,
+            urls,
+            options,
+            concurrency=concurrency or self.http_client.pool_maxsize,
+            stop_on_error=stop_on_error,
+            fairness=fairness,
+        )
 
     def search(
         self,
@@ -237,6 +337,9 @@ class FirecrawlClient:
         poll_interval: int = 2,
         timeout: Optional[int] = None,
         integration: Optional[str] = None,
+        poll_mode: PollMode = "full",
+        document_store: Optional[DocumentStore] = None,
+        idempotency_key: Optional[str] = None,
     ) -> CrawlJob:
         """
         Start a crawl job and wait for it to complete.
@@ -260,9 +363,17 @@ class FirecrawlClient:
             zero_data_retention: Whether to delete data after 24 hours
             poll_interval: Seconds between status checks
             timeout: Maximum seconds to wait (None for no timeout)
+            poll_mode: "full" (default) re-fetches all results on every poll,
+                "status" polls only counters and downloads results once at
+                completion, "delta" fetches only new documents per poll
+            document_store: Optional DocumentStore to spill results to disk; the
+                returned job's ``data`` is then a lazy view of the store
+            idempotency_key: UUID header used to deduplicate starts; with a journal,
+                a crawl already journaled under this key is resumed instead of restarted
             
         Returns:
-            CrawlJob when job completes
+            CrawlJob when job completes (with a journal, its results are downloaded
+            into the journal and ``poll_mode``/``document_store`` are not used)
             
         Raises:
             ValueError: If request is invalid
@@ -289,11 +400,22 @@ class FirecrawlClient:
             integration=integration,
         )
         
+        if self.journal is not None:
+            job = journal_methods.start_crawl(
+                self.http_client, self.journal, request, idempotency_key=idempotency_key
+            )
+            return journal_methods.download_job(
+                self.http_client, self.journal, job.id, poll_interval=poll_interval, timeout=timeout
+            )
+
         return crawl_module.crawl(
             self.http_client, 
             request, 
+            idempotency_key=idempotency_key,
             poll_interval=poll_interval, 
-            timeout=timeout
+            timeout=timeout,
+            poll_mode=poll_mode,
+            document_store=document_store,
         )
     
     def start_crawl(
@@ -316,6 +438,7 @@ class FirecrawlClient:
         scrape_options: Optional[ScrapeOptions] = None,
         zero_data_retention: bool = False,
         integration: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
     ) -> CrawlResponse:
         """
         Start an asynchronous crawl job.
@@ -337,6 +460,8 @@ class FirecrawlClient:
             webhook: Webhook configuration for notifications
             scrape_options: Page scraping configuration
             zero_data_retention: Whether to delete data after 24 hours
+            idempotency_key: UUID header used to deduplicate starts; with a journal,
+                a crawl already journaled under this key is returned instead of restarted
             
         Returns:
             CrawlResponse with job information
@@ -365,12 +490,17 @@ class FirecrawlClient:
             integration=integration,
         )
         
-        return crawl_module.start_crawl(self.http_client, request)
+        if self.journal is not None:
+            return journal_methods.start_crawl(
+                self.http_client, self.journal, request, idempotency_key=idempotency_key
+            )
+        return crawl_module.start_crawl(self.http_client, request, idempotency_key=idempotency_key)
     
     def get_crawl_status(
         self, 
         job_id: str,
-        pagination_config: Optional[PaginationConfig] = None
+        pagination_config: Optional[PaginationConfig] = None,
+        document_store: Optional[DocumentStore] = None,
     ) -> CrawlJob:
         """
         Get the status of a crawl job.
@@ -378,6 +508,7 @@ class FirecrawlClient:
         Args:
             job_id: ID of the crawl job
             pagination_config: Optional configuration for pagination behavior
+            document_store: Optional DocumentStore to spill results to disk
             
         Returns:
             CrawlJob with current status and data
@@ -388,8 +519,38 @@ class FirecrawlClient:
         return crawl_module.get_crawl_status(
             self.http_client, 
             job_id,
-            pagination_config=pagination_config
+            pagination_config=pagination_config,
+            document_store=document_store,
         )
+
+    def iter_crawl_pages(self, job_id: str, *, cursor: Optional[str] = None) -> Iterator[CrawlJob]:
+        """
+        Iterate over crawl results one page at a time.
+
+        Each page holds only its own documents; save ``page.next`` after
+        processing a page and pass it as ``cursor`` to resume later.
+
+        Args:
+            job_id: ID of the crawl job
+            cursor: ``next`` URL saved from a previous page
+
+        Returns:
+            Iterator of CrawlJob pages
+        """
+        return crawl_module.iter_crawl_pages(self.http_client, job_id, cursor)
+
+    def iter_crawl_documents(self, job_id: str, *, cursor: Optional[str] = None) -> Iterator[Document]:
+        """
+        Stream crawl documents page by page without loading the whole crawl into memory.
+
+        Args:
+            job_id: ID of the crawl job
+            cursor: ``next`` URL saved from a previous page
+
+        Returns:
+            Iterator of Document objects
+        """
+        return crawl_module.iter_crawl_documents(self.http_client, job_id, cursor)
     
     def get_crawl_errors(self, crawl_id: str) -> CrawlErrorsResponse:
         """
@@ -497,6 +658,7 @@ class FirecrawlClient:
         ignore_invalid_urls: Optional[bool] = None,
         integration: Optional[str] = None,
         agent: Optional[AgentOptions] = None,
+        dedupe: Union[bool, UrlCanonicalization] = False,
     ):
         """Start an extract job (non-blocking).
 
@@ -512,6 +674,7 @@ class FirecrawlClient:
             ignore_invalid_urls: Skip invalid URLs instead of failing
             integration: Integration tag/name
             agent: Agent configuration
+            dedupe: Drop URLs that are duplicates after canonicalization
         Returns:
             Response payload with job id/status (poll with get_extract_status)
         """
@@ -528,6 +691,7 @@ class FirecrawlClient:
             ignore_invalid_urls=ignore_invalid_urls,
             integration=integration,
             agent=agent,
+            dedupe=dedupe,
         )
 
     def extract(
@@ -546,6 +710,7 @@ class FirecrawlClient:
         timeout: Optional[int] = None,
         integration: Optional[str] = None,
         agent: Optional[AgentOptions] = None,
+        dedupe: Union[bool, UrlCanonicalization] = False,
     ):
         """Extract structured data and wait until completion.
 
@@ -563,6 +728,7 @@ class FirecrawlClient:
             timeout: Maximum seconds to wait (None for no timeout)
             integration: Integration tag/name
             agent: Agent configuration
+            dedupe: Drop URLs that are duplicates after canonicalization
         Returns:
             Final extract response when completed
         """
@@ -581,6 +747,7 @@ class FirecrawlClient:
             timeout=timeout,
             integration=integration,
             agent=agent,
+            dedupe=dedupe,
         )
 
     def start_batch_scrape(
@@ -613,6 +780,10 @@ class FirecrawlClient:
         zero_data_retention: Optional[bool] = None,
         integration: Optional[str] = None,
         idempotency_key: Optional[str] = None,
+        chunk_size: int = MAX_BATCH_URLS,
+        max_parallel_chunks: int = 4,
+        dedupe: Union[bool, UrlCanonicalization] = False,
+        fairness: Optional[HostFairness] = None,
     ):
         """Start a batch scrape job over multiple URLs (non-blocking).
 
@@ -643,7 +814,20 @@ class FirecrawlClient:
             max_concurrency: Max concurrent scrapes
             zero_data_retention: Delete data after 24 hours
             integration: Integration tag/name
-            idempotency_key: Header used to deduplicate starts
+            idempotency_key: UUID header used to deduplicate starts
+            chunk_size: Maximum URLs per request; longer lists are sent in
+                chunks appended to one job, in parallel. If a later chunk
+                fails, ``BatchChunkError`` reports the job ID and the URLs to
+                resubmit with ``append_to_id``
+            max_parallel_chunks: Chunk requests in flight at once
+            dedupe: Drop URLs that are duplicates after canonicalization
+                (True for the default rules, or a ``UrlCanonicalization``);
+                the response reports how many were removed
+            fairness: Interleave hosts (by weight) before chunking, so no
+                chunk holds a single site
+
+        With a journal the job is recorded in it, and a job already journaled
+        under ``idempotency_key`` is returned instead of being submitted again.
 
         Returns:
             Response payload with job id (poll with get_batch_scrape_status)
@@ -672,6 +856,25 @@ class FirecrawlClient:
             ).items() if v is not None}
         ) if any(v is not None for v in [formats, headers, include_tags, exclude_tags, only_main_content, timeout, wait_for, mobile, parsers, actions, location, skip_tls_verification, remove_base64_images, fast_mode, use_mock, block_ads, proxy, max_age, store_in_cache]) else None
 
+        if self.journal is not None:
+            return journal_methods.start_batch_scrape(
+                self.http_client,
+                self.journal,
+                urls,
+                options=options,
+                webhook=webhook,
+                append_to_id=append_to_id,
+                ignore_invalid_urls=ignore_invalid_urls,
+                max_concurrency=max_concurrency,
+                zero_data_retention=zero_data_retention,
+                integration=integration,
+                idempotency_key=idempotency_key,
+                chunk_size=chunk_size,
+                max_parallel_chunks=max_parallel_chunks,
+                dedupe=dedupe,
+                fairness=fairness,
+            )
+
         return batch_module.start_batch_scrape(
             self.http_client,
             urls,
@@ -683,18 +886,24 @@ class FirecrawlClient:
             zero_data_retention=zero_data_retention,
             integration=integration,
             idempotency_key=idempotency_key,
+            chunk_size=chunk_size,
+            max_parallel_chunks=max_parallel_chunks,
+            dedupe=dedupe,
+            fairness=fairness,
         )
 
     def get_batch_scrape_status(
         self, 
         job_id: str,
-        pagination_config: Optional[PaginationConfig] = None
+        pagination_config: Optional[PaginationConfig] = None,
+        document_store: Optional[DocumentStore] = None,
     ):
         """Get current status and any scraped data for a batch job.
 
         Args:
             job_id: Batch job ID
             pagination_config: Optional configuration for pagination behavior
+            document_store: Optional DocumentStore to spill results to disk
 
         Returns:
             Status payload including counts and partial data
@@ -702,9 +911,34 @@ class FirecrawlClient:
         return batch_module.get_batch_scrape_status(
             self.http_client, 
             job_id,
-            pagination_config=pagination_config
+            pagination_config=pagination_config,
+            document_store=document_store,
         )
 
+    def iter_batch_pages(self, job_id: str, *, cursor: Optional[str] = None):
+        """Iterate over batch scrape results one page at a time.
+
+        Args:
+            job_id: Batch job ID
+            cursor: ``next`` URL saved from a previous page to resume from
+
+        Returns:
+            Iterator of BatchScrapeJob pages, each holding only its own documents
+        """
+        return batch_module.iter_batch_pages(self.http_client, job_id, cursor)
+
+    def iter_batch_documents(self, job_id: str, *, cursor: Optional[str] = None) -> Iterator[Document]:
+        """Stream batch scrape documents page by page.
+
+        Args:
+            job_id: Batch job ID
+            cursor: ``next`` URL saved from a previous page to resume from
+
+        Returns:
+            Iterator of Document objects
+        """
+        return batch_module.iter_batch_documents(self.http_client, job_id, cursor)
+
     def cancel_batch_scrape(self, job_id: str) -> bool:
         """Cancel a running batch scrape job.
 
@@ -762,6 +996,30 @@ class FirecrawlClient:
         """Get metrics about the team's scrape queue."""
         return usage_methods.get_queue_status(self.http_client)
 
+    def resume(
+        self, *, poll_interval: int = 2, timeout: Optional[int] = None
+    ) -> Dict[str, Union[BatchScrapeJob, CrawlJob]]:
+        """
+        Finish the journaled jobs whose results were not fully downloaded.
+
+        Reattaches to each unfinished batch scrape and crawl job in the
+        client's journal, waits for it to complete and downloads only the
+        result pages the journal does not already hold.
+
+        Args:
+            poll_interval: Seconds before the first status re-check of each job
+            timeout: Maximum seconds to wait for each job (None for no timeout)
+
+        Returns:
+            Mapping of job ID to the finished job with all of its documents
+
+        Raises:
+            ValueError: If the client was created without a journal
+        """
+        if self.journal is None:
+            raise ValueError("resume() requires a client created with a journal")
+        return journal_methods.resume(self.http_client, self.journal, poll_interval=poll_interval, timeout=timeout)
+
     def watcher(
         self,
         job_id: str,
@@ -769,6 +1027,12 @@ class FirecrawlClient:
         kind: Literal["crawl", "batch"] = "crawl",
         poll_interval: int = 2,
         timeout: Optional[int] = None,
+        hub: Optional[WatcherHub] = None,
+        reconnect_policy: Optional[RetryPolicy] = None,
+        snapshot_mode: SnapshotMode = "full",
+        retain_data: bool = True,
+        queue_size: int = 1000,
+        overflow: OverflowPolicy = "block",
     ) -> Watcher:
         """Create a watcher for crawl or batch jobs.
 
@@ -777,11 +1041,36 @@ class FirecrawlClient:
             kind: Job kind ("crawl" or "batch")
             poll_interval: Seconds between status checks
             timeout: Maximum seconds to watch (None for no timeout)
+            hub: Run the watcher on this hub's shared event loop instead of
+                its own thread
+            reconnect_policy: Backoff for reconnecting dropped WebSockets
+                before falling back to HTTP polling
+            snapshot_mode: Documents in each snapshot passed to listeners:
+                all so far ("full"), new since the last snapshot ("delta"),
+                or none ("counters")
+            retain_data: Keep received documents in ``watcher.data`` and in
+                snapshots; when False snapshots hold no documents
+            queue_size: Documents buffered for ``watcher.documents()``
+            overflow: What to do when that buffer is full: wait for the
+                consumer ("block"), drop the oldest document ("drop_oldest")
+                or spill to a temporary file ("spill")
 
         Returns:
             Watcher instance
         """
-        return Watcher(self, job_id, kind=kind, poll_interval=poll_interval, timeout=timeout)
+        return Watcher(
+            self,
+            job_id,
+            kind=kind,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            hub=hub,
+            reconnect_policy=reconnect_policy,
+            snapshot_mode=snapshot_mode,
+            retain_data=retain_data,
+            queue_size=queue_size,
+            overflow=overflow,
+        )
 
     def batch_scrape(
         self,
@@ -813,11 +1102,34 @@ class FirecrawlClient:
         zero_data_retention: Optional[bool] = None,
         integration: Optional[str] = None,
         idempotency_key: Optional[str] = None,
+        chunk_size: int = MAX_BATCH_URLS,
+        max_parallel_chunks: int = 4,
+        dedupe: Union[bool, UrlCanonicalization] = False,
+        fairness: Optional[HostFairness] = None,
         poll_interval: int = 2,
         wait_timeout: Optional[int] = None,
+        poll_mode: PollMode = "full",
+        document_store: Optional[DocumentStore] = None,
+        retry_failed: int = 0,
+        retry_backoff: float = 1.0,
     ):
         """
         Start a batch scrape job and wait until completion.
+
+        ``poll_mode`` controls polling while the job runs: "full" (default)
+        re-fetches everything, "status" fetches only counters and downloads
+        results once at the end, "delta" fetches only new documents per poll.
+        Pass a ``document_store`` to spill results to disk instead of memory.
+        Lists longer than ``chunk_size`` URLs are submitted in chunks, and
+        ``dedupe`` drops duplicate URLs first and ``fairness`` interleaves
+        hosts across the chunks (see ``start_batch_scrape``).
+        ``retry_failed=N`` re-scrapes URLs that failed transiently (timeouts,
+        5xx) in up to N follow-up jobs, ``retry_backoff`` seconds apart and
+        growing; their documents are merged into the returned job and its
+        ``retry_report`` lists the recovered URLs and the failures that remain.
+        With a journal, results are downloaded page by page into the journal
+        instead (``poll_mode``, ``document_store`` and ``retry_failed`` are not
+        used) and a job already journaled under ``idempotency_key`` is resumed.
         """
         options = ScrapeOptions(
             **{k: v for k, v in dict(
@@ -843,6 +1155,28 @@ class FirecrawlClient:
             ).items() if v is not None}
         ) if any(v is not None for v in [formats, headers, include_tags, exclude_tags, only_main_content, timeout, wait_for, mobile, parsers, actions, location, skip_tls_verification, remove_base64_images, fast_mode, use_mock, block_ads, proxy, max_age, store_in_cache]) else None
 
+        if self.journal is not None:
+            job = journal_methods.start_batch_scrape(
+                self.http_client,
+                self.journal,
+                urls,
+                options=options,
+                webhook=webhook,
+                append_to_id=append_to_id,
+                ignore_invalid_urls=ignore_invalid_urls,
+                max_concurrency=max_concurrency,
+                zero_data_retention=zero_data_retention,
+                integration=integration,
+                idempotency_key=idempotency_key,
+                chunk_size=chunk_size,
+                max_parallel_chunks=max_parallel_chunks,
+                dedupe=dedupe,
+                fairness=fairness,
+            )
+            return journal_methods.download_job(
+                self.http_client, self.journal, job.id, poll_interval=poll_interval, timeout=wait_timeout
+            )
+
         return batch_module.batch_scrape(
             self.http_client,
             urls,
@@ -854,7 +1188,15 @@ class FirecrawlClient:
             zero_data_retention=zero_data_retention,
             integration=integration,
             idempotency_key=idempotency_key,
+            chunk_size=chunk_size,
+            max_parallel_chunks=max_parallel_chunks,
+            dedupe=dedupe,
+            fairness=fairness,
             poll_interval=poll_interval,
             timeout=wait_timeout,
+            poll_mode=poll_mode,
+            document_store=document_store,
+            retry_failed=retry_failed,
+            retry_backoff=retry_backoff,
         )
     
\ No newline at end of file
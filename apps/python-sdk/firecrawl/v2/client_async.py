@@ -4,7 +4,7 @@ Async v2 client mirroring the regular client surface using true async HTTP trans
 
 import os
 import asyncio
-from typing import Optional, List, Dict, Any, Union, Callable, Literal
+from typing import Optional, List, Dict, Any, Union, Callable, Literal, AsyncIterator, Iterable
 from .types import (
     ScrapeOptions,
     CrawlRequest,
@@ -32,10 +32,24 @@ from .types import (
     PDFAction,
     Location,
     PaginationConfig,
+    Document,
+    BatchScrapeJob,
+    PollMode,
+    SnapshotMode,
+    UrlCanonicalization,
+    ScrapeManyResult,
+    HostFairness,
 )
 from .utils.http_client import HttpClient
 from .utils.http_client_async import AsyncHttpClient
+from .utils.retry import RetryPolicy
+from .utils.rate_limiter import RateLimiter
+from .utils.adaptive_concurrency import AdaptiveConcurrency
+from .utils.document_store import DocumentStore
+from .utils.scrape_cache import ScrapeCache
+from .utils.validation import CompiledScrapeOptions
 
+from .methods import usage as usage_methods
 from .methods.aio import scrape as async_scrape  # type: ignore[attr-defined]
 from .methods.aio import batch as async_batch  # type: ignore[attr-defined]
 from .methods.aio import crawl as async_crawl  # type: ignore[attr-defined]
@@ -47,13 +61,70 @@ from .methods.aio import extract as async_extract  # type: ignore[attr-defined]
 from .watcher_async import AsyncWatcher
 
 class AsyncFirecrawlClient:
-    def __init__(self, api_key: Optional[str] = None, api_url: str = "https://api.firecrawl.dev"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_url: str = "https://api.firecrawl.dev",
+        *,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        timeout: Optional[float] = None,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_controller: Optional[AdaptiveConcurrency] = None,
+        scrape_cache: Optional[ScrapeCache] = None,
+    ):
         if api_key is None:
             api_key = os.getenv("FIRECRAWL_API_KEY")
         if not api_key:
             raise ValueError("API key is required. Set FIRECRAWL_API_KEY or pass api_key.")
-        self.http_client = HttpClient(api_key, api_url)
-        self.async_http_client = AsyncHttpClient(api_key, api_url)
+        if retry_policy is None:
+            retry_policy = RetryPolicy(max_retries=max_retries, backoff_factor=backoff_factor)
+        self.scrape_cache = scrape_cache
+        self.http_client = HttpClient(
+            api_key,
+            api_url,
+            timeout=timeout,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            concurrency_controller=concurrency_controller,
+        )
+        self.async_http_client = AsyncHttpClient(
+            api_key,
+            api_url,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            timeout=timeout,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            concurrency_controller=concurrency_controller,
+        )
+        if rate_limiter is not None:
+            rate_limiter.bind(
+                sync_refresher=lambda: usage_methods.get_concurrency(self.http_client),
+                async_refresher=lambda: async_usage.get_concurrency(self.async_http_client),
+            )
+
+    async def close(self) -> None:
+        """Close pooled connections held by the sync and async transports."""
+        await self.async_http_client.close()
+        self.http_client.close()
+
+    async def __aenter__(self) -> "AsyncFirecrawlClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Open, idle and in-flight connection counts for the async transport."""
+        return self.async_http_client.pool_stats()
 
     # Scrape
     async def scrape(
@@ -62,7 +133,25 @@ class AsyncFirecrawlClient:
         **kwargs,
     ):
         options = ScrapeOptions(**{k: v for k, v in kwargs.items() if v is not None}) if kwargs else None
-        return await async_scrape.scrape(self.async_http_client, url, options)
+        return await async_scrape.scrape(self.async_http_client, url, options, cache=self.scrape_cache)
+
+    def scrape_many(
+        self,
+        urls: Iterable[str],
+        options: Optional[Union[ScrapeOptions, CompiledScrapeOptions]] = None,
+        *,
+        concurrency: Optional[int] = None,
+        stop_on_error: bool = False,
+        fairness: Optional[HostFairness] = None,
+    ) -> AsyncIterator[ScrapeManyResult]:
+        # Async generator of results in completion order (see FirecrawlClient.scrape_many).
+        # Like the sync client, concurrency defaults to the pool's keep-alive connections
+        limits = self.async_http_client.limits
+        return async_scrape.scrape_many(
+            self.async_http_client, urls, options,
+            concurrency=concurrency or limits.max_keepalive_connections or limits.max_connections or 8,
+            stop_on_error=stop_on_error, fairness=fairness,
+        )
 
     # Search
     async def search(
@@ -77,35 +166,49 @@ class AsyncFirecrawlClient:
         request = CrawlRequest(url=url, **kwargs)
         return await async_crawl.start_crawl(self.async_http_client, request)
 
-    async def wait_crawl(self, job_id: str, poll_interval: int = 2, timeout: Optional[int] = None) -> CrawlJob:
-        # simple polling loop using blocking get (ok for test-level async)
-        start = asyncio.get_event_loop().time()
-        while True:
-            status = await async_crawl.get_crawl_status(self.async_http_client, job_id)
-            if status.status in ["completed", "failed"]:
-                return status
-            if timeout and (asyncio.get_event_loop().time() - start) > timeout:
-                raise TimeoutError("Crawl wait timed out")
-            await asyncio.sleep(poll_interval)
+    async def wait_crawl(
+        self,
+        job_id: str,
+        poll_interval: int = 2,
+        timeout: Optional[int] = None,
+        poll_mode: PollMode = "full",
+        document_store: Optional[DocumentStore] = None,
+    ) -> CrawlJob:
+        return await async_crawl.wait_for_crawl_completion(
+            self.async_http_client, job_id, poll_interval, timeout,
+            poll_mode=poll_mode, document_store=document_store,
+        )
 
     async def crawl(self, **kwargs) -> CrawlJob:
         # wrapper combining start and wait
-        resp = await self.start_crawl(**{k: v for k, v in kwargs.items() if k not in ("poll_interval", "timeout")})
+        resp = await self.start_crawl(**{k: v for k, v in kwargs.items() if k not in ("poll_interval", "timeout", "poll_mode", "document_store")})
         poll_interval = kwargs.get("poll_interval", 2)
         timeout = kwargs.get("timeout")
-        return await self.wait_crawl(resp.id, poll_interval=poll_interval, timeout=timeout)
+        poll_mode = kwargs.get("poll_mode", "full")
+        document_store = kwargs.get("document_store")
+        return await self.wait_crawl(
+            resp.id, poll_interval=poll_interval, timeout=timeout, poll_mode=poll_mode, document_store=document_store
+        )
 
     async def get_crawl_status(
         self, 
         job_id: str,
-        pagination_config: Optional[PaginationConfig] = None
+        pagination_config: Optional[PaginationConfig] = None,
+        document_store: Optional[DocumentStore] = None,
     ) -> CrawlJob:
         return await async_crawl.get_crawl_status(
             self.async_http_client, 
             job_id,
-            pagination_config=pagination_config
+            pagination_config=pagination_config,
+            document_store=document_store,
         )
 
+    def iter_crawl_pages(self, job_id: str, *, cursor: Optional[str] = None) -> AsyncIterator[CrawlJob]:
+        return async_crawl.iter_crawl_pages(self.async_http_client, job_id, cursor)
+
+    def iter_crawl_documents(self, job_id: str, *, cursor: Optional[str] = None) -> AsyncIterator[Document]:
+        return async_crawl.iter_crawl_documents(self.async_http_client, job_id, cursor)
+
     async def cancel_crawl(self, job_id: str) -> bool:
         return await async_crawl.cancel_crawl(self.async_http_client, job_id)
 
@@ -147,35 +250,42 @@ class AsyncFirecrawlClient:
     async def start_batch_scrape(self, urls: List[str], **kwargs) -> Any:
         return await async_batch.start_batch_scrape(self.async_http_client, urls, **kwargs)
 
-    async def wait_batch_scrape(self, job_id: str, poll_interval: int = 2, timeout: Optional[int] = None) -> Any:
-        start = asyncio.get_event_loop().time()
-        while True:
-            status = await async_batch.get_batch_scrape_status(self.async_http_client, job_id)
-            if status.status in ["completed", "failed", "cancelled"]:
-                return status
-            if timeout and (asyncio.get_event_loop().time() - start) > timeout:
-                raise TimeoutError("Batch wait timed out")
-            await asyncio.sleep(poll_interval)
+    async def wait_batch_scrape(
+        self,
+        job_id: str,
+        poll_interval: int = 2,
+        timeout: Optional[int] = None,
+        poll_mode: PollMode = "full",
+        document_store: Optional[DocumentStore] = None,
+    ) -> Any:
+        return await async_batch.wait_for_batch_completion(
+            self.async_http_client, job_id, poll_interval, timeout,
+            poll_mode=poll_mode, document_store=document_store,
+        )
 
     async def batch_scrape(self, urls: List[str], **kwargs) -> Any:
-        # waiter wrapper
-        start = await self.start_batch_scrape(urls, **{k: v for k, v in kwargs.items() if k not in ("poll_interval", "timeout")})
-        job_id = start.id
-        poll_interval = kwargs.get("poll_interval", 2)
-        timeout = kwargs.get("timeout")
-        return await self.wait_batch_scrape(job_id, poll_interval=poll_interval, timeout=timeout)
+        # waiter wrapper; retry_failed=N re-scrapes transiently failed URLs in follow-up jobs
+        return await async_batch.batch_scrape(self.async_http_client, urls, **kwargs)
 
     async def get_batch_scrape_status(
         self, 
         job_id: str,
-        pagination_config: Optional[PaginationConfig] = None
+        pagination_config: Optional[PaginationConfig] = None,
+        document_store: Optional[DocumentStore] = None,
     ):
         return await async_batch.get_batch_scrape_status(
             self.async_http_client, 
             job_id,
-            pagination_config=pagination_config
+            pagination_config=pagination_config,
+            document_store=document_store,
         )
 
+    def iter_batch_pages(self, job_id: str, *, cursor: Optional[str] = None) -> AsyncIterator[BatchScrapeJob]:
+        return async_batch.iter_batch_pages(self.async_http_client, job_id, cursor)
+
+    def iter_batch_documents(self, job_id: str, *, cursor: Optional[str] = None) -> AsyncIterator[Document]:
+        return async_batch.iter_batch_documents(self.async_http_client, job_id, cursor)
+
     async def cancel_batch_scrape(self, job_id: str) -> bool:
         return await async_batch.cancel_batch_scrape(self.async_http_client, job_id)
 
@@ -199,6 +309,7 @@ class AsyncFirecrawlClient:
         poll_interval: int = 2,
         timeout: Optional[int] = None,
         integration: Optional[str] = None,
+        dedupe: Union[bool, UrlCanonicalization] = False,
     ):
         return await async_extract.extract(
             self.async_http_client,
@@ -214,6 +325,7 @@ class AsyncFirecrawlClient:
             poll_interval=poll_interval,
             timeout=timeout,
             integration=integration,
+            dedupe=dedupe,
         )
 
     async def get_extract_status(self, job_id: str):
@@ -232,6 +344,7 @@ class AsyncFirecrawlClient:
         scrape_options: Optional['ScrapeOptions'] = None,
         ignore_invalid_urls: Optional[bool] = None,
         integration: Optional[str] = None,
+        dedupe: Union[bool, UrlCanonicalization] = False,
     ):
         return await async_extract.start_extract(
             self.async_http_client,
@@ -245,6 +358,7 @@ class AsyncFirecrawlClient:
             scrape_options=scrape_options,
             ignore_invalid_urls=ignore_invalid_urls,
             integration=integration,
+            dedupe=dedupe,
         )
 
     # Usage endpoints
@@ -280,6 +394,18 @@ class AsyncFirecrawlClient:
         kind: Literal["crawl", "batch"] = "crawl",
         poll_interval: int = 2,
         timeout: Optional[int] = None,
+        reconnect_policy: Optional[RetryPolicy] = None,
+        snapshot_mode: SnapshotMode = "full",
+        retain_data: bool = True,
     ) -> AsyncWatcher:
-        return AsyncWatcher(self, job_id, kind=kind, poll_interval=poll_interval, timeout=timeout)
+        return AsyncWatcher(
+            self,
+            job_id,
+            kind=kind,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            reconnect_policy=reconnect_policy,
+            snapshot_mode=snapshot_mode,
+            retain_data=retain_data,
+        )
 
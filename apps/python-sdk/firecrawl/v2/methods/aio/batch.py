@@ -1,9 +1,26 @@
-from typing import Optional, List, Dict, Any
-from ...types import ScrapeOptions, WebhookConfig, Document, BatchScrapeResponse, BatchScrapeJob, PaginationConfig
+from typing import Optional, List, Dict, Any, AsyncIterator, Awaitable, Callable, Tuple, Union
+from ...types import ScrapeOptions, WebhookConfig, Document, BatchScrapeResponse, BatchScrapeJob, PaginationConfig, PollMode, UrlCanonicalization, BatchRetryReport, CrawlErrorsResponse, HostFairness
 from ...utils.http_client_async import AsyncHttpClient
 from ...utils.validation import prepare_scrape_options
 from ...utils.error_handler import handle_response_error
-from ...utils.normalize import normalize_document_input
+from ...utils.poll_scheduler import PollScheduler, PollLimitExceeded
+from ...utils.document_store import DocumentStore
+from ...utils.payload_decoder import decode_job_page
+from ...utils.page_fetcher import delta_cursor, fetch_remaining_pages
+from ...utils.url_dedup import apply_dedupe
+from ...utils.host_scheduler import fair_order
+from ...utils.retry import RetryPolicy
+from ...utils.batch_retry import merge_retry_job, parse_batch_errors, split_retryable
+from ...utils.batch_chunking import (
+    MAX_BATCH_URLS,
+    chunk_idempotency_key,
+    merge_batch_responses,
+    new_idempotency_key,
+    raise_for_failed_chunks,
+    split_batch_urls,
+    validate_idempotency_key,
+)
+import asyncio
 import time
 
 
@@ -32,9 +49,72 @@ def _prepare(urls: List[str], *, options: Optional[ScrapeOptions] = None, **kwar
     return payload
 
 
-async def start_batch_scrape(client: AsyncHttpClient, urls: List[str], **kwargs) -> BatchScrapeResponse:
-    payload = _prepare(urls, **kwargs)
-    response = await client.post("/v2/batch/scrape", payload)
+async def start_batch_scrape(
+    client: AsyncHttpClient,
+    urls: List[str],
+    *,
+    idempotency_key: Optional[str] = None,
+    chunk_size: int = MAX_BATCH_URLS,
+    max_parallel_chunks: int = 4,
+    dedupe: Union[bool, UrlCanonicalization] = False,
+    fairness: Optional[HostFairness] = None,
+    **kwargs,
+) -> BatchScrapeResponse:
+    validate_idempotency_key(idempotency_key)
+    urls, duplicates_removed = apply_dedupe(urls, dedupe)
+    if fairness is not None:
+        urls = fair_order(urls, fairness)
+    chunks = split_batch_urls(urls, max_urls=chunk_size)
+    payloads = [_prepare(chunk, **kwargs) for chunk in chunks or [urls]]
+    if len(payloads) == 1:
+        response = await _post_batch_scrape(client, payloads[0], idempotency_key)
+    else:
+        response = await _post_batch_scrape_chunks(
+            client, payloads, kwargs.get("append_to_id"), idempotency_key, max_parallel_chunks
+        )
+    response.duplicate_urls_removed = duplicates_removed
+    return response
+
+
+async def _post_batch_scrape_chunks(
+    client: AsyncHttpClient,
+    payloads: List[Dict[str, Any]],
+    append_to_id: Optional[str],
+    idempotency_key: Optional[str],
+    max_parallel_chunks: int,
+) -> BatchScrapeResponse:
+    # Large list: the first chunk creates the job, the rest are appended to it
+    base_key = idempotency_key or new_idempotency_key()
+    semaphore = asyncio.Semaphore(max(1, max_parallel_chunks))
+
+    async def submit(index: int, job_id: str) -> BatchScrapeResponse:
+        payloads[index]["appendToId"] = job_id
+        async with semaphore:
+            return await _post_batch_scrape(client, payloads[index], chunk_idempotency_key(base_key, index))
+
+    if append_to_id is None:
+        first = await _post_batch_scrape(client, payloads[0], base_key)
+        job_id, responses, rest = first.id, [first], range(1, len(payloads))
+    else:
+        job_id, responses, rest = append_to_id, [], range(len(payloads))
+    results = await asyncio.gather(*(submit(index, job_id) for index in rest), return_exceptions=True)
+    errors: Dict[int, Exception] = {}
+    for index, result in zip(rest, results):
+        if isinstance(result, Exception):
+            errors[index] = result
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            responses.append(result)
+    raise_for_failed_chunks(job_id, payloads, errors)
+    return merge_batch_responses(job_id, responses)
+
+
+async def _post_batch_scrape(
+    client: AsyncHttpClient, payload: Dict[str, Any], idempotency_key: Optional[str]
+) -> BatchScrapeResponse:
+    headers = {"x-idempotency-key": idempotency_key} if idempotency_key else None
+    response = await client.post("/v2/batch/scrape", payload, headers=headers)
     if response.status_code >= 400:
         handle_response_error(response, "start batch scrape")
     body = response.json()
@@ -46,7 +126,8 @@ async def start_batch_scrape(client: AsyncHttpClient, urls: List[str], **kwargs)
 async def get_batch_scrape_status(
     client: AsyncHttpClient, 
     job_id: str,
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    document_store: Optional[DocumentStore] = None,
 ) -> BatchScrapeJob:
     """
     Get the status of a batch scrape job.
@@ -55,6 +136,8 @@ async def get_batch_scrape_status(
         client: Async HTTP client instance
         job_id: ID of the batch scrape job
         pagination_config: Optional configuration for pagination behavior
+        document_store: Optional store to spill documents to as pages are
+            fetched; ``data`` is then a lazy view of the store
         
     Returns:
         BatchScrapeJob containing job status and data
@@ -65,14 +148,13 @@ async def get_batch_scrape_status(
     response = await client.get(f"/v2/batch/scrape/{job_id}")
     if response.status_code >= 400:
         handle_response_error(response, "get batch scrape status")
-    body = response.json()
+    body = decode_job_page(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
-    docs: List[Document] = []
-    for doc in body.get("data", []) or []:
-        if isinstance(doc, dict):
-            normalized = normalize_document_input(doc)
-            docs.append(Document(**normalized))
+    if document_store is not None:
+        document_store.clear()
+    docs: Union[List[Document], DocumentStore] = document_store if document_store is not None else []
+    docs.extend(body["data"])
     
     # Handle pagination if requested
     auto_paginate = pagination_config.auto_paginate if pagination_config else True
@@ -81,90 +163,217 @@ async def get_batch_scrape_status(
             client, 
             body.get("next"), 
             docs, 
-            pagination_config
+            pagination_config,
+            available=body.get("completed"),
         )
     
-    return BatchScrapeJob(
+    batch_job = BatchScrapeJob(
         status=body.get("status"),
         completed=body.get("completed", 0),
         total=body.get("total", 0),
         credits_used=body.get("creditsUsed"),
         expires_at=body.get("expiresAt"),
         next=body.get("next") if not auto_paginate else None,
-        data=docs,
+        data=docs if document_store is None else [],
     )
+    if document_store is not None:
+        batch_job.data = document_store.documents()
+    return batch_job
 
 
 async def _fetch_all_batch_pages_async(
     client: AsyncHttpClient,
     next_url: str,
-    initial_documents: List[Document],
-    pagination_config: Optional[PaginationConfig] = None
-) -> List[Document]:
+    initial_documents: Union[List[Document], DocumentStore],
+    pagination_config: Optional[PaginationConfig] = None,
+    available: Optional[int] = None,
+) -> Union[List[Document], DocumentStore]:
     """
     Fetch all pages of batch scrape results asynchronously.
     
+    Up to ``pagination_config.max_concurrent_pages`` pages are requested at
+    once when ``available`` is known; documents keep their original order.
+    
     Args:
         client: Async HTTP client instance
         next_url: URL for the next page
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
+        available: Number of completed documents reported by the first page
         
     Returns:
         List of all documents from all pages
     """
-    documents = initial_documents.copy()
-    current_url = next_url
-    page_count = 0
-    
-    # Apply pagination limits
-    max_pages = pagination_config.max_pages if pagination_config else None
-    max_results = pagination_config.max_results if pagination_config else None
-    max_wait_time = pagination_config.max_wait_time if pagination_config else None
-    
-    start_time = time.monotonic()
-    
-    while current_url:
-        # Check pagination limits
-        if (max_pages is not None) and (page_count >= max_pages):
-            break
-            
-        if (max_wait_time is not None) and (time.monotonic() - start_time) > max_wait_time:
-            break
-        
-        # Fetch next page
-        response = await client.get(current_url)
-        
+    # A DocumentStore is appended to in place; lists are copied
+    documents = initial_documents.copy() if isinstance(initial_documents, list) else initial_documents
+    return await fetch_remaining_pages(client, next_url, documents, pagination_config, available=available)
+
+
+async def iter_batch_pages(
+    client: AsyncHttpClient,
+    job_id: str,
+    cursor: Optional[str] = None,
+) -> AsyncIterator[BatchScrapeJob]:
+    """
+    Iterate over batch scrape results one page at a time.
+
+    Each yielded BatchScrapeJob holds only that page's documents; its
+    ``next`` is the cursor to pass back as ``cursor`` to resume later.
+
+    Args:
+        client: Async HTTP client instance
+        job_id: ID of the batch scrape job
+        cursor: ``next`` URL saved from a previous page (None to start from the beginning)
+
+    Returns:
+        Async iterator of BatchScrapeJob pages
+
+    Raises:
+        Exception: If fetching a page fails
+    """
+    url: Optional[str] = cursor or f"/v2/batch/scrape/{job_id}"
+    while url:
+        response = await client.get(url)
         if response.status_code >= 400:
-            # Log error but continue with what we have
-            import logging
-            logger = logging.getLogger("firecrawl")
-            logger.warning(f"Failed to fetch next page: {response.status_code}")
-            break
-        
-        page_data = response.json()
-        
-        if not page_data.get("success"):
-            break
-        
-        # Add documents from this page
-        for doc in page_data.get("data", []) or []:
-            if isinstance(doc, dict):
-                # Check max_results limit
-                if (max_results is not None) and (len(documents) >= max_results):
-                    break
-                normalized = normalize_document_input(doc)
-                documents.append(Document(**normalized))
-        
-        # Check if we hit max_results limit
-        if (max_results is not None) and (len(documents) >= max_results):
+            handle_response_error(response, "get batch scrape status")
+        body = decode_job_page(response)
+        if not body.get("success"):
+            raise Exception(body.get("error", "Unknown error occurred"))
+
+        page = BatchScrapeJob(
+            status=body.get("status"),
+            completed=body.get("completed", 0),
+            total=body.get("total", 0),
+            credits_used=body.get("creditsUsed"),
+            expires_at=body.get("expiresAt"),
+            next=body.get("next"),
+            data=body["data"],
+        )
+        del body, response
+        url = page.next
+        yield page
+        del page
+
+
+async def iter_batch_documents(
+    client: AsyncHttpClient,
+    job_id: str,
+    cursor: Optional[str] = None,
+) -> AsyncIterator[Document]:
+    """
+    Iterate over batch scrape documents, fetching one page at a time.
+
+    Args:
+        client: Async HTTP client instance
+        job_id: ID of the batch scrape job
+        cursor: ``next`` URL to resume from (see ``iter_batch_pages``)
+
+    Returns:
+        Async iterator of Document objects
+    """
+    async for page in iter_batch_pages(client, job_id, cursor):
+        for document in page.data:
+            yield document
+
+
+async def _get_batch_progress(client: AsyncHttpClient, job_id: str) -> BatchScrapeJob:
+    """Fetch only the status counters of a batch job (at most one document is transferred)."""
+    response = await client.get(f"/v2/batch/scrape/{job_id}?limit=1")
+    if response.status_code >= 400:
+        handle_response_error(response, "get batch scrape status")
+    body = response.json()
+    if not body.get("success"):
+        raise Exception(body.get("error", "Unknown error occurred"))
+    return BatchScrapeJob(
+        status=body.get("status"),
+        completed=body.get("completed", 0),
+        total=body.get("total", 0),
+        credits_used=body.get("creditsUsed"),
+        expires_at=body.get("expiresAt"),
+        data=[],
+    )
+
+
+async def _fetch_batch_delta(
+    client: AsyncHttpClient, job_id: str, documents: Union[List[Document], DocumentStore], cursor: str
+) -> Tuple[BatchScrapeJob, str]:
+    """Append documents from ``cursor`` on; return the latest status page and the cursor to poll next."""
+    base = f"/v2/batch/scrape/{job_id}"
+    latest = None
+    async for page in iter_batch_pages(client, job_id, cursor=cursor):
+        documents.extend(page.data)
+        page.data = []
+        latest = page
+        cursor, more = delta_cursor(base, cursor, page.next, page.total)
+        if not more:
             break
-        
-        # Get next URL
-        current_url = page_data.get("next")
-        page_count += 1
-    
-    return documents
+    return latest, cursor
+
+
+async def wait_for_batch_completion(
+    client: AsyncHttpClient,
+    job_id: str,
+    poll_interval: int = 2,
+    timeout: Optional[int] = None,
+    poll_mode: PollMode = "full",
+    max_polls: Optional[int] = None,
+    document_store: Optional[DocumentStore] = None,
+) -> BatchScrapeJob:
+    """
+    Wait for a batch scrape job to complete, polling for status updates.
+
+    Args:
+        client: Async HTTP client instance
+        job_id: ID of the batch scrape job
+        poll_interval: Seconds before the first re-check; later delays adapt to the job's progress
+        timeout: Maximum seconds to wait (None for no timeout)
+        poll_mode: "full" (default) re-fetches all results on every poll,
+            "status" polls only counters and downloads results once at
+            completion, "delta" fetches only new documents on each poll
+        max_polls: Maximum number of status checks (None for no limit)
+        document_store: Optional store to spill result documents to (see
+            ``get_batch_scrape_status``)
+
+    Returns:
+        BatchScrapeJob when job completes
+
+    Raises:
+        TimeoutError: If timeout is reached
+    """
+    if poll_mode not in ("status", "delta", "full"):
+        raise ValueError(f"Unknown poll_mode: {poll_mode}")
+
+    start_time = time.monotonic()
+    scheduler = PollScheduler(poll_interval, max_polls=max_polls, timeout=timeout or None)
+    # Without a store the status call keeps its original (client, job_id) form
+    store_kwargs = {"document_store": document_store} if document_store is not None else {}
+    documents: Union[List[Document], DocumentStore] = []
+    if poll_mode == "delta" and document_store is not None:
+        document_store.clear()
+        documents = document_store
+    cursor = f"/v2/batch/scrape/{job_id}?skip=0"
+    while True:
+        if poll_mode == "full":
+            status_job = await get_batch_scrape_status(client, job_id, **store_kwargs)
+        elif poll_mode == "delta":
+            status_job, cursor = await _fetch_batch_delta(client, job_id, documents, cursor)
+        else:
+            status_job = await _get_batch_progress(client, job_id)
+        scheduler.observe(getattr(status_job, "completed", None), getattr(status_job, "total", None))
+
+        if status_job.status in ["completed", "failed", "cancelled"]:
+            if poll_mode == "status":
+                return await get_batch_scrape_status(client, job_id, **store_kwargs)
+            if poll_mode == "delta":
+                status_job.data = documents if document_store is None else document_store.documents()
+                status_job.next = None
+            return status_job
+
+        if timeout and (time.monotonic() - start_time) > timeout:
+            raise TimeoutError("Batch wait timed out")
+        if scheduler.exhausted:
+            raise PollLimitExceeded(f"Batch job {job_id} did not complete within {max_polls} polls")
+        await scheduler.sleep_async()
 
 
 async def cancel_batch_scrape(client: AsyncHttpClient, job_id: str) -> bool:
@@ -184,3 +393,98 @@ async def get_batch_scrape_errors(client: AsyncHttpClient, job_id: str) -> Dict[
         raise Exception(body.get("error", "Unknown error occurred"))
     return body
 
+
+async def batch_scrape(
+    client: AsyncHttpClient,
+    urls: List[str],
+    *,
+    poll_interval: int = 2,
+    timeout: Optional[int] = None,
+    poll_mode: PollMode = "full",
+    max_polls: Optional[int] = None,
+    document_store: Optional[DocumentStore] = None,
+    retry_failed: int = 0,
+    retry_backoff: float = 1.0,
+    **kwargs,
+) -> BatchScrapeJob:
+    """
+    Start a batch scrape job and wait for it to complete.
+
+    ``kwargs`` are passed to ``start_batch_scrape``. With ``retry_failed``,
+    URLs that failed transiently are re-scraped in up to that many follow-up
+    jobs (see the sync ``batch_scrape``).
+    """
+    start = await start_batch_scrape(client, urls, **kwargs)
+    deadline = time.monotonic() + timeout if timeout else None
+    job = await wait_for_batch_completion(
+        client, start.id, poll_interval, timeout,
+        poll_mode=poll_mode, max_polls=max_polls, document_store=document_store,
+    )
+    if retry_failed > 0:
+        # Follow-up jobs get the same scrape options but not the caller's job wiring
+        retry_kwargs = {
+            k: v for k, v in kwargs.items()
+            if k not in ("append_to_id", "webhook", "idempotency_key", "dedupe")
+        }
+
+        async def resubmit(retry_urls: List[str]) -> str:
+            return (await start_batch_scrape(client, retry_urls, **retry_kwargs)).id
+
+        await _retry_failed_urls(
+            client, start.id, job, resubmit,
+            rounds=retry_failed, backoff=retry_backoff, poll_interval=poll_interval,
+            deadline=deadline, document_store=document_store,
+        )
+    return job
+
+
+async def _retry_failed_urls(
+    client: AsyncHttpClient,
+    job_id: str,
+    job: BatchScrapeJob,
+    resubmit: Callable[[List[str]], Awaitable[str]],
+    *,
+    rounds: int,
+    backoff: float,
+    poll_interval: int,
+    deadline: Optional[float],
+    document_store: Optional[DocumentStore],
+) -> None:
+    report = BatchRetryReport()
+    policy = RetryPolicy(backoff_factor=backoff, budget=None)
+    errors = await _get_batch_errors(client, job_id)
+    report.robots_blocked.extend(errors.robots_blocked)
+    pending = errors.errors
+    delay = 0.0
+    for attempt in range(rounds):
+        retry_urls, final = split_retryable(pending)
+        if not retry_urls:
+            break
+        delay = policy.backoff(attempt, delay)
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            # No time left for another round; what is pending is reported as failed
+            break
+        report.failed.extend(final)
+        pending = []
+        await asyncio.sleep(delay)
+        retry_id = await resubmit(retry_urls)
+        report.rounds += 1
+        report.retry_job_ids.append(retry_id)
+        remaining = deadline - time.monotonic() if deadline is not None else None
+        retry_job = await wait_for_batch_completion(client, retry_id, poll_interval, remaining)
+        merge_retry_job(job, retry_job, document_store)
+        errors = await _get_batch_errors(client, retry_id)
+        report.robots_blocked.extend(errors.robots_blocked)
+        pending = errors.errors
+        failed_again = {error.url for error in pending}
+        report.recovered.extend(url for url in retry_urls if url not in failed_again)
+    report.failed.extend(pending)
+    job.retry_report = report
+
+
+async def _get_batch_errors(client: AsyncHttpClient, job_id: str) -> CrawlErrorsResponse:
+    # The errors endpoint answers without a "success" flag; parse it like the sync method
+    response = await client.get(f"/v2/batch/scrape/{job_id}/errors")
+    if response.status_code >= 400:
+        handle_response_error(response, "get batch scrape errors")
+    return parse_batch_errors(response.json())
@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator, Tuple, Union
 from ...types import (
     CrawlRequest,
     CrawlJob,
@@ -11,11 +11,15 @@ from ...types import (
     ActiveCrawlsResponse,
     ActiveCrawl,
     PaginationConfig,
+    PollMode,
 )
 from ...utils.error_handler import handle_response_error
 from ...utils.validation import prepare_scrape_options
 from ...utils.http_client_async import AsyncHttpClient
-from ...utils.normalize import normalize_document_input
+from ...utils.poll_scheduler import PollScheduler, PollLimitExceeded
+from ...utils.document_store import DocumentStore
+from ...utils.payload_decoder import decode_job_page
+from ...utils.page_fetcher import delta_cursor, fetch_remaining_pages
 import time
 
 
@@ -89,7 +93,8 @@ async def start_crawl(client: AsyncHttpClient, request: CrawlRequest) -> CrawlRe
 async def get_crawl_status(
     client: AsyncHttpClient, 
     job_id: str,
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    document_store: Optional[DocumentStore] = None,
 ) -> CrawlJob:
     """
     Get the status of a crawl job.
@@ -98,6 +103,8 @@ async def get_crawl_status(
         client: Async HTTP client instance
         job_id: ID of the crawl job
         pagination_config: Optional configuration for pagination limits
+        document_store: Optional store to spill documents to as pages are
+            fetched; ``data`` is then a lazy view of the store
         
     Returns:
         CrawlJob with job information
@@ -108,13 +115,12 @@ async def get_crawl_status(
     response = await client.get(f"/v2/crawl/{job_id}")
     if response.status_code >= 400:
         handle_response_error(response, "get crawl status")
-    body = response.json()
+    body = decode_job_page(response)
     if body.get("success"):
-        documents = []
-        for doc_data in body.get("data", []):
-            if isinstance(doc_data, dict):
-                normalized = normalize_document_input(doc_data)
-                documents.append(Document(**normalized))
+        if document_store is not None:
+            document_store.clear()
+        documents = document_store if document_store is not None else []
+        documents.extend(body["data"])
         
         # Handle pagination if requested
         auto_paginate = pagination_config.auto_paginate if pagination_config else True
@@ -123,91 +129,218 @@ async def get_crawl_status(
                 client, 
                 body.get("next"), 
                 documents, 
-                pagination_config
+                pagination_config,
+                available=body.get("completed"),
             )
         
-        return CrawlJob(
+        crawl_job = CrawlJob(
             status=body.get("status"),
             completed=body.get("completed", 0),
             total=body.get("total", 0),
             credits_used=body.get("creditsUsed", 0),
             expires_at=body.get("expiresAt"),
             next=body.get("next") if not auto_paginate else None,
-            data=documents,
+            data=documents if document_store is None else [],
         )
+        if document_store is not None:
+            crawl_job.data = document_store.documents()
+        return crawl_job
     raise Exception(body.get("error", "Unknown error occurred"))
 
 
 async def _fetch_all_pages_async(
     client: AsyncHttpClient,
     next_url: str,
-    initial_documents: List[Document],
-    pagination_config: Optional[PaginationConfig] = None
-) -> List[Document]:
+    initial_documents: Union[List[Document], DocumentStore],
+    pagination_config: Optional[PaginationConfig] = None,
+    available: Optional[int] = None,
+) -> Union[List[Document], DocumentStore]:
     """
     Fetch all pages of crawl results asynchronously.
     
+    Up to ``pagination_config.max_concurrent_pages`` pages are requested at
+    once when ``available`` is known; documents keep their original order.
+    
     Args:
         client: Async HTTP client instance
         next_url: URL for the next page
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
+        available: Number of completed documents reported by the first page
         
     Returns:
         List of all documents from all pages
     """
-    documents = initial_documents.copy()
-    current_url = next_url
-    page_count = 0
-    
-    # Apply pagination limits
-    max_pages = pagination_config.max_pages if pagination_config else None
-    max_results = pagination_config.max_results if pagination_config else None
-    max_wait_time = pagination_config.max_wait_time if pagination_config else None
-    
-    start_time = time.monotonic()
-    
-    while current_url:
-        # Check pagination limits (treat 0 as a valid limit)
-        if (max_pages is not None) and page_count >= max_pages:
-            break
+    # A DocumentStore is appended to in place; lists are copied
+    documents = initial_documents.copy() if isinstance(initial_documents, list) else initial_documents
+    return await fetch_remaining_pages(client, next_url, documents, pagination_config, available=available)
 
-        if (max_wait_time is not None) and (time.monotonic() - start_time) > max_wait_time:
-            break
-        
-        # Fetch next page
-        response = await client.get(current_url)
-        
+
+async def iter_crawl_pages(
+    client: AsyncHttpClient,
+    job_id: str,
+    cursor: Optional[str] = None,
+) -> AsyncIterator[CrawlJob]:
+    """
+    Iterate over crawl results one page at a time.
+
+    Each yielded CrawlJob holds only that page's documents; its ``next`` is
+    the cursor to pass back as ``cursor`` to resume later.
+
+    Args:
+        client: Async HTTP client instance
+        job_id: ID of the crawl job
+        cursor: ``next`` URL saved from a previous page (None to start from the beginning)
+
+    Returns:
+        Async iterator of CrawlJob pages
+
+    Raises:
+        Exception: If fetching a page fails
+    """
+    url: Optional[str] = cursor or f"/v2/crawl/{job_id}"
+    while url:
+        response = await client.get(url)
         if response.status_code >= 400:
-            # Log error but continue with what we have
-            import logging
-            logger = logging.getLogger("firecrawl")
-            logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
-            break
-        
-        page_data = response.json()
-        
-        if not page_data.get("success"):
-            break
-        
-        # Add documents from this page
-        for doc_data in page_data.get("data", []):
-            if isinstance(doc_data, dict):
-                # Check max_results limit
-                if (max_results is not None) and (len(documents) >= max_results):
-                    break
-                normalized = normalize_document_input(doc_data)
-                documents.append(Document(**normalized))
-        
-        # Check if we hit max_results limit
-        if (max_results is not None) and (len(documents) >= max_results):
+            handle_response_error(response, "get crawl status")
+        body = decode_job_page(response)
+        if not body.get("success"):
+            raise Exception(body.get("error", "Unknown error occurred"))
+
+        page = CrawlJob(
+            status=body.get("status"),
+            completed=body.get("completed", 0),
+            total=body.get("total", 0),
+            credits_used=body.get("creditsUsed", 0),
+            expires_at=body.get("expiresAt"),
+            next=body.get("next"),
+            data=body["data"],
+        )
+        del body, response
+        url = page.next
+        yield page
+        del page
+
+
+async def iter_crawl_documents(
+    client: AsyncHttpClient,
+    job_id: str,
+    cursor: Optional[str] = None,
+) -> AsyncIterator[Document]:
+    """
+    Iterate over crawl documents, fetching one page at a time.
+
+    Args:
+        client: Async HTTP client instance
+        job_id: ID of the crawl job
+        cursor: ``next`` URL to resume from (see ``iter_crawl_pages``)
+
+    Returns:
+        Async iterator of Document objects
+    """
+    async for page in iter_crawl_pages(client, job_id, cursor):
+        for document in page.data:
+            yield document
+
+
+async def _get_crawl_progress(client: AsyncHttpClient, job_id: str) -> CrawlJob:
+    """Fetch only the status counters of a crawl (at most one document is transferred)."""
+    response = await client.get(f"/v2/crawl/{job_id}?limit=1")
+    if response.status_code >= 400:
+        handle_response_error(response, "get crawl status")
+    body = response.json()
+    if not body.get("success"):
+        raise Exception(body.get("error", "Unknown error occurred"))
+    return CrawlJob(
+        status=body.get("status"),
+        completed=body.get("completed", 0),
+        total=body.get("total", 0),
+        credits_used=body.get("creditsUsed", 0),
+        expires_at=body.get("expiresAt"),
+        data=[],
+    )
+
+
+async def _fetch_crawl_delta(
+    client: AsyncHttpClient, job_id: str, documents: Union[List[Document], DocumentStore], cursor: str
+) -> Tuple[CrawlJob, str]:
+    """Append documents from ``cursor`` on; return the latest status page and the cursor to poll next."""
+    base = f"/v2/crawl/{job_id}"
+    latest = None
+    async for page in iter_crawl_pages(client, job_id, cursor=cursor):
+        documents.extend(page.data)
+        page.data = []
+        latest = page
+        cursor, more = delta_cursor(base, cursor, page.next, page.total)
+        if not more:
             break
-        
-        # Get next URL
-        current_url = page_data.get("next")
-        page_count += 1
-    
-    return documents
+    return latest, cursor
+
+
+async def wait_for_crawl_completion(
+    client: AsyncHttpClient,
+    job_id: str,
+    poll_interval: int = 2,
+    timeout: Optional[int] = None,
+    poll_mode: PollMode = "full",
+    max_polls: Optional[int] = None,
+    document_store: Optional[DocumentStore] = None,
+) -> CrawlJob:
+    """
+    Wait for a crawl job to complete, polling for status updates.
+
+    Args:
+        client: Async HTTP client instance
+        job_id: ID of the crawl job
+        poll_interval: Seconds before the first re-check; later delays adapt to the job's progress
+        timeout: Maximum seconds to wait (None for no timeout)
+        poll_mode: "full" (default) re-fetches all results on every poll,
+            "status" polls only counters and downloads results once at
+            completion, "delta" fetches only new documents on each poll
+        max_polls: Maximum number of status checks (None for no limit)
+        document_store: Optional store to spill result documents to (see
+            ``get_crawl_status``)
+
+    Returns:
+        CrawlJob when job completes
+
+    Raises:
+        TimeoutError: If timeout is reached
+    """
+    if poll_mode not in ("status", "delta", "full"):
+        raise ValueError(f"Unknown poll_mode: {poll_mode}")
+
+    start_time = time.monotonic()
+    scheduler = PollScheduler(poll_interval, max_polls=max_polls, timeout=timeout or None)
+    # Without a store the status call keeps its original (client, job_id) form
+    store_kwargs = {"document_store": document_store} if document_store is not None else {}
+    documents: Union[List[Document], DocumentStore] = []
+    if poll_mode == "delta" and document_store is not None:
+        document_store.clear()
+        documents = document_store
+    cursor = f"/v2/crawl/{job_id}?skip=0"
+    while True:
+        if poll_mode == "full":
+            crawl_job = await get_crawl_status(client, job_id, **store_kwargs)
+        elif poll_mode == "delta":
+            crawl_job, cursor = await _fetch_crawl_delta(client, job_id, documents, cursor)
+        else:
+            crawl_job = await _get_crawl_progress(client, job_id)
+        scheduler.observe(getattr(crawl_job, "completed", None), getattr(crawl_job, "total", None))
+
+        if crawl_job.status in ["completed", "failed"]:
+            if poll_mode == "status":
+                return await get_crawl_status(client, job_id, **store_kwargs)
+            if poll_mode == "delta":
+                crawl_job.data = documents if document_store is None else document_store.documents()
+                crawl_job.next = None
+            return crawl_job
+
+        if timeout and (time.monotonic() - start_time) > timeout:
+            raise TimeoutError("Crawl wait timed out")
+        if scheduler.exhausted:
+            raise PollLimitExceeded(f"Crawl job {job_id} did not complete within {max_polls} polls")
+        await scheduler.sleep_async()
 
 
 async def cancel_crawl(client: AsyncHttpClient, job_id: str) -> bool:
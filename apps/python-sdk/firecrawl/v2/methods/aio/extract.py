@@ -1,9 +1,11 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 import asyncio
 
-from ...types import ExtractResponse, ScrapeOptions
+from ...types import ExtractResponse, ScrapeOptions, UrlCanonicalization
 from ...utils.http_client_async import AsyncHttpClient
 from ...utils.validation import prepare_scrape_options
+from ...utils.poll_scheduler import PollScheduler
+from ...utils.url_dedup import apply_dedupe
 
 
 def _prepare_extract_request(
@@ -18,10 +20,12 @@ def _prepare_extract_request(
     scrape_options: Optional[ScrapeOptions] = None,
     ignore_invalid_urls: Optional[bool] = None,
     integration: Optional[str] = None,
+    dedupe: Union[bool, UrlCanonicalization] = False,
 ) -> Dict[str, Any]:
     body: Dict[str, Any] = {}
     if urls is not None:
-        body["urls"] = urls
+        # Duplicates after canonicalization cost credits without adding sources
+        body["urls"] = apply_dedupe(urls, dedupe)[0]
     if prompt is not None:
         body["prompt"] = prompt
     if schema is not None:
@@ -58,6 +62,7 @@ async def start_extract(
     scrape_options: Optional[ScrapeOptions] = None,
     ignore_invalid_urls: Optional[bool] = None,
     integration: Optional[str] = None,
+    dedupe: Union[bool, UrlCanonicalization] = False,
 ) -> ExtractResponse:
     body = _prepare_extract_request(
         urls,
@@ -70,6 +75,7 @@ async def start_extract(
         scrape_options=scrape_options,
         ignore_invalid_urls=ignore_invalid_urls,
         integration=integration,
+        dedupe=dedupe,
     )
     resp = await client.post("/v2/extract", body)
     return ExtractResponse(**resp.json())
@@ -86,15 +92,20 @@ async def wait_extract(
     *,
     poll_interval: int = 2,
     timeout: Optional[int] = None,
+    max_polls: Optional[int] = None,
 ) -> ExtractResponse:
     start_ts = asyncio.get_event_loop().time()
+    scheduler = PollScheduler(max(1, poll_interval), min_interval=1, max_polls=max_polls, timeout=timeout)
     while True:
         status = await get_extract_status(client, job_id)
+        scheduler.observe()
         if status.status in ("completed", "failed", "cancelled"):
             return status
         if timeout is not None and (asyncio.get_event_loop().time() - start_ts) > timeout:
             return status
-        await asyncio.sleep(max(1, poll_interval))
+        if scheduler.exhausted:
+            return status
+        await scheduler.sleep_async()
 
 
 async def extract(
@@ -112,6 +123,7 @@ async def extract(
     poll_interval: int = 2,
     timeout: Optional[int] = None,
     integration: Optional[str] = None,
+    dedupe: Union[bool, UrlCanonicalization] = False,
 ) -> ExtractResponse:
     started = await start_extract(
         client,
@@ -125,6 +137,7 @@ async def extract(
         scrape_options=scrape_options,
         ignore_invalid_urls=ignore_invalid_urls,
         integration=integration,
+        dedupe=dedupe,
     )
     job_id = getattr(started, "id", None)
     if not job_id:
@@ -1,33 +1,169 @@
-from typing import Optional, Dict, Any
-from ...types import ScrapeOptions, Document
+import asyncio
+import logging
+from typing import Optional, Dict, Any, Union, AsyncIterator, Iterable, Set
+from ...types import ScrapeOptions, Document, ScrapeManyResult, HostFairness
 from ...utils.normalize import normalize_document_input
 from ...utils.error_handler import handle_response_error
-from ...utils.validation import prepare_scrape_options, validate_scrape_options
+from ...utils.validation import compile_scrape_options, CompiledScrapeOptions
 from ...utils.http_client_async import AsyncHttpClient
+from ...utils.host_scheduler import url_dispatcher
+from ...utils.scrape_cache import ScrapeCache, scrape_cache_key
+from ...utils import json_codec
 
+logger = logging.getLogger("firecrawl")
 
-async def _prepare_scrape_request(url: str, options: Optional[ScrapeOptions] = None) -> Dict[str, Any]:
+# Background revalidations, referenced until done so they are not garbage collected
+_revalidations: Set["asyncio.Task[None]"] = set()
+
+
+async def _prepare_scrape_request(
+    url: str, options: Optional[Union[ScrapeOptions, CompiledScrapeOptions]] = None
+) -> Dict[str, Any]:
     if not url or not url.strip():
         raise ValueError("URL cannot be empty")
     payload: Dict[str, Any] = {"url": url.strip()}
     if options is not None:
-        validated = validate_scrape_options(options)
-        if validated is not None:
-            opts = prepare_scrape_options(validated)
-            if opts:
-                payload.update(opts)
+        payload.update(compile_scrape_options(options).payload)
     return payload
 
 
-async def scrape(client: AsyncHttpClient, url: str, options: Optional[ScrapeOptions] = None) -> Document:
-    payload = await _prepare_scrape_request(url, options)
+def _encode_scrape_request(
+    url: str, options: Optional[Union[ScrapeOptions, CompiledScrapeOptions]] = None
+) -> Union[Dict[str, Any], bytes]:
+    if not url or not url.strip():
+        raise ValueError("URL cannot be empty")
+    if options is None:
+        return {"url": url.strip()}
+    return compile_scrape_options(options).encode_request(url.strip())
+
+
+async def _post_scrape(client: AsyncHttpClient, payload: Union[Dict[str, Any], bytes]) -> Dict[str, Any]:
     response = await client.post("/v2/scrape", payload)
     if response.status_code >= 400:
         handle_response_error(response, "scrape")
     body = response.json()
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
-    document_data = body.get("data", {})
+    return body.get("data", {})
+
+
+async def scrape(
+    client: AsyncHttpClient,
+    url: str,
+    options: Optional[Union[ScrapeOptions, CompiledScrapeOptions]] = None,
+    *,
+    cache: Optional[ScrapeCache] = None,
+) -> Document:
+    if cache is not None:
+        return await _cached_scrape(client, cache, url, options)
+    document_data = await _post_scrape(client, _encode_scrape_request(url, options))
     normalized = normalize_document_input(document_data)
     return Document(**normalized)
 
+
+async def _cached_scrape(
+    client: AsyncHttpClient,
+    cache: ScrapeCache,
+    url: str,
+    options: Optional[Union[ScrapeOptions, CompiledScrapeOptions]],
+) -> Document:
+    # See the sync _cached_scrape; the stale-entry refresh runs as a task
+    request = await _prepare_scrape_request(url, options)
+    ttl = cache.ttl_for(request)
+    if ttl <= 0:
+        return await scrape(client, url, options)
+    key = scrape_cache_key(
+        request, api_url=getattr(client, "api_url", None), api_key=getattr(client, "api_key", None)
+    )
+    cached = cache.get(key)
+    if cached is not None:
+        body, fresh = cached
+        if not fresh and cache.begin_revalidation(key):
+            task = asyncio.ensure_future(_revalidate(client, cache, key, url, options, ttl))
+            _revalidations.add(task)
+            task.add_done_callback(_revalidations.discard)
+        return Document(**normalize_document_input(json_codec.loads(body)))
+
+    document_data = await _post_scrape(client, _encode_scrape_request(url, options))
+    cache.put(key, request["url"], json_codec.dumps(document_data, default=str), ttl)
+    return Document(**normalize_document_input(document_data))
+
+
+async def _revalidate(
+    client: AsyncHttpClient,
+    cache: ScrapeCache,
+    key: str,
+    url: str,
+    options: Optional[Union[ScrapeOptions, CompiledScrapeOptions]],
+    ttl: float,
+) -> None:
+    try:
+        document_data = await _post_scrape(client, _encode_scrape_request(url, options))
+        cache.put(key, url.strip(), json_codec.dumps(document_data, default=str), ttl)
+    except Exception as exc:
+        logger.debug("Revalidating cached scrape of %s failed: %s", url, exc)
+    finally:
+        cache.end_revalidation(key)
+
+
+async def _scrape_outcome(
+    client: AsyncHttpClient, index: int, url: str, options: Optional[CompiledScrapeOptions]
+) -> ScrapeManyResult:
+    try:
+        return ScrapeManyResult(index=index, url=url, document=await scrape(client, url, options))
+    except Exception as exc:
+        return ScrapeManyResult(
+            index=index, url=url, error=str(exc), status_code=getattr(exc, "status_code", None), exception=exc
+        )
+
+
+async def scrape_many(
+    client: AsyncHttpClient,
+    urls: Iterable[str],
+    options: Optional[Union[ScrapeOptions, CompiledScrapeOptions]] = None,
+    *,
+    concurrency: int = 8,
+    stop_on_error: bool = False,
+    fairness: Optional[HostFairness] = None,
+) -> AsyncIterator[ScrapeManyResult]:
+    """
+    Scrape many URLs concurrently, yielding results as they finish.
+
+    Async counterpart of the sync ``scrape_many``: one task per URL, with at
+    most ``concurrency`` tasks alive at a time, so a long URL list does not
+    create every task up front. ``fairness`` dispatches round-robin across
+    hosts with a per-host cap. Closing the generator cancels the scrapes
+    still in flight.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    compiled = compile_scrape_options(options) if options is not None else None
+    dispatcher = url_dispatcher(urls, fairness)
+    in_flight: Set["asyncio.Task[ScrapeManyResult]"] = set()
+
+    def fill() -> None:
+        while len(in_flight) < concurrency:
+            item = dispatcher.next()
+            if item is None:
+                return
+            in_flight.add(asyncio.ensure_future(_scrape_outcome(client, item[0], item[1], compiled)))
+
+    try:
+        fill()
+        while in_flight:
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            in_flight.difference_update(done)
+            stop = False
+            for task in done:
+                result = task.result()
+                dispatcher.done(result.url)
+                stop = stop or (stop_on_error and not result.ok)
+                yield result
+            if stop:
+                return
+            fill()
+    finally:
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
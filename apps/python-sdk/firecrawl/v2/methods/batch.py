@@ -3,7 +3,8 @@ Batch scraping functionality for Firecrawl v2 API.
 """
 
 import time
-from typing import Optional, List, Callable, Dict, Any, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Callable, Dict, Any, Tuple, Union, Iterator
 from ..types import (
     BatchScrapeRequest,
     BatchScrapeResponse,
@@ -12,9 +13,29 @@ from ..types import (
     Document,
     WebhookConfig,
     PaginationConfig,
+    PollMode,
+    UrlCanonicalization,
+    BatchRetryReport,
+    HostFairness,
 )
 from ..utils import HttpClient, handle_response_error, validate_scrape_options, prepare_scrape_options
-from ..utils.normalize import normalize_document_input
+from ..utils.poll_scheduler import PollScheduler, PollLimitExceeded
+from ..utils.document_store import DocumentStore
+from ..utils.payload_decoder import decode_job_page
+from ..utils.page_fetcher import delta_cursor
+from ..utils.url_dedup import apply_dedupe
+from ..utils.host_scheduler import fair_order
+from ..utils.retry import RetryPolicy
+from ..utils.batch_retry import merge_retry_job, parse_batch_errors, split_retryable
+from ..utils.batch_chunking import (
+    MAX_BATCH_URLS,
+    chunk_idempotency_key,
+    merge_batch_responses,
+    new_idempotency_key,
+    raise_for_failed_chunks,
+    split_batch_urls,
+    validate_idempotency_key,
+)
 from ..types import CrawlErrorsResponse
 
 
@@ -30,24 +51,47 @@ def start_batch_scrape(
     zero_data_retention: Optional[bool] = None,
     integration: Optional[str] = None,
     idempotency_key: Optional[str] = None,
+    chunk_size: int = MAX_BATCH_URLS,
+    max_parallel_chunks: int = 4,
+    dedupe: Union[bool, UrlCanonicalization] = False,
+    fairness: Optional[HostFairness] = None,
 ) -> BatchScrapeResponse:
     """
     Start a batch scrape job for multiple URLs.
+
+    Lists larger than ``chunk_size`` URLs (or about 1 MiB of URLs) are sent
+    in chunks: the first creates the job and the rest are appended to it in
+    parallel, each with an idempotency key derived from ``idempotency_key``.
     
     Args:
         client: HTTP client instance
         urls: List of URLs to scrape
         options: Scraping options
+        chunk_size: Maximum URLs per request
+        max_parallel_chunks: Chunk requests in flight at once
+        dedupe: Drop URLs that are duplicates after canonicalization (True for
+            the default ``UrlCanonicalization`` rules, or custom rules)
+        fairness: Interleave hosts (by weight) before the list is chunked,
+            so every chunk mixes hosts instead of holding one site
         
     Returns:
-        BatchScrapeResponse containing job information
+        BatchScrapeResponse containing job information (with the invalid
+        URLs of every chunk)
         
     Raises:
         FirecrawlError: If the batch scrape operation fails to start
+        BatchChunkError: If the job was created (or appended to) but some
+            chunks failed; carries ``job_id`` and the chunks' ``failed_urls``
+            to resubmit with ``append_to_id`` (chunks that may have been
+            queued anyway are listed in ``unconfirmed_urls``)
+        ValueError: If ``idempotency_key`` is not a UUID
     """
-    # Prepare request data
-    request_data = prepare_batch_scrape_request(
+    validate_idempotency_key(idempotency_key)
+    requests_data, duplicates_removed = _prepare_batch_chunks(
         urls,
+        chunk_size=chunk_size,
+        dedupe=dedupe,
+        fairness=fairness,
         options=options,
         webhook=webhook,
         append_to_id=append_to_id,
@@ -56,7 +100,80 @@ def start_batch_scrape(
         zero_data_retention=zero_data_retention,
         integration=integration,
     )
-    
+    return _send_batch_chunks(
+        client, requests_data, duplicates_removed, append_to_id, idempotency_key, max_parallel_chunks
+    )
+
+
+def _prepare_batch_chunks(
+    urls: List[str],
+    *,
+    chunk_size: int = MAX_BATCH_URLS,
+    dedupe: Union[bool, UrlCanonicalization] = False,
+    fairness: Optional[HostFairness] = None,
+    **kwargs: Any,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Build the request body of every chunk, validating all of them before anything is sent."""
+    urls, duplicates_removed = apply_dedupe(urls, dedupe)
+    if fairness is not None:
+        urls = fair_order(urls, fairness)
+    chunks = split_batch_urls(urls, max_urls=chunk_size)
+    requests_data = [prepare_batch_scrape_request(chunk, **kwargs) for chunk in chunks or [urls]]
+    return requests_data, duplicates_removed
+
+
+def _send_batch_chunks(
+    client: HttpClient,
+    requests_data: List[Dict[str, Any]],
+    duplicates_removed: int,
+    append_to_id: Optional[str],
+    idempotency_key: Optional[str],
+    max_parallel_chunks: int,
+) -> BatchScrapeResponse:
+    if len(requests_data) == 1:
+        response = _post_batch_scrape(client, requests_data[0], idempotency_key)
+    else:
+        response = _post_batch_scrape_chunks(
+            client, requests_data, append_to_id, idempotency_key, max_parallel_chunks
+        )
+    response.duplicate_urls_removed = duplicates_removed
+    return response
+
+
+def _post_batch_scrape_chunks(
+    client: HttpClient,
+    requests_data: List[Dict[str, Any]],
+    append_to_id: Optional[str],
+    idempotency_key: Optional[str],
+    max_parallel_chunks: int,
+) -> BatchScrapeResponse:
+    base_key = idempotency_key or new_idempotency_key()
+
+    def submit(index: int, job_id: str) -> BatchScrapeResponse:
+        request_data = requests_data[index]
+        request_data["appendToId"] = job_id
+        return _post_batch_scrape(client, request_data, chunk_idempotency_key(base_key, index))
+
+    if append_to_id is None:
+        first = _post_batch_scrape(client, requests_data[0], base_key)
+        job_id, responses, rest = first.id, [first], range(1, len(requests_data))
+    else:
+        job_id, responses, rest = append_to_id, [], range(len(requests_data))
+    with ThreadPoolExecutor(max_workers=max(1, min(max_parallel_chunks, len(rest)))) as pool:
+        futures = {index: pool.submit(submit, index, job_id) for index in rest}
+    errors: Dict[int, Exception] = {}
+    for index, future in futures.items():
+        try:
+            responses.append(future.result())
+        except Exception as exc:
+            errors[index] = exc
+    raise_for_failed_chunks(job_id, requests_data, errors)
+    return merge_batch_responses(job_id, responses)
+
+
+def _post_batch_scrape(
+    client: HttpClient, request_data: Dict[str, Any], idempotency_key: Optional[str]
+) -> BatchScrapeResponse:
     # Make the API request
     headers = client._prepare_headers(idempotency_key)  # type: ignore[attr-defined]
     response = client.post("/v2/batch/scrape", request_data, headers=headers)
@@ -79,7 +196,8 @@ def start_batch_scrape(
 def get_batch_scrape_status(
     client: HttpClient,
     job_id: str,
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    document_store: Optional[DocumentStore] = None,
 ) -> BatchScrapeJob:
     """
     Get the status of a batch scrape job.
@@ -88,6 +206,8 @@ def get_batch_scrape_status(
         client: HTTP client instance
         job_id: ID of the batch scrape job
         pagination_config: Optional configuration for pagination behavior
+        document_store: Optional store to spill documents to as pages are
+            fetched; ``data`` is then a lazy view of the store
         
     Returns:
         BatchScrapeJob containing job status and data
@@ -103,16 +223,15 @@ def get_batch_scrape_status(
         handle_response_error(response, "get batch scrape status")
     
     # Parse response
-    body = response.json()
+    body = decode_job_page(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
 
     # Convert documents
-    documents: List[Document] = []
-    for doc in body.get("data", []) or []:
-        if isinstance(doc, dict):
-            normalized = normalize_document_input(doc)
-            documents.append(Document(**normalized))
+    if document_store is not None:
+        document_store.clear()
+    documents: Union[List[Document], DocumentStore] = document_store if document_store is not None else []
+    documents.extend(body["data"])
 
     # Handle pagination if requested
     auto_paginate = pagination_config.auto_paginate if pagination_config else True
@@ -124,23 +243,26 @@ def get_batch_scrape_status(
             pagination_config
         )
 
-    return BatchScrapeJob(
+    batch_job = BatchScrapeJob(
         status=body.get("status"),
         completed=body.get("completed", 0),
         total=body.get("total", 0),
         credits_used=body.get("creditsUsed"),
         expires_at=body.get("expiresAt"),
         next=body.get("next") if not auto_paginate else None,
-        data=documents,
+        data=documents if document_store is None else [],
     )
+    if document_store is not None:
+        batch_job.data = document_store.documents()
+    return batch_job
 
 
 def _fetch_all_batch_pages(
     client: HttpClient,
     next_url: str,
-    initial_documents: List[Document],
+    initial_documents: Union[List[Document], DocumentStore],
     pagination_config: Optional[PaginationConfig] = None
-) -> List[Document]:
+) -> Union[List[Document], DocumentStore]:
     """
     Fetch all pages of batch scrape results.
     
@@ -153,7 +275,8 @@ def _fetch_all_batch_pages(
     Returns:
         List of all documents from all pages
     """
-    documents = initial_documents.copy()
+    # A DocumentStore is appended to in place; lists are copied
+    documents = initial_documents.copy() if isinstance(initial_documents, list) else initial_documents
     current_url = next_url
     page_count = 0
     
@@ -182,19 +305,17 @@ def _fetch_all_batch_pages(
             logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
             break
         
-        page_data = response.json()
+        page_data = decode_job_page(response)
         
         if not page_data.get("success"):
             break
         
         # Add documents from this page
-        for doc in page_data.get("data", []) or []:
-            if isinstance(doc, dict):
-                # Check max_results limit
-                if max_results is not None and len(documents) >= max_results:
-                    break
-                normalized = normalize_document_input(doc)
-                documents.append(Document(**normalized))
+        for doc in page_data["data"]:
+            # Check max_results limit
+            if max_results is not None and len(documents) >= max_results:
+                break
+            documents.append(doc)
         
         # Check if we hit max_results limit after adding all docs from this page
         if max_results is not None and len(documents) >= max_results:
@@ -207,6 +328,72 @@ def _fetch_all_batch_pages(
     return documents
 
 
+def iter_batch_pages(
+    client: HttpClient,
+    job_id: str,
+    cursor: Optional[str] = None,
+) -> Iterator[BatchScrapeJob]:
+    """
+    Iterate over batch scrape results one page at a time.
+
+    Each yielded BatchScrapeJob carries the job status and only that page's
+    documents; its ``next`` is the cursor to pass back to resume later.
+
+    Args:
+        client: HTTP client instance
+        job_id: ID of the batch scrape job
+        cursor: ``next`` URL saved from a previous page (None to start from the beginning)
+
+    Returns:
+        Iterator of BatchScrapeJob pages
+
+    Raises:
+        FirecrawlError: If fetching a page fails
+    """
+    url: Optional[str] = cursor or f"/v2/batch/scrape/{job_id}"
+    while url:
+        response = client.get(url)
+        if not response.ok:
+            handle_response_error(response, "get batch scrape status")
+        body = decode_job_page(response)
+        if not body.get("success"):
+            raise Exception(body.get("error", "Unknown error occurred"))
+
+        page = BatchScrapeJob(
+            status=body.get("status"),
+            completed=body.get("completed", 0),
+            total=body.get("total", 0),
+            credits_used=body.get("creditsUsed"),
+            expires_at=body.get("expiresAt"),
+            next=body.get("next"),
+            data=body["data"],
+        )
+        del body, response
+        url = page.next
+        yield page
+        del page
+
+
+def iter_batch_documents(
+    client: HttpClient,
+    job_id: str,
+    cursor: Optional[str] = None,
+) -> Iterator[Document]:
+    """
+    Iterate over batch scrape documents, fetching one page at a time.
+
+    Args:
+        client: HTTP client instance
+        job_id: ID of the batch scrape job
+        cursor: ``next`` URL to resume from (see ``iter_batch_pages``)
+
+    Returns:
+        Iterator of Document objects
+    """
+    for page in iter_batch_pages(client, job_id, cursor):
+        yield from page.data
+
+
 def cancel_batch_scrape(
     client: HttpClient,
     job_id: str
@@ -236,20 +423,66 @@ def cancel_batch_scrape(
     return body.get("status") == "cancelled"
 
 
+def _get_batch_progress(client: HttpClient, job_id: str) -> BatchScrapeJob:
+    """Fetch only the status counters of a batch job (at most one document is transferred)."""
+    response = client.get(f"/v2/batch/scrape/{job_id}?limit=1")
+    if not response.ok:
+        handle_response_error(response, "get batch scrape status")
+    body = response.json()
+    if not body.get("success"):
+        raise Exception(body.get("error", "Unknown error occurred"))
+    return BatchScrapeJob(
+        status=body.get("status"),
+        completed=body.get("completed", 0),
+        total=body.get("total", 0),
+        credits_used=body.get("creditsUsed"),
+        expires_at=body.get("expiresAt"),
+        data=[],
+    )
+
+
+def _fetch_batch_delta(
+    client: HttpClient, job_id: str, documents: Union[List[Document], DocumentStore], cursor: str
+) -> Tuple[BatchScrapeJob, str]:
+    """Append documents from ``cursor`` on; return the latest status page and the cursor to poll next."""
+    base = f"/v2/batch/scrape/{job_id}"
+    latest = None
+    for page in iter_batch_pages(client, job_id, cursor=cursor):
+        documents.extend(page.data)
+        page.data = []
+        latest = page
+        cursor, more = delta_cursor(base, cursor, page.next, page.total)
+        if not more:
+            break
+    return latest, cursor
+
+
 def wait_for_batch_completion(
     client: HttpClient,
     job_id: str,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    poll_mode: PollMode = "full",
+    max_polls: Optional[int] = None,
+    document_store: Optional[DocumentStore] = None,
 ) -> BatchScrapeJob:
     """
     Wait for a batch scrape job to complete, polling for status updates.
+
+    Polls are scheduled adaptively from the job's progress (see
+    ``wait_for_crawl_completion``).
     
     Args:
         client: HTTP client instance
         job_id: ID of the batch scrape job
-        poll_interval: Seconds between status checks
+        poll_interval: Seconds before the first re-check
         timeout: Maximum seconds to wait (None for no timeout)
+        poll_mode: "full" (default) re-fetches all results on every poll,
+            "status" polls only counters and downloads results once at
+            completion, "delta" fetches only new documents on each poll
+        max_polls: Maximum number of status checks (None for no limit)
+        document_store: Optional store to spill result documents to (see
+            ``get_batch_scrape_status``)
         
     Returns:
         BatchScrapeStatusResponse when job completes
@@ -257,22 +490,45 @@ def wait_for_batch_completion(
     Raises:
         FirecrawlError: If the job fails or timeout is reached
         TimeoutError: If timeout is reached
+        PollLimitExceeded: If the job is still running after ``max_polls`` checks
     """
+    if poll_mode not in ("status", "delta", "full"):
+        raise ValueError(f"Unknown poll_mode: {poll_mode}")
+
     start_time = time.monotonic()
+    scheduler = PollScheduler(poll_interval, max_polls=max_polls, timeout=timeout or None)
+    documents: Union[List[Document], DocumentStore] = []
+    if poll_mode == "delta" and document_store is not None:
+        document_store.clear()
+        documents = document_store
+    cursor = f"/v2/batch/scrape/{job_id}?skip=0"
     
     while True:
-        status_job = get_batch_scrape_status(client, job_id)
+        if poll_mode == "full":
+            status_job = get_batch_scrape_status(client, job_id, document_store=document_store)
+        elif poll_mode == "delta":
+            status_job, cursor = _fetch_batch_delta(client, job_id, documents, cursor)
+        else:
+            status_job = _get_batch_progress(client, job_id)
+        scheduler.observe(status_job.completed, status_job.total)
         
         # Check if job is complete
         if status_job.status in ["completed", "failed", "cancelled"]:
+            if poll_mode == "status":
+                return get_batch_scrape_status(client, job_id, document_store=document_store)
+            if poll_mode == "delta":
+                status_job.data = documents if document_store is None else document_store.documents()
+                status_job.next = None
             return status_job
         
         # Check timeout
         if timeout and (time.monotonic() - start_time) > timeout:
             raise TimeoutError(f"Batch scrape job {job_id} did not complete within {timeout} seconds")
+        if scheduler.exhausted:
+            raise PollLimitExceeded(f"Batch scrape job {job_id} did not complete within {max_polls} polls")
         
         # Wait before next poll
-        time.sleep(poll_interval)
+        scheduler.sleep()
 
 
 def batch_scrape(
@@ -287,8 +543,17 @@ def batch_scrape(
     zero_data_retention: Optional[bool] = None,
     integration: Optional[str] = None,
     idempotency_key: Optional[str] = None,
+    chunk_size: int = MAX_BATCH_URLS,
+    max_parallel_chunks: int = 4,
+    dedupe: Union[bool, UrlCanonicalization] = False,
+    fairness: Optional[HostFairness] = None,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    poll_mode: PollMode = "full",
+    max_polls: Optional[int] = None,
+    document_store: Optional[DocumentStore] = None,
+    retry_failed: int = 0,
+    retry_backoff: float = 1.0,
 ) -> BatchScrapeJob:
     """
     Start a batch scrape job and wait for it to complete.
@@ -297,8 +562,19 @@ def batch_scrape(
         client: HTTP client instance
         urls: List of URLs to scrape
         options: Scraping options
+        chunk_size: Maximum URLs per start request (see ``start_batch_scrape``)
+        max_parallel_chunks: Chunk requests in flight at once
+        dedupe: Drop duplicate URLs before submission (see ``start_batch_scrape``)
+        fairness: Interleave hosts before chunking (see ``start_batch_scrape``)
         poll_interval: Seconds between status checks
-        timeout: Maximum seconds to wait (None for no timeout)
+        timeout: Maximum seconds to wait, retry rounds included (None for no timeout)
+        poll_mode: How to poll while the job runs (see ``wait_for_batch_completion``)
+        max_polls: Maximum number of status checks (None for no limit)
+        document_store: Optional store to spill result documents to
+        retry_failed: Rounds of re-submitting URLs that failed transiently
+            (timeouts, 5xx) in a follow-up job; documents are merged into the
+            result and ``retry_report`` lists what failed for good
+        retry_backoff: Base delay in seconds before each retry round
         
     Returns:
         BatchScrapeStatusResponse when job completes
@@ -319,14 +595,86 @@ def batch_scrape(
         zero_data_retention=zero_data_retention,
         integration=integration,
         idempotency_key=idempotency_key,
+        chunk_size=chunk_size,
+        max_parallel_chunks=max_parallel_chunks,
+        dedupe=dedupe,
+        fairness=fairness,
     )
 
     job_id = start.id
 
-    # Wait for completion
-    return wait_for_batch_completion(
-        client, job_id, poll_interval, timeout
+    # Wait for completion; retry rounds share the same deadline
+    deadline = time.monotonic() + timeout if timeout else None
+    job = wait_for_batch_completion(
+        client, job_id, poll_interval, timeout,
+        poll_mode=poll_mode, max_polls=max_polls, document_store=document_store,
     )
+    if retry_failed > 0:
+        def resubmit(retry_urls: List[str]) -> str:
+            return start_batch_scrape(
+                client,
+                retry_urls,
+                options=options,
+                ignore_invalid_urls=ignore_invalid_urls,
+                max_concurrency=max_concurrency,
+                zero_data_retention=zero_data_retention,
+                integration=integration,
+                chunk_size=chunk_size,
+                max_parallel_chunks=max_parallel_chunks,
+                fairness=fairness,
+            ).id
+
+        _retry_failed_urls(
+            client, job_id, job, resubmit,
+            rounds=retry_failed, backoff=retry_backoff, poll_interval=poll_interval,
+            deadline=deadline, document_store=document_store,
+        )
+    return job
+
+
+def _retry_failed_urls(
+    client: HttpClient,
+    job_id: str,
+    job: BatchScrapeJob,
+    resubmit: Callable[[List[str]], str],
+    *,
+    rounds: int,
+    backoff: float,
+    poll_interval: int,
+    deadline: Optional[float],
+    document_store: Optional[DocumentStore],
+) -> None:
+    """Re-scrape transiently failed URLs of a finished job in follow-up jobs, merging results into ``job``."""
+    report = BatchRetryReport()
+    policy = RetryPolicy(backoff_factor=backoff, budget=None)
+    errors = get_batch_scrape_errors(client, job_id)
+    report.robots_blocked.extend(errors.robots_blocked)
+    pending = errors.errors
+    delay = 0.0
+    for attempt in range(rounds):
+        retry_urls, final = split_retryable(pending)
+        if not retry_urls:
+            break
+        delay = policy.backoff(attempt, delay)
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            # No time left for another round; what is pending is reported as failed
+            break
+        report.failed.extend(final)
+        pending = []
+        time.sleep(delay)
+        retry_id = resubmit(retry_urls)
+        report.rounds += 1
+        report.retry_job_ids.append(retry_id)
+        remaining = deadline - time.monotonic() if deadline is not None else None
+        retry_job = wait_for_batch_completion(client, retry_id, poll_interval, remaining)
+        merge_retry_job(job, retry_job, document_store)
+        errors = get_batch_scrape_errors(client, retry_id)
+        report.robots_blocked.extend(errors.robots_blocked)
+        pending = errors.errors
+        failed_again = {error.url for error in pending}
+        report.recovered.extend(url for url in retry_urls if url not in failed_again)
+    report.failed.extend(pending)
+    job.retry_report = report
 
 
 def validate_batch_urls(urls: List[str]) -> List[str]:
@@ -345,8 +693,8 @@ def validate_batch_urls(urls: List[str]) -> List[str]:
     if not urls:
         raise ValueError("URLs list cannot be empty")
     
-    if len(urls) > 1000:  # Assuming API limit
-        raise ValueError("Too many URLs (maximum 1000)")
+    if len(urls) > MAX_BATCH_URLS:
+        raise ValueError(f"Too many URLs (maximum {MAX_BATCH_URLS})")
     
     validated_urls = []
     for url in urls:
@@ -493,10 +841,4 @@ def get_batch_scrape_errors(client: HttpClient, job_id: str) -> CrawlErrorsRespo
     if not response.ok:
         handle_response_error(response, "get batch scrape errors")
 
-    body = response.json()
-    payload = body.get("data", body)
-    normalized = {
-        "errors": payload.get("errors", []),
-        "robots_blocked": payload.get("robotsBlocked", payload.get("robots_blocked", [])),
-    }
-    return CrawlErrorsResponse(**normalized)
\ No newline at end of file
+    return parse_batch_errors(response.json())
\ No newline at end of file
@@ -3,15 +3,18 @@ Crawling functionality for Firecrawl v2 API.
 """
 
 import time
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator, Tuple, Union
 from ..types import (
     CrawlRequest,
     CrawlJob,
     CrawlResponse, Document, CrawlParamsRequest, CrawlParamsResponse, CrawlParamsData,
-    WebhookConfig, CrawlErrorsResponse, ActiveCrawlsResponse, ActiveCrawl, PaginationConfig
+    WebhookConfig, CrawlErrorsResponse, ActiveCrawlsResponse, ActiveCrawl, PaginationConfig, PollMode
 )
 from ..utils import HttpClient, handle_response_error, validate_scrape_options, prepare_scrape_options
-from ..utils.normalize import normalize_document_input
+from ..utils.poll_scheduler import PollScheduler, PollLimitExceeded
+from ..utils.document_store import DocumentStore
+from ..utils.payload_decoder import decode_job_page
+from ..utils.page_fetcher import delta_cursor
 
 
 def _validate_crawl_request(request: CrawlRequest) -> None:
@@ -106,13 +109,16 @@ def _prepare_crawl_request(request: CrawlRequest) -> dict:
     return data
 
 
-def start_crawl(client: HttpClient, request: CrawlRequest) -> CrawlResponse:
+def start_crawl(
+    client: HttpClient, request: CrawlRequest, idempotency_key: Optional[str] = None
+) -> CrawlResponse:
     """
     Start a crawl job for a website.
     
     Args:
         client: HTTP client instance
         request: CrawlRequest containing URL and options
+        idempotency_key: Header used to deduplicate starts
         
     Returns:
         CrawlResponse with job information
@@ -123,7 +129,11 @@ def start_crawl(client: HttpClient, request: CrawlRequest) -> CrawlResponse:
     """
     request_data = _prepare_crawl_request(request)
     
-    response = client.post("/v2/crawl", request_data)
+    if idempotency_key:
+        headers = client._prepare_headers(idempotency_key)  # type: ignore[attr-defined]
+        response = client.post("/v2/crawl", request_data, headers=headers)
+    else:
+        response = client.post("/v2/crawl", request_data)
     
     if not response.ok:
         handle_response_error(response, "start crawl")
@@ -144,7 +154,8 @@ def start_crawl(client: HttpClient, request: CrawlRequest) -> CrawlResponse:
 def get_crawl_status(
     client: HttpClient, 
     job_id: str,
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    document_store: Optional[DocumentStore] = None,
 ) -> CrawlJob:
     """
     Get the status of a crawl job.
@@ -153,6 +164,8 @@ def get_crawl_status(
         client: HTTP client instance
         job_id: ID of the crawl job
         pagination_config: Optional configuration for pagination behavior
+        document_store: Optional store to spill documents to as pages are
+            fetched; ``data`` is then a lazy view of the store
         
     Returns:
         CrawlJob with current status and data
@@ -168,21 +181,16 @@ def get_crawl_status(
         handle_response_error(response, "get crawl status")
     
     # Parse response
-    response_data = response.json()
+    response_data = decode_job_page(response)
     
     if response_data.get("success"):
         # The API returns status fields at the top level, not in a data field
         
         # Convert documents
-        documents = []
-        data_list = response_data.get("data", [])
-        for doc_data in data_list:
-            if isinstance(doc_data, str):
-                # Handle case where API returns just URLs - this shouldn't happen for crawl
-                # but we'll handle it gracefully
-                continue
-            else:
-                documents.append(Document(**normalize_document_input(doc_data)))
+        if document_store is not None:
+            document_store.clear()
+        documents = document_store if document_store is not None else []
+        documents.extend(response_data["data"])
         
         # Handle pagination if requested
         auto_paginate = pagination_config.auto_paginate if pagination_config else True
@@ -195,15 +203,18 @@ def get_crawl_status(
             )
         
         # Create CrawlJob with current status and data
-        return CrawlJob(
+        crawl_job = CrawlJob(
             status=response_data.get("status"),
             completed=response_data.get("completed", 0),
             total=response_data.get("total", 0),
             credits_used=response_data.get("creditsUsed", 0),
             expires_at=response_data.get("expiresAt"),
             next=response_data.get("next", None) if not auto_paginate else None,
-            data=documents
+            data=documents if document_store is None else []
         )
+        if document_store is not None:
+            crawl_job.data = document_store.documents()
+        return crawl_job
     else:
         raise Exception(response_data.get("error", "Unknown error occurred"))
 
@@ -211,9 +222,9 @@ def get_crawl_status(
 def _fetch_all_pages(
     client: HttpClient,
     next_url: str,
-    initial_documents: List[Document],
+    initial_documents: Union[List[Document], DocumentStore],
     pagination_config: Optional[PaginationConfig] = None
-) -> List[Document]:
+) -> Union[List[Document], DocumentStore]:
     """
     Fetch all pages of crawl results.
     
@@ -226,7 +237,8 @@ def _fetch_all_pages(
     Returns:
         List of all documents from all pages
     """
-    documents = initial_documents.copy()
+    # A DocumentStore is appended to in place; lists are copied
+    documents = initial_documents.copy() if isinstance(initial_documents, list) else initial_documents
     current_url = next_url
     page_count = 0
     
@@ -255,21 +267,17 @@ def _fetch_all_pages(
             logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
             break
         
-        page_data = response.json()
+        page_data = decode_job_page(response)
         
         if not page_data.get("success"):
             break
         
         # Add documents from this page
-        data_list = page_data.get("data", [])
-        for doc_data in data_list:
-            if isinstance(doc_data, str):
-                continue
-            else:
-                # Check max_results limit BEFORE adding each document
-                if max_results is not None and len(documents) >= max_results:
-                    break
-                documents.append(Document(**normalize_document_input(doc_data)))
+        for doc in page_data["data"]:
+            # Check max_results limit BEFORE adding each document
+            if max_results is not None and len(documents) >= max_results:
+                break
+            documents.append(doc)
         
         # Check if we hit max_results limit
         if max_results is not None and len(documents) >= max_results:
@@ -282,6 +290,74 @@ def _fetch_all_pages(
     return documents
 
 
+def iter_crawl_pages(
+    client: HttpClient,
+    job_id: str,
+    cursor: Optional[str] = None,
+) -> Iterator[CrawlJob]:
+    """
+    Iterate over crawl results one page at a time.
+
+    Each yielded CrawlJob carries the job status and only that page's
+    documents, so memory use stays flat regardless of crawl size. Its
+    ``next`` is the cursor for the following page: persist it after
+    processing a page and pass it back as ``cursor`` to resume later.
+
+    Args:
+        client: HTTP client instance
+        job_id: ID of the crawl job
+        cursor: ``next`` URL saved from a previous page (None to start from the beginning)
+
+    Returns:
+        Iterator of CrawlJob pages
+
+    Raises:
+        Exception: If fetching a page fails
+    """
+    url: Optional[str] = cursor or f"/v2/crawl/{job_id}"
+    while url:
+        response = client.get(url)
+        if not response.ok:
+            handle_response_error(response, "get crawl status")
+        body = decode_job_page(response)
+        if not body.get("success"):
+            raise Exception(body.get("error", "Unknown error occurred"))
+
+        page = CrawlJob(
+            status=body.get("status"),
+            completed=body.get("completed", 0),
+            total=body.get("total", 0),
+            credits_used=body.get("creditsUsed", 0),
+            expires_at=body.get("expiresAt"),
+            next=body.get("next"),
+            data=body["data"],
+        )
+        del body, response
+        url = page.next
+        yield page
+        del page
+
+
+def iter_crawl_documents(
+    client: HttpClient,
+    job_id: str,
+    cursor: Optional[str] = None,
+) -> Iterator[Document]:
+    """
+    Iterate over crawl documents, fetching one page at a time.
+
+    Args:
+        client: HTTP client instance
+        job_id: ID of the crawl job
+        cursor: ``next`` URL to resume from (see ``iter_crawl_pages``)
+
+    Returns:
+        Iterator of Document objects
+    """
+    for page in iter_crawl_pages(client, job_id, cursor):
+        yield from page.data
+
+
 def cancel_crawl(client: HttpClient, job_id: str) -> bool:
     """
     Cancel a running crawl job.
@@ -305,20 +381,68 @@ def cancel_crawl(client: HttpClient, job_id: str) -> bool:
     
     return response_data.get("status") == "cancelled"
 
+def _get_crawl_progress(client: HttpClient, job_id: str) -> CrawlJob:
+    """Fetch only the status counters of a crawl (at most one document is transferred)."""
+    response = client.get(f"/v2/crawl/{job_id}?limit=1")
+    if not response.ok:
+        handle_response_error(response, "get crawl status")
+    body = response.json()
+    if not body.get("success"):
+        raise Exception(body.get("error", "Unknown error occurred"))
+    return CrawlJob(
+        status=body.get("status"),
+        completed=body.get("completed", 0),
+        total=body.get("total", 0),
+        credits_used=body.get("creditsUsed", 0),
+        expires_at=body.get("expiresAt"),
+        data=[],
+    )
+
+
+def _fetch_crawl_delta(
+    client: HttpClient, job_id: str, documents: Union[List[Document], DocumentStore], cursor: str
+) -> Tuple[CrawlJob, str]:
+    """Append documents from ``cursor`` on; return the latest status page and the cursor to poll next."""
+    base = f"/v2/crawl/{job_id}"
+    latest = None
+    for page in iter_crawl_pages(client, job_id, cursor=cursor):
+        documents.extend(page.data)
+        page.data = []
+        latest = page
+        cursor, more = delta_cursor(base, cursor, page.next, page.total)
+        if not more:
+            break
+    return latest, cursor
+
+
 def wait_for_crawl_completion(
     client: HttpClient,
     job_id: str,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    poll_mode: PollMode = "full",
+    max_polls: Optional[int] = None,
+    document_store: Optional[DocumentStore] = None,
 ) -> CrawlJob:
     """
     Wait for a crawl job to complete, polling for status updates.
+
+    Polls are scheduled adaptively: the delay starts at ``poll_interval``,
+    grows while the crawl is far from done and shrinks as its predicted
+    completion (estimated from the ``completed``/``total`` progress)
+    approaches.
     
     Args:
         client: HTTP client instance
         job_id: ID of the crawl job
-        poll_interval: Seconds between status checks
+        poll_interval: Seconds before the first re-check
         timeout: Maximum seconds to wait (None for no timeout)
+        poll_mode: "full" (default) re-fetches all results on every poll,
+            "status" polls only counters and downloads results once at
+            completion, "delta" fetches only new documents on each poll
+        max_polls: Maximum number of status checks (None for no limit)
+        document_store: Optional store to spill result documents to (see
+            ``get_crawl_status``)
         
     Returns:
         CrawlJob when job completes
@@ -326,29 +450,56 @@ def wait_for_crawl_completion(
     Raises:
         Exception: If the job fails
         TimeoutError: If timeout is reached
+        PollLimitExceeded: If the job is still running after ``max_polls`` checks
     """
+    if poll_mode not in ("status", "delta", "full"):
+        raise ValueError(f"Unknown poll_mode: {poll_mode}")
+
     start_time = time.monotonic()
+    scheduler = PollScheduler(poll_interval, max_polls=max_polls, timeout=timeout)
+    documents: Union[List[Document], DocumentStore] = []
+    if poll_mode == "delta" and document_store is not None:
+        document_store.clear()
+        documents = document_store
+    cursor = f"/v2/crawl/{job_id}?skip=0"
     
     while True:
-        crawl_job = get_crawl_status(client, job_id)
+        if poll_mode == "full":
+            crawl_job = get_crawl_status(client, job_id, document_store=document_store)
+        elif poll_mode == "delta":
+            crawl_job, cursor = _fetch_crawl_delta(client, job_id, documents, cursor)
+        else:
+            crawl_job = _get_crawl_progress(client, job_id)
+        scheduler.observe(crawl_job.completed, crawl_job.total)
         
         # Check if job is complete
         if crawl_job.status in ["completed", "failed"]:
+            if poll_mode == "status":
+                return get_crawl_status(client, job_id, document_store=document_store)
+            if poll_mode == "delta":
+                crawl_job.data = documents if document_store is None else document_store.documents()
+                crawl_job.next = None
             return crawl_job
         
         # Check timeout
         if timeout is not None and (time.monotonic() - start_time) > timeout:
             raise TimeoutError(f"Crawl job {job_id} did not complete within {timeout} seconds")
+        if scheduler.exhausted:
+            raise PollLimitExceeded(f"Crawl job {job_id} did not complete within {max_polls} polls")
         
         # Wait before next poll
-        time.sleep(poll_interval)
+        scheduler.sleep()
 
 
 def crawl(
     client: HttpClient,
     request: CrawlRequest,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    poll_mode: PollMode = "full",
+    max_polls: Optional[int] = None,
+    document_store: Optional[DocumentStore] = None,
+    idempotency_key: Optional[str] = None,
 ) -> CrawlJob:
     """
     Start a crawl job and wait for it to complete.
@@ -358,6 +509,10 @@ def crawl(
         request: CrawlRequest containing URL and options
         poll_interval: Seconds between status checks
         timeout: Maximum seconds to wait (None for no timeout)
+        poll_mode: How to poll while the crawl runs (see ``wait_for_crawl_completion``)
+        max_polls: Maximum number of status checks (None for no limit)
+        document_store: Optional store to spill result documents to
+        idempotency_key: Header used to deduplicate starts
         
     Returns:
         CrawlJob when job completes
@@ -368,12 +523,13 @@ def crawl(
         TimeoutError: If timeout is reached
     """
     # Start the crawl
-    crawl_job = start_crawl(client, request)
+    crawl_job = start_crawl(client, request, idempotency_key)
     job_id = crawl_job.id
     
     # Wait for completion
     return wait_for_crawl_completion(
-        client, job_id, poll_interval, timeout
+        client, job_id, poll_interval, timeout,
+        poll_mode=poll_mode, max_polls=max_polls, document_store=document_store,
     )
 
 
@@ -1,11 +1,13 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 import time
 
-from ..types import ExtractResponse, ScrapeOptions
+from ..types import ExtractResponse, ScrapeOptions, UrlCanonicalization
 from ..types import AgentOptions
 from ..utils.http_client import HttpClient
 from ..utils.validation import prepare_scrape_options
 from ..utils.error_handler import handle_response_error
+from ..utils.poll_scheduler import PollScheduler
+from ..utils.url_dedup import apply_dedupe
 
 
 def _prepare_extract_request(
@@ -21,10 +23,12 @@ def _prepare_extract_request(
     ignore_invalid_urls: Optional[bool] = None,
     integration: Optional[str] = None,
     agent: Optional[AgentOptions] = None,
+    dedupe: Union[bool, UrlCanonicalization] = False,
 ) -> Dict[str, Any]:
     body: Dict[str, Any] = {}
     if urls is not None:
-        body["urls"] = urls
+        # Duplicates after canonicalization cost credits without adding sources
+        body["urls"] = apply_dedupe(urls, dedupe)[0]
     if prompt is not None:
         body["prompt"] = prompt
     if schema is not None:
@@ -67,6 +71,7 @@ def start_extract(
     ignore_invalid_urls: Optional[bool] = None,
     integration: Optional[str] = None,
     agent: Optional[AgentOptions] = None,
+    dedupe: Union[bool, UrlCanonicalization] = False,
 ) -> ExtractResponse:
     body = _prepare_extract_request(
         urls,
@@ -80,6 +85,7 @@ def start_extract(
         ignore_invalid_urls=ignore_invalid_urls,
         integration=integration,
         agent=agent,
+        dedupe=dedupe,
     )
     resp = client.post("/v2/extract", body)
     if not resp.ok:
@@ -100,15 +106,20 @@ def wait_extract(
     *,
     poll_interval: int = 2,
     timeout: Optional[int] = None,
+    max_polls: Optional[int] = None,
 ) -> ExtractResponse:
     start_ts = time.time()
+    scheduler = PollScheduler(max(1, poll_interval), min_interval=1, max_polls=max_polls, timeout=timeout)
     while True:
         status = get_extract_status(client, job_id)
+        scheduler.observe()
         if status.status in ("completed", "failed", "cancelled"):
             return status
         if timeout is not None and (time.time() - start_ts) > timeout:
             return status
-        time.sleep(max(1, poll_interval))
+        if scheduler.exhausted:
+            return status
+        scheduler.sleep()
 
 
 def extract(
@@ -127,6 +138,7 @@ def extract(
     timeout: Optional[int] = None,
     integration: Optional[str] = None,
     agent: Optional[AgentOptions] = None,
+    dedupe: Union[bool, UrlCanonicalization] = False,
 ) -> ExtractResponse:
     started = start_extract(
         client,
@@ -141,6 +153,7 @@ def extract(
         ignore_invalid_urls=ignore_invalid_urls,
         integration=integration,
         agent=agent,
+        dedupe=dedupe,
     )
     job_id = getattr(started, "id", None)
     if not job_id:
@@ -0,0 +1,292 @@
+"""
+Journaled batch scrape and crawl jobs for Firecrawl v2 API.
+
+These wrap the batch and crawl start methods to record every job in a
+``JobJournal``, and download results page by page into the journal so that
+a restarted worker can reattach to its jobs and fetch only what is missing.
+"""
+
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+
+from pydantic import BaseModel
+
+from ..types import BatchScrapeJob, BatchScrapeResponse, CrawlJob, CrawlRequest, CrawlResponse, JournaledJob
+from ..utils import HttpClient
+from ..utils.batch_chunking import MAX_BATCH_URLS, new_idempotency_key, validate_idempotency_key
+from ..utils.error_handler import BatchChunkError, FirecrawlError
+from ..utils.job_journal import JobJournal, UnconfirmedSubmission, options_fingerprint
+from ..utils.poll_scheduler import PollScheduler, PollLimitExceeded
+from . import batch as batch_methods
+from . import crawl as crawl_methods
+
+logger = logging.getLogger("firecrawl")
+
+_TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+# Rejections after which the server may still hold the job (a timeout, or the key already used)
+_AMBIGUOUS_STATUSES = (408, 409)
+
+R = TypeVar("R", BatchScrapeResponse, CrawlResponse)
+
+
+def _options(options: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        k: v.model_dump(exclude_none=True) if isinstance(v, BaseModel) else v
+        for k, v in options.items()
+        if v is not None
+    }
+
+
+def _reattach(
+    journal: JobJournal, kind: str, idempotency_key: str, urls: List[str], options: Dict[str, Any]
+) -> Optional[JournaledJob]:
+    entry = journal.find(kind, idempotency_key)  # type: ignore[arg-type]
+    if entry is None:
+        return None
+    if entry.urls != list(urls) or entry.options_fingerprint != options_fingerprint(options):
+        raise ValueError(
+            f"Idempotency key {idempotency_key!r} was already used for {kind} job "
+            f"{entry.job_id or '(not yet confirmed)'} with different URLs or options"
+        )
+    return entry
+
+
+def _submit(
+    journal: JobJournal,
+    kind: str,
+    idempotency_key: str,
+    urls: List[str],
+    options: Dict[str, Any],
+    entry: Optional[JournaledJob],
+    send: Callable[[], R],
+) -> R:
+    """
+    Send a start request recorded beforehand as ``submitting``, then fill in its job ID.
+
+    ``send`` must only raise once the request may have gone out, so callers
+    validate first. The row is dropped only when the server rejected the
+    start outright; after any other error (a timeout, or a body that does
+    not decode) the job may exist, so the row is left without an ID.
+    """
+    if entry is None:
+        journal.record_submission(kind, idempotency_key, urls=urls, options=options)  # type: ignore[arg-type]
+    # An interrupted submission is sent again under its original key: if the first
+    # attempt reached the server the key is rejected with 409 and nothing is queued twice
+    try:
+        response = send()
+    except BatchChunkError as exc:
+        journal.confirm_submission(kind, idempotency_key, exc.job_id)  # type: ignore[arg-type]
+        raise
+    except FirecrawlError as exc:
+        if exc.status_code == 409:
+            raise UnconfirmedSubmission(journal.find(kind, idempotency_key)) from exc  # type: ignore[arg-type]
+        if exc.status_code is not None and 400 <= exc.status_code < 500 and exc.status_code not in _AMBIGUOUS_STATUSES:
+            journal.discard_submission(kind, idempotency_key)  # type: ignore[arg-type]
+        raise
+    journal.confirm_submission(kind, idempotency_key, response.id, url=response.url)  # type: ignore[arg-type]
+    return response
+
+
+def start_batch_scrape(
+    client: HttpClient,
+    journal: JobJournal,
+    urls: List[str],
+    *,
+    idempotency_key: Optional[str] = None,
+    chunk_size: int = MAX_BATCH_URLS,
+    max_parallel_chunks: int = 4,
+    **kwargs: Any,
+) -> BatchScrapeResponse:
+    """
+    Start a batch scrape job and record it in ``journal``.
+
+    The job is journaled as ``submitting`` before the request is sent and
+    its ID is filled in from the response. If the journal already holds a
+    job submitted with ``idempotency_key`` for the same URLs and options,
+    that job is returned instead of submitting again. Without a key a UUID
+    is generated.
+
+    The server does not replay the response to a reused key; it rejects the
+    request with 409. A journaled start that was interrupted before its ID
+    was recorded is therefore sent again under the same key: it goes through
+    if the first attempt never reached the server, and otherwise raises
+    ``UnconfirmedSubmission`` rather than starting the work twice.
+
+    Args:
+        client: HTTP client instance
+        journal: Journal to record the job in
+        urls: List of URLs to scrape
+        idempotency_key: UUID identifying this unit of work across restarts
+        chunk_size: Maximum URLs per request (see ``batch.start_batch_scrape``)
+        max_parallel_chunks: Chunk requests in flight at once
+        **kwargs: Other ``batch.start_batch_scrape`` options
+
+    Returns:
+        BatchScrapeResponse for the new or reattached job
+
+    Raises:
+        ValueError: If the key is not a UUID, or was already used with
+            different URLs or options
+        UnconfirmedSubmission: If an interrupted start under this key had
+            already reached the server
+        BatchChunkError: If some chunks failed (the job ID is journaled)
+    """
+    validate_idempotency_key(idempotency_key)
+    options = _options(kwargs)
+    entry = _reattach(journal, "batch", idempotency_key, urls, options) if idempotency_key else None
+    if entry is not None and entry.job_id is not None:
+        return BatchScrapeResponse(id=entry.job_id, url=entry.url or "")
+    key = idempotency_key or new_idempotency_key()
+    # Validate every chunk before the submission is journaled
+    requests_data, duplicates_removed = batch_methods._prepare_batch_chunks(urls, chunk_size=chunk_size, **kwargs)
+    return _submit(
+        journal, "batch", key, urls, options, entry,
+        lambda: batch_methods._send_batch_chunks(
+            client, requests_data, duplicates_removed, kwargs.get("append_to_id"), key, max_parallel_chunks
+        ),
+    )
+
+
+def start_crawl(
+    client: HttpClient,
+    journal: JobJournal,
+    request: CrawlRequest,
+    *,
+    idempotency_key: Optional[str] = None,
+) -> CrawlResponse:
+    """
+    Start a crawl job and record it in ``journal``.
+
+    Reattaches to a journaled crawl started with the same ``idempotency_key``
+    and request (see ``start_batch_scrape``).
+
+    Args:
+        client: HTTP client instance
+        journal: Journal to record the job in
+        request: CrawlRequest containing URL and options
+        idempotency_key: UUID identifying this unit of work across restarts
+
+    Returns:
+        CrawlResponse for the new or reattached job
+
+    Raises:
+        ValueError: If the key is not a UUID, or was already used with a
+            different request
+        UnconfirmedSubmission: If an interrupted start under this key had
+            already reached the server
+    """
+    validate_idempotency_key(idempotency_key)
+    options = request.model_dump(exclude_none=True, exclude={"url"})
+    entry = _reattach(journal, "crawl", idempotency_key, [request.url], options) if idempotency_key else None
+    if entry is not None and entry.job_id is not None:
+        return CrawlResponse(id=entry.job_id, url=entry.url or "")
+    key = idempotency_key or new_idempotency_key()
+    # Validate the request before the submission is journaled
+    crawl_methods._prepare_crawl_request(request)
+    return _submit(
+        journal, "crawl", key, [request.url], options, entry,
+        lambda: crawl_methods.start_crawl(client, request, idempotency_key=key),
+    )
+
+
+def download_job(
+    client: HttpClient,
+    journal: JobJournal,
+    job_id: str,
+    *,
+    poll_interval: int = 2,
+    timeout: Optional[int] = None,
+    max_polls: Optional[int] = None,
+) -> Union[BatchScrapeJob, CrawlJob]:
+    """
+    Wait for a journaled job to finish and download the results it is missing.
+
+    Only status counters are polled while the job runs. Once it finishes,
+    result pages are fetched from the journaled ``next`` cursor (or past the
+    documents already persisted) and each page is committed to the journal
+    with its cursor, so an interrupted download picks up where it stopped.
+
+    Args:
+        client: HTTP client instance
+        journal: Journal the job was recorded in
+        job_id: ID of the journaled job
+        poll_interval: Seconds before the first re-check
+        timeout: Maximum seconds to wait (None for no timeout)
+        max_polls: Maximum number of status checks (None for no limit)
+
+    Returns:
+        BatchScrapeJob or CrawlJob with every document persisted for the job
+
+    Raises:
+        KeyError: If the job is not in the journal
+        TimeoutError: If timeout is reached
+        PollLimitExceeded: If the job is still running after ``max_polls`` checks
+    """
+    entry = journal.get(job_id)
+    if entry is None:
+        raise KeyError(f"Job {job_id} is not in the journal")
+    if entry.kind == "batch":
+        job_type, base = BatchScrapeJob, f"/v2/batch/scrape/{job_id}"
+        get_progress, iter_pages = batch_methods._get_batch_progress, batch_methods.iter_batch_pages
+    else:
+        job_type, base = CrawlJob, f"/v2/crawl/{job_id}"
+        get_progress, iter_pages = crawl_methods._get_crawl_progress, crawl_methods.iter_crawl_pages
+
+    if entry.downloaded:
+        return job_type(
+            status=entry.status, completed=entry.documents, total=entry.documents, data=journal.documents(job_id)
+        )
+
+    start_time = time.monotonic()
+    scheduler = PollScheduler(poll_interval, max_polls=max_polls, timeout=timeout)
+    while True:
+        job = get_progress(client, job_id)
+        scheduler.observe(job.completed, job.total)
+        if job.status in _TERMINAL_STATUSES:
+            break
+        if timeout is not None and (time.monotonic() - start_time) > timeout:
+            raise TimeoutError(f"Job {job_id} did not complete within {timeout} seconds")
+        if scheduler.exhausted:
+            raise PollLimitExceeded(f"Job {job_id} did not complete within {max_polls} polls")
+        scheduler.sleep()
+
+    cursor = entry.next_cursor
+    if cursor is None and entry.documents:
+        cursor = f"{base}?skip={entry.documents}"
+    for page in iter_pages(client, job_id, cursor):
+        journal.save_page(job_id, page.data, page.next, page.status)
+    journal.mark_downloaded(job_id, job.status)
+
+    job.data = journal.documents(job_id)
+    return job
+
+
+def resume(
+    client: HttpClient,
+    journal: JobJournal,
+    *,
+    poll_interval: int = 2,
+    timeout: Optional[int] = None,
+) -> Dict[str, Union[BatchScrapeJob, CrawlJob]]:
+    """
+    Reattach to every journaled job whose results are not fully downloaded.
+
+    Jobs are finished one at a time with ``download_job``; ``timeout``
+    applies to each job. Submissions interrupted before their job ID was
+    recorded cannot be reattached: each is logged as a warning and left in
+    the journal (see ``JobJournal.unconfirmed()``), never resubmitted.
+
+    Returns:
+        Mapping of job ID to the finished job with all of its documents
+    """
+    for entry in journal.unconfirmed():
+        logger.warning(
+            "Journaled %s start with idempotency key %s (%d URLs) has no job ID and is not resumed; "
+            "record its ID with JobJournal.confirm_submission() or drop it with discard_submission()",
+            entry.kind, entry.idempotency_key, len(entry.urls),
+        )
+    return {
+        entry.job_id: download_job(client, journal, entry.job_id, poll_interval=poll_interval, timeout=timeout)
+        for entry in journal.jobs(pending=True)
+    }
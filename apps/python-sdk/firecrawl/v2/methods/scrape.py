@@ -2,13 +2,23 @@
 Scraping functionality for Firecrawl v2 API.
 """
 
-from typing import Optional, Dict, Any
-from ..types import ScrapeOptions, Document
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Optional, Dict, Any, Union, Iterable, Iterator, Set
+from ..types import ScrapeOptions, Document, ScrapeManyResult, HostFairness
 from ..utils.normalize import normalize_document_input
-from ..utils import HttpClient, handle_response_error, prepare_scrape_options, validate_scrape_options
+from ..utils import HttpClient, handle_response_error, compile_scrape_options, CompiledScrapeOptions
+from ..utils.host_scheduler import url_dispatcher
+from ..utils.scrape_cache import ScrapeCache, scrape_cache_key
+from ..utils import json_codec
 
+logger = logging.getLogger("firecrawl")
 
-def _prepare_scrape_request(url: str, options: Optional[ScrapeOptions] = None) -> Dict[str, Any]:
+
+def _prepare_scrape_request(
+    url: str, options: Optional[Union[ScrapeOptions, CompiledScrapeOptions]] = None
+) -> Dict[str, Any]:
     """
     Prepare a scrape request payload for v2 API.
     
@@ -25,15 +35,47 @@ def _prepare_scrape_request(url: str, options: Optional[ScrapeOptions] = None) -
     request_data: Dict[str, Any] = {"url": url.strip()}
 
     if options is not None:
-        validated = validate_scrape_options(options)
-        if validated is not None:
-            opts = prepare_scrape_options(validated)
-            if opts:
-                request_data.update(opts)
+        request_data.update(compile_scrape_options(options).payload)
 
     return request_data
 
-def scrape(client: HttpClient, url: str, options: Optional[ScrapeOptions] = None) -> Document:
+
+def _encode_scrape_request(
+    url: str, options: Optional[Union[ScrapeOptions, CompiledScrapeOptions]] = None
+) -> Union[Dict[str, Any], bytes]:
+    """
+    Build the scrape request body.
+
+    Options are compiled (and cached) once, so with options the body is the
+    pre-encoded options JSON with the URL spliced in.
+    """
+    if not url or not url.strip():
+        raise ValueError("URL cannot be empty")
+    if options is None:
+        return {"url": url.strip()}
+    return compile_scrape_options(options).encode_request(url.strip())
+
+def _post_scrape(client: HttpClient, payload: Union[Dict[str, Any], bytes]) -> Dict[str, Any]:
+    """Send a scrape request and return the document data of the response."""
+    response = client.post("/v2/scrape", payload)
+
+    if not response.ok:
+        handle_response_error(response, "scrape")
+
+    body = response.json()
+    if not body.get("success"):
+        raise Exception(body.get("error", "Unknown error occurred"))
+
+    return body.get("data", {})
+
+
+def scrape(
+    client: HttpClient,
+    url: str,
+    options: Optional[Union[ScrapeOptions, CompiledScrapeOptions]] = None,
+    *,
+    cache: Optional[ScrapeCache] = None,
+) -> Document:
     """
     Scrape a single URL and return the document.
     
@@ -43,22 +85,140 @@ def scrape(client: HttpClient, url: str, options: Optional[ScrapeOptions] = None
     Args:
         client: HTTP client instance
         url: URL to scrape
-        options: Scraping options (snake_case)
+        options: Scraping options (snake_case), or options from compile_scrape_options
+        cache: Local response cache to answer from and fill (see ``ScrapeCache``)
         
     Returns:
         Document
     """
-    payload = _prepare_scrape_request(url, options)
+    if cache is not None:
+        return _cached_scrape(client, cache, url, options)
 
-    response = client.post("/v2/scrape", payload)
+    document_data = _post_scrape(client, _encode_scrape_request(url, options))
+    normalized = normalize_document_input(document_data)
+    return Document(**normalized)
 
-    if not response.ok:
-        handle_response_error(response, "scrape")
 
-    body = response.json()
-    if not body.get("success"):
-        raise Exception(body.get("error", "Unknown error occurred"))
+def _cached_scrape(
+    client: HttpClient,
+    cache: ScrapeCache,
+    url: str,
+    options: Optional[Union[ScrapeOptions, CompiledScrapeOptions]],
+) -> Document:
+    request = _prepare_scrape_request(url, options)
+    ttl = cache.ttl_for(request)
+    if ttl <= 0:
+        return scrape(client, url, options)
+    key = scrape_cache_key(
+        request, api_url=getattr(client, "api_url", None), api_key=getattr(client, "api_key", None)
+    )
+    cached = cache.get(key)
+    if cached is not None:
+        body, fresh = cached
+        if not fresh and cache.begin_revalidation(key):
+            threading.Thread(
+                target=_revalidate,
+                args=(client, cache, key, url, options, ttl),
+                name="firecrawl-revalidate",
+                daemon=True,
+            ).start()
+        return Document(**normalize_document_input(json_codec.loads(body)))
 
-    document_data = body.get("data", {})
-    normalized = normalize_document_input(document_data)
-    return Document(**normalized)
\ No newline at end of file
+    document_data = _post_scrape(client, _encode_scrape_request(url, options))
+    cache.put(key, request["url"], json_codec.dumps(document_data, default=str), ttl)
+    return Document(**normalize_document_input(document_data))
+
+
+def _revalidate(
+    client: HttpClient,
+    cache: ScrapeCache,
+    key: str,
+    url: str,
+    options: Optional[Union[ScrapeOptions, CompiledScrapeOptions]],
+    ttl: float,
+) -> None:
+    # Background refresh of a stale entry; on failure the stale entry stays until its window ends
+    try:
+        document_data = _post_scrape(client, _encode_scrape_request(url, options))
+        cache.put(key, url.strip(), json_codec.dumps(document_data, default=str), ttl)
+    except Exception as exc:
+        logger.debug("Revalidating cached scrape of %s failed: %s", url, exc)
+    finally:
+        cache.end_revalidation(key)
+
+
+def _scrape_outcome(
+    client: HttpClient, index: int, url: str, options: Optional[CompiledScrapeOptions]
+) -> ScrapeManyResult:
+    try:
+        return ScrapeManyResult(index=index, url=url, document=scrape(client, url, options))
+    except Exception as exc:
+        return ScrapeManyResult(
+            index=index, url=url, error=str(exc), status_code=getattr(exc, "status_code", None), exception=exc
+        )
+
+
+def scrape_many(
+    client: HttpClient,
+    urls: Iterable[str],
+    options: Optional[Union[ScrapeOptions, CompiledScrapeOptions]] = None,
+    *,
+    concurrency: int = 8,
+    stop_on_error: bool = False,
+    fairness: Optional[HostFairness] = None,
+) -> Iterator[ScrapeManyResult]:
+    """
+    Scrape many URLs concurrently on a thread pool, yielding results as they finish.
+
+    Options are compiled once, so each URL costs one POST on the client's
+    pooled session. At most ``concurrency`` scrapes are in flight and URLs
+    are drawn from ``urls`` lazily, unless ``fairness`` is given: then all
+    URLs are queued per host up front and dispatched round-robin across
+    hosts, with at most ``max_in_flight_per_host`` scrapes per host. Errors
+    are captured per URL rather than raised; closing the generator (or
+    ``stop_on_error``) stops submitting new URLs.
+
+    Args:
+        client: HTTP client instance
+        urls: URLs to scrape
+        options: Scraping options shared by every URL
+        concurrency: Maximum scrapes in flight
+        stop_on_error: Stop after the first failed URL
+        fairness: Per-host round-robin dispatch and in-flight cap (see ``HostScheduler``)
+
+    Returns:
+        Iterator of ScrapeManyResult in completion order
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    compiled = compile_scrape_options(options) if options is not None else None
+    dispatcher = url_dispatcher(urls, fairness)
+    in_flight: Set["Future[ScrapeManyResult]"] = set()
+    pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="firecrawl-scrape")
+
+    def fill() -> None:
+        while len(in_flight) < concurrency:
+            item = dispatcher.next()
+            if item is None:
+                return
+            in_flight.add(pool.submit(_scrape_outcome, client, item[0], item[1], compiled))
+
+    try:
+        fill()
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            in_flight.difference_update(done)
+            stop = False
+            for future in done:
+                result = future.result()
+                dispatcher.done(result.url)
+                stop = stop or (stop_on_error and not result.ok)
+                yield result
+            if stop:
+                return
+            fill()
+    finally:
+        # Scrapes already sent finish in the background; nothing new is started
+        for future in in_flight:
+            future.cancel()
+        pool.shutdown(wait=False)
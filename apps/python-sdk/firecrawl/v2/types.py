@@ -8,7 +8,7 @@ import warnings
 from datetime import datetime
 from typing import Any, Dict, Generic, List, Literal, Optional, TypeVar, Union
 import logging
-from pydantic import BaseModel, Field, field_validator, ValidationError
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_serializer, ValidationError
 
 # Suppress pydantic warnings about schema field shadowing
 # Tested using schema_field alias="schema" but it doesn't work.
@@ -124,6 +124,10 @@ class AttributeResult(BaseModel):
     attribute: str
     values: List[str]
 
+# API keys of Document fields that differ from the snake_case field names
+_DOCUMENT_API_KEYS = {"rawHtml": "raw_html", "changeTracking": "change_tracking"}
+
+
 class Document(BaseModel):
     """A scraped document."""
     markdown: Optional[str] = None
@@ -139,6 +143,79 @@ class Document(BaseModel):
     warning: Optional[str] = None
     change_tracking: Optional[Dict[str, Any]] = None
 
+    # Raw API metadata of documents built by ``from_api``, normalized on first access
+    _raw_metadata: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Document":
+        """
+        Build a Document from a server payload without validating it.
+
+        Top-level fields are trusted and stored as-is; ``metadata`` is only
+        normalized into a DocumentMetadata when first read (or when the
+        document is compared, printed or serialized), which skips most of the
+        parsing cost for documents that are just passed through.
+        """
+        values: Dict[str, Any] = dict.fromkeys(cls.model_fields)
+        fields_set = set()
+        for key, value in data.items():
+            name = _DOCUMENT_API_KEYS.get(key, key)
+            if name in values and name not in fields_set:
+                values[name] = value
+                fields_set.add(name)
+        raw_metadata = values["metadata"]
+        if isinstance(raw_metadata, dict):
+            del values["metadata"]
+        else:
+            raw_metadata = None
+        doc = cls.__new__(cls)
+        object.__setattr__(doc, "__dict__", values)
+        object.__setattr__(doc, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(doc, "__pydantic_extra__", None)
+        object.__setattr__(doc, "__pydantic_private__", {"_raw_metadata": raw_metadata})
+        return doc
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "metadata":
+            return self._load_metadata()
+        return super().__getattr__(name)
+
+    def _load_metadata(self) -> Any:
+        from .utils.normalize import normalize_metadata
+
+        raw = self.__pydantic_private__.get("_raw_metadata") if self.__pydantic_private__ else None
+        metadata = normalize_metadata(raw) if raw is not None else None
+        # Keep field order so repr and iteration match eagerly built documents
+        values = {name: self.__dict__.get(name) for name in type(self).model_fields}
+        values["metadata"] = metadata
+        object.__setattr__(self, "__dict__", values)
+        if raw is not None:
+            self.__pydantic_private__["_raw_metadata"] = None
+        return metadata
+
+    def _materialize(self) -> None:
+        if "metadata" not in self.__dict__:
+            self._load_metadata()
+
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler):
+        self._materialize()
+        return handler(self)
+
+    def __eq__(self, other: Any) -> bool:
+        self._materialize()
+        if isinstance(other, Document):
+            other._materialize()
+        return super().__eq__(other)
+
+    def __repr_args__(self):
+        self._materialize()
+        return super().__repr_args__()
+
+    def __iter__(self):
+        self._materialize()
+        return super().__iter__()
+
     @property
     def metadata_typed(self) -> DocumentMetadata:
         """Always returns a DocumentMetadata instance for LSP-friendly access."""
@@ -320,6 +397,45 @@ class ScrapeResponse(BaseResponse[ScrapeData]):
     """Response for scrape operations."""
     pass
 
+class ScrapeManyResult(BaseModel):
+    """Outcome of one URL of a ``scrape_many`` run: its document, or the error it raised."""
+    # Position of the URL in the input
+    index: int
+    url: str
+    document: Optional[Document] = None
+    error: Optional[str] = None
+    status_code: Optional[int] = None
+    exception: Optional[Any] = Field(default=None, exclude=True, repr=False)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+class ScrapeCacheStats(BaseModel):
+    """Counters of a ``ScrapeCache`` since it was opened."""
+    memory_hits: int = 0
+    disk_hits: int = 0
+    # Expired entries served while a refresh runs in the background
+    stale_hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    # Encoded document bytes served from and written to the cache
+    bytes_served: int = 0
+    bytes_stored: int = 0
+    # Size of the in-memory tier
+    memory_entries: int = 0
+    memory_bytes: int = 0
+    evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
 # Crawl types
 class CrawlRequest(BaseModel):
     """Request for crawling a website."""
@@ -443,6 +559,8 @@ class BatchScrapeResponse(BaseModel):
     id: str
     url: str
     invalid_urls: Optional[List[str]] = None
+    # Duplicate URLs dropped client-side before submission (when deduplication is on)
+    duplicate_urls_removed: Optional[int] = None
 
 class BatchScrapeJob(BaseModel):
     """Batch scrape job status and results."""
@@ -453,6 +571,8 @@ class BatchScrapeJob(BaseModel):
     expires_at: Optional[datetime] = None
     next: Optional[str] = None
     data: List[Document] = []
+    # Set by batch_scrape(retry_failed=...): what was re-submitted and what still failed
+    retry_report: Optional["BatchRetryReport"] = None
 
 class BatchScrapeStatusRequest(BaseModel):
     """Request to get batch scrape job status."""
@@ -739,6 +859,18 @@ class CrawlErrorsResponse(BaseModel):
     errors: List[CrawlError]
     robots_blocked: List[str]
 
+class BatchRetryReport(BaseModel):
+    """Outcome of re-submitting the failed URLs of a batch scrape."""
+    rounds: int = 0
+    retry_job_ids: List[str] = []
+    # Failed URLs that succeeded in a retry job
+    recovered: List[str] = []
+    # Errors that are not worth retrying, or still failing after the last round
+    failed: List[CrawlError] = []
+    robots_blocked: List[str] = []
+
+BatchScrapeJob.model_rebuild()
+
 class CrawlErrorsRequest(BaseModel):
     """Request for crawl error monitoring."""
     crawl_id: str
@@ -774,6 +906,75 @@ class PaginationConfig(BaseModel):
     max_pages: Optional[int] = Field(default=None, ge=0)
     max_results: Optional[int] = Field(default=None, ge=0)
     max_wait_time: Optional[int] = Field(default=None, ge=0)    # seconds
+    # Pages requested at once by the async clients when downloading results
+    max_concurrent_pages: int = Field(default=4, ge=1)
+
+# How waiters poll a running job:
+#   "status" - fetch only counters while running, download all results once at the end
+#   "delta"  - fetch only documents past the last seen offset on each poll
+#   "full"   - re-fetch every page on every poll (pre-existing behavior)
+PollMode = Literal["status", "delta", "full"]
+
+# Documents in each snapshot a watcher hands to listeners:
+#   "full"     - every document received so far (each converted once, shared between snapshots)
+#   "delta"    - only documents received since the previous snapshot
+#   "counters" - none; status and counters only
+SnapshotMode = Literal["full", "delta", "counters"]
+
+# What a watcher's document queue does when its consumer falls behind:
+#   "block"       - stop reading from the WebSocket until there is room
+#   "drop_oldest" - discard the oldest queued document
+#   "spill"       - keep the overflow in a temporary file on disk
+OverflowPolicy = Literal["block", "drop_oldest", "spill"]
+
+class UrlCanonicalization(BaseModel):
+    """Rules for treating URLs that differ only cosmetically as duplicates."""
+    lowercase_host: bool = True
+    remove_default_port: bool = True
+    drop_fragment: bool = True
+    strip_trailing_slash: bool = True
+    sort_query: bool = True
+    # Query parameters removed by name; shell-style patterns, matched case-insensitively
+    strip_query_params: List[str] = Field(default_factory=lambda: ["utm_*", "gclid", "fbclid", "msclkid"])
+    # Drop the whole query string, like the server's ignoreQueryParameters crawl option
+    ignore_query_parameters: bool = False
+
+# How dedupe_urls remembers URLs it has seen:
+#   "exact" - a set of canonical URLs
+#   "bloom" - a Bloom filter; fixed memory, may drop a few unique URLs as duplicates
+#   "auto"  - "bloom" for very large lists, otherwise "exact"
+DedupMethod = Literal["exact", "bloom", "auto"]
+
+class UrlDedupResult(BaseModel):
+    """URLs left after deduplication (first occurrences, in input order)."""
+    urls: List[str]
+    removed: int = 0
+
+class HostFairness(BaseModel):
+    """Spreading of a mixed-domain URL list across hosts (see HostScheduler)."""
+    # Scrapes in flight per host (None for no cap); only enforceable client-side, by scrape_many
+    max_in_flight_per_host: Optional[int] = Field(default=None, ge=1)
+    # Relative share of dispatches per host name; hosts not listed get default_weight
+    weights: Dict[str, float] = {}
+    default_weight: float = Field(default=1.0, gt=0)
+
+JournalJobKind = Literal["batch", "crawl"]
+
+class JournaledJob(BaseModel):
+    """A job recorded in a JobJournal and how far its results have been downloaded."""
+    # None while the start request is in flight (status "submitting")
+    job_id: Optional[str] = None
+    kind: JournalJobKind
+    url: Optional[str] = None
+    idempotency_key: Optional[str] = None
+    urls: List[str] = []
+    options_fingerprint: str
+    status: str = "scraping"
+    # ``next`` cursor of the last page persisted (None before the first page)
+    next_cursor: Optional[str] = None
+    documents: int = 0
+    # True once every result page has been persisted
+    downloaded: bool = False
 
 # Response union types
 AnyResponse = Union[
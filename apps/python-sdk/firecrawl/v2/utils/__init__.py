@@ -3,7 +3,17 @@ Utility modules for v2 API client.
 """
 
 from .http_client import HttpClient
-from .error_handler import FirecrawlError, handle_response_error
-from .validation import validate_scrape_options, prepare_scrape_options
+from .retry import RetryPolicy, RetryBudget
+from .rate_limiter import RateLimiter
+from .adaptive_concurrency import AdaptiveConcurrency
+from .poll_scheduler import PollScheduler, PollLimitExceeded
+from .document_store import DocumentStore, StoredDocuments
+from .document_queue import DocumentQueue
+from .job_journal import JobJournal, UnconfirmedSubmission
+from .url_dedup import canonicalize_url, dedupe_urls, UrlCanonicalizer
+from .host_scheduler import HostScheduler, fair_order
+from .scrape_cache import ScrapeCache
+from .error_handler import FirecrawlError, BatchChunkError, handle_response_error
+from .validation import validate_scrape_options, prepare_scrape_options, compile_scrape_options, CompiledScrapeOptions
 
-__all__ = ['HttpClient', 'FirecrawlError', 'handle_response_error', 'validate_scrape_options', 'prepare_scrape_options']
\ No newline at end of file
+__all__ = ['HttpClient', 'RetryPolicy', 'RetryBudget', 'RateLimiter', 'AdaptiveConcurrency', 'PollScheduler', 'PollLimitExceeded', 'DocumentStore', 'StoredDocuments', 'DocumentQueue', 'JobJournal', 'UnconfirmedSubmission', 'canonicalize_url', 'dedupe_urls', 'UrlCanonicalizer', 'HostScheduler', 'fair_order', 'ScrapeCache', 'FirecrawlError', 'BatchChunkError', 'handle_response_error', 'validate_scrape_options', 'prepare_scrape_options', 'compile_scrape_options', 'CompiledScrapeOptions']
\ No newline at end of file
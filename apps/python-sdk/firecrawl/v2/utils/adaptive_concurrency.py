@@ -0,0 +1,166 @@
+"""
+Adaptive (AIMD) concurrency control for the v2 transports.
+
+Instead of guessing a fixed semaphore size for bulk fan-out, the controller
+grows the in-flight limit additively while requests succeed at a healthy
+latency and halves it when the API pushes back (429, 5xx, timeouts), the
+same way TCP congestion control probes for available bandwidth.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from .rate_limiter import FairSemaphore, classify_endpoint
+
+logger = logging.getLogger("firecrawl")
+
+
+class LimitChange(NamedTuple):
+    """One entry in the controller's history ring buffer."""
+    timestamp: float
+    limit: int
+    reason: str
+
+
+class AttemptToken(NamedTuple):
+    """Handed out by ``acquire`` and passed back to ``release``."""
+    started: float
+    epoch: int
+    endpoint_class: str
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD controller for the number of in-flight requests.
+
+    Args:
+        initial_limit: Starting concurrency
+        min_limit: Lower bound for the limit
+        max_limit: Upper bound for the limit
+        increase: Limit added per window of ``limit`` healthy responses
+        decrease_factor: Multiplier applied on overload (429/5xx/timeouts)
+        latency_tolerance: Responses slower than this multiple of the
+            endpoint's baseline latency stop the limit from growing
+        history_size: Number of limit changes kept for ``history()``
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        history_size: int = 512,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self._lock = threading.Lock()
+        self._limit = float(initial_limit)
+        self._epoch = 0
+        self._semaphore = FairSemaphore(initial_limit)
+        self._latency: Dict[str, Tuple[float, float]] = {}  # class -> (ewma, baseline)
+        self._history: Deque[LimitChange] = deque(maxlen=history_size)
+        self._history.append(LimitChange(time.time(), initial_limit, "initial"))
+
+    @property
+    def limit(self) -> int:
+        """Current in-flight limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._semaphore.in_use
+
+    @property
+    def waiting(self) -> int:
+        return self._semaphore.waiting
+
+    def history(self) -> List[LimitChange]:
+        """Recent limit changes, oldest first."""
+        with self._lock:
+            return list(self._history)
+
+    def _token(self, method: str, endpoint: str) -> AttemptToken:
+        return AttemptToken(time.monotonic(), self._epoch, classify_endpoint(method, endpoint))
+
+    def acquire(self, method: str, endpoint: str) -> AttemptToken:
+        self._semaphore.acquire()
+        return self._token(method, endpoint)
+
+    async def acquire_async(self, method: str, endpoint: str) -> AttemptToken:
+        await self._semaphore.acquire_async()
+        return self._token(method, endpoint)
+
+    def release(
+        self,
+        token: AttemptToken,
+        *,
+        status_code: Optional[int] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Free the slot and feed the attempt's outcome into the controller."""
+        try:
+            if error is not None or (status_code is not None and (status_code == 429 or status_code >= 500)):
+                self._on_overload(token, status_code, error)
+            elif status_code is not None and status_code < 400:
+                self._on_success(token, time.monotonic() - token.started)
+        finally:
+            self._semaphore.release()
+
+    def _set_limit(self, value: float, reason: str) -> None:
+        # Caller holds the lock
+        old = int(self._limit)
+        self._limit = value
+        new = int(value)
+        if new != old:
+            self._semaphore.set_limit(new)
+            self._history.append(LimitChange(time.time(), new, reason))
+            logger.debug("Adaptive concurrency limit %d -> %d (%s)", old, new, reason)
+
+    def _on_overload(self, token: AttemptToken, status_code: Optional[int], error: Optional[BaseException]) -> None:
+        with self._lock:
+            # Attempts that started before the last cut saw the old limit; one cut per window
+            if token.epoch != self._epoch:
+                return
+            self._epoch += 1
+            reason = f"status {status_code}" if error is None else type(error).__name__
+            self._set_limit(max(float(self.min_limit), self._limit * self.decrease_factor), reason)
+
+    def _on_success(self, token: AttemptToken, latency: float) -> None:
+        with self._lock:
+            ewma, baseline = self._latency.get(token.endpoint_class, (latency, latency))
+            ewma = 0.8 * ewma + 0.2 * latency
+            # Baseline tracks the fastest recent latency, drifting up slowly so it can recover
+            baseline = min(ewma, baseline + (ewma - baseline) * 0.01)
+            self._latency[token.endpoint_class] = (ewma, baseline)
+
+            if ewma > baseline * self.latency_tolerance:
+                return
+            # Only probe upwards while callers are actually using the current limit
+            if self._semaphore.in_use + self._semaphore.waiting < self._limit / 2:
+                return
+            if self._limit < self.max_limit:
+                self._set_limit(min(float(self.max_limit), self._limit + self.increase / self._limit), "increase")
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            latency = {name: {"ewma": e, "baseline": b} for name, (e, b) in self._latency.items()}
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "latency": latency,
+        }
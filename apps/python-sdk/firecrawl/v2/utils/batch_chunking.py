@@ -0,0 +1,123 @@
+"""
+Splitting of large batch scrape URL lists into several start requests.
+
+A batch scrape of a few hundred thousand URLs would otherwise be sent as one
+multi-megabyte POST body. ``start_batch_scrape`` instead splits the list with
+``split_batch_urls``: the first chunk creates the job and the remaining
+chunks are appended to it (``appendToId``) in parallel. Every chunk is sent
+with its own idempotency key derived from the caller's (or a generated) key.
+The API only accepts UUID keys and rejects a key it has already seen with
+409 rather than replaying the first response, so chunk keys are UUIDv5s of
+the base key and the chunk index: a retried chunk request that already
+reached the server fails with 409 instead of queueing its URLs twice.
+
+Keyed POSTs are not retried after a read timeout, since the retry would be
+rejected with 409 even when the first attempt was queued.
+
+If the first chunk fails its error is raised as is. Once the job exists, a
+failed later chunk no longer hides the job: the remaining chunks are still
+sent and ``BatchChunkError`` is then raised with the job ID and the chunks
+the server did not accept, so the caller can resubmit just those URLs with
+``append_to_id``. Chunks that timed out after being sent or got a 409 may
+have been queued and are reported separately as unconfirmed.
+"""
+
+import uuid
+from typing import Any, Dict, Iterable, List, Optional
+
+import httpx
+import requests
+
+from ..types import BatchScrapeResponse
+from .error_handler import BatchChunkError, FirecrawlError
+
+# Errors raised after a request was sent, when the server may still have queued it
+_UNCONFIRMED_ERRORS = (requests.ReadTimeout, httpx.ReadTimeout, httpx.WriteTimeout)
+
+# Largest URL list the API accepts in one batch scrape request
+MAX_BATCH_URLS = 1000
+# URL bytes sent per request, keeping bodies of long URLs well below server limits
+MAX_BATCH_URL_BYTES = 1 << 20
+
+
+def split_batch_urls(
+    urls: List[str],
+    *,
+    max_urls: int = MAX_BATCH_URLS,
+    max_bytes: int = MAX_BATCH_URL_BYTES,
+) -> List[List[str]]:
+    """
+    Split URLs into chunks of at most ``max_urls`` URLs and about ``max_bytes`` bytes.
+
+    A single URL longer than ``max_bytes`` gets a chunk of its own.
+    """
+    if max_urls < 1:
+        raise ValueError("max_urls must be at least 1")
+    chunks: List[List[str]] = []
+    chunk: List[str] = []
+    size = 0
+    for url in urls:
+        # Quotes and separator around each URL in the JSON array
+        url_size = len(url.encode("utf-8")) + 3 if isinstance(url, str) else 0
+        if chunk and (len(chunk) >= max_urls or size + url_size > max_bytes):
+            chunks.append(chunk)
+            chunk, size = [], 0
+        chunk.append(url)
+        size += url_size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def new_idempotency_key() -> str:
+    return str(uuid.uuid4())
+
+
+def validate_idempotency_key(key: Optional[str]) -> None:
+    """Raise ValueError unless ``key`` is None or a UUID, the only form the API accepts."""
+    if key is None:
+        return
+    try:
+        uuid.UUID(key)
+    except (TypeError, ValueError, AttributeError):
+        raise ValueError(f"idempotency_key must be a UUID, got {key!r}") from None
+
+
+def chunk_idempotency_key(base: str, index: int) -> str:
+    """Idempotency key of chunk ``index``; the first chunk uses ``base`` itself."""
+    return base if index == 0 else str(uuid.uuid5(uuid.UUID(base), str(index)))
+
+
+def possibly_submitted(error: Exception) -> bool:
+    """True if a start request that raised ``error`` may still have been queued by the server."""
+    if isinstance(error, FirecrawlError):
+        # The key was already used: an earlier attempt of this chunk reached the server
+        return error.status_code == 409
+    return isinstance(error, _UNCONFIRMED_ERRORS)
+
+
+def raise_for_failed_chunks(job_id: str, payloads: List[Dict[str, Any]], errors: Dict[int, Exception]) -> None:
+    """Raise ``BatchChunkError`` if any chunk of job ``job_id`` failed or may not have been submitted."""
+    if not errors:
+        return
+    unconfirmed = [index for index in sorted(errors) if possibly_submitted(errors[index])]
+    failed = [index for index in sorted(errors) if index not in unconfirmed]
+    raise BatchChunkError(
+        job_id,
+        failed,
+        [url for index in failed for url in payloads[index]["urls"]],
+        errors,
+        unconfirmed_chunks=unconfirmed,
+        unconfirmed_urls=[url for index in unconfirmed for url in payloads[index]["urls"]],
+    )
+
+
+def merge_batch_responses(job_id: str, responses: Iterable[BatchScrapeResponse]) -> BatchScrapeResponse:
+    """Combine the start responses of every chunk of one job."""
+    url: Optional[str] = None
+    invalid_urls: List[str] = []
+    for response in responses:
+        if url is None:
+            url = response.url
+        invalid_urls.extend(response.invalid_urls or [])
+    return BatchScrapeResponse(id=job_id, url=url, invalid_urls=invalid_urls or None)
@@ -0,0 +1,71 @@
+"""
+Re-submission of failed batch scrape URLs.
+
+With ``batch_scrape(..., retry_failed=N)`` the URLs reported by the batch
+errors endpoint are classified once the job finishes: transient failures
+(timeouts, all engines failing, 5xx responses) are scraped again in a
+follow-up batch job after a backoff delay, for up to ``N`` rounds, while
+robots-blocked URLs and permanent failures (DNS, TLS, unsupported files,
+failing actions, ...) go straight into a ``BatchRetryReport``. Documents of
+the follow-up jobs are merged into the original ``BatchScrapeJob``.
+
+Follow-up jobs are used instead of ``appendToId`` so that the errors of each
+round can be told apart from those of the rounds before it.
+"""
+
+import re
+from typing import Iterable, List, Optional, Tuple
+
+from ..types import BatchScrapeJob, CrawlError, CrawlErrorsResponse
+from .document_store import DocumentStore
+
+# Error codes of failures that may well succeed when scraped again
+RETRYABLE_ERROR_CODES = frozenset({"SCRAPE_TIMEOUT", "SCRAPE_ALL_ENGINES_FAILED"})
+
+# Errors without a code are retried when the message reports a timeout or a 5xx status
+_RETRYABLE_MESSAGE = re.compile(r"timed? ?out|timeout|\b5\d\d\b", re.IGNORECASE)
+
+
+def is_retryable_error(error: CrawlError) -> bool:
+    """True if a batch scrape error is transient and worth re-submitting."""
+    if error.code:
+        return error.code in RETRYABLE_ERROR_CODES
+    return bool(_RETRYABLE_MESSAGE.search(error.error or ""))
+
+
+def split_retryable(errors: Iterable[CrawlError]) -> Tuple[List[str], List[CrawlError]]:
+    """Split errors into the distinct URLs to retry and the errors that are final."""
+    retry: List[str] = []
+    final: List[CrawlError] = []
+    seen = set()
+    for error in errors:
+        if is_retryable_error(error):
+            if error.url not in seen:
+                seen.add(error.url)
+                retry.append(error.url)
+        else:
+            final.append(error)
+    return retry, final
+
+
+def parse_batch_errors(body: dict) -> CrawlErrorsResponse:
+    """Normalize a batch errors endpoint response body."""
+    payload = body.get("data", body)
+    return CrawlErrorsResponse(
+        errors=payload.get("errors", []),
+        robots_blocked=payload.get("robotsBlocked", payload.get("robots_blocked", [])),
+    )
+
+
+def merge_retry_job(
+    job: BatchScrapeJob, retry_job: BatchScrapeJob, document_store: Optional[DocumentStore] = None
+) -> None:
+    """Add the documents and credits of a follow-up job to ``job``."""
+    if document_store is not None:
+        document_store.extend(retry_job.data)
+        job.data = document_store.documents()  # type: ignore[assignment]
+    else:
+        job.data = list(job.data) + list(retry_job.data)
+    job.completed = min(job.total, job.completed + len(retry_job.data)) if job.total else job.completed
+    if retry_job.credits_used is not None:
+        job.credits_used = (job.credits_used or 0) + retry_job.credits_used
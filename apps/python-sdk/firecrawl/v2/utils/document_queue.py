@@ -0,0 +1,173 @@
+"""
+Bounded hand-off of streamed documents from a watcher to its consumer.
+
+The watcher's WebSocket reader puts each new document into a
+``DocumentQueue`` and ``Watcher.documents()`` takes them out on the
+consumer's thread. When the consumer falls behind, the queue's
+``OverflowPolicy`` decides what happens: the reader waits for room (the
+socket stops being read, so the server is slowed down instead of memory
+growing), the oldest queued document is dropped, or the overflow is spilled
+to a temporary ``DocumentStore`` on disk and read back in order.
+"""
+
+import asyncio
+import queue
+import threading
+from collections import deque
+from typing import Deque, Iterator, List, Optional, Tuple, get_args
+
+from ..types import Document, OverflowPolicy
+from .document_store import DocumentStore
+
+
+def _wake(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class DocumentQueue:
+    """
+    Thread-safe FIFO of documents holding at most ``maxsize`` in memory.
+
+    Args:
+        maxsize: Documents kept in memory before ``overflow`` applies
+        overflow: "block", "drop_oldest" or "spill" (see ``OverflowPolicy``)
+    """
+
+    def __init__(self, maxsize: int = 1000, overflow: OverflowPolicy = "block"):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if overflow not in get_args(OverflowPolicy):
+            raise ValueError(f"Unknown overflow policy: {overflow!r}")
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.dropped = 0
+        self._items: Deque[Document] = deque()
+        self._cond = threading.Condition()
+        self._putters: List[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]] = []
+        self._spill: Optional[DocumentStore] = None
+        self._spill_read = 0
+        self._closed = False
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._items) + self._spilled()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def put(self, doc: Document, timeout: Optional[float] = None) -> bool:
+        """
+        Add a document, waiting for room under the "block" policy.
+
+        Returns:
+            False if ``timeout`` elapsed before there was room
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: self._offer(doc), timeout)
+
+    async def put_async(self, doc: Document) -> None:
+        """Add a document from an event loop, waiting for room without blocking the loop."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self._offer(doc):
+                    return
+                future = loop.create_future()
+                self._putters.append((loop, future))
+            try:
+                await future
+            finally:
+                with self._cond:
+                    if (loop, future) in self._putters:
+                        self._putters.remove((loop, future))
+
+    def get(self, timeout: Optional[float] = None) -> Document:
+        """
+        Remove and return the oldest document.
+
+        Raises:
+            queue.Empty: If ``timeout`` elapsed, or the queue is closed and drained
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._items or self._closed, timeout) or not self._items:
+                raise queue.Empty
+            doc = self._items.popleft()
+            self._refill()
+            self._cond.notify_all()
+            self._wake_putters()
+            return doc
+
+    def close(self) -> None:
+        """Stop accepting documents; consumers drain what is queued, then stop."""
+        with self._cond:
+            self._closed = True
+            if not self._spilled():
+                self._close_spill()
+            self._cond.notify_all()
+            self._wake_putters()
+
+    def __iter__(self) -> Iterator[Document]:
+        while True:
+            try:
+                yield self.get()
+            except queue.Empty:
+                return
+
+    # Called with the lock held
+
+    def _offer(self, doc: Document) -> bool:
+        if self._closed:
+            # Nobody will read it; don't hold the producer up
+            return True
+        if self._spilled():
+            self._spill.append(doc)
+        elif len(self._items) < self.maxsize:
+            self._items.append(doc)
+        elif self.overflow == "drop_oldest":
+            self._items.popleft()
+            self._items.append(doc)
+            self.dropped += 1
+        elif self.overflow == "spill":
+            if self._spill is None:
+                self._spill = DocumentStore(cache_size=0)
+            self._spill.append(doc)
+        else:
+            return False
+        self._cond.notify_all()
+        return True
+
+    def _spilled(self) -> int:
+        return len(self._spill) - self._spill_read if self._spill is not None else 0
+
+    def _refill(self) -> None:
+        spilled = self._spilled()
+        room = self.maxsize - len(self._items)
+        if not spilled or room <= 0:
+            return
+        view = self._spill.documents()
+        end = self._spill_read + min(spilled, room)
+        self._items.extend(view[self._spill_read:end])
+        self._spill_read = end
+        if not self._spilled():
+            if self._closed:
+                self._close_spill()
+            else:
+                self._spill.clear()
+                self._spill_read = 0
+
+    def _close_spill(self) -> None:
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+            self._spill_read = 0
+
+    def _wake_putters(self) -> None:
+        putters, self._putters = self._putters, []
+        for loop, future in putters:
+            try:
+                loop.call_soon_threadsafe(_wake, future)
+            except RuntimeError:
+                # Loop already closed
+                pass
@@ -0,0 +1,218 @@
+"""
+On-disk storage for large crawl and batch scrape results.
+
+Paginated results are normally collected into ``List[Document]``, so every
+``raw_html`` and base64 ``screenshot`` payload of a job stays in memory at
+once. A ``DocumentStore`` spills documents to an append-only SQLite file as
+pages arrive, indexed by position and source URL, and hands back a
+``StoredDocuments`` sequence that reads individual records on demand through
+a small LRU cache.
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union, overload
+
+from ..types import Document
+from . import json_codec
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    seq INTEGER PRIMARY KEY,
+    url TEXT,
+    body BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_url ON documents (url);
+"""
+
+
+def _source_url(doc: Union[Document, Dict[str, Any]]) -> Optional[str]:
+    if isinstance(doc, Document):
+        metadata = doc.metadata_dict
+    else:
+        metadata = doc.get("metadata") or {}
+        if not isinstance(metadata, dict):
+            metadata = getattr(metadata, "model_dump", dict)()
+    return metadata.get("source_url") or metadata.get("url")
+
+
+class DocumentStore:
+    """
+    Append-only SQLite file of scraped documents.
+
+    Pass a store as ``document_store`` to the crawl/batch status and wait
+    methods; documents are written as each page is paginated and the returned
+    job's ``data`` becomes a lazy ``StoredDocuments`` view of the file. A store
+    holds one result set: reusing it for another call replaces its contents
+    and invalidates views handed out earlier. Pydantic does not serialize the
+    view; use ``list(job.data)`` before dumping a job to JSON.
+
+    Args:
+        path: SQLite file to write (None for a temporary file removed on close)
+        cache_size: Number of decoded documents kept in memory per view
+    """
+
+    def __init__(self, path: Optional[str] = None, *, cache_size: int = 128):
+        self._owns_file = path is None
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="firecrawl-", suffix=".sqlite3")
+            os.close(fd)
+        self.path = path
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        # Results are re-downloadable scratch data; skip fsyncs on every page
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.executescript(_SCHEMA)
+        self._count = self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+        self._generation = 0
+        self._in_transaction = False
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, doc: Union[Document, Dict[str, Any]]) -> None:
+        """Write one document (a Document or its normalized dict) to the end of the store."""
+        self.extend((doc,))
+
+    def extend(self, docs: Iterable[Union[Document, Dict[str, Any]]]) -> None:
+        """Write documents to the end of the store."""
+        rows = []
+        for doc in docs:
+            body = doc.model_dump(exclude_none=True) if isinstance(doc, Document) else doc
+            rows.append((self._count + len(rows), _source_url(doc), json_codec.dumps(body, default=str)))
+        if not rows:
+            return
+        with self._lock:
+            if not self._in_transaction:
+                self._conn.execute("BEGIN")
+                self._in_transaction = True
+            self._conn.executemany("INSERT INTO documents (seq, url, body) VALUES (?, ?, ?)", rows)
+            self._count += len(rows)
+
+    def clear(self) -> None:
+        """Remove all documents; views created before the call become invalid."""
+        with self._lock:
+            self._commit()
+            self._conn.execute("DELETE FROM documents")
+            self._count = 0
+            self._generation += 1
+
+    def documents(self) -> "StoredDocuments":
+        """Commit pending writes and return a lazy sequence over the stored documents."""
+        with self._lock:
+            self._commit()
+        return StoredDocuments(self, self._count, self._generation)
+
+    def close(self) -> None:
+        with self._lock:
+            self._commit()
+            self._conn.close()
+        if self._owns_file:
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+    def __enter__(self) -> "DocumentStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _commit(self) -> None:
+        if self._in_transaction:
+            self._conn.execute("COMMIT")
+            self._in_transaction = False
+
+    def _check(self, generation: int) -> None:
+        if generation != self._generation:
+            raise RuntimeError("DocumentStore was cleared; this view is no longer valid")
+
+    def _read(self, seq: int, generation: int) -> Document:
+        with self._lock:
+            self._check(generation)
+            row = self._conn.execute("SELECT body FROM documents WHERE seq = ?", (seq,)).fetchone()
+        return Document.from_api(json_codec.loads(row[0]))
+
+    def _read_range(self, start: int, stop: int, generation: int) -> List[Document]:
+        with self._lock:
+            self._check(generation)
+            rows = self._conn.execute(
+                "SELECT body FROM documents WHERE seq >= ? AND seq < ? ORDER BY seq", (start, stop)
+            ).fetchall()
+        return [Document.from_api(json_codec.loads(body)) for (body,) in rows]
+
+    def _find(self, url: str, limit: int, generation: int) -> List[int]:
+        with self._lock:
+            self._check(generation)
+            rows = self._conn.execute(
+                "SELECT seq FROM documents WHERE url = ? AND seq < ? ORDER BY seq", (url, limit)
+            ).fetchall()
+        return [seq for (seq,) in rows]
+
+
+class StoredDocuments(Sequence[Document]):
+    """
+    Read-only sequence of documents backed by a ``DocumentStore``.
+
+    Indexing and ``get(url)`` read a single record from disk; iteration
+    streams records in chunks. Recently accessed documents are cached.
+    """
+
+    _chunk_size = 64
+
+    def __init__(self, store: DocumentStore, length: int, generation: int):
+        self._store = store
+        self._length = length
+        self._generation = generation
+        self._cache: "OrderedDict[int, Document]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> Document: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Document]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step == 1:
+                return self._store._read_range(start, stop, self._generation) if start < stop else []
+            return [self[i] for i in range(start, stop, step)]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("document index out of range")
+        cached = self._cache.get(index)
+        if cached is not None:
+            self._cache.move_to_end(index)
+            return cached
+        doc = self._store._read(index, self._generation)
+        if self._store.cache_size > 0:
+            self._cache[index] = doc
+            if len(self._cache) > self._store.cache_size:
+                self._cache.popitem(last=False)
+        return doc
+
+    def __iter__(self) -> Iterator[Document]:
+        for start in range(0, self._length, self._chunk_size):
+            yield from self._store._read_range(start, min(start + self._chunk_size, self._length), self._generation)
+
+    def get(self, url: str) -> Optional[Document]:
+        """Return the first document whose source URL is ``url`` (None if absent)."""
+        matches = self._store._find(url, self._length, self._generation)
+        return self[matches[0]] if matches else None
+
+    def get_all(self, url: str) -> List[Document]:
+        """Return every document whose source URL is ``url``."""
+        return [self[seq] for seq in self._store._find(url, self._length, self._generation)]
+
+    def __repr__(self) -> str:
+        return f"StoredDocuments(len={self._length}, path={self._store.path!r})"
@@ -3,7 +3,7 @@ Error handling utilities for v2 API.
 """
 
 import requests
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 
 class FirecrawlError(Exception):
@@ -51,6 +51,46 @@ class InternalServerError(FirecrawlError):
     pass
 
 
+class BatchChunkError(FirecrawlError):
+    """
+    Raised when a chunked batch scrape created (or appended to) a job but some
+    chunks could not be submitted.
+
+    ``job_id`` is the job the other chunks were queued on; resubmit
+    ``failed_urls`` with ``append_to_id=job_id`` to complete it.
+    ``failed_chunks`` holds the indices of the chunks the server did not
+    accept. Chunks whose request timed out after it was sent, or was
+    rejected because its key was already used, may have been queued; they
+    are listed in ``unconfirmed_chunks``/``unconfirmed_urls`` instead, so
+    resubmitting ``failed_urls`` never scrapes a URL twice. ``errors`` holds
+    the exception each failed or unconfirmed chunk raised.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        failed_chunks: List[int],
+        failed_urls: List[str],
+        errors: Dict[int, Exception],
+        unconfirmed_chunks: Optional[List[int]] = None,
+        unconfirmed_urls: Optional[List[str]] = None,
+    ):
+        self.unconfirmed_chunks = unconfirmed_chunks or []
+        self.unconfirmed_urls = unconfirmed_urls or []
+        first = errors[(failed_chunks or self.unconfirmed_chunks)[0]]
+        super().__init__(
+            f"Batch scrape {job_id}: {len(failed_chunks)} chunk(s) ({len(failed_urls)} URLs) were not "
+            f"submitted and {len(self.unconfirmed_chunks)} chunk(s) ({len(self.unconfirmed_urls)} URLs) "
+            f"may have been: {first}",
+            getattr(first, "status_code", None),
+            getattr(first, "response", None),
+        )
+        self.job_id = job_id
+        self.failed_chunks = failed_chunks
+        self.failed_urls = failed_urls
+        self.errors = errors
+
+
 def handle_response_error(response: requests.Response, action: str) -> None:
     """
     Handle API response errors and raise appropriate exceptions.
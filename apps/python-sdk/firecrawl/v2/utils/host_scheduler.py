@@ -0,0 +1,171 @@
+"""
+Per-host fair scheduling of mixed-domain URL lists.
+
+Submitted in input order, a list of 50k URLs from one large site followed by
+5k URLs from small sites keeps every worker on the large site until it is
+done: the small sites wait, and the large one is hit with the client's full
+concurrency until it starts timing out. ``HostScheduler`` keeps one queue
+per host and dispatches across hosts with deficit round robin, so each host
+gets a share of dispatches proportional to its weight, and it can cap the
+scrapes in flight per host.
+
+``scrape_many`` dispatches from a scheduler as scrapes finish. Batch scrape
+cannot cap what the server runs per host, so there the scheduler only
+interleaves hosts when the URL list is split into chunks (``fair_order``).
+"""
+
+import math
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+from ..types import HostFairness
+
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def host_of(url: str) -> str:
+    """Lowercased host (with any non-default port) of ``url``; "" when it has none."""
+    scheme, sep, rest = url.strip().partition("://")
+    if not sep:
+        return ""
+    for delimiter in "/?#":
+        rest = rest.partition(delimiter)[0]
+    host = rest.rpartition("@")[2].lower()
+    port = _DEFAULT_PORTS.get(scheme.lower())
+    if port is not None and host.endswith(":" + port):
+        host = host[: -len(port) - 1]
+    return host
+
+
+class _HostQueue:
+    __slots__ = ("items", "weight", "deficit", "in_flight")
+
+    def __init__(self, weight: float):
+        self.items: Deque[Tuple[int, str]] = deque()
+        self.weight = weight
+        self.deficit = 0.0
+        self.in_flight = 0
+
+
+class HostScheduler:
+    """
+    Per-host URL queues with weighted round-robin dispatch.
+
+    Not thread-safe; ``scrape_many`` only calls it from the consuming thread.
+
+    Args:
+        fairness: Per-host cap and weights (defaults to ``HostFairness()``:
+            equal shares, no cap)
+    """
+
+    def __init__(self, fairness: Optional[HostFairness] = None):
+        self.fairness = fairness = fairness if fairness is not None else HostFairness()
+        if any(weight <= 0 for weight in fairness.weights.values()):
+            raise ValueError("host weights must be positive")
+        self._cap = fairness.max_in_flight_per_host
+        self._hosts: Dict[str, _HostQueue] = {}
+        # Hosts with queued URLs, in round-robin order
+        self._active: Deque[str] = deque()
+        self._pending = 0
+        # Visits needed before the lightest host has earned one dispatch
+        self._rounds = math.ceil(1 / min([fairness.default_weight, *fairness.weights.values()]))
+
+    def __len__(self) -> int:
+        """Number of queued URLs."""
+        return self._pending
+
+    def add(self, index: int, url: str) -> None:
+        """Queue ``url``; ``index`` is handed back with it by ``next``."""
+        host = host_of(url) if isinstance(url, str) else ""
+        state = self._hosts.get(host)
+        if state is None:
+            weight = self.fairness.weights.get(host, self.fairness.default_weight)
+            state = self._hosts[host] = _HostQueue(weight)
+        if not state.items:
+            self._active.append(host)
+        state.items.append((index, url))
+        self._pending += 1
+
+    def extend(self, urls: Iterable[str]) -> None:
+        """Queue URLs, indexed by their position in ``urls``."""
+        for index, url in enumerate(urls):
+            self.add(index, url)
+
+    def next(self) -> Optional[Tuple[int, str]]:
+        """
+        Take the next ``(index, url)`` to dispatch and count it as in flight.
+
+        Returns None when nothing is queued or every host with queued URLs is
+        at its in-flight cap.
+        """
+        active = self._active
+        for _ in range(len(active) * self._rounds):
+            host = active[0]
+            state = self._hosts[host]
+            if self._cap is not None and state.in_flight >= self._cap:
+                active.rotate(-1)
+                continue
+            if state.deficit < 1:
+                state.deficit += state.weight
+                if state.deficit < 1:
+                    active.rotate(-1)
+                    continue
+            state.deficit -= 1
+            item = state.items.popleft()
+            state.in_flight += 1
+            self._pending -= 1
+            if not state.items:
+                active.popleft()
+                state.deficit = 0.0
+            elif state.deficit < 1:
+                active.rotate(-1)
+            return item
+        return None
+
+    def done(self, url: str) -> None:
+        """Release the in-flight slot of a dispatched URL."""
+        state = self._hosts.get(host_of(url) if isinstance(url, str) else "")
+        if state is not None and state.in_flight > 0:
+            state.in_flight -= 1
+
+    def drain(self) -> List[str]:
+        """Take every queued URL in fair order, ignoring the in-flight cap."""
+        cap, self._cap = self._cap, None
+        try:
+            ordered = []
+            while self._pending:
+                ordered.append(self.next()[1])  # type: ignore[index]
+            return ordered
+        finally:
+            self._cap = cap
+
+
+def fair_order(urls: List[str], fairness: Optional[HostFairness] = None) -> List[str]:
+    """Reorder ``urls`` so hosts are interleaved according to their weights."""
+    scheduler = HostScheduler(fairness)
+    scheduler.extend(urls)
+    return scheduler.drain()
+
+
+class _InputOrder:
+    """The dispatch interface of HostScheduler over URLs drawn lazily in input order."""
+
+    def __init__(self, urls: Iterable[str]):
+        self._urls = enumerate(urls)
+
+    def next(self) -> Optional[Tuple[int, str]]:
+        return next(self._urls, None)
+
+    def done(self, url: str) -> None:
+        pass
+
+
+def url_dispatcher(
+    urls: Iterable[str], fairness: Optional[HostFairness] = None
+) -> Union[HostScheduler, _InputOrder]:
+    """Dispatch ``urls`` fairly across hosts when ``fairness`` is given, else lazily in input order."""
+    if fairness is None:
+        return _InputOrder(urls)
+    scheduler = HostScheduler(fairness)
+    scheduler.extend(urls)
+    return scheduler
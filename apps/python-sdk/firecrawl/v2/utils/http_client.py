@@ -2,20 +2,108 @@
 HTTP client utilities for v2 API.
 """
 
+import threading
 import time
-from typing import Dict, Any, Optional
+from contextlib import nullcontext
+from typing import Dict, Any, Optional, Union
 from urllib.parse import urlparse, urlunparse, urljoin
 import requests
+from requests.adapters import HTTPAdapter
 from .get_version import get_version
+from .retry import RetryPolicy
+from .rate_limiter import RateLimiter
+from .adaptive_concurrency import AdaptiveConcurrency
+from . import json_codec
 
 version = get_version()
 
 class HttpClient:
-    """HTTP client with retry logic and error handling."""
+    """
+    HTTP client with connection pooling, retry logic and error handling.
+
+    A single ``requests.Session`` is shared by every request made through the
+    client, so repeated calls (status polls, pagination, scrape fan-out) reuse
+    keep-alive connections instead of paying a new TCP+TLS handshake each time.
+    The underlying urllib3 pool is thread-safe, so one client can be shared by
+    many worker threads.
+    """
     
-    def __init__(self, api_key: str, api_url: str):
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str,
+        *,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        timeout: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_controller: Optional[AdaptiveConcurrency] = None,
+    ):
+        """
+        Initialize the HTTP client.
+
+        Args:
+            api_key: Firecrawl API key
+            api_url: Base URL for the Firecrawl API
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum number of connections kept open per host
+            pool_block: Block when the per-host pool is exhausted instead of
+                opening (and later discarding) extra connections
+            timeout: Default per-attempt timeout in seconds (None for no timeout)
+            retry_policy: Retry behavior for failed attempts (defaults to RetryPolicy())
+            rate_limiter: Optional limiter every attempt waits on before being sent
+            concurrency_controller: Optional AIMD controller sizing the number of in-flight attempts
+        """
         self.api_key = api_key
         self.api_url = api_url
+        self.timeout = timeout
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.concurrency_controller = concurrency_controller
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self._session: Optional[requests.Session] = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """The pooled session, created lazily on first use."""
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                session = self._session
+                if session is None:
+                    session = self._create_session()
+                    self._session = session
+        return session
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        """Close the pooled session and release its connections."""
+        with self._session_lock:
+            session = self._session
+            self._session = None
+        if session is not None:
+            session.close()
+
+    def __enter__(self) -> "HttpClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     def _build_url(self, endpoint: str) -> str:
         base = urlparse(self.api_url)
@@ -51,126 +139,158 @@ class HttpClient:
             
         return headers
     
-    def post(
+    def _resolve_policy(self, retries: Optional[int], backoff_factor: Optional[float]) -> RetryPolicy:
+        """Apply legacy per-call ``retries`` (total attempts) / ``backoff_factor`` overrides."""
+        changes: Dict[str, Any] = {}
+        if retries is not None:
+            changes["max_retries"] = max(0, retries - 1)
+        if backoff_factor is not None:
+            changes["backoff_factor"] = backoff_factor
+        return self.retry_policy.copy(**changes) if changes else self.retry_policy
+
+    def _request(
         self,
+        method: str,
         endpoint: str,
-        data: Dict[str, Any],
+        *,
         headers: Optional[Dict[str, str]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        content: Optional[bytes] = None,
         timeout: Optional[float] = None,
-        retries: int = 3,
-        backoff_factor: float = 0.5
+        retries: Optional[int] = None,
+        backoff_factor: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> requests.Response:
-        """Make a POST request with retry logic."""
+        """Send a request, retrying according to the client's retry policy."""
         if headers is None:
             headers = self._prepare_headers()
-
-        data['origin'] = f'python-sdk@{version}'
-            
         url = self._build_url(endpoint)
-        
-        last_exception = None
-        
-        for attempt in range(retries):
+        if timeout is None:
+            timeout = self.timeout
+        # Read timeouts are only safe to retry when repeating the call has no side
+        # effects. That includes keyed POSTs: the server answers a reused
+        # idempotency key with 409 instead of the original response
+        retryable_errors = (
+            (requests.ConnectionError, requests.Timeout)
+            if method in ("GET", "DELETE")
+            else (requests.ConnectionError,)
+        )
+        state = self._resolve_policy(retries, backoff_factor).begin(deadline)
+        body = content
+        if body is None and json is not None:
+            body = json_codec.dumps(json)
+
+        while True:
             try:
-                response = requests.post(
-                    url,
-                    headers=headers,
-                    json=data,
-                    timeout=timeout
-                )
-
-                if response.status_code == 502:
-                    if attempt < retries - 1:
-                        time.sleep(backoff_factor * (2 ** attempt))
-                        continue
-                
-                return response
-                
+                response = self._send_once(method, endpoint, url, headers, body, state.attempt_timeout(timeout))
+            except retryable_errors as e:
+                delay = state.next_delay(error=e)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+
+            delay = state.next_delay(status_code=response.status_code, headers=response.headers)
+            if delay is None:
+                return json_codec.bind_response(response)
+            response.close()
+            time.sleep(delay)
+
+    def _send_once(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        headers: Dict[str, str],
+        body: Optional[bytes],
+        timeout: Optional[float],
+    ) -> requests.Response:
+        """Send a single attempt through the rate limiter and concurrency controller."""
+        limiter = self.rate_limiter
+        controller = self.concurrency_controller
+        with limiter.acquire(method, endpoint) if limiter is not None else nullcontext():
+            if controller is None:
+                return self.session.request(method, url, headers=headers, data=body, timeout=timeout)
+            token = controller.acquire(method, endpoint)
+            try:
+                response = self.session.request(method, url, headers=headers, data=body, timeout=timeout)
             except requests.RequestException as e:
-                last_exception = e
-                if attempt == retries - 1:
-                    raise e
-                time.sleep(backoff_factor * (2 ** attempt))
-        
-        # This should never be reached due to the exception handling above
-        raise last_exception or Exception("Unexpected error in POST request")
-    
+                controller.release(token, error=e)
+                raise
+            except BaseException:
+                controller.release(token)
+                raise
+            controller.release(token, status_code=response.status_code)
+            return response
+
+    def post(
+        self,
+        endpoint: str,
+        data: Union[Dict[str, Any], bytes],
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        backoff_factor: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> requests.Response:
+        """
+        Make a POST request with retry logic.
+
+        ``data`` is a dict, or an already encoded JSON object as bytes.
+        """
+        if isinstance(data, (bytes, bytearray)):
+            json, content = None, json_codec.extend_object(data, {"origin": f"python-sdk@{version}"})
+        else:
+            data['origin'] = f'python-sdk@{version}'
+            json, content = data, None
+        return self._request(
+            "POST",
+            endpoint,
+            headers=headers,
+            json=json,
+            content=content,
+            timeout=timeout,
+            retries=retries,
+            backoff_factor=backoff_factor,
+            deadline=deadline,
+        )
+
     def get(
         self,
         endpoint: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
-        retries: int = 3,
-        backoff_factor: float = 0.5
+        retries: Optional[int] = None,
+        backoff_factor: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> requests.Response:
         """Make a GET request with retry logic."""
-        if headers is None:
-            headers = self._prepare_headers()
+        return self._request(
+            "GET",
+            endpoint,
+            headers=headers,
+            timeout=timeout,
+            retries=retries,
+            backoff_factor=backoff_factor,
+            deadline=deadline,
+        )
 
-        url = self._build_url(endpoint)
-        
-        last_exception = None
-        
-        for attempt in range(retries):
-            try:
-                response = requests.get(
-                    url,
-                    headers=headers,
-                    timeout=timeout
-                )
-                
-                if response.status_code == 502:
-                    if attempt < retries - 1:
-                        time.sleep(backoff_factor * (2 ** attempt))
-                        continue
-                
-                return response
-                
-            except requests.RequestException as e:
-                last_exception = e
-                if attempt == retries - 1:
-                    raise e
-                time.sleep(backoff_factor * (2 ** attempt))
-        
-        # This should never be reached due to the exception handling above
-        raise last_exception or Exception("Unexpected error in GET request")
-    
     def delete(
         self,
         endpoint: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
-        retries: int = 3,
-        backoff_factor: float = 0.5
+        retries: Optional[int] = None,
+        backoff_factor: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> requests.Response:
         """Make a DELETE request with retry logic."""
-        if headers is None:
-            headers = self._prepare_headers()
-            
-        url = self._build_url(endpoint)
-        
-        last_exception = None
-        
-        for attempt in range(retries):
-            try:
-                response = requests.delete(
-                    url,
-                    headers=headers,
-                    timeout=timeout
-                )
-                
-                if response.status_code == 502:
-                    if attempt < retries - 1:
-                        time.sleep(backoff_factor * (2 ** attempt))
-                        continue
-                
-                return response
-                
-            except requests.RequestException as e:
-                last_exception = e
-                if attempt == retries - 1:
-                    raise e
-                time.sleep(backoff_factor * (2 ** attempt))
-        
-        # This should never be reached due to the exception handling above
-        raise last_exception or Exception("Unexpected error in DELETE request")
\ No newline at end of file
+        return self._request(
+            "DELETE",
+            endpoint,
+            headers=headers,
+            timeout=timeout,
+            retries=retries,
+            backoff_factor=backoff_factor,
+            deadline=deadline,
+        )
@@ -1,26 +1,192 @@
+import asyncio
 import httpx
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from .get_version import get_version
+from .retry import RetryPolicy
+from .rate_limiter import RateLimiter
+from .adaptive_concurrency import AdaptiveConcurrency
+from . import json_codec
 
 version = get_version()
 
 
 class AsyncHttpClient:
-    def __init__(self, api_key: str, api_url: str):
+    """
+    Async HTTP client backed by a pooled ``httpx.AsyncClient``.
+
+    Connections are kept alive between requests so high-concurrency callers
+    reuse sockets instead of reconnecting. With ``http2=True`` many concurrent
+    requests are multiplexed over a handful of connections (requires the
+    optional ``h2`` package: ``pip install firecrawl-py[http2]``).
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_url: str,
+        *,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        timeout: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_controller: Optional[AdaptiveConcurrency] = None,
+    ):
+        """
+        Initialize the async HTTP client.
+
+        Args:
+            api_key: Firecrawl API key
+            api_url: Base URL for the Firecrawl API
+            max_connections: Maximum number of open connections (None for no limit)
+            max_keepalive_connections: Maximum number of idle connections kept alive (None for no limit)
+            keepalive_expiry: Seconds an idle connection is kept before being closed
+            http2: Negotiate HTTP/2 and multiplex requests over shared connections
+            timeout: Default per-attempt timeout in seconds (None for no timeout)
+            retry_policy: Retry behavior for failed attempts (defaults to RetryPolicy())
+            rate_limiter: Optional limiter every attempt waits on before being sent
+            concurrency_controller: Optional AIMD controller sizing the number of in-flight attempts
+        """
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    "HTTP/2 support requires the 'h2' package. Install it with: pip install firecrawl-py[http2]"
+                ) from e
+
         self.api_key = api_key
         self.api_url = api_url
+        self.http2 = http2
+        self.timeout = timeout
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.concurrency_controller = concurrency_controller
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._in_flight = 0
         self._client = httpx.AsyncClient(
             base_url=api_url,
             headers={
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json",
             },
-            limits=httpx.Limits(max_keepalive_connections=0),
+            limits=self.limits,
+            http2=http2,
         )
 
     async def close(self) -> None:
         await self._client.aclose()
 
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of connection pool usage for sizing the pool in production.
+
+        Returns:
+            Dict with ``open`` (established connections), ``idle`` (open with no
+            active request), ``active`` (open and serving at least one request;
+            all three are None with a custom transport),
+            ``in_flight`` (requests currently awaiting a response), and the
+            configured limits.
+        """
+        open_count: Optional[int] = None
+        idle_count: Optional[int] = None
+        transport = self._client._transport
+        # The pool is httpcore internals (httpx/httpcore versions are pinned in
+        # setup.py); a custom transport has no pool to report on.
+        if isinstance(transport, httpx.AsyncHTTPTransport):
+            connections = [conn for conn in transport._pool.connections if not conn.is_closed()]
+            open_count = len(connections)
+            idle_count = sum(1 for conn in connections if conn.is_idle())
+        return {
+            "open": open_count,
+            "idle": idle_count,
+            "active": open_count - idle_count if open_count is not None else None,
+            "in_flight": self._in_flight,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "http2": self.http2,
+        }
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request, retrying according to the client's retry policy."""
+        if timeout is None:
+            timeout = self.timeout
+        # Read timeouts are only safe to retry when repeating the call has no side
+        # effects. That includes keyed POSTs: the server answers a reused
+        # idempotency key with 409 instead of the original response
+        retryable_errors = (
+            (httpx.TransportError,)
+            if method in ("GET", "DELETE")
+            else (httpx.NetworkError, httpx.ConnectTimeout, httpx.PoolTimeout, httpx.RemoteProtocolError)
+        )
+        state = self.retry_policy.begin(deadline)
+
+        while True:
+            try:
+                response = await self._send_once(method, endpoint, state.attempt_timeout(timeout), **kwargs)
+            except retryable_errors as e:
+                delay = state.next_delay(error=e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+
+            delay = state.next_delay(status_code=response.status_code, headers=response.headers)
+            if delay is None:
+                return json_codec.bind_response(response)
+            await response.aclose()
+            await asyncio.sleep(delay)
+
+    async def _send_once(
+        self, method: str, endpoint: str, timeout: Optional[float], **kwargs: Any
+    ) -> httpx.Response:
+        if self.rate_limiter is None:
+            return await self._request_counted(method, endpoint, timeout, **kwargs)
+        async with self.rate_limiter.acquire_async(method, endpoint):
+            return await self._request_counted(method, endpoint, timeout, **kwargs)
+
+    async def _request_counted(
+        self, method: str, endpoint: str, timeout: Optional[float], **kwargs: Any
+    ) -> httpx.Response:
+        controller = self.concurrency_controller
+        token = await controller.acquire_async(method, endpoint) if controller is not None else None
+        self._in_flight += 1
+        try:
+            response = await self._client.request(method, endpoint, timeout=timeout, **kwargs)
+        except httpx.TransportError as e:
+            if token is not None:
+                controller.release(token, error=e)
+            raise
+        except BaseException:
+            if token is not None:
+                controller.release(token)
+            raise
+        finally:
+            self._in_flight -= 1
+        if token is not None:
+            controller.release(token, status_code=response.status_code)
+        return response
+
     def _headers(self, idempotency_key: Optional[str] = None) -> Dict[str, str]:
         headers: Dict[str, str] = {}
         if idempotency_key:
@@ -30,17 +196,25 @@ class AsyncHttpClient:
     async def post(
         self,
         endpoint: str,
-        data: Dict[str, Any],
+        data: Union[Dict[str, Any], bytes],
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> httpx.Response:
-        payload = dict(data)
-        payload["origin"] = f"python-sdk@{version}"
-        return await self._client.post(
+        # ``data`` may be an already encoded JSON object
+        if isinstance(data, (bytes, bytearray)):
+            content = json_codec.extend_object(data, {"origin": f"python-sdk@{version}"})
+        else:
+            payload = dict(data)
+            payload["origin"] = f"python-sdk@{version}"
+            content = json_codec.dumps(payload)
+        return await self._send(
+            "POST",
             endpoint,
-            json=payload,
+            content=content,
             headers={**self._headers(), **(headers or {})},
             timeout=timeout,
+            deadline=deadline,
         )
 
     async def get(
@@ -48,9 +222,14 @@ class AsyncHttpClient:
         endpoint: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> httpx.Response:
-        return await self._client.get(
-            endpoint, headers={**self._headers(), **(headers or {})}, timeout=timeout
+        return await self._send(
+            "GET",
+            endpoint,
+            headers={**self._headers(), **(headers or {})},
+            timeout=timeout,
+            deadline=deadline,
         )
 
     async def delete(
@@ -58,8 +237,12 @@ class AsyncHttpClient:
         endpoint: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
     ) -> httpx.Response:
-        return await self._client.delete(
-            endpoint, headers={**self._headers(), **(headers or {})}, timeout=timeout
+        return await self._send(
+            "DELETE",
+            endpoint,
+            headers={**self._headers(), **(headers or {})},
+            timeout=timeout,
+            deadline=deadline,
         )
-
@@ -0,0 +1,267 @@
+"""
+Durable journal of submitted batch scrape and crawl jobs.
+
+A worker that dies mid-run loses the mapping from its work items to job IDs
+and how far it got paging through results, so a restart submits (and pays
+for) everything again. A ``JobJournal`` records each submitted job (ID,
+idempotency key, URLs and a fingerprint of its options), the ``next`` cursor
+of the last result page downloaded and the documents persisted so far in a
+SQLite file. Each page and its cursor are committed together, so after a
+crash ``FirecrawlClient.resume()`` can reattach to unfinished jobs and
+download only the pages that are missing.
+
+A job is recorded as ``submitting`` (key, URLs and fingerprint, no job ID)
+before its start request is sent and the ID is filled in from the response.
+A crash in between leaves a row without an ID: the job may or may not exist
+on the server, and since the API rejects a reused idempotency key with 409
+instead of returning the original job, it cannot be recovered by sending
+the start again. Such rows are listed by ``unconfirmed()`` and are never
+resubmitted silently.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Iterable, List, Optional
+
+from ..types import Document, JournaledJob, JournalJobKind
+from . import json_codec
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT UNIQUE,
+    kind TEXT NOT NULL,
+    url TEXT,
+    idempotency_key TEXT,
+    urls BLOB NOT NULL,
+    options_fingerprint TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'scraping',
+    next_cursor TEXT,
+    documents INTEGER NOT NULL DEFAULT 0,
+    downloaded INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_idempotency_key ON jobs (kind, idempotency_key);
+CREATE TABLE IF NOT EXISTS documents (
+    job_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    body BLOB NOT NULL,
+    PRIMARY KEY (job_id, seq)
+);
+"""
+
+_COLUMNS = "job_id, kind, url, idempotency_key, urls, options_fingerprint, status, next_cursor, documents, downloaded"
+
+
+def options_fingerprint(options: Any) -> str:
+    """Stable hash of a job's options, used to spot an idempotency key reused for different work."""
+    encoded = json.dumps(options, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class UnconfirmedSubmission(RuntimeError):
+    """Raised when a journaled start was interrupted before its job ID was recorded."""
+
+    def __init__(self, entry: JournaledJob):
+        super().__init__(
+            f"The {entry.kind} start with idempotency key {entry.idempotency_key} ({len(entry.urls)} URLs) "
+            "reached the server but its job ID was never recorded, so it cannot be resumed. Record the ID with "
+            "JobJournal.confirm_submission(), or discard_submission() to start the work again under a new key."
+        )
+        self.entry = entry
+
+
+def _entry(row) -> JournaledJob:
+    job_id, kind, url, key, urls, fingerprint, status, cursor, documents, downloaded = row
+    return JournaledJob(
+        job_id=job_id,
+        kind=kind,
+        url=url,
+        idempotency_key=key,
+        urls=json_codec.loads(urls),
+        options_fingerprint=fingerprint,
+        status=status,
+        next_cursor=cursor,
+        documents=documents,
+        downloaded=bool(downloaded),
+    )
+
+
+class JobJournal:
+    """
+    SQLite journal of batch scrape and crawl jobs and their downloaded results.
+
+    Pass a journal as ``journal`` to ``FirecrawlClient`` to record jobs started
+    through it; see the module docstring. Unlike a ``DocumentStore`` the file
+    is the durable record of a run and is never removed by the journal.
+
+    Args:
+        path: SQLite file to open or create
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        # WAL keeps committed pages across a process crash without an fsync per page
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def record_job(
+        self,
+        kind: JournalJobKind,
+        job_id: str,
+        *,
+        urls: List[str],
+        options: Any = None,
+        url: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> JournaledJob:
+        """Record a submitted job; recording the same job ID again keeps the existing entry."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO jobs (job_id, kind, url, idempotency_key, urls, options_fingerprint,"
+                " created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, kind, url, idempotency_key, json_codec.dumps(list(urls)),
+                 options_fingerprint(options), now, now),
+            )
+        return self.get(job_id)
+
+    def record_submission(
+        self,
+        kind: JournalJobKind,
+        idempotency_key: str,
+        *,
+        urls: List[str],
+        options: Any = None,
+    ) -> JournaledJob:
+        """Record a job about to be submitted, before the server has assigned its ID."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, kind, idempotency_key, urls, options_fingerprint, status,"
+                " created_at, updated_at) VALUES (NULL, ?, ?, ?, ?, 'submitting', ?, ?)",
+                (kind, idempotency_key, json_codec.dumps(list(urls)), options_fingerprint(options), now, now),
+            )
+        return self.find(kind, idempotency_key)  # type: ignore[return-value]
+
+    def confirm_submission(
+        self, kind: JournalJobKind, idempotency_key: str, job_id: str, url: Optional[str] = None
+    ) -> JournaledJob:
+        """Fill in the job ID of a submission recorded with ``record_submission``."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET job_id = ?, url = ?, status = 'scraping', updated_at = ?"
+                " WHERE kind = ? AND idempotency_key = ? AND job_id IS NULL",
+                (job_id, url, time.time(), kind, idempotency_key),
+            )
+        if cursor.rowcount == 0:
+            raise KeyError(f"No {kind} submission without a job ID is journaled under {idempotency_key}")
+        return self.get(job_id)  # type: ignore[return-value]
+
+    def discard_submission(self, kind: JournalJobKind, idempotency_key: str) -> None:
+        """Drop a submission that has no job ID, e.g. one the server rejected."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM jobs WHERE kind = ? AND idempotency_key = ? AND job_id IS NULL",
+                (kind, idempotency_key),
+            )
+
+    def get(self, job_id: str) -> Optional[JournaledJob]:
+        """Return the entry for ``job_id`` (None if it was never recorded)."""
+        with self._lock:
+            row = self._conn.execute(f"SELECT {_COLUMNS} FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return _entry(row) if row else None
+
+    def find(self, kind: JournalJobKind, idempotency_key: str) -> Optional[JournaledJob]:
+        """Return the most recent job of ``kind`` submitted with ``idempotency_key``."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE kind = ? AND idempotency_key = ?"
+                " ORDER BY created_at DESC LIMIT 1",
+                (kind, idempotency_key),
+            ).fetchone()
+        return _entry(row) if row else None
+
+    def jobs(self, *, pending: bool = False) -> List[JournaledJob]:
+        """
+        Return recorded jobs in submission order.
+
+        With ``pending`` only jobs that have an ID and are not fully downloaded
+        are returned; submissions without an ID are listed by ``unconfirmed()``.
+        """
+        query = f"SELECT {_COLUMNS} FROM jobs"
+        if pending:
+            query += " WHERE downloaded = 0 AND job_id IS NOT NULL"
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY created_at, rowid").fetchall()
+        return [_entry(row) for row in rows]
+
+    def unconfirmed(self) -> List[JournaledJob]:
+        """Return submissions that were interrupted before their job ID was recorded."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM jobs WHERE job_id IS NULL ORDER BY created_at, rowid"
+            ).fetchall()
+        return [_entry(row) for row in rows]
+
+    def save_page(
+        self, job_id: str, documents: Iterable[Document], next_cursor: Optional[str], status: str
+    ) -> None:
+        """Persist one page of results and its ``next`` cursor in a single transaction."""
+        with self._lock:
+            (count,) = self._conn.execute("SELECT documents FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            rows = [
+                (job_id, count + i, json_codec.dumps(doc.model_dump(exclude_none=True), default=str))
+                for i, doc in enumerate(documents)
+            ]
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany("INSERT INTO documents (job_id, seq, body) VALUES (?, ?, ?)", rows)
+                self._conn.execute(
+                    "UPDATE jobs SET next_cursor = ?, documents = ?, status = ?, updated_at = ? WHERE job_id = ?",
+                    (next_cursor, count + len(rows), status, time.time(), job_id),
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def mark_downloaded(self, job_id: str, status: str) -> None:
+        """Record that every result page of a finished job has been persisted."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET downloaded = 1, next_cursor = NULL, status = ?, updated_at = ? WHERE job_id = ?",
+                (status, time.time(), job_id),
+            )
+
+    def documents(self, job_id: str) -> List[Document]:
+        """Return the documents persisted for ``job_id``, in download order."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT body FROM documents WHERE job_id = ? ORDER BY seq", (job_id,)
+            ).fetchall()
+        return [Document.from_api(json_codec.loads(body)) for (body,) in rows]
+
+    def forget(self, job_id: str) -> None:
+        """Remove a job and its documents from the journal."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.execute("DELETE FROM documents WHERE job_id = ?", (job_id,))
+            self._conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+            self._conn.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "JobJournal":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
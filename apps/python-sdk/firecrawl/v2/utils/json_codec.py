@@ -0,0 +1,175 @@
+"""
+JSON encoding and decoding for request bodies, responses and WebSocket messages.
+
+Crawl status pages carry megabytes of markdown and HTML, and decoding them
+with the standard library dominates client CPU time. This module picks the
+fastest codec available: orjson, then msgspec, then the stdlib ``json``
+module. Neither optional package is required; install one with
+``pip install firecrawl-py[fast-json]`` (orjson) to enable it.
+"""
+
+import functools
+import json
+import logging
+from typing import Any, Callable, Dict, Optional, Union
+
+logger = logging.getLogger("firecrawl")
+
+CODEC_NAMES = ("orjson", "msgspec", "json")
+
+
+class JsonCodec:
+    """
+    A named pair of JSON functions.
+
+    Args:
+        name: Backend name ("orjson", "msgspec" or "json")
+        dumps: Encodes an object to UTF-8 bytes; takes an optional ``default`` hook
+        loads: Decodes bytes or str
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dumps: Callable[..., bytes],
+        loads: Callable[[Union[bytes, bytearray, memoryview, str]], Any],
+    ):
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        return f"JsonCodec({self.name!r})"
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+
+    def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+    return JsonCodec("orjson", dumps, orjson.loads)
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        if default is not None:
+            return msgspec.json.encode(obj, enc_hook=default)
+        return encoder.encode(obj)
+
+    return JsonCodec("msgspec", dumps, decoder.decode)
+
+
+def _stdlib_codec() -> JsonCodec:
+    def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        return json.dumps(obj, default=default, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    return JsonCodec("json", dumps, json.loads)
+
+
+_FACTORIES = {"orjson": _orjson_codec, "msgspec": _msgspec_codec, "json": _stdlib_codec}
+
+
+def load_codec(name: str) -> JsonCodec:
+    """
+    Build the codec for a backend.
+
+    Raises:
+        ValueError: If ``name`` is not a known backend
+        ImportError: If the backend's package is not installed
+    """
+    try:
+        factory = _FACTORIES[name]
+    except KeyError:
+        raise ValueError(f"Unknown JSON codec: {name!r} (expected one of {', '.join(CODEC_NAMES)})") from None
+    return factory()
+
+
+def _detect() -> JsonCodec:
+    for name in CODEC_NAMES:
+        try:
+            return load_codec(name)
+        except ImportError:
+            continue
+    return _stdlib_codec()
+
+
+_codec: JsonCodec = _detect()
+
+
+def get_codec() -> JsonCodec:
+    """Return the codec currently in use."""
+    return _codec
+
+
+def set_codec(codec: Optional[Union[str, JsonCodec]] = None) -> JsonCodec:
+    """
+    Select the JSON codec used by the SDK.
+
+    Args:
+        codec: Backend name, a JsonCodec instance, or None to pick the fastest installed backend
+
+    Returns:
+        The codec now in use
+    """
+    global _codec
+    if codec is None:
+        _codec = _detect()
+    elif isinstance(codec, JsonCodec):
+        _codec = codec
+    else:
+        _codec = load_codec(codec)
+    logger.debug("Using %s JSON codec", _codec.name)
+    return _codec
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Encode ``obj`` to compact UTF-8 JSON bytes."""
+    return _codec.dumps(obj, default)
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Decode a JSON document."""
+    return _codec.loads(data)
+
+
+def extend_object(encoded: bytes, fields: Dict[str, Any]) -> bytes:
+    """
+    Add ``fields`` to an already encoded JSON object without decoding it.
+
+    ``encoded`` must be a JSON object that does not contain any of the keys.
+    """
+    if not fields:
+        return encoded
+    head = encoded.rstrip()[:-1].rstrip()
+    extra = _codec.dumps(fields, None)[1:]
+    if head.endswith(b"{"):
+        return head + extra
+    return head + b"," + extra
+
+
+def _response_json(response: Any, **kwargs: Any) -> Any:
+    if not kwargs:
+        try:
+            return _codec.loads(response.content)
+        except ValueError:
+            # Let the HTTP library raise its own error type for invalid bodies
+            pass
+    return type(response).json(response, **kwargs)
+
+
+def bind_response(response: Any) -> Any:
+    """
+    Route ``response.json()`` through the active codec.
+
+    Works for ``requests`` and ``httpx`` responses; objects without a bytes
+    ``content`` (such as test doubles) are returned unchanged.
+    """
+    if isinstance(getattr(response, "content", None), (bytes, bytearray)):
+        response.json = functools.partial(_response_json, response)
+    return response
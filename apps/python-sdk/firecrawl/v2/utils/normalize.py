@@ -2,7 +2,7 @@
 Normalization helpers for v2 API payloads to avoid relying on Pydantic aliases.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 from ..types import DocumentMetadata
 
 
@@ -94,14 +94,22 @@ def normalize_document_input(doc: Dict[str, Any]) -> Dict[str, Any]:
 
     md = normalized.get("metadata")
     if isinstance(md, dict):
-        mapped = _map_metadata_keys(md)
-        # Construct a concrete DocumentMetadata so downstream has a typed object
-        try:
-            normalized["metadata"] = DocumentMetadata(**mapped)
-        except Exception:
-            # Fallback to mapped dict if model construction fails for any reason
-            normalized["metadata"] = mapped
+        normalized["metadata"] = normalize_metadata(md)
 
     return normalized
 
 
+def normalize_metadata(md: Dict[str, Any]) -> Union[DocumentMetadata, Dict[str, Any]]:
+    """
+    Convert a raw API metadata dict into a DocumentMetadata, falling back to
+    the snake_case dict if it does not validate.
+    """
+    mapped = _map_metadata_keys(md)
+    # Construct a concrete DocumentMetadata so downstream has a typed object
+    try:
+        return DocumentMetadata(**mapped)
+    except Exception:
+        # Fallback to mapped dict if model construction fails for any reason
+        return mapped
+
+
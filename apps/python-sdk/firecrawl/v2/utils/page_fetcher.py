@@ -0,0 +1,218 @@
+"""
+Concurrent download of the remaining result pages of a crawl or batch job.
+
+Status responses link the next page with a ``skip`` cursor. When the number of
+available documents is known, the rest of the results are split into ranges
+the size of the first page and up to ``PaginationConfig.max_concurrent_pages``
+ranges are requested at once with ``skip``/``limit`` cursors. The API also
+caps pages by size, so a short range is completed with follow-up requests.
+Documents are appended in their original order, and ``max_pages``,
+``max_results`` and ``max_wait_time`` apply as they do to sequential paging.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Deque, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from ..types import Document, PaginationConfig
+from .document_store import DocumentStore
+from .http_client_async import AsyncHttpClient
+from .payload_decoder import decode_job_page
+
+logger = logging.getLogger("firecrawl")
+
+Documents = Union[List[Document], DocumentStore]
+
+
+def _skip_of(url: str) -> Optional[int]:
+    for key, value in parse_qsl(urlsplit(url).query):
+        if key == "skip":
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+def _cursor(url: str, skip: int, limit: int) -> str:
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in ("skip", "limit")]
+    query += [("skip", str(skip)), ("limit", str(limit))]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def delta_cursor(base: str, cursor: str, next_url: Optional[str], total: int) -> Tuple[str, bool]:
+    """
+    Cursor to resume delta polling from after the page fetched at ``cursor``,
+    and whether that page is worth requesting right away.
+
+    The API's ``skip`` counts jobs it iterated over, including jobs that left
+    no document, so the offset comes from its ``next`` link rather than from
+    the number of documents received. Without ``next`` every job was iterated
+    over and the offset is ``total``; a ``next`` that does not move past
+    ``cursor`` means nothing new has finished yet.
+    """
+    if not next_url:
+        return f"{base}?skip={total}", False
+    return next_url, (_skip_of(next_url) or 0) > (_skip_of(cursor) or 0)
+
+
+class _Limits:
+    """Pagination limits shared by every request of one download."""
+
+    def __init__(self, config: Optional[PaginationConfig], collected: int):
+        self.max_pages = config.max_pages if config else None
+        self.max_results = config.max_results if config else None
+        max_wait_time = config.max_wait_time if config else None
+        self.deadline = time.monotonic() + max_wait_time if max_wait_time is not None else None
+        self.collected = collected
+        self.pages = 0
+
+    def can_fetch(self) -> bool:
+        if self.max_pages is not None and self.pages >= self.max_pages:
+            return False
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            return False
+        return True
+
+    def take(self) -> bool:
+        """Reserve one page request, if the limits allow it."""
+        if not self.can_fetch():
+            return False
+        self.pages += 1
+        return True
+
+    def results_left(self) -> Optional[int]:
+        if self.max_results is None:
+            return None
+        return max(0, self.max_results - self.collected)
+
+
+async def _get_page(client: AsyncHttpClient, url: str) -> Optional[dict]:
+    response = await client.get(url)
+    if response.status_code >= 400:
+        # Keep what we have; the caller sees a shorter result list
+        logger.warning(f"Failed to fetch next page: {response.status_code}")
+        return None
+    body = decode_job_page(response)
+    if not body.get("success"):
+        return None
+    return body
+
+
+async def _fetch_sequential(
+    client: AsyncHttpClient, next_url: Optional[str], documents: Documents, limits: _Limits
+) -> None:
+    """Follow ``next`` links one page at a time."""
+    current_url = next_url
+    while current_url and limits.take():
+        body = await _get_page(client, current_url)
+        if body is None:
+            break
+        for doc in body["data"]:
+            if limits.results_left() == 0:
+                break
+            documents.append(doc)
+            limits.collected += 1
+        if limits.results_left() == 0:
+            break
+        current_url = body.get("next")
+
+
+async def _fetch_range(
+    client: AsyncHttpClient, next_url: str, start: int, end: int, limits: _Limits
+) -> Tuple[List[Document], bool, Optional[str]]:
+    """
+    Fetch documents ``[start, end)``.
+
+    Returns the documents, whether the range is complete, and the ``next``
+    link of the last response.
+    """
+    docs: List[Document] = []
+    next_link: Optional[str] = None
+    while len(docs) < end - start:
+        if not limits.take():
+            return docs, False, None
+        remaining = end - start - len(docs)
+        body = await _get_page(client, _cursor(next_url, start + len(docs), remaining))
+        if body is None:
+            return docs, False, None
+        # Servers that ignore ``limit`` return more than asked for
+        page = body["data"][:remaining]
+        docs.extend(page)
+        next_link = body.get("next")
+        if not page:
+            return docs, False, None
+    return docs, True, next_link
+
+
+async def fetch_remaining_pages(
+    client: AsyncHttpClient,
+    next_url: str,
+    documents: Documents,
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    available: Optional[int] = None,
+) -> Documents:
+    """
+    Download the pages after the first one and append their documents.
+
+    Args:
+        client: Async HTTP client instance
+        next_url: ``next`` link of the first page
+        documents: Documents of the first page; appended to in place
+        pagination_config: Optional pagination limits and concurrency
+        available: Number of documents the job has ready (``completed``); when
+            unknown, pages are fetched one after another
+
+    Returns:
+        ``documents``
+    """
+    limits = _Limits(pagination_config, len(documents))
+    concurrency = (pagination_config or PaginationConfig()).max_concurrent_pages
+    start = _skip_of(next_url)
+    page_size = start  # the first page started at offset 0
+    if available is None or not page_size or concurrency <= 1 or available <= start:
+        await _fetch_sequential(client, next_url, documents, limits)
+        return documents
+
+    end = available
+    results_left = limits.results_left()
+    if results_left is not None:
+        end = min(end, start + results_left)
+    ranges = iter([(lo, min(lo + page_size, end)) for lo in range(start, end, page_size)])
+
+    pending: Deque["asyncio.Future[Tuple[List[Document], bool, Optional[str]]]"] = deque()
+
+    def launch() -> None:
+        while len(pending) < concurrency and limits.can_fetch():
+            bounds = next(ranges, None)
+            if bounds is None:
+                return
+            pending.append(asyncio.ensure_future(_fetch_range(client, next_url, *bounds, limits)))
+
+    complete = True
+    next_link: Optional[str] = None
+    try:
+        launch()
+        while pending:
+            docs, complete, next_link = await pending.popleft()
+            documents.extend(docs)
+            limits.collected += len(docs)
+            if not complete:
+                break
+            launch()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    # Ranges were planned from the first page's counters; keep following
+    # ``next`` while more results exist and the limits allow
+    if complete and next(ranges, None) is None and limits.results_left() != 0:
+        await _fetch_sequential(client, next_link, documents, limits)
+    return documents
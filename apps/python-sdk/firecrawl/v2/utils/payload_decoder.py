@@ -0,0 +1,99 @@
+"""
+Single-pass decoding of crawl and batch status pages.
+
+Status pages are decoded straight from the response bytes into typed
+structures when msgspec is installed: the top-level document keys
+(``rawHtml``, ``changeTracking``) are renamed during decoding and documents
+are built without a separate normalization pass. Metadata is kept raw and
+normalized lazily by ``Document`` on first access. Without msgspec, or for
+payloads that do not fit the expected shape, the response is decoded with the
+configured JSON codec and documents are built with ``Document.from_api``;
+both paths produce identical objects. Install msgspec with
+``pip install firecrawl-py[fast-decode]``.
+"""
+
+from typing import Any, Dict, List, Optional, Union
+
+from ..types import Document
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+
+if msgspec is not None:
+    UNSET = msgspec.UNSET
+
+    class _ApiDocument(
+        msgspec.Struct,
+        rename={"raw_html": "rawHtml", "change_tracking": "changeTracking"},
+    ):
+        markdown: Any = UNSET
+        html: Any = UNSET
+        raw_html: Any = UNSET
+        json: Any = UNSET
+        summary: Any = UNSET
+        metadata: Any = UNSET
+        links: Any = UNSET
+        images: Any = UNSET
+        screenshot: Any = UNSET
+        actions: Any = UNSET
+        warning: Any = UNSET
+        change_tracking: Any = UNSET
+
+    class _ApiJobPage(msgspec.Struct):
+        success: Any = UNSET
+        status: Any = UNSET
+        completed: Any = UNSET
+        total: Any = UNSET
+        creditsUsed: Any = UNSET
+        expiresAt: Any = UNSET
+        next: Any = UNSET
+        error: Any = UNSET
+        data: Union[List[Union[_ApiDocument, str]], None, msgspec.UnsetType] = UNSET
+
+    _DOCUMENT_FIELDS = _ApiDocument.__struct_fields__
+    _PAGE_FIELDS = tuple(f for f in _ApiJobPage.__struct_fields__ if f != "data")
+    _page_decoder: Optional[Any] = msgspec.json.Decoder(_ApiJobPage)
+else:
+    _page_decoder = None
+
+
+def _document_from_struct(doc: Any) -> Document:
+    values = {}
+    for name in _DOCUMENT_FIELDS:
+        value = getattr(doc, name)
+        if value is not UNSET:
+            values[name] = value
+    return Document.from_api(values)
+
+
+def decode_job_page(response: Any) -> Dict[str, Any]:
+    """
+    Decode a crawl or batch status page.
+
+    Returns the response body as a dict whose ``data`` is a list of
+    Documents (non-object entries are dropped).
+    """
+    content = getattr(response, "content", None)
+    if _page_decoder is not None and isinstance(content, (bytes, bytearray)):
+        try:
+            page = _page_decoder.decode(content)
+        except msgspec.DecodeError:
+            pass
+        else:
+            body = {}
+            for name in _PAGE_FIELDS:
+                value = getattr(page, name)
+                if value is not UNSET:
+                    body[name] = value
+            data = page.data if page.data is not UNSET else None
+            body["data"] = [_document_from_struct(doc) for doc in data or () if not isinstance(doc, str)]
+            return body
+
+    body = response.json()
+    if isinstance(body, dict):
+        body = dict(body)
+        body["data"] = [Document.from_api(doc) for doc in body.get("data") or () if isinstance(doc, dict)]
+    return body
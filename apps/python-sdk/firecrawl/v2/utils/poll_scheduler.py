@@ -0,0 +1,98 @@
+"""
+Adaptive poll scheduling for job waiters.
+
+Waiters used to sleep a fixed ``poll_interval`` between status checks. That
+wastes requests on multi-hour crawls and adds up to a full interval of tail
+latency on short jobs. ``PollScheduler`` estimates the completion rate from
+successive ``completed``/``total`` snapshots, backs off geometrically while the
+job is far from done, and polls sooner as the predicted end approaches.
+Given the waiter's timeout, it never sleeps past the deadline, so a grown
+interval cannot make a waiter return late.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class PollLimitExceeded(TimeoutError):
+    """Raised by waiters when a job is still running after ``max_polls`` polls."""
+
+
+class PollScheduler:
+    """
+    Computes the delay before each status poll of a single job.
+
+    Args:
+        poll_interval: Delay before the second poll (the first poll is immediate)
+        min_interval: Shortest delay, used when the job is predicted to finish soon
+        max_interval: Longest delay for long-running jobs
+        growth: Factor the delay grows by per poll while the job is far from done
+        max_polls: Maximum number of polls (None for unlimited)
+        timeout: Seconds from now the waiter gives up (None for no deadline);
+            no delay extends past it
+    """
+
+    def __init__(
+        self,
+        poll_interval: float = 2.0,
+        *,
+        min_interval: float = 0.5,
+        max_interval: float = 30.0,
+        growth: float = 1.5,
+        max_polls: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.min_interval = min(min_interval, poll_interval)
+        self.max_interval = max(max_interval, poll_interval)
+        self.growth = growth
+        self.max_polls = max_polls
+        self.polls = 0
+        self._interval = poll_interval
+        self._rate: Optional[float] = None
+        self._last: Optional[tuple] = None  # (timestamp, completed)
+        self._eta: Optional[float] = None
+        self._deadline = time.monotonic() + timeout if timeout is not None else None
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Seconds until the job is predicted to finish (None until progress is observed)."""
+        return self._eta
+
+    @property
+    def exhausted(self) -> bool:
+        return self.max_polls is not None and self.polls >= self.max_polls
+
+    def observe(self, completed: Optional[int] = None, total: Optional[int] = None) -> None:
+        """Record a status snapshot; call once per poll."""
+        self.polls += 1
+        if completed is None or not total:
+            return
+        now = time.monotonic()
+        if self._last is not None:
+            last_time, last_completed = self._last
+            elapsed = now - last_time
+            if elapsed > 0 and completed >= last_completed:
+                sample = (completed - last_completed) / elapsed
+                self._rate = sample if self._rate is None else 0.5 * self._rate + 0.5 * sample
+        self._last = (now, completed)
+        remaining = max(0, total - completed)
+        self._eta = remaining / self._rate if self._rate else None
+
+    def next_interval(self) -> float:
+        """Delay before the next poll."""
+        interval = self._interval
+        self._interval = min(self.max_interval, self._interval * self.growth)
+        if self._eta is not None:
+            # Wake up around the predicted completion instead of overshooting it
+            interval = min(interval, max(self.min_interval, self._eta))
+        if self._deadline is not None:
+            # Wake up for one last poll at the deadline rather than past it
+            interval = min(interval, max(0.0, self._deadline - time.monotonic()))
+        return interval
+
+    def sleep(self) -> None:
+        time.sleep(self.next_interval())
+
+    async def sleep_async(self) -> None:
+        await asyncio.sleep(self.next_interval())
@@ -0,0 +1,377 @@
+"""
+Client-side rate limiting for the v2 transports.
+
+``RateLimiter`` caps in-flight requests at the team's ``max_concurrency``
+(refreshed periodically from ``/v2/concurrency-check``) and paces requests per
+endpoint class with token buckets, so many worker threads or asyncio tasks
+sharing one client queue locally instead of collecting 429s from the API.
+
+The same limiter can be shared by a sync ``HttpClient`` and an
+``AsyncHttpClient``: waiting is FIFO across both, with threads blocking on an
+event and tasks awaiting a future.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterable, Iterator, Mapping, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger("firecrawl")
+
+ENDPOINT_CLASSES = ("scrape", "crawl_start", "status", "search", "other")
+
+# Requests that never wait on the limiter (the limiter's own refresh call)
+EXEMPT_PATHS = frozenset({"/v2/concurrency-check"})
+
+_JOB_START_PATHS = ("/v2/crawl", "/v2/batch/scrape", "/v2/extract")
+
+
+def classify_endpoint(method: str, endpoint: str) -> str:
+    """Map a request to its endpoint class (see ``ENDPOINT_CLASSES``)."""
+    path = urlparse(endpoint).path or endpoint
+    if not path.startswith("/"):
+        path = "/" + path
+    path = path.rstrip("/")
+    method = method.upper()
+    if method == "GET":
+        return "status"
+    if method == "POST":
+        if path == "/v2/scrape":
+            return "scrape"
+        if path == "/v2/search":
+            return "search"
+        if path in _JOB_START_PATHS:
+            return "crawl_start"
+    return "other"
+
+
+class _Waiter:
+    __slots__ = ("event", "loop", "future", "granted")
+
+    def __init__(self, event=None, loop=None, future=None):
+        self.event = event
+        self.loop = loop
+        self.future = future
+        self.granted = False
+
+    def wake(self) -> None:
+        if self.event is not None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(_resolve, self.future)
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class FairSemaphore:
+    """
+    FIFO semaphore usable from threads and asyncio tasks at the same time.
+
+    Slots are handed directly to the oldest waiter on release, so a steady
+    stream of new arrivals cannot starve queued callers. ``limit=None`` means
+    unbounded. The limit can be changed at runtime.
+    """
+
+    def __init__(self, limit: Optional[int] = None):
+        self._lock = threading.Lock()
+        self._limit = limit
+        self._in_use = 0
+        self._waiters: Deque[_Waiter] = deque()
+
+    @property
+    def limit(self) -> Optional[int]:
+        return self._limit
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def _has_room(self) -> bool:
+        return self._limit is None or self._in_use < self._limit
+
+    def _grant_waiters(self) -> None:
+        # Caller holds the lock
+        while self._waiters and self._has_room():
+            waiter = self._waiters.popleft()
+            waiter.granted = True
+            self._in_use += 1
+            waiter.wake()
+
+    def set_limit(self, limit: Optional[int]) -> None:
+        with self._lock:
+            self._limit = limit
+            self._grant_waiters()
+
+    def acquire(self) -> None:
+        with self._lock:
+            if not self._waiters and self._has_room():
+                self._in_use += 1
+                return
+            waiter = _Waiter(event=threading.Event())
+            self._waiters.append(waiter)
+        waiter.event.wait()
+
+    async def acquire_async(self) -> None:
+        with self._lock:
+            if not self._waiters and self._has_room():
+                self._in_use += 1
+                return
+            loop = asyncio.get_running_loop()
+            waiter = _Waiter(loop=loop, future=loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.granted:
+                    self._in_use -= 1
+                    self._grant_waiters()
+                else:
+                    self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            self._in_use -= 1
+            self._grant_waiters()
+
+
+class TokenBucket:
+    """
+    Reservation-based token bucket.
+
+    ``reserve()`` always succeeds immediately and returns how long the caller
+    must wait before sending, so callers are served in reservation order and
+    no thread spins or polls while waiting.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            return min(self.burst, self._tokens + (now - self._updated) * self.rate)
+
+
+class RateLimiter:
+    """
+    Concurrency and rate limiter shared by a client's HTTP transports.
+
+    Args:
+        rates: Requests per second allowed for each endpoint class
+            (``scrape``, ``crawl_start``, ``status``, ``search``, ``other``);
+            classes not listed are not rate limited
+        burst: Bucket size per endpoint class (defaults to one second of rate)
+        max_concurrency: Local cap on in-flight requests; the effective cap is
+            the lower of this and the server-reported ``max_concurrency``
+        refresh_interval: Seconds between ``get_concurrency()`` refreshes
+            (None disables refreshing)
+        concurrency_classes: Endpoint classes that hold a concurrency slot
+            while in flight (status polls are cheap and excluded by default)
+    """
+
+    def __init__(
+        self,
+        rates: Optional[Mapping[str, float]] = None,
+        *,
+        burst: Optional[Mapping[str, float]] = None,
+        max_concurrency: Optional[int] = None,
+        refresh_interval: Optional[float] = 30.0,
+        concurrency_classes: Iterable[str] = ("scrape", "crawl_start", "search", "other"),
+    ):
+        rates = dict(rates or {})
+        burst = dict(burst or {})
+        for name in list(rates) + list(burst):
+            if name not in ENDPOINT_CLASSES:
+                raise ValueError(f"Unknown endpoint class: {name}")
+        self._buckets: Dict[str, TokenBucket] = {
+            name: TokenBucket(rate, burst.get(name)) for name, rate in rates.items()
+        }
+        self.max_concurrency = max_concurrency
+        self.refresh_interval = refresh_interval
+        self.concurrency_classes = frozenset(concurrency_classes)
+        self.server_concurrency: Optional[int] = None
+        self.server_max_concurrency: Optional[int] = None
+        self._semaphore = FairSemaphore(max_concurrency)
+        self._rate_waiting: Dict[str, int] = {name: 0 for name in ENDPOINT_CLASSES}
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._last_refresh: Optional[float] = None
+        self._sync_refresher: Optional[Callable[[], Any]] = None
+        self._async_refresher: Optional[Callable[[], Awaitable[Any]]] = None
+        # Held closed while the first refresh is in flight so early callers
+        # wait for the real limit instead of rushing through unbounded
+        self._ready = FairSemaphore(None)
+
+    def bind(
+        self,
+        sync_refresher: Optional[Callable[[], Any]] = None,
+        async_refresher: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> None:
+        """Attach callables returning a ``ConcurrencyCheck``; called by the clients."""
+        if sync_refresher is not None:
+            self._sync_refresher = sync_refresher
+        if async_refresher is not None:
+            self._async_refresher = async_refresher
+        with self._lock:
+            if self.refresh_interval is not None and self._last_refresh is None:
+                self._ready.set_limit(0)
+
+    @property
+    def limit(self) -> Optional[int]:
+        """Effective in-flight cap (None when unbounded)."""
+        return self._semaphore.limit
+
+    def update_limits(self, max_concurrency: Optional[int], concurrency: Optional[int] = None) -> None:
+        """Apply a server-reported concurrency limit."""
+        self.server_max_concurrency = max_concurrency
+        self.server_concurrency = concurrency
+        limits = [n for n in (self.max_concurrency, max_concurrency) if n is not None]
+        self._semaphore.set_limit(max(1, min(limits)) if limits else None)
+
+    def _claim_refresh(self) -> bool:
+        if self.refresh_interval is None:
+            return False
+        with self._lock:
+            if self._refreshing:
+                return False
+            now = time.monotonic()
+            if self._last_refresh is not None and now - self._last_refresh < self.refresh_interval:
+                return False
+            self._refreshing = True
+            return True
+
+    def _finish_refresh(self, check: Any) -> None:
+        if check is not None:
+            self.update_limits(check.max_concurrency, check.concurrency)
+        with self._lock:
+            self._refreshing = False
+            self._last_refresh = time.monotonic()
+        self._ready.set_limit(None)
+
+    def _refresh_sync(self) -> None:
+        if self._sync_refresher is None or not self._claim_refresh():
+            return
+        check = None
+        try:
+            check = self._sync_refresher()
+        except Exception as e:
+            logger.debug("Failed to refresh concurrency limits: %s", e)
+        finally:
+            self._finish_refresh(check)
+
+    async def _refresh_async(self) -> None:
+        if self._async_refresher is None or not self._claim_refresh():
+            return
+        check = None
+        try:
+            check = await self._async_refresher()
+        except Exception as e:
+            logger.debug("Failed to refresh concurrency limits: %s", e)
+        finally:
+            self._finish_refresh(check)
+
+    def _reserve(self, endpoint_class: str) -> float:
+        bucket = self._buckets.get(endpoint_class)
+        return bucket.reserve() if bucket is not None else 0.0
+
+    @contextmanager
+    def acquire(self, method: str, endpoint: str) -> Iterator[str]:
+        """Hold a rate token and, if applicable, a concurrency slot for one request."""
+        if (urlparse(endpoint).path or endpoint) in EXEMPT_PATHS:
+            yield "other"
+            return
+        self._refresh_sync()
+        if self._ready.limit is not None and self._sync_refresher is not None:
+            self._ready.acquire()
+            self._ready.release()
+        endpoint_class = classify_endpoint(method, endpoint)
+        delay = self._reserve(endpoint_class)
+        if delay > 0:
+            with self._lock:
+                self._rate_waiting[endpoint_class] += 1
+            try:
+                time.sleep(delay)
+            finally:
+                with self._lock:
+                    self._rate_waiting[endpoint_class] -= 1
+        if endpoint_class not in self.concurrency_classes:
+            yield endpoint_class
+            return
+        self._semaphore.acquire()
+        try:
+            yield endpoint_class
+        finally:
+            self._semaphore.release()
+
+    @asynccontextmanager
+    async def acquire_async(self, method: str, endpoint: str) -> AsyncIterator[str]:
+        """Async counterpart of ``acquire``."""
+        if (urlparse(endpoint).path or endpoint) in EXEMPT_PATHS:
+            yield "other"
+            return
+        await self._refresh_async()
+        if self._ready.limit is not None and self._async_refresher is not None:
+            await self._ready.acquire_async()
+            self._ready.release()
+        endpoint_class = classify_endpoint(method, endpoint)
+        delay = self._reserve(endpoint_class)
+        if delay > 0:
+            with self._lock:
+                self._rate_waiting[endpoint_class] += 1
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                with self._lock:
+                    self._rate_waiting[endpoint_class] -= 1
+        if endpoint_class not in self.concurrency_classes:
+            yield endpoint_class
+            return
+        await self._semaphore.acquire_async()
+        try:
+            yield endpoint_class
+        finally:
+            self._semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depths and current limits."""
+        with self._lock:
+            rate_waiting = dict(self._rate_waiting)
+        return {
+            "limit": self._semaphore.limit,
+            "in_flight": self._semaphore.in_use,
+            "waiting": self._semaphore.waiting,
+            "rate_waiting": rate_waiting,
+            "tokens": {name: bucket.tokens for name, bucket in self._buckets.items()},
+            "server_concurrency": self.server_concurrency,
+            "server_max_concurrency": self.server_max_concurrency,
+        }
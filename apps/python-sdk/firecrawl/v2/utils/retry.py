@@ -0,0 +1,250 @@
+"""
+Retry policy shared by the sync and async v2 HTTP transports.
+
+The policy decides *whether* a failed attempt is retried and *how long* to
+wait first; the transports only own the request loop and the sleeping. It
+supports retryable status sets, ``Retry-After`` headers, decorrelated jitter,
+per-call deadlines and a process-wide retry budget that stops retry storms
+from amplifying load while the API is degraded.
+"""
+
+import logging
+import random
+import threading
+import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, FrozenSet, Iterable, Mapping, Optional
+
+logger = logging.getLogger("firecrawl")
+
+DEFAULT_RETRY_STATUSES: FrozenSet[int] = frozenset({429, 502, 503, 504})
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a fraction of overall request volume.
+
+    Every new call deposits ``ratio`` tokens and each retry withdraws one, so
+    retries can never exceed roughly ``ratio`` of traffic plus a small
+    ``min_per_second`` allowance that keeps low-volume clients retrying.
+    Thread-safe; a single instance is shared process-wide by default.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 1.0, max_tokens: float = 50.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.exhausted_count = 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        if elapsed > 0:
+            self._tokens = min(self.max_tokens, self._tokens + elapsed * self.min_per_second)
+
+    def deposit(self) -> None:
+        """Record a new (non-retry) call."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        """Spend one token for a retry. Returns False when the budget is exhausted."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            self.exhausted_count += 1
+            return False
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+# Shared by every client in the process unless a policy is given its own budget
+DEFAULT_RETRY_BUDGET = RetryBudget()
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header (delta-seconds or HTTP-date) into seconds.
+
+    Returns None if the header is missing or malformed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when is None:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    current = now if now is not None else time.time()
+    return max(0.0, when.timestamp() - current)
+
+
+class RetryPolicy:
+    """
+    Configuration for retrying failed HTTP attempts.
+
+    Args:
+        max_retries: Retries allowed after the first attempt
+        backoff_factor: Base delay in seconds
+        max_backoff: Upper bound for any single computed delay
+        retry_statuses: HTTP status codes that are retried
+        retry_on_connection_errors: Retry connection resets/refusals raised by the transport
+        respect_retry_after: Honor ``Retry-After`` on retryable responses
+        max_retry_after: Longest ``Retry-After`` honored; longer values give up instead
+        jitter: Use decorrelated jitter; when False use plain exponential backoff
+        deadline: Default overall time budget per call in seconds (None for none)
+        budget: Retry budget to draw from (None disables budgeting)
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        *,
+        max_backoff: float = 30.0,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        retry_on_connection_errors: bool = True,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 60.0,
+        jitter: bool = True,
+        deadline: Optional[float] = None,
+        budget: Optional[RetryBudget] = DEFAULT_RETRY_BUDGET,
+    ):
+        if max_retries < 0:
+            raise ValueError("max_retries must be non-negative")
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_on_connection_errors = retry_on_connection_errors
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.jitter = jitter
+        self.deadline = deadline
+        self.budget = budget
+
+    def copy(self, **changes: Any) -> "RetryPolicy":
+        """Return a copy of this policy with the given attributes replaced."""
+        clone = RetryPolicy.__new__(RetryPolicy)
+        clone.__dict__.update(self.__dict__)
+        for key, value in changes.items():
+            if not hasattr(clone, key):
+                raise TypeError(f"Unknown RetryPolicy attribute: {key}")
+            setattr(clone, key, value)
+        return clone
+
+    def begin(self, deadline: Optional[float] = None) -> "RetryState":
+        """Start tracking a new call. ``deadline`` overrides the policy default."""
+        if self.budget is not None:
+            self.budget.deposit()
+        effective = deadline if deadline is not None else self.deadline
+        return RetryState(self, None if effective is None else time.monotonic() + effective)
+
+    def backoff(self, attempt: int, previous: float) -> float:
+        """Delay before retry number ``attempt`` (0-based) given the previous delay."""
+        if self.backoff_factor <= 0:
+            return 0.0
+        if not self.jitter:
+            return min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        # Decorrelated jitter: spreads clients out instead of retrying in lockstep
+        upper = max(self.backoff_factor, previous * 3)
+        return min(self.max_backoff, random.uniform(self.backoff_factor, upper))
+
+
+class RetryState:
+    """Per-call retry bookkeeping created by ``RetryPolicy.begin``."""
+
+    def __init__(self, policy: RetryPolicy, deadline_at: Optional[float]):
+        self.policy = policy
+        self.deadline_at = deadline_at
+        self.retries = 0
+        self._previous_delay = 0.0
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the call deadline (None if unbounded)."""
+        if self.deadline_at is None:
+            return None
+        return max(0.0, self.deadline_at - time.monotonic())
+
+    def attempt_timeout(self, timeout: Optional[float]) -> Optional[float]:
+        """Clamp a per-attempt timeout so it never outlives the call deadline."""
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        remaining = max(remaining, 0.001)
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def should_retry_status(self, status_code: int) -> bool:
+        return status_code in self.policy.retry_statuses
+
+    def next_delay(
+        self,
+        *,
+        status_code: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        error: Optional[BaseException] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt.
+
+        Pass ``status_code``/``headers`` for an HTTP response or ``error`` for a
+        retryable transport exception. Returns the delay in seconds before the
+        next attempt, or None if the caller should stop and surface the result.
+        """
+        policy = self.policy
+        if error is not None:
+            if not policy.retry_on_connection_errors:
+                return None
+        elif status_code is None or status_code not in policy.retry_statuses:
+            return None
+
+        if self.retries >= policy.max_retries:
+            return None
+
+        delay: Optional[float] = None
+        if policy.respect_retry_after and headers is not None:
+            retry_after = parse_retry_after(headers.get("Retry-After") or headers.get("retry-after"))
+            if retry_after is not None:
+                if retry_after > policy.max_retry_after:
+                    return None
+                delay = retry_after
+        if delay is None:
+            delay = policy.backoff(self.retries, self._previous_delay)
+
+        remaining = self.remaining()
+        if remaining is not None and delay >= remaining:
+            return None
+
+        if policy.budget is not None and not policy.budget.try_withdraw():
+            logger.debug("Retry budget exhausted; not retrying")
+            return None
+
+        self.retries += 1
+        self._previous_delay = delay
+        logger.debug(
+            "Retrying request (retry %d/%d) in %.2fs after %s",
+            self.retries,
+            policy.max_retries,
+            delay,
+            f"status {status_code}" if error is None else type(error).__name__,
+        )
+        return delay
@@ -0,0 +1,247 @@
+"""
+Local cache of single-URL scrape results.
+
+Services that scrape the same URLs many times a day pay API latency and
+credits on every call, even when the server answers from its own cache. A
+``ScrapeCache`` passed to ``FirecrawlClient(scrape_cache=...)`` keeps scrape
+responses in an in-memory LRU tier, backed by an optional SQLite file that
+survives restarts and can be shared by processes on one machine.
+
+Entries are keyed on a hash of the prepared request body (the URL plus the
+compiled scrape options), the API base URL and a hash of the API key, so a
+different format list or header set never returns another request's
+document, and clients of different deployments or teams sharing one cache
+file never see each other's results. An entry lives for the request's
+``maxAge`` (the SDK sends 14400000 ms, four hours, unless told otherwise);
+requests sent with ``max_age=0`` bypass the cache. With
+``stale_while_revalidate`` an expired entry is still returned for that many
+seconds while a single background scrape refreshes it.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+from ..types import ScrapeCacheStats
+from . import json_codec
+
+# maxAge the SDK sends with scrape options by default, in milliseconds
+DEFAULT_MAX_AGE_MS = 14400000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    body BLOB NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at);
+"""
+
+
+def scrape_cache_key(
+    payload: Dict[str, Any], *, api_url: Optional[str] = None, api_key: Optional[str] = None
+) -> str:
+    """Hash of a prepared scrape request body (URL and camelCase options) scoped to an API and key."""
+    scope = {
+        "api_url": (api_url or "").rstrip("/"),
+        "api_key": hashlib.sha256((api_key or "").encode("utf-8")).hexdigest(),
+        "request": _sorted(payload),
+    }
+    encoded = json_codec.dumps(scope, default=str)
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _sorted(value: Any) -> Any:
+    # Key order of the options payload depends on how they were built; formats and actions keep theirs
+    if isinstance(value, dict):
+        return {key: _sorted(value[key]) for key in sorted(value)}
+    if isinstance(value, (list, tuple)):
+        return [_sorted(item) for item in value]
+    return value
+
+
+class ScrapeCache:
+    """
+    Two-tier (memory, then SQLite) cache of scrape responses.
+
+    Thread-safe; one cache can back several clients. Documents are held as
+    encoded JSON, so the memory tier is bounded by bytes as well as entries.
+
+    Args:
+        path: SQLite file for the disk tier (None to cache in memory only)
+        max_entries: Entries kept in the memory tier
+        max_memory_bytes: Encoded bytes kept in the memory tier
+        ttl: Seconds an entry stays fresh (None to use each request's maxAge)
+        stale_while_revalidate: Seconds past expiry an entry is still served
+            while it is refreshed in the background (0 to disable)
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        *,
+        max_entries: int = 1024,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        ttl: Optional[float] = None,
+        stale_while_revalidate: float = 0.0,
+    ):
+        if max_entries < 1 or max_memory_bytes < 1:
+            raise ValueError("max_entries and max_memory_bytes must be positive")
+        if stale_while_revalidate < 0:
+            raise ValueError("stale_while_revalidate must not be negative")
+        self.path = path
+        self.max_entries = max_entries
+        self.max_memory_bytes = max_memory_bytes
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self._lock = threading.Lock()
+        # key -> (body, expires_at), least recently used first
+        self._memory: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._revalidating: Set[str] = set()
+        self._stats = ScrapeCacheStats()
+        self._conn: Optional[sqlite3.Connection] = None
+        if path is not None:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            # Other processes may read while we write; a lost entry is only a cache miss
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=OFF")
+            self._conn.executescript(_SCHEMA)
+
+    def ttl_for(self, payload: Dict[str, Any]) -> float:
+        """Seconds a response to ``payload`` stays fresh (0 when it must not be cached)."""
+        if self.ttl is not None:
+            return self.ttl
+        max_age = payload.get("maxAge", DEFAULT_MAX_AGE_MS)
+        return max(max_age, 0) / 1000.0
+
+    def get(self, key: str) -> Optional[Tuple[bytes, bool]]:
+        """
+        Look up an entry.
+
+        Returns ``(body, fresh)``, where ``fresh`` is False for an expired entry
+        still inside the stale-while-revalidate window, or None on a miss.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                tier = "memory"
+            elif self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT body, expires_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                tier = "disk"
+                if row is not None and now < row[1] + self.stale_while_revalidate:
+                    # Only live rows are promoted; dead ones would push out live entries
+                    entry = (bytes(row[0]), row[1])
+                    self._remember(key, entry)
+            if entry is None or now >= entry[1] + self.stale_while_revalidate:
+                self._stats.misses += 1
+                return None
+            body, expires_at = entry
+            fresh = now < expires_at
+            if not fresh:
+                self._stats.stale_hits += 1
+            elif tier == "memory":
+                self._stats.memory_hits += 1
+            else:
+                self._stats.disk_hits += 1
+            self._stats.bytes_served += len(body)
+            return body, fresh
+
+    def put(self, key: str, url: str, body: bytes, ttl: float) -> None:
+        """Store a response body for ``ttl`` seconds in both tiers."""
+        if ttl <= 0:
+            return
+        now = time.time()
+        expires_at = now + ttl
+        with self._lock:
+            self._remember(key, (body, expires_at))
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, url, body, stored_at, expires_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (key, url, body, now, expires_at),
+                )
+            self._stats.bytes_stored += len(body)
+
+    def begin_revalidation(self, key: str) -> bool:
+        """Claim the refresh of a stale entry; False if one is already running."""
+        with self._lock:
+            if key in self._revalidating:
+                return False
+            self._revalidating.add(key)
+            self._stats.revalidations += 1
+            return True
+
+    def end_revalidation(self, key: str) -> None:
+        with self._lock:
+            self._revalidating.discard(key)
+
+    def invalidate(self, key: str) -> None:
+        """Drop one entry from both tiers."""
+        with self._lock:
+            entry = self._memory.pop(key, None)
+            if entry is not None:
+                self._stats.memory_bytes -= len(entry[0])
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers (statistics are kept)."""
+        with self._lock:
+            self._memory.clear()
+            self._stats.memory_bytes = 0
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM responses")
+
+    def prune(self) -> int:
+        """Delete disk entries past their stale window; returns how many were removed."""
+        if self._conn is None:
+            return 0
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE expires_at <= ?", (time.time() - self.stale_while_revalidate,)
+            )
+            return cursor.rowcount
+
+    def stats(self) -> ScrapeCacheStats:
+        """Snapshot of the hit, miss and byte counters."""
+        with self._lock:
+            self._stats.memory_entries = len(self._memory)
+            return self._stats.model_copy()
+
+    def _remember(self, key: str, entry: Tuple[bytes, float]) -> None:
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._stats.memory_bytes -= len(previous[0])
+        if len(entry[0]) > self.max_memory_bytes:
+            return
+        self._memory[key] = entry
+        self._stats.memory_bytes += len(entry[0])
+        while len(self._memory) > self.max_entries or self._stats.memory_bytes > self.max_memory_bytes:
+            _, (evicted, _) = self._memory.popitem(last=False)
+            self._stats.memory_bytes -= len(evicted)
+            self._stats.evictions += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> "ScrapeCache":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,199 @@
+"""
+Client-side URL canonicalization and deduplication.
+
+URL lists (and links returned by ``map``) often repeat the same page with
+tracking parameters, fragments, a trailing slash or a differently cased
+host. Every repeat costs credits once submitted, so batch scrape and extract
+can drop them first (``dedupe=True``). ``UrlCanonicalizer`` reduces a URL to
+a canonical form according to ``UrlCanonicalization`` rules, and
+``dedupe_urls`` keeps the first URL of each canonical form, remembering
+what it has seen in a set or, for very large lists, a fixed-size Bloom
+filter.
+"""
+
+import fnmatch
+import hashlib
+import logging
+import math
+import re
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from ..types import DedupMethod, UrlCanonicalization, UrlDedupResult
+
+logger = logging.getLogger("firecrawl")
+
+# "auto" switches to a Bloom filter above this many URLs
+BLOOM_THRESHOLD = 1_000_000
+
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+class UrlCanonicalizer:
+    """
+    Callable mapping URLs to their canonical form.
+
+    Args:
+        rules: Canonicalization rules (defaults to ``UrlCanonicalization()``)
+    """
+
+    def __init__(self, rules: Optional[UrlCanonicalization] = None):
+        self.rules = rules = rules if rules is not None else UrlCanonicalization()
+        patterns = [fnmatch.translate(p) for p in rules.strip_query_params]
+        self._strip = re.compile("|".join(patterns), re.IGNORECASE).match if patterns else None
+        # Read once; attribute lookups on the rules model add up over millions of URLs
+        self._lowercase_host = rules.lowercase_host
+        self._remove_default_port = rules.remove_default_port
+        self._drop_fragment = rules.drop_fragment
+        self._strip_trailing_slash = rules.strip_trailing_slash
+        self._sort_query = rules.sort_query
+        self._ignore_query = rules.ignore_query_parameters
+
+    def __call__(self, url: str) -> str:
+        url = url.strip()
+        # Split by hand: urllib.parse.urlsplit is several times slower
+        scheme, sep, rest = url.partition("://")
+        if not sep or not scheme.isalpha():
+            return url
+        scheme = scheme.lower()
+        rest, _, fragment = rest.partition("#")
+        rest, _, query = rest.partition("?")
+        slash = rest.find("/")
+        if slash < 0:
+            netloc, path = rest, "/"
+        else:
+            netloc, path = rest[:slash], rest[slash:]
+
+        if self._lowercase_host or self._remove_default_port:
+            userinfo, at, host = netloc.rpartition("@")
+            if self._lowercase_host:
+                host = host.lower()
+            if self._remove_default_port:
+                port = _DEFAULT_PORTS.get(scheme)
+                if port is not None and host.endswith(":" + port):
+                    host = host[: -len(port) - 1]
+            netloc = userinfo + at + host
+
+        if self._strip_trailing_slash and len(path) > 1 and path.endswith("/"):
+            path = path.rstrip("/") or "/"
+
+        if self._ignore_query:
+            query = ""
+        elif query:
+            params = [p for p in query.split("&") if p]
+            if self._strip is not None:
+                strip = self._strip
+                params = [p for p in params if not strip(p.partition("=")[0])]
+            if self._sort_query:
+                params.sort()
+            query = "&".join(params)
+
+        canonical = f"{scheme}://{netloc}{path}"
+        if query:
+            canonical += "?" + query
+        if fragment and not self._drop_fragment:
+            canonical += "#" + fragment
+        return canonical
+
+
+def canonicalize_url(url: str, rules: Optional[UrlCanonicalization] = None) -> str:
+    """Return the canonical form of ``url``."""
+    return UrlCanonicalizer(rules)(url)
+
+
+class BloomFilter:
+    """
+    Fixed-size probabilistic set of strings.
+
+    Args:
+        capacity: Number of items the filter is sized for
+        error_rate: False-positive rate at ``capacity`` items
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        capacity = max(1, capacity)
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        size = self.size
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % size
+
+    def add(self, item: str) -> bool:
+        """Add ``item``; True if it was (probably) already present."""
+        bits = self._bits
+        present = True
+        for bit in self._positions(item):
+            mask = 1 << (bit & 7)
+            if not bits[bit >> 3] & mask:
+                present = False
+                bits[bit >> 3] |= mask
+        return present
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[bit >> 3] & (1 << (bit & 7)) for bit in self._positions(item))
+
+
+def dedupe_urls(
+    urls: Iterable[str],
+    *,
+    rules: Optional[UrlCanonicalization] = None,
+    method: DedupMethod = "auto",
+    error_rate: float = 0.001,
+) -> UrlDedupResult:
+    """
+    Drop URLs whose canonical form was already seen.
+
+    Args:
+        urls: URLs to deduplicate
+        rules: Canonicalization rules (defaults to ``UrlCanonicalization()``)
+        method: "exact", "bloom" or "auto" (see ``DedupMethod``)
+        error_rate: Share of unique URLs the Bloom filter may wrongly drop
+
+    Returns:
+        UrlDedupResult with the first occurrence of each URL and the number removed
+    """
+    urls = list(urls)
+    canonical = UrlCanonicalizer(rules)
+    if method == "auto":
+        method = "bloom" if len(urls) > BLOOM_THRESHOLD else "exact"
+
+    kept: List[str] = []
+    if method == "bloom":
+        seen = BloomFilter(len(urls), error_rate)
+        for url in urls:
+            if not isinstance(url, str) or not seen.add(canonical(url)):
+                kept.append(url)
+    elif method == "exact":
+        seen_set = set()
+        for url in urls:
+            if not isinstance(url, str):
+                kept.append(url)
+                continue
+            key = canonical(url)
+            if key not in seen_set:
+                seen_set.add(key)
+                kept.append(url)
+    else:
+        raise ValueError(f"Unknown dedup method: {method!r}")
+    # Skip re-validating what can be millions of strings
+    return UrlDedupResult.model_construct(urls=kept, removed=len(urls) - len(kept))
+
+
+def apply_dedupe(
+    urls: List[str], dedupe: Union[bool, UrlCanonicalization, None]
+) -> Tuple[List[str], Optional[int]]:
+    """Deduplicate ``urls`` for submission when ``dedupe`` is set; returns them with the number removed."""
+    if not dedupe or not urls:
+        return urls, None
+    result = dedupe_urls(urls, rules=dedupe if isinstance(dedupe, UrlCanonicalization) else None)
+    if result.removed:
+        logger.debug("Removed %d duplicate URLs before submission", result.removed)
+    return result.urls, result.removed
@@ -2,8 +2,13 @@
 Shared validation functions for Firecrawl v2 API.
 """
 
-from typing import Optional, Dict, Any, List
+import copy
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Union
+from pydantic import BaseModel
 from ..types import ScrapeOptions, ScrapeFormats
+from . import json_codec
 
 
 def _convert_format_string(format_str: str) -> str:
@@ -114,7 +119,9 @@ def validate_scrape_options(options: Optional[ScrapeOptions]) -> Optional[Scrape
     return options
 
 
-def prepare_scrape_options(options: Optional[ScrapeOptions]) -> Optional[Dict[str, Any]]:
+def prepare_scrape_options(
+    options: Optional[Union[ScrapeOptions, "CompiledScrapeOptions"]]
+) -> Optional[Dict[str, Any]]:
     """
     Prepare ScrapeOptions for API submission with manual snake_case to camelCase conversion.
     
@@ -126,6 +133,8 @@ def prepare_scrape_options(options: Optional[ScrapeOptions]) -> Optional[Dict[st
     """
     if options is None:
         return None
+    if isinstance(options, CompiledScrapeOptions):
+        return options.payload
     
     # Validate options first
     validated_options = validate_scrape_options(options)
@@ -338,4 +347,110 @@ def prepare_scrape_options(options: Optional[ScrapeOptions]) -> Optional[Dict[st
                 # For fields that don't need conversion, use as-is
                 scrape_data[key] = value
     
-    return scrape_data  
\ No newline at end of file
+    return scrape_data
+
+
+class CompiledScrapeOptions:
+    """
+    ScrapeOptions prepared once for reuse across many requests.
+
+    Holds the camelCase payload built by ``prepare_scrape_options`` (defaults,
+    converted formats, JSON schemas of pydantic schema classes) together with
+    its encoded JSON, so each scrape only splices in the URL. Build one with
+    ``compile_scrape_options``; it is accepted wherever ``scrape`` and
+    ``batch_scrape`` take ScrapeOptions.
+    """
+
+    __slots__ = ("_payload", "_encoded")
+
+    def __init__(self, payload: Dict[str, Any]):
+        self._payload = payload
+        self._encoded: Optional[bytes] = None
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        """A copy of the prepared options payload."""
+        return copy.deepcopy(self._payload)
+
+    @property
+    def encoded(self) -> bytes:
+        """The payload encoded as a JSON object."""
+        if self._encoded is None:
+            self._encoded = json_codec.dumps(self._payload)
+        return self._encoded
+
+    def encode_request(self, url: str) -> bytes:
+        """Encode a scrape request body for ``url``."""
+        return json_codec.extend_object(self.encoded, {"url": url})
+
+    def __repr__(self) -> str:
+        return f"CompiledScrapeOptions({self._payload!r})"
+
+
+_COMPILED_CACHE_SIZE = 256
+_compiled_cache: "OrderedDict[Any, CompiledScrapeOptions]" = OrderedDict()
+_compiled_lock = threading.Lock()
+
+
+def _fingerprint(value: Any) -> Any:
+    """
+    Build a hashable key describing ``value``'s contents.
+
+    Raises:
+        TypeError: If ``value`` contains objects that cannot be fingerprinted
+    """
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)):
+        # Tag numbers with their type so True, 1 and 1.0 stay distinct
+        return (value.__class__, value)
+    if isinstance(value, BaseModel):
+        return (value.__class__, tuple((k, _fingerprint(v)) for k, v in value.__dict__.items()))
+    if isinstance(value, dict):
+        return (dict, tuple((k, _fingerprint(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (value.__class__, tuple(_fingerprint(v) for v in value))
+    if isinstance(value, type):
+        # Schema classes; their JSON schema does not change
+        return value
+    raise TypeError(f"cannot fingerprint {type(value).__name__}")
+
+
+def compile_scrape_options(options: Union[ScrapeOptions, CompiledScrapeOptions]) -> CompiledScrapeOptions:
+    """
+    Validate and prepare ScrapeOptions once.
+
+    Results are cached by the options' contents, so repeated calls with equal
+    options (including separately built but identical ScrapeOptions) return
+    the same compiled object.
+
+    Args:
+        options: Scraping options to compile
+
+    Returns:
+        CompiledScrapeOptions
+
+    Raises:
+        ValueError: If options are invalid
+    """
+    if isinstance(options, CompiledScrapeOptions):
+        return options
+    try:
+        key = _fingerprint(options)
+    except TypeError:
+        key = None
+    if key is not None:
+        with _compiled_lock:
+            compiled = _compiled_cache.get(key)
+            if compiled is not None:
+                _compiled_cache.move_to_end(key)
+                return compiled
+
+    # Copy so later changes to the caller's dicts cannot leak into the cache
+    compiled = CompiledScrapeOptions(copy.deepcopy(prepare_scrape_options(options) or {}))
+    if key is not None:
+        with _compiled_lock:
+            _compiled_cache[key] = compiled
+            if len(_compiled_cache) > _COMPILED_CACHE_SIZE:
+                _compiled_cache.popitem(last=False)
+    return compiled
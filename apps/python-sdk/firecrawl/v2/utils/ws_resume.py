@@ -0,0 +1,144 @@
+"""
+Reconnect-and-resume support for the WebSocket watchers.
+
+When a watcher's socket drops it reconnects with jittered backoff
+(``DEFAULT_RECONNECT_POLICY``) instead of falling back to HTTP polling. On
+every connection the server first sends a ``catchup`` message holding all
+documents so far; ``DocumentTracker`` skips the ones already received so
+listeners see each document once. The tracker also converts each document
+to a ``Document`` once, on arrival, and hands the same objects to every
+snapshot according to the watcher's ``SnapshotMode``.
+
+While the socket is quiet, or once reconnecting has given up, watchers poll
+the job's status counters over HTTP and fetch only the documents past the
+ones already received (``fetch_new_documents``), so each document still
+reaches listeners and ``documents()`` exactly once.
+"""
+
+from typing import Any, Dict, List, Optional, Set, Tuple, get_args
+
+from ..types import Document, SnapshotMode
+from .error_handler import handle_response_error
+from .http_client import HttpClient
+from .http_client_async import AsyncHttpClient
+from .retry import RetryPolicy
+
+# Reconnect attempts after a drop before falling back to HTTP polling
+DEFAULT_RECONNECT_POLICY = RetryPolicy(max_retries=5, backoff_factor=0.5, max_backoff=10.0, budget=None)
+
+
+def _document_key(doc: Dict[str, Any]) -> Optional[str]:
+    metadata = doc.get("metadata")
+    if isinstance(metadata, dict):
+        for field in ("scrapeId", "sourceURL", "url"):
+            value = metadata.get(field)
+            if isinstance(value, str) and value:
+                return f"{field}:{value}"
+    value = doc.get("url")
+    if isinstance(value, str) and value:
+        return f"url:{value}"
+    return None
+
+
+class DocumentTracker:
+    """
+    Remembers which documents a watcher has received.
+
+    Documents are identified by scrape ID or URL; documents without either are
+    matched by their position in the ``catchup`` list.
+
+    Args:
+        snapshot_mode: Documents included in each snapshot: all received so
+            far ("full"), those received since the previous snapshot
+            ("delta"), or none ("counters")
+        retain: Keep converted documents for snapshots; when False only the
+            keys used to skip repeats are kept and snapshots hold no documents
+    """
+
+    def __init__(self, snapshot_mode: SnapshotMode = "full", *, retain: bool = True) -> None:
+        if snapshot_mode not in get_args(SnapshotMode):
+            raise ValueError(f"Unknown snapshot_mode: {snapshot_mode!r}")
+        self.snapshot_mode = snapshot_mode if retain else "counters"
+        self.retain = retain
+        self.count = 0
+        self.documents: List[Document] = []
+        self._seen: Set[str] = set()
+        self._snapshot_offset = 0
+
+    def accept(self, doc: Dict[str, Any]) -> Optional[Document]:
+        """Record a streamed document and return it converted; None if it was already received."""
+        key = _document_key(doc)
+        if key is not None:
+            if key in self._seen:
+                return None
+            self._seen.add(key)
+        self.count += 1
+        document = Document.from_api(doc)
+        if self.retain:
+            self.documents.append(document)
+        return document
+
+    def catchup(self, docs: List[Any]) -> List[Tuple[Dict[str, Any], Document]]:
+        """Return the documents of a ``catchup`` message not received yet, with their conversions."""
+        received = self.count
+        new: List[Tuple[Dict[str, Any], Document]] = []
+        for index, doc in enumerate(docs):
+            if not isinstance(doc, dict):
+                continue
+            key = _document_key(doc)
+            if key is None and index < received:
+                continue
+            document = self.accept(doc)
+            if document is not None:
+                new.append((doc, document))
+        return new
+
+    def snapshot_documents(self) -> List[Document]:
+        """Documents for the next snapshot, per ``snapshot_mode``."""
+        if self.snapshot_mode == "counters":
+            return []
+        if self.snapshot_mode == "delta":
+            docs = self.documents[self._snapshot_offset:]
+            self._snapshot_offset = len(self.documents)
+            return docs
+        return list(self.documents)
+
+
+def job_status_path(kind: str, job_id: str) -> str:
+    return f"/v2/crawl/{job_id}" if kind == "crawl" else f"/v2/batch/scrape/{job_id}"
+
+
+def _page_documents(body: Dict[str, Any]) -> List[Dict[str, Any]]:
+    if not body.get("success"):
+        raise Exception(body.get("error", "Unknown error occurred"))
+    return [doc for doc in body.get("data") or [] if isinstance(doc, dict)]
+
+
+def fetch_new_documents(http_client: HttpClient, kind: str, job_id: str, skip: int) -> List[Dict[str, Any]]:
+    """Raw documents of a job past the first ``skip``, following ``next`` pages."""
+    docs: List[Dict[str, Any]] = []
+    url: Optional[str] = f"{job_status_path(kind, job_id)}?skip={skip}"
+    while url:
+        response = http_client.get(url)
+        if not response.ok:
+            handle_response_error(response, "get job status")
+        body = response.json()
+        docs.extend(_page_documents(body))
+        url = body.get("next")
+    return docs
+
+
+async def fetch_new_documents_async(
+    http_client: AsyncHttpClient, kind: str, job_id: str, skip: int
+) -> List[Dict[str, Any]]:
+    """Async counterpart of ``fetch_new_documents``."""
+    docs: List[Dict[str, Any]] = []
+    url: Optional[str] = f"{job_status_path(kind, job_id)}?skip={skip}"
+    while url:
+        response = await http_client.get(url)
+        if response.status_code >= 400:
+            handle_response_error(response, "get job status")
+        body = response.json()
+        docs.extend(_page_documents(body))
+        url = body.get("next")
+    return docs
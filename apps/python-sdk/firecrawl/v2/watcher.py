@@ -5,17 +5,33 @@ Usage:
     watcher = client.watcher(job_id, kind="crawl")
     watcher.add_listener(lambda status: print(status.status))
     watcher.start()
+
+Pass a ``WatcherHub`` to run many watchers on one shared event loop instead of
+a thread per watcher. To process documents on your own thread at your own
+pace, iterate ``watcher.documents()``; a bounded queue sits between the
+WebSocket reader and the loop, with ``overflow`` deciding what happens when
+it is full.
 """
 
 import asyncio
-import json
+import concurrent.futures
 import threading
-from typing import Callable, List, Optional, Literal, Union, Dict, Any
+import time
+from typing import Callable, Iterator, List, Optional, Literal, Tuple, Union, Dict, Any, TYPE_CHECKING
 
 import websockets
 
-from .types import CrawlJob, BatchScrapeJob, Document
-from .utils.normalize import normalize_document_input
+from .types import CrawlJob, BatchScrapeJob, Document, OverflowPolicy, SnapshotMode
+from .utils import json_codec
+from .utils.document_queue import DocumentQueue
+from .utils.http_client import HttpClient
+from .utils.retry import RetryPolicy
+from .utils.ws_resume import DEFAULT_RECONNECT_POLICY, DocumentTracker, fetch_new_documents
+from .methods import batch as batch_methods
+from .methods import crawl as crawl_methods
+
+if TYPE_CHECKING:
+    from .watcher_hub import WatcherHub
 
 
 JobKind = Literal["crawl", "batch"]
@@ -30,6 +46,12 @@ class Watcher:
         kind: JobKind = "crawl",
         poll_interval: int = 2,
         timeout: Optional[int] = None,
+        hub: Optional["WatcherHub"] = None,
+        reconnect_policy: Optional[RetryPolicy] = None,
+        snapshot_mode: SnapshotMode = "full",
+        retain_data: bool = True,
+        queue_size: int = 1000,
+        overflow: OverflowPolicy = "block",
     ) -> None:
         self._client = client
         self._job_id = job_id
@@ -39,10 +61,21 @@ class Watcher:
         self._listeners: List[Callable[[JobType], None]] = []
         self._thread: Optional[threading.Thread] = None
         self._stop = threading.Event()
+        self._hub = hub
+        self._reconnect_policy = reconnect_policy or DEFAULT_RECONNECT_POLICY
+        self._tracker = DocumentTracker(snapshot_mode, retain=retain_data)
+        self._retain_data = retain_data
+        # Filled only once someone iterates documents()
+        self._queue = DocumentQueue(queue_size, overflow)
+        self._consuming = False
+        self._future: Optional["concurrent.futures.Future[None]"] = None
 
         http_client = getattr(client, "http_client", None)
         self._api_url: Optional[str] = getattr(http_client, "api_url", None)
         self._api_key: Optional[str] = getattr(http_client, "api_key", None)
+        # HTTP polls fetch only the status counters through the SDK client;
+        # other clients are polled through their get_*_status methods
+        self._http_client = http_client if isinstance(http_client, HttpClient) else None
 
         # v1-parity state and event handlers
         self.status: str = "scraping"
@@ -59,6 +92,13 @@ class Watcher:
         self._listeners.append(callback)
 
     def _emit(self, status: JobType) -> None:
+        if self._hub is not None:
+            # Keep the shared loop free; callbacks run on the hub's workers
+            self._hub.dispatch(self, self._emit_now, status)
+        else:
+            self._emit_now(status)
+
+    def _emit_now(self, status: JobType) -> None:
         for cb in list(self._listeners):
             try:
                 cb(status)
@@ -71,6 +111,12 @@ class Watcher:
             self._event_handlers[event_type].append(handler)
 
     def dispatch_event(self, event_type: str, detail: Dict[str, Any]) -> None:
+        if self._hub is not None:
+            self._hub.dispatch(self, self._dispatch_event_now, event_type, detail)
+        else:
+            self._dispatch_event_now(event_type, detail)
+
+    def _dispatch_event_now(self, event_type: str, detail: Dict[str, Any]) -> None:
         if event_type in self._event_handlers:
             for handler in self._event_handlers[event_type]:
                 try:
@@ -92,194 +138,262 @@ class Watcher:
         if self._api_key:
             headers_list.append(("Authorization", f"Bearer {self._api_key}"))
 
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + self._timeout if self._timeout else None
+        policy = self._reconnect_policy
+        attempt = 0
+        delay = 0.0
+        # Close this run's queue even if a restart has replaced self._queue meanwhile
+        queue = self._queue
         try:
-            async with websockets.connect(uri, max_size=None, additional_headers=headers_list) as websocket:
-                deadline = asyncio.get_event_loop().time() + self._timeout if self._timeout else None
-                while not self._stop.is_set():
-                    # Use short recv timeouts to allow HTTP polling fallback
-                    if deadline is not None:
-                        remaining = max(0.0, deadline - asyncio.get_event_loop().time())
-                        timeout = min(self._poll_interval or remaining, remaining)
-                    else:
-                        timeout = self._poll_interval or 5
-                    try:
-                        msg = await asyncio.wait_for(websocket.recv(), timeout=timeout)
-                    except asyncio.TimeoutError:
-                        # Quiet period: poll HTTP once to progress statuses
-                        if await self._poll_status_once():
-                            break
-                        else:
-                            continue
-                    except asyncio.CancelledError:
-                        break
-                    except Exception:
-                        # Connection error: switch to HTTP polling until terminal or timeout
-                        while not self._stop.is_set():
-                            if await self._poll_status_once():
-                                return
-                            if deadline is not None and asyncio.get_event_loop().time() >= deadline:
-                                return
-                            await asyncio.sleep(self._poll_interval or 2)
-                        return
-
-                    try:
-                        body = json.loads(msg)
-                    except Exception:
-                        continue
-
-                    # v1-style typed event handling
-                    msg_type = body.get("type")
-                    if msg_type == "error":
-                        self.status = "failed"
-                        self.dispatch_event("error", {
-                            "status": self.status,
-                            "data": self.data,
-                            "error": body.get("error"),
-                            "id": self._job_id,
-                        })
-                        self._sent_error = True
-                        # Emit a final failed snapshot for listeners
-                        if self._kind == "crawl":
-                            job = CrawlJob(status="failed", completed=0, total=0, credits_used=0, expires_at=None, next=None, data=[])
-                        else:
-                            job = BatchScrapeJob(status="failed", completed=0, total=0, credits_used=0, expires_at=None, next=None, data=[])
-                        self._emit(job)
-                        break
-                    elif msg_type == "catchup":
-                        d = body.get("data", {})
-                        self.status = d.get("status", self.status)
-                        docs_in = d.get("data", [])
-                        self.data.extend(docs_in)
-                        for doc in docs_in:
-                            self.dispatch_event("document", {"data": doc, "id": self._job_id})
-                    elif msg_type == "document":
-                        doc = body.get("data")
-                        if isinstance(doc, dict):
-                            self.data.append(doc)
-                            self.dispatch_event("document", {"data": doc, "id": self._job_id})
-                    elif msg_type == "done":
-                        self.status = "completed"
-                        # Gather any documents in the done payload
-                        raw_payload = body.get("data", {}) or {}
-                        docs_in = raw_payload.get("data", []) or []
-                        if isinstance(docs_in, list) and docs_in:
-                            for doc in docs_in:
-                                if isinstance(doc, dict):
-                                    self.data.append(doc)
-                        # Dispatch done event first
-                        self.dispatch_event("done", {"status": self.status, "data": self.data, "id": self._job_id})
-                        self._sent_done = True
-                        # Emit a final completed snapshot for listeners and break immediately
-                        docs: List[Document] = []
-                        for doc in self.data:
-                            if isinstance(doc, dict):
-                                d = normalize_document_input(doc)
-                                docs.append(Document(**d))
-                        if self._kind == "crawl":
-                            job = CrawlJob(
-                                status="completed",
-                                completed=raw_payload.get("completed", 0),
-                                total=raw_payload.get("total", 0),
-                                credits_used=raw_payload.get("creditsUsed", 0),
-                                expires_at=raw_payload.get("expiresAt"),
-                                next=raw_payload.get("next"),
-                                data=docs,
-                            )
-                        else:
-                            job = BatchScrapeJob(
-                                status="completed",
-                                completed=raw_payload.get("completed", 0),
-                                total=raw_payload.get("total", 0),
-                                credits_used=raw_payload.get("creditsUsed", 0),
-                                expires_at=raw_payload.get("expiresAt"),
-                                next=raw_payload.get("next"),
-                                data=docs,
-                            )
-                        self._emit(job)
-                        break
-
-                    payload = body.get("data", body)
-                    # Only treat messages with an explicit status as job snapshots
-                    has_status_field = (isinstance(payload, dict) and "status" in payload) or ("status" in body)
-                    if not has_status_field:
-                        continue
-                    status_str = payload.get("status", body.get("status", self.status))
-
-                    if self._kind == "crawl":
-                        docs = []
-                        for doc in payload.get("data", []):
-                            if isinstance(doc, dict):
-                                d = normalize_document_input(doc)
-                                docs.append(Document(**d))
-                        job = CrawlJob(
-                            status=status_str,
-                            completed=payload.get("completed", 0),
-                            total=payload.get("total", 0),
-                            credits_used=payload.get("creditsUsed", 0),
-                            expires_at=payload.get("expiresAt"),
-                            next=payload.get("next"),
-                            data=docs,
-                        )
-                        self._emit(job)
-                        if status_str in ("completed", "failed", "cancelled"):
-                            # Ensure done/error dispatched even if server didn't send explicit event type
-                            if status_str == "completed" and not self._sent_done:
-                                self.dispatch_event("done", {"status": status_str, "data": self.data, "id": self._job_id})
-                                self._sent_done = True
-                            if status_str == "failed" and not self._sent_error:
-                                self.dispatch_event("error", {"status": status_str, "data": self.data, "id": self._job_id})
-                                self._sent_error = True
-                            break
-                    else:
-                        docs = []
-                        for doc in payload.get("data", []):
-                            if isinstance(doc, dict):
-                                d = normalize_document_input(doc)
-                                docs.append(Document(**d))
-                        job = BatchScrapeJob(
-                            status=status_str,
-                            completed=payload.get("completed", 0),
-                            total=payload.get("total", 0),
-                            credits_used=payload.get("creditsUsed"),
-                            expires_at=payload.get("expiresAt"),
-                            next=payload.get("next"),
-                            data=docs,
-                        )
-                        self._emit(job)
-                        if status_str in ("completed", "failed", "cancelled"):
-                            if status_str == "completed" and not self._sent_done:
-                                self.dispatch_event("done", {"status": status_str, "data": self.data, "id": self._job_id})
-                                self._sent_done = True
-                            if status_str == "failed" and not self._sent_error:
-                                self.dispatch_event("error", {"status": status_str, "data": self.data, "id": self._job_id})
-                                self._sent_error = True
-                            break
-        except Exception:
-            pass
+            while not self._stop.is_set():
+                try:
+                    async with websockets.connect(uri, max_size=None, additional_headers=headers_list) as websocket:
+                        attempt = 0
+                        delay = 0.0
+                        if await self._consume(websocket, deadline):
+                            return
+                except Exception:
+                    # Connect failure or dropped socket: reconnect below
+                    pass
+                if self._stop.is_set() or (deadline is not None and loop.time() >= deadline):
+                    return
+                if attempt >= policy.max_retries:
+                    break
+                delay = policy.backoff(attempt, delay)
+                attempt += 1
+                if deadline is not None:
+                    delay = min(delay, max(0.0, deadline - loop.time()))
+                await asyncio.sleep(delay)
+
+            # Reconnecting kept failing: poll HTTP until terminal or timeout
+            while not self._stop.is_set():
+                if await self._poll_status_once():
+                    return
+                if deadline is not None and loop.time() >= deadline:
+                    return
+                await asyncio.sleep(self._poll_interval or 2)
         finally:
             # Ensure terminal event parity with v1 even on abrupt disconnects
             if self.status == "completed" and not self._sent_done:
                 self.dispatch_event("done", {"status": self.status, "data": self.data, "id": self._job_id})
                 self._sent_done = True
+            queue.close()
+
+    async def _consume(self, websocket: Any, deadline: Optional[float]) -> bool:
+        """
+        Handle messages from one connection.
+
+        Returns True when watching is over (terminal status, timeout or stop)
+        and False when the connection dropped and should be re-established.
+        """
+        loop = asyncio.get_event_loop()
+        while not self._stop.is_set():
+            # Use short recv timeouts to allow HTTP polling fallback
+            if deadline is not None:
+                remaining = max(0.0, deadline - loop.time())
+                timeout = min(self._poll_interval or remaining, remaining)
+            else:
+                timeout = self._poll_interval or 5
+            try:
+                msg = await asyncio.wait_for(websocket.recv(), timeout=timeout)
+            except asyncio.TimeoutError:
+                # Quiet period: poll HTTP once to progress statuses
+                if await self._poll_status_once():
+                    return True
+                if deadline is not None and loop.time() >= deadline:
+                    return True
+                continue
+            except asyncio.CancelledError:
+                return True
+            except Exception:
+                return False
+
+            try:
+                body = json_codec.loads(msg)
+            except Exception:
+                continue
+
+            # v1-style typed event handling
+            msg_type = body.get("type")
+            if msg_type == "error":
+                self.status = "failed"
+                self.dispatch_event("error", {
+                    "status": self.status,
+                    "data": self.data,
+                    "error": body.get("error"),
+                    "id": self._job_id,
+                })
+                self._sent_error = True
+                # Emit a final failed snapshot for listeners
+                if self._kind == "crawl":
+                    job = CrawlJob(status="failed", completed=0, total=0, credits_used=0, expires_at=None, next=None, data=[])
+                else:
+                    job = BatchScrapeJob(status="failed", completed=0, total=0, credits_used=0, expires_at=None, next=None, data=[])
+                self._emit(job)
+                return True
+            elif msg_type == "catchup":
+                d = body.get("data", {})
+                self.status = d.get("status", self.status)
+                await self._deliver(self._tracker.catchup(d.get("data", []) or []))
+            elif msg_type == "document":
+                await self._deliver(self._accept([body.get("data")]))
+            elif msg_type == "done":
+                self.status = "completed"
+                # Gather any documents in the done payload
+                raw_payload = body.get("data", {}) or {}
+                await self._deliver(self._accept(raw_payload.get("data")), dispatch=False)
+                # Dispatch done event first
+                self.dispatch_event("done", {"status": self.status, "data": self.data, "id": self._job_id})
+                self._sent_done = True
+                # Emit a final completed snapshot for listeners and stop immediately
+                docs = self._tracker.snapshot_documents()
+                if self._kind == "crawl":
+                    job = CrawlJob(
+                        status="completed",
+                        completed=raw_payload.get("completed", 0),
+                        total=raw_payload.get("total", 0),
+                        credits_used=raw_payload.get("creditsUsed", 0),
+                        expires_at=raw_payload.get("expiresAt"),
+                        next=raw_payload.get("next"),
+                        data=docs,
+                    )
+                else:
+                    job = BatchScrapeJob(
+                        status="completed",
+                        completed=raw_payload.get("completed", 0),
+                        total=raw_payload.get("total", 0),
+                        credits_used=raw_payload.get("creditsUsed", 0),
+                        expires_at=raw_payload.get("expiresAt"),
+                        next=raw_payload.get("next"),
+                        data=docs,
+                    )
+                self._emit(job)
+                return True
+
+            payload = body.get("data", body)
+            # Only treat messages with an explicit status as job snapshots
+            has_status_field = (isinstance(payload, dict) and "status" in payload) or ("status" in body)
+            if not has_status_field:
+                continue
+            status_str = payload.get("status", body.get("status", self.status))
+            if msg_type is None:
+                # Status snapshots may carry documents not streamed individually
+                await self._deliver(self._accept(payload.get("data")))
+            docs = self._tracker.snapshot_documents()
 
-    async def _poll_status_once(self) -> bool:
-        """Poll job status over HTTP once. Returns True if terminal."""
-        try:
             if self._kind == "crawl":
-                job: CrawlJob = await asyncio.to_thread(self._client.get_crawl_status, self._job_id)
+                job = CrawlJob(
+                    status=status_str,
+                    completed=payload.get("completed", 0),
+                    total=payload.get("total", 0),
+                    credits_used=payload.get("creditsUsed", 0),
+                    expires_at=payload.get("expiresAt"),
+                    next=payload.get("next"),
+                    data=docs,
+                )
+                self._emit(job)
+                if status_str in ("completed", "failed", "cancelled"):
+                    # Ensure done/error dispatched even if server didn't send explicit event type
+                    if status_str == "completed" and not self._sent_done:
+                        self.dispatch_event("done", {"status": status_str, "data": self.data, "id": self._job_id})
+                        self._sent_done = True
+                    if status_str == "failed" and not self._sent_error:
+                        self.dispatch_event("error", {"status": status_str, "data": self.data, "id": self._job_id})
+                        self._sent_error = True
+                    return True
             else:
-                job: BatchScrapeJob = await asyncio.to_thread(self._client.get_batch_scrape_status, self._job_id)
+                job = BatchScrapeJob(
+                    status=status_str,
+                    completed=payload.get("completed", 0),
+                    total=payload.get("total", 0),
+                    credits_used=payload.get("creditsUsed"),
+                    expires_at=payload.get("expiresAt"),
+                    next=payload.get("next"),
+                    data=docs,
+                )
+                self._emit(job)
+                if status_str in ("completed", "failed", "cancelled"):
+                    if status_str == "completed" and not self._sent_done:
+                        self.dispatch_event("done", {"status": status_str, "data": self.data, "id": self._job_id})
+                        self._sent_done = True
+                    if status_str == "failed" and not self._sent_error:
+                        self.dispatch_event("error", {"status": status_str, "data": self.data, "id": self._job_id})
+                        self._sent_error = True
+                    return True
+        return True
+
+    def _accept(self, docs_in: Any) -> List[Tuple[Dict[str, Any], Document]]:
+        received = []
+        if isinstance(docs_in, list):
+            for doc in docs_in:
+                if isinstance(doc, dict):
+                    document = self._tracker.accept(doc)
+                    if document is not None:
+                        received.append((doc, document))
+        return received
+
+    async def _deliver(self, received: List[Tuple[Dict[str, Any], Document]], *, dispatch: bool = True) -> None:
+        for doc, document in received:
+            if self._retain_data:
+                self.data.append(doc)
+            if dispatch:
+                self.dispatch_event("document", {"data": doc, "id": self._job_id})
+            if self._consuming:
+                # Waits for the consumer under the "block" overflow policy
+                await self._queue.put_async(document)
+
+    def documents(self) -> Iterator[Document]:
+        """
+        Iterate over documents as they arrive, blocking while waiting for more.
+
+        Call before ``start()`` to see every document; iteration ends once the
+        watcher finishes or is stopped and the queued documents are consumed.
+        After ``stop()``, call it again for the documents of the next ``start()``.
+        """
+        if self._stop.is_set():
+            self._renew_queue()
+        self._consuming = True
+        return iter(self._queue)
+
+    def _renew_queue(self) -> None:
+        # A run closes its queue when it ends; a restarted watcher needs a fresh one
+        if self._queue.closed:
+            self._queue = DocumentQueue(self._queue.maxsize, self._queue.overflow)
+
+    async def _fetch_progress(self) -> JobType:
+        if self._http_client is not None:
+            if self._kind == "crawl":
+                return await asyncio.to_thread(crawl_methods._get_crawl_progress, self._http_client, self._job_id)
+            return await asyncio.to_thread(batch_methods._get_batch_progress, self._http_client, self._job_id)
+        if self._kind == "crawl":
+            return await asyncio.to_thread(self._client.get_crawl_status, self._job_id)
+        return await asyncio.to_thread(self._client.get_batch_scrape_status, self._job_id)
+
+    async def _poll_status_once(self) -> bool:
+        """Poll the job's status counters over HTTP once. Returns True if terminal."""
+        try:
+            progress = await self._fetch_progress()
+            received = []
+            if self._http_client is not None and progress.completed > self._tracker.count:
+                # Documents the socket has not delivered: fetch only those past the ones received
+                received = self._accept(await asyncio.to_thread(
+                    fetch_new_documents, self._http_client, self._kind, self._job_id, self._tracker.count
+                ))
         except Exception:
             return False
 
-        self.status = job.status
+        await self._deliver(received)
+        self.status = progress.status
+        # Snapshots hold the documents received so far, per snapshot_mode
+        job = progress.model_copy(update={"data": self._tracker.snapshot_documents()})
         self._emit(job)
         if job.status in ("completed", "failed", "cancelled"):
             if job.status == "completed" and not self._sent_done:
-                self.dispatch_event("done", {"status": job.status, "data": [d.model_dump() for d in job.data], "id": self._job_id})
+                self.dispatch_event("done", {"status": job.status, "data": self.data, "id": self._job_id})
                 self._sent_done = True
             if job.status == "failed" and not self._sent_error:
-                self.dispatch_event("error", {"status": job.status, "data": [d.model_dump() for d in job.data], "id": self._job_id})
+                self.dispatch_event("error", {"status": job.status, "data": self.data, "id": self._job_id})
                 self._sent_error = True
             return True
         return False
@@ -288,14 +402,51 @@ class Watcher:
         asyncio.run(self._run_ws())
 
     def start(self) -> None:
+        if self._hub is not None:
+            if self._future is not None and not self._future.done():
+                return
+            self._renew_queue()
+            self._stop.clear()
+            self._future = self._hub.submit(self._run_ws())
+            return
         if self._thread and self._thread.is_alive():
             return
+        self._renew_queue()
         self._stop.clear()
         self._thread = threading.Thread(target=self._loop, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
         self._stop.set()
+        # Release a reader waiting for room in the queue
+        self._queue.close()
+        if self._future is not None:
+            self._future.cancel()
+            return
         if self._thread:
             self._thread.join(timeout=1)
 
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the watcher to finish and its callbacks to run.
+
+        Returns:
+            False if ``timeout`` elapsed first
+        """
+        if self._future is not None:
+            deadline = time.monotonic() + timeout if timeout is not None else None
+            try:
+                self._future.result(timeout)
+            except concurrent.futures.TimeoutError:
+                return False
+            except concurrent.futures.CancelledError:
+                pass
+            if self._hub is None:
+                return True
+            remaining = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+            return self._hub.wait_idle(self, remaining)
+        if self._thread is not None:
+            self._thread.join(timeout)
+            return not self._thread.is_alive()
+        return True
+
@@ -8,15 +8,19 @@ Usage:
 
 import asyncio
 import inspect
-import json
 import time
 from typing import AsyncIterator, Dict, List, Literal, Optional
 
 import websockets
 from websockets.exceptions import ConnectionClosed, ConnectionClosedOK, ConnectionClosedError
 
-from .types import BatchScrapeJob, CrawlJob, Document
-from .utils.normalize import normalize_document_input
+from .types import BatchScrapeJob, CrawlJob, SnapshotMode
+from .utils import json_codec
+from .utils.retry import RetryPolicy
+from .utils.http_client_async import AsyncHttpClient
+from .utils.ws_resume import DEFAULT_RECONNECT_POLICY, DocumentTracker, fetch_new_documents_async
+from .methods.aio import batch as async_batch
+from .methods.aio import crawl as async_crawl
 
 JobKind = Literal["crawl", "batch"]
 
@@ -28,13 +32,21 @@ class AsyncWatcher:
         job_id: str,
         *,
         kind: JobKind = "crawl",
+        poll_interval: float = 2.0,
         timeout: Optional[int] = None,
+        reconnect_policy: Optional[RetryPolicy] = None,
+        snapshot_mode: SnapshotMode = "full",
+        retain_data: bool = True,
     ) -> None:
         self._client = client
         self._job_id = job_id
         self._kind = kind
         self._timeout = timeout
-        self._poll_interval: float = 2.0
+        self._poll_interval: float = poll_interval
+        self._reconnect_policy = reconnect_policy or DEFAULT_RECONNECT_POLICY
+        self._tracker = DocumentTracker(snapshot_mode, retain=retain_data)
+        self._retain_data = retain_data
+        self._finished = False
 
         http_client = getattr(client, "http_client", None)
         if http_client is not None:
@@ -45,6 +57,11 @@ class AsyncWatcher:
             self._api_url = getattr(client, "api_url", None)
             self._api_key = getattr(client, "api_key", None)
 
+        # HTTP polls fetch only the status counters through the SDK client;
+        # other clients are polled through their get_*_status methods
+        async_http_client = getattr(client, "async_http_client", None)
+        self._async_http_client = async_http_client if isinstance(async_http_client, AsyncHttpClient) else None
+
         self._status: str = "scraping"
         self._data: List[Dict] = []
 
@@ -65,109 +82,141 @@ class AsyncWatcher:
         if self._api_key:
             headers_list.append(("Authorization", f"Bearer {self._api_key}"))
 
-        # Attempt to establish WS; on failure, fall back to HTTP polling immediately
-        try:
-            async with websockets.connect(uri, max_size=None, additional_headers=headers_list) as websocket:
-                deadline = asyncio.get_event_loop().time() + self._timeout if self._timeout else None
-                # Pre-yield a snapshot if available to ensure progress is visible
-                try:
-                    pre = await self._fetch_job_status()
-                    yield pre
-                    if pre.status in ("completed", "failed", "cancelled"):
-                        return
-                except Exception:
-                    pass
-
-                while True:
-                    try:
-                        if deadline is not None:
-                            remaining = max(0.0, deadline - asyncio.get_event_loop().time())
-                            timeout = min(self._poll_interval, remaining) if remaining > 0 else 0.0
-                        else:
-                            timeout = self._poll_interval
-                        msg = await asyncio.wait_for(websocket.recv(), timeout=timeout)
-                    except asyncio.TimeoutError:
-                        # Quiet period: poll HTTP once
-                        job = await self._safe_fetch()
-                        if job is not None:
-                            yield job
-                            if job.status in ("completed", "failed", "cancelled"):
-                                return
-                        if deadline is not None and asyncio.get_event_loop().time() >= deadline:
-                            return
-                        continue
-                    except (ConnectionClosedOK, ConnectionClosed, ConnectionClosedError):
-                        # Graceful/abrupt close: poll HTTP until terminal (bounded by timeout)
-                        deadline = time.time() + (self._timeout or 30)
-                        while True:
-                            try:
-                                job = await self._fetch_job_status()
-                                yield job
-                                if job.status in ("completed", "failed", "cancelled"):
-                                    return
-                            except Exception:
-                                return
-                            if time.time() >= deadline:
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + self._timeout if self._timeout else None
+        policy = self._reconnect_policy
+        attempt = 0
+        delay = 0.0
+        connected = False
+        self._finished = False
+        while True:
+            try:
+                async with websockets.connect(uri, max_size=None, additional_headers=headers_list) as websocket:
+                    attempt = 0
+                    delay = 0.0
+                    if not connected:
+                        connected = True
+                        # Pre-yield a snapshot if available to ensure progress is visible
+                        pre = await self._poll()
+                        if pre is not None:
+                            yield pre
+                            if pre.status in ("completed", "failed", "cancelled"):
                                 return
-                            await asyncio.sleep(1)
-                    try:
-                        body = json.loads(msg)
-                    except Exception:
-                        continue
-
-                    msg_type = body.get("type")
-                    if msg_type == "error":
-                        self._status = "failed"
-                        # Yield a terminal snapshot
-                        if self._kind == "crawl":
-                            yield CrawlJob(status="failed", completed=0, total=0, credits_used=0, expires_at=None, next=None, data=[])
-                        else:
-                            yield BatchScrapeJob(status="failed", completed=0, total=0, credits_used=0, expires_at=None, next=None, data=[])
-                        return
-                    elif msg_type == "catchup":
-                        d = body.get("data", {})
-                        self._status = d.get("status", self._status)
-                        docs_in = d.get("data", []) or []
-                        self._data.extend(docs_in)
-                        # Fall through to emit a snapshot below
-                    elif msg_type == "document":
-                        doc = body.get("data")
-                        if isinstance(doc, dict):
-                            self._data.append(doc)
-                        # Fall through to emit a snapshot below
-                    elif msg_type == "done":
-                        self._status = "completed"
-                        raw_payload = body.get("data", {}) or {}
-                        docs_in = raw_payload.get("data", []) or []
-                        if isinstance(docs_in, list) and docs_in:
-                            for doc in docs_in:
-                                if isinstance(doc, dict):
-                                    self._data.append(doc)
-                        # Emit final snapshot then end
-                        yield self._make_snapshot(status="completed", payload=raw_payload, docs_override=self._data)
+                    async for snapshot in self._consume(websocket, deadline):
+                        yield snapshot
+                    if self._finished:
                         return
+            except Exception:
+                # Connect failure or dropped socket: reconnect below
+                pass
+            if deadline is not None and loop.time() >= deadline:
+                return
+            if attempt >= policy.max_retries:
+                break
+            delay = policy.backoff(attempt, delay)
+            attempt += 1
+            if deadline is not None:
+                delay = min(delay, max(0.0, deadline - loop.time()))
+            await asyncio.sleep(delay)
 
-                    # Generic snapshot emit for status messages and periodic progress
-                    payload = body.get("data", body)
-                    status_str = payload.get("status", body.get("status", self._status))
-                    snapshot = self._make_snapshot(status=status_str, payload=payload)
-                    yield snapshot
-                    if status_str in ("completed", "failed", "cancelled"):
-                        return
-        except Exception:
-            # WS connect failure: fallback to HTTP polling loop until terminal/timeout
-            deadline = time.time() + (self._timeout or 30)
-            while True:
-                try:
-                    job = await self._fetch_job_status()
+        # Reconnecting kept failing: poll HTTP until terminal/timeout
+        poll_deadline = time.time() + (self._timeout or 30)
+        while True:
+            job = await self._poll()
+            if job is None:
+                return
+            yield job
+            if job.status in ("completed", "failed", "cancelled"):
+                return
+            if time.time() >= poll_deadline:
+                return
+            await asyncio.sleep(1)
+
+    async def _consume(self, websocket, deadline: Optional[float]) -> AsyncIterator[object]:
+        """
+        Yield snapshots from one connection.
+
+        Sets ``_finished`` when watching is over; returning without it means
+        the connection dropped and should be re-established.
+        """
+        loop = asyncio.get_event_loop()
+        while True:
+            try:
+                if deadline is not None:
+                    remaining = max(0.0, deadline - loop.time())
+                    timeout = min(self._poll_interval, remaining) if remaining > 0 else 0.0
+                else:
+                    timeout = self._poll_interval
+                msg = await asyncio.wait_for(websocket.recv(), timeout=timeout)
+            except asyncio.TimeoutError:
+                # Quiet period: poll HTTP once
+                job = await self._poll()
+                if job is not None:
                     yield job
                     if job.status in ("completed", "failed", "cancelled"):
+                        self._finished = True
                         return
-                except Exception:
+                if deadline is not None and loop.time() >= deadline:
+                    self._finished = True
                     return
-                if time.time() >= deadline:
-                    return
-                await asyncio.sleep(1)
+                continue
+            except (ConnectionClosedOK, ConnectionClosed, ConnectionClosedError):
+                return
+            try:
+                body = json_codec.loads(msg)
+            except Exception:
+                continue
+
+            msg_type = body.get("type")
+            if msg_type == "error":
+                self._status = "failed"
+                self._finished = True
+                # Yield a terminal snapshot
+                if self._kind == "crawl":
+                    yield CrawlJob(status="failed", completed=0, total=0, credits_used=0, expires_at=None, next=None, data=[])
+                else:
+                    yield BatchScrapeJob(status="failed", completed=0, total=0, credits_used=0, expires_at=None, next=None, data=[])
+                return
+            elif msg_type == "catchup":
+                d = body.get("data", {})
+                self._status = d.get("status", self._status)
+                for doc, _ in self._tracker.catchup(d.get("data", []) or []):
+                    self._retain(doc)
+                # Fall through to emit a snapshot below
+            elif msg_type == "document":
+                self._accept([body.get("data")])
+                # Fall through to emit a snapshot below
+            elif msg_type == "done":
+                self._status = "completed"
+                self._finished = True
+                raw_payload = body.get("data", {}) or {}
+                self._accept(raw_payload.get("data"))
+                # Emit final snapshot then end
+                yield self._make_snapshot(status="completed", payload=raw_payload)
+                return
+
+            # Generic snapshot emit for status messages and periodic progress
+            payload = body.get("data", body)
+            status_str = payload.get("status", body.get("status", self._status))
+            if msg_type is None:
+                # Status snapshots may carry documents not streamed individually
+                self._accept(payload.get("data"))
+            snapshot = self._make_snapshot(status=status_str, payload=payload)
+            if status_str in ("completed", "failed", "cancelled"):
+                self._finished = True
+                yield snapshot
+                return
+            yield snapshot
+
+    def _accept(self, docs_in) -> None:
+        if isinstance(docs_in, list):
+            for doc in docs_in:
+                if isinstance(doc, dict) and self._tracker.accept(doc) is not None:
+                    self._retain(doc)
+
+    def _retain(self, doc: Dict) -> None:
+        if self._retain_data:
+            self._data.append(doc)
 
     async def _fetch_job_status(self):
         if self._kind == "crawl":
@@ -206,19 +255,31 @@ class AsyncWatcher:
 
         raise RuntimeError(f"Client does not expose {method_name}")
 
-    async def _safe_fetch(self):
+    async def _fetch_progress(self):
+        if self._async_http_client is not None:
+            if self._kind == "crawl":
+                return await async_crawl._get_crawl_progress(self._async_http_client, self._job_id)
+            return await async_batch._get_batch_progress(self._async_http_client, self._job_id)
+        return await self._fetch_job_status()
+
+    async def _poll(self):
+        """Snapshot built from the job's status counters; None if the poll failed."""
         try:
-            return await self._fetch_job_status()
+            progress = await self._fetch_progress()
+            if self._async_http_client is not None and progress.completed > self._tracker.count:
+                # Documents the socket has not delivered: fetch only those past the ones received
+                self._accept(await fetch_new_documents_async(
+                    self._async_http_client, self._kind, self._job_id, self._tracker.count
+                ))
         except Exception:
             return None
+        self._status = progress.status
+        # Snapshots hold the documents received so far, per snapshot_mode
+        return progress.model_copy(update={"data": self._tracker.snapshot_documents()})
 
-    def _make_snapshot(self, *, status: str, payload: Dict, docs_override: Optional[List[Dict]] = None):
-        docs = []
-        source_docs = docs_override if docs_override is not None else payload.get("data", []) or []
-        for doc in source_docs:
-            if isinstance(doc, dict):
-                d = normalize_document_input(doc)
-                docs.append(Document(**d))
+    def _make_snapshot(self, *, status: str, payload: Dict):
+        # Documents were converted once on arrival; snapshots share them
+        docs = self._tracker.snapshot_documents()
 
         if self._kind == "crawl":
             return CrawlJob(
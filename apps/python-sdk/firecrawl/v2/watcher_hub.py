@@ -0,0 +1,179 @@
+"""
+Shared event loop for many sync watchers.
+
+Each ``Watcher`` normally runs on its own thread with its own event loop.
+Watchers created with a ``WatcherHub`` instead run as tasks on one background
+loop owned by the hub: WebSocket connections, quiet-period polls and HTTP
+fallbacks of every job share that loop, status polls share a fixed pool of
+HTTP worker threads, and listener callbacks run on a fixed pool of callback
+workers (in order per watcher) so a slow callback never stalls the loop.
+
+Usage:
+    with WatcherHub() as hub:
+        for job_id in job_ids:
+            watcher = client.watcher(job_id, hub=hub)
+            watcher.add_listener(on_status)
+            watcher.start()
+        ...
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Coroutine, Deque, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger("firecrawl")
+
+# Callbacks a worker runs for one watcher before yielding to other watchers
+_DRAIN_BATCH = 64
+
+
+class WatcherHub:
+    """
+    Runs watchers on one shared background event loop.
+
+    Args:
+        callback_workers: Threads running listener callbacks
+        http_workers: Threads running HTTP status polls
+    """
+
+    def __init__(self, *, callback_workers: int = 8, http_workers: int = 16):
+        if callback_workers < 1 or http_workers < 1:
+            raise ValueError("callback_workers and http_workers must be at least 1")
+        self._callback_workers = callback_workers
+        self._http_workers = http_workers
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending: Dict[Hashable, Deque[Tuple[Callable[..., Any], Tuple[Any, ...]]]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._callbacks: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._http: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._closed = False
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("WatcherHub is closed")
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._http = concurrent.futures.ThreadPoolExecutor(
+                    self._http_workers, thread_name_prefix="firecrawl-hub-http"
+                )
+                # asyncio.to_thread (used for HTTP polls) runs on the default executor
+                loop.set_default_executor(self._http)
+                self._callbacks = concurrent.futures.ThreadPoolExecutor(
+                    self._callback_workers, thread_name_prefix="firecrawl-hub-callback"
+                )
+                ready = threading.Event()
+
+                def run() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=run, name="firecrawl-watcher-hub", daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> "concurrent.futures.Future[Any]":
+        """Run a coroutine on the hub's loop."""
+        try:
+            loop = self._ensure_started()
+        except RuntimeError:
+            coro.close()
+            raise
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def dispatch(self, key: Hashable, callback: Callable[..., Any], *args: Any) -> None:
+        """
+        Run ``callback(*args)`` on a callback worker.
+
+        Callbacks dispatched with the same ``key`` run one at a time, in order.
+        Callbacks dispatched after ``close()`` are dropped.
+        """
+        with self._lock:
+            if self._closed:
+                self._drop(key)
+                return
+            if self._callbacks is None:
+                raise RuntimeError("WatcherHub is not running")
+            pending = self._pending.get(key)
+            schedule = pending is None
+            if schedule:
+                pending = self._pending[key] = deque()
+            pending.append((callback, args))
+            if schedule:
+                self._callbacks.submit(self._drain, key)
+
+    def _drain(self, key: Hashable) -> None:
+        for _ in range(_DRAIN_BATCH):
+            with self._lock:
+                pending = self._pending[key]
+                if not pending:
+                    del self._pending[key]
+                    self._idle.notify_all()
+                    return
+                callback, args = pending[0]
+            try:
+                callback(*args)
+            except Exception:
+                logger.exception("Watcher callback failed")
+            with self._lock:
+                pending.popleft()
+        # Let other watchers' callbacks run before continuing with this one
+        with self._lock:
+            if self._closed or self._callbacks is None:
+                # The executor is shut down; drop the rest so wait_idle() returns
+                self._drop(key)
+            else:
+                self._callbacks.submit(self._drain, key)
+
+    def _drop(self, key: Hashable) -> None:
+        # Caller holds self._lock
+        if self._pending.pop(key, None) is not None:
+            self._idle.notify_all()
+
+    def wait_idle(self, key: Hashable, timeout: Optional[float] = None) -> bool:
+        """Wait until every callback dispatched with ``key`` has run."""
+        with self._idle:
+            return self._idle.wait_for(lambda: key not in self._pending, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Cancel running watchers and stop the loop and worker threads."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop, thread = self._loop, self._thread
+        if loop is not None:
+
+            async def _cancel_all() -> None:
+                tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+            try:
+                asyncio.run_coroutine_threadsafe(_cancel_all(), loop).result(timeout)
+            except Exception:
+                pass
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None:
+                thread.join(timeout)
+            if not loop.is_running():
+                loop.close()
+        if self._callbacks is not None:
+            self._callbacks.shutdown(wait=False)
+        if self._http is not None:
+            self._http.shutdown(wait=False)
+
+    def __enter__(self) -> "WatcherHub":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -28,6 +28,9 @@ setup(
     packages=find_packages(),
     install_requires=[
         'requests',
+        # pool_stats() reads httpcore's connection pool; keep both in a tested range
+        'httpx>=0.25.1,<0.29',
+        'httpcore>=1.0,<2',
         'pytest',
         'python-dotenv',
         'websockets',
@@ -36,6 +39,11 @@ setup(
         'pydantic>=2.0',
         'aiohttp'
     ],
+    extras_require={
+        'http2': ['httpx[http2]'],
+        'fast-json': ['orjson'],
+        'fast-decode': ['msgspec'],
+    },
     python_requires=">=3.8",
     classifiers=[
         "Development Status :: 5 - Production/Stable",